@@ -184,6 +184,14 @@ def build_cognitive_digest(paths) -> CognitiveDigest:
 # Continuity Chain
 # ---------------------------------------------------------------------------
 
+def _larger_mood_delta(held, newer):
+    """Coalesce merge for MOOD_CHANGED: keep the event with the larger |delta|."""
+    def size(event):
+        delta = event.data.get("delta", 0)
+        return abs(delta) if isinstance(delta, (int, float)) else 0.0
+    return newer if size(newer) >= size(held) else held
+
+
 class ContinuityChain:
     """
     Cryptographic chain of cognitive state checkpoints.
@@ -274,12 +282,16 @@ class ContinuityChain:
                 source="continuity_chain",
             )
 
-        # Mood: only checkpoint if delta > 0.3
+        # Mood: only checkpoint if delta > 0.3. Bursts are coalesced; the
+        # held event keeps the largest delta so a big shift isn't hidden
+        # behind a small one that came after it
         self._bus.on(
             Events.MOOD_CHANGED,
             self._on_mood_changed,
             priority=40,
             source="continuity_chain",
+            coalesce=True,
+            coalesce_merge=_larger_mood_delta,
         )
 
         logger.info("Subscribed to %d trigger events", len(triggers) + 1)
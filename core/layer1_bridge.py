@@ -178,9 +178,14 @@ class L1Bridge:
     # Event subscription
     # ------------------------------------------------------------------
 
-    def setup(self):
-        """Subscribe to creation events on the event bus."""
-        from daemon.events import bus
+    def setup(self, delivery: Optional[str] = None):
+        """Subscribe to creation events on the event bus.
+
+        Queued by default: signing (Dilithium3 + SPHINCS+) and the DAG
+        insert run on the bridge's own worker, not inside the tool call
+        that emitted the event.
+        """
+        from daemon.events import bus, Delivery
 
         for event_type in _get_validated_events():
             bus.on(
@@ -188,6 +193,7 @@ class L1Bridge:
                 self._handle_event,
                 priority=50,
                 source="layer1_bridge",
+                delivery=delivery or Delivery.QUEUED,
             )
         logger.info("Subscribed to %d event types", len(_get_validated_events()))
 
@@ -442,11 +448,12 @@ def get_bridge() -> Optional[L1Bridge]:
     return _bridge
 
 
-def setup():
+def setup(delivery: Optional[str] = None):
     """
     Initialize the Layer 1 bridge if elara_protocol is available.
 
     Called at MCP server startup. Silent no-op if Layer 1 not installed.
+    `delivery` overrides the bridge's event delivery (default queued).
     """
     global _bridge
     if not is_available():
@@ -454,4 +461,4 @@ def setup():
         return
 
     _bridge = L1Bridge()
-    _bridge.setup()
+    _bridge.setup(delivery)
@@ -347,6 +347,14 @@ class ElaraPaths:
     def overwatch_inject(self) -> Path:
         return self._root / "elara-overwatch-inject.md"
 
+    @property
+    def overwatch_socket(self) -> Path:
+        return self._root / "elara-overwatch.sock"
+
+    @property
+    def overwatch_status(self) -> Path:
+        return self._root / "elara-overwatch-status.json"
+
     @property
     def overwatch_pid(self) -> Path:
         return self._root / "elara-overwatch.pid"
@@ -359,6 +367,18 @@ class ElaraPaths:
     def session_snapshot(self) -> Path:
         return self._root / "elara-session-snapshot.json"
 
+    @property
+    def boot_bundle(self) -> Path:
+        return self._root / "elara-boot-bundle.json"
+
+    @property
+    def event_journal(self) -> Path:
+        return self._root / "elara-events.db"
+
+    @property
+    def cache_snapshot(self) -> Path:
+        return self._root / "elara-cache-snapshot.json"
+
     # ------------------------------------------------------------------
     # Knowledge Graph
     # ------------------------------------------------------------------
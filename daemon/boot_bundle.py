@@ -0,0 +1,187 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Elara Boot Bundle — boot context materialized ahead of time.
+
+Boot used to assemble its context (snapshot sections, business and
+briefing summaries, long-range memory sweep, recent exchanges) at session
+start, when latency hurts most. Session end (hooks/on-stop.sh) and the
+overnight brain now materialize it into one versioned file instead, and
+its readers — hooks/boot.py, the intention hook's boot path and
+daemon.snapshot.get_snapshot() — load it from there.
+
+Every section records the generation of the sources it was computed from:
+(mtime_ns, size) for a file, (newest child mtime_ns, child count) for a
+directory. Boot reads the one file, and only sections whose sources moved
+on (or whose TTL ran out, for time-dependent output) are recomputed and
+written back.
+
+CLI:
+    python -m daemon.boot_bundle build     # materialize every section
+    python -m daemon.boot_bundle status    # fresh / stale per section
+"""
+
+import json
+import logging
+import sys
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.paths import get_paths
+from daemon.file_cache import fingerprint
+from daemon.schemas import atomic_write_json
+from daemon.snapshot import SNAPSHOT_SECTIONS
+
+logger = logging.getLogger("elara.boot_bundle")
+
+BUNDLE_VERSION = 1
+RECENT_EXCHANGES = 5
+
+
+def _business_summary() -> Optional[str]:
+    from daemon.business import boot_summary
+    return boot_summary()
+
+
+def _briefing_summary() -> str:
+    from daemon.briefing import boot_summary
+    return boot_summary()
+
+
+def _temporal_context() -> str:
+    from memory.temporal import boot_temporal_context
+    return boot_temporal_context()
+
+
+def _recent_exchanges() -> List[Dict[str, Any]]:
+    """Last exchanges by near-pure recency (boot can't search on 'hello')."""
+    from memory.conversations import get_conversations
+    conv = get_conversations()
+    if not conv.collection:
+        return []
+    return conv.recall(
+        "session work build implement",
+        n_results=RECENT_EXCHANGES,
+        recency_weight=0.95,
+    )
+
+
+# name -> (compute, source path attributes on ElaraPaths, TTL seconds or None)
+SECTIONS: Dict[str, Tuple[Callable[[], Any], Tuple[str, ...], Optional[float]]] = {
+    "mood": (SNAPSHOT_SECTIONS["mood"], ("state_file",), 3600),
+    "presence": (SNAPSHOT_SECTIONS["presence"], ("presence_file",), None),
+    "episode": (SNAPSHOT_SECTIONS["episode"], ("episodes_dir",), None),
+    "goals": (SNAPSHOT_SECTIONS["goals"], ("goals_file",), None),
+    "corrections": (SNAPSHOT_SECTIONS["corrections"], ("corrections_file",), None),
+    "business": (SNAPSHOT_SECTIONS["business"], ("business_dir",), None),
+    "memories": (SNAPSHOT_SECTIONS["memories"], ("memory_db",), None),
+    "conversations": (SNAPSHOT_SECTIONS["conversations"], ("conversations_db",), None),
+    "synthesis": (SNAPSHOT_SECTIONS["synthesis"], ("synthesis_dir",), None),
+    "briefing": (SNAPSHOT_SECTIONS["briefing"], ("feeds_config", "briefing_db"), None),
+    "handoff": (SNAPSHOT_SECTIONS["handoff"], ("handoff_file",), None),
+    # Boot output (hooks/boot.py, intention hook boot path). Stale-idea and
+    # long-range sweeps depend on today's date, hence the TTLs.
+    "business_summary": (_business_summary, ("business_dir",), 6 * 3600),
+    "briefing_summary": (_briefing_summary, ("briefing_db",), None),
+    "temporal": (_temporal_context, ("memory_db",), 6 * 3600),
+    "recent_exchanges": (_recent_exchanges, ("conversations_db",), None),
+}
+
+
+def generation(name: str) -> Dict[str, Optional[List[int]]]:
+    """Current generation of a section's sources."""
+    paths = get_paths()
+    return {attr: fingerprint(getattr(paths, attr)) for attr in SECTIONS[name][1]}
+
+
+def _is_fresh(name: str, entry: Optional[Dict[str, Any]], now: float) -> bool:
+    if not entry or entry.get("generation") is None or entry["generation"] != generation(name):
+        return False
+    ttl = SECTIONS[name][2]
+    return ttl is None or now - entry.get("built", 0) < ttl
+
+
+def build_section(name: str) -> Dict[str, Any]:
+    """Compute one section, stamped with the generation it was built from.
+
+    A failed build (exception, or a snapshot getter's {"error": ...}) is
+    kept for this boot but stamped with no generation, so the next load
+    retries it instead of serving the failure as fresh.
+    """
+    gen = generation(name)  # before computing: a write mid-build reads as stale
+    try:
+        data = SECTIONS[name][0]()
+    except Exception as e:
+        logger.debug("Boot bundle section %s failed: %s", name, e)
+        data, gen = None, None
+    if isinstance(data, dict) and "error" in data:
+        gen = None
+    # Round-trip so the cached value matches what a later load returns
+    data = json.loads(json.dumps(data, default=str))
+    return {"generation": gen, "built": time.time(), "data": data}
+
+
+def _read() -> Dict[str, Any]:
+    try:
+        bundle = json.loads(get_paths().boot_bundle.read_text())
+        if bundle.get("version") == BUNDLE_VERSION:
+            return bundle
+    except (OSError, ValueError):
+        pass
+    return {"version": BUNDLE_VERSION, "sections": {}}
+
+
+def _write(bundle: Dict[str, Any], reason: str):
+    bundle["version"] = BUNDLE_VERSION
+    bundle["built"] = time.time()
+    bundle["reason"] = reason
+    try:
+        atomic_write_json(get_paths().boot_bundle, bundle)
+    except OSError as e:
+        logger.warning("Boot bundle write failed: %s", e)
+
+
+def materialize(reason: str = "manual") -> Dict[str, Any]:
+    """Build every section and write the bundle. Returns the bundle."""
+    bundle = {"sections": {name: build_section(name) for name in SECTIONS}}
+    _write(bundle, reason)
+    logger.info("Boot bundle materialized (%s): %d sections", reason, len(SECTIONS))
+    return bundle
+
+
+def load_bundle(names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """Section data for boot, recomputing (and saving) only stale sections."""
+    names = list(SECTIONS) if names is None else list(names)
+    bundle = _read()
+    sections = bundle.setdefault("sections", {})
+    now = time.time()
+
+    stale = [name for name in names if not _is_fresh(name, sections.get(name), now)]
+    for name in stale:
+        sections[name] = build_section(name)
+    if stale:
+        logger.debug("Boot bundle refreshed: %s", ", ".join(stale))
+        _write(bundle, "refresh")
+
+    return {name: sections[name]["data"] for name in names}
+
+
+def bundle_status() -> Dict[str, str]:
+    """fresh / stale / missing per section, without recomputing anything."""
+    sections = _read().get("sections", {})
+    now = time.time()
+    return {
+        name: "missing" if name not in sections
+        else "fresh" if _is_fresh(name, sections[name], now) else "stale"
+        for name in SECTIONS
+    }
+
+
+if __name__ == "__main__":
+    cmd = sys.argv[1] if len(sys.argv) > 1 else "status"
+    if cmd == "build":
+        materialize(sys.argv[2] if len(sys.argv) > 2 else "manual")
+    for section, state in bundle_status().items():
+        print(f"{section:<18} {state}")
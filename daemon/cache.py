@@ -9,65 +9,182 @@ TTL-based in-memory cache with event-driven invalidation.
 Zero-I/O for common reads: mood, presence stats, imprints, context.
 
 Design:
-  - Simple dict {key: (value, expires_at)} + threading.Lock
+  - OrderedDict {key: (value, expires_at, size)} + threading.Lock, kept
+    in LRU order and bounded by entry count and approximate bytes
   - Lazy population (cache on first miss)
+  - get_or_compute is single-flight per key: concurrent misses wait for
+    one computation instead of stampeding it
+  - None results are cached too (negative caching, optionally with a
+    shorter TTL); get(key, MISSING) tells a cached None from a miss
   - Event subscriptions invalidate stale entries automatically
-  - ~15 keys total, no size eviction needed
+  - Optional per-key stamp (e.g. source file generation) taken when the
+    value is computed, for consumers that must know what it was built from
   - Falls through to normal I/O on miss (graceful degradation)
 """
 
 import logging
+import os
+import sys
 import threading
 import time
+from collections import OrderedDict
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger("elara.cache")
 
-# Cache entry: (value, expires_at_monotonic)
-CacheEntry = Tuple[Any, float]
+# Cache entry: (value, expires_at_monotonic, approx_size_bytes, stamp)
+CacheEntry = Tuple[Any, float, int, Any]
+
+# Size budget — least recently used entries are evicted beyond either bound
+CACHE_MAX_ENTRIES = int(os.environ.get("ELARA_CACHE_MAX_ENTRIES", "1024"))
+CACHE_MAX_BYTES = int(os.environ.get("ELARA_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+
+
+class _Missing:
+    """Sentinel type for "no cached entry" (a cached None is a value)."""
+    __slots__ = ()
+
+    def __repr__(self):
+        return "MISSING"
+
+
+MISSING: Any = _Missing()
+
+
+def _approx_size(value: Any, _depth: int = 0) -> int:
+    """Rough deep size in bytes — containers walked a few levels down."""
+    size = sys.getsizeof(value)
+    if _depth >= 4:
+        return size
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += _approx_size(k, _depth + 1) + _approx_size(v, _depth + 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += _approx_size(item, _depth + 1)
+    return size
+
+
+class _Flight:
+    """One in-progress computation that concurrent callers wait on."""
+    __slots__ = ("done", "value", "error", "stale")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+        # Set when the key is invalidated mid-compute: the result may
+        # predate the write, so it is returned to its waiters but not stored
+        self.stale = False
 
 
 class CorticalCache:
     """
     Layer 0 reflex cache — hot reads with TTL expiry and event invalidation.
 
-    Thread-safe via threading.Lock. All operations are O(1).
+    Thread-safe via threading.Lock. All operations are O(1) except
+    eviction, which pops least recently used entries until within budget.
     """
 
-    def __init__(self):
-        self._store: Dict[str, CacheEntry] = {}
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        self._store: "OrderedDict[str, CacheEntry]" = OrderedDict()
         self._lock = threading.Lock()
+        self.max_entries = max_entries or CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes or CACHE_MAX_BYTES
+        self._bytes = 0
         self._hits = 0
         self._misses = 0
         self._invalidations = 0
-
-    def get(self, key: str) -> Optional[Any]:
-        """Get a cached value. Returns None on miss or expiry."""
+        self._evictions = 0
+        self._expirations = 0
+        self._negative_hits = 0
+        self._flight_waits = 0
+        self._inflight: Dict[str, _Flight] = {}
+        self._stampers: Dict[str, Callable[[], Any]] = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a cached value. Returns `default` on miss or expiry.
+
+        Pass default=MISSING to tell a cached None from a miss.
+        """
         with self._lock:
             entry = self._store.get(key)
             if entry is None:
                 self._misses += 1
-                return None
-            value, expires_at = entry
+                return default
+            value, expires_at, size, _ = entry
             if time.monotonic() > expires_at:
-                del self._store[key]
+                self._drop(key)
+                self._expirations += 1
                 self._misses += 1
-                return None
+                return default
+            self._store.move_to_end(key)
             self._hits += 1
+            if value is None:
+                self._negative_hits += 1
             return value
 
+    def peek(self, key: str) -> Optional[Tuple[Any, float, Any]]:
+        """(value, seconds of TTL left, stamp) for a live entry, without
+        touching stats or LRU order. None on miss or expiry."""
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            value, expires_at, _, stamp = entry
+            left = expires_at - time.monotonic()
+            return (value, left, stamp) if left > 0 else None
+
+    def stamp_with(self, key: str, stamper: Callable[[], Any]) -> None:
+        """Record stamper() with every entry of key, taken before its value
+        is computed (get_or_compute) or when it is stored (set)."""
+        with self._lock:
+            self._stampers[key] = stamper
+
+    def _stamp(self, key: str) -> Any:
+        stamper = self._stampers.get(key)
+        if stamper is None:
+            return None
+        try:
+            return stamper()
+        except Exception as e:
+            logger.debug("Cache stamp for %s failed: %s", key, e)
+            return None
+
     def set(self, key: str, value: Any, ttl: float) -> None:
-        """Store a value with TTL in seconds."""
+        """Store a value (None included) with TTL in seconds."""
+        size = _approx_size(value)
+        stamp = self._stamp(key)
         with self._lock:
-            self._store[key] = (value, time.monotonic() + ttl)
+            self._put(key, value, ttl, size, stamp)
+
+    def _put(self, key: str, value: Any, ttl: float, size: int, stamp: Any = None) -> None:
+        """Store and evict down to budget (lock held)."""
+        if key in self._store:
+            self._drop(key)
+        self._store[key] = (value, time.monotonic() + ttl, size, stamp)
+        self._bytes += size
+        while len(self._store) > 1 and (
+            len(self._store) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            oldest = next(iter(self._store))
+            self._drop(oldest)
+            self._evictions += 1
+            logger.debug("Cache evicted: %s", oldest)
+
+    def _drop(self, key: str) -> None:
+        """Remove one entry (lock held)."""
+        _, _, size, _ = self._store.pop(key)
+        self._bytes -= size
 
     def invalidate(self, *keys: str) -> int:
         """Invalidate one or more cache keys. Returns count of keys actually removed."""
         removed = 0
         with self._lock:
             for key in keys:
+                self._detach(key)
                 if key in self._store:
-                    del self._store[key]
+                    self._drop(key)
                     removed += 1
             self._invalidations += removed
         if removed:
@@ -79,32 +196,95 @@ class CorticalCache:
         with self._lock:
             count = len(self._store)
             self._store.clear()
+            self._bytes = 0
+            for key in list(self._inflight):
+                self._detach(key)
         if count:
             logger.debug("Cache cleared (%d entries)", count)
 
+    def _detach(self, key: str) -> None:
+        """Cut an in-progress computation loose (lock held).
+
+        Callers arriving after an invalidation start a fresh computation
+        instead of joining one that may have read the old data.
+        """
+        flight = self._inflight.pop(key, None)
+        if flight is not None:
+            flight.stale = True
+
     def stats(self) -> Dict[str, Any]:
         """Cache statistics."""
         with self._lock:
             total = self._hits + self._misses
             return {
                 "entries": len(self._store),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
                 "hits": self._hits,
                 "misses": self._misses,
                 "hit_rate": round(self._hits / total, 3) if total > 0 else 0.0,
+                "negative_hits": self._negative_hits,
                 "invalidations": self._invalidations,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "inflight": len(self._inflight),
+                "singleflight_waits": self._flight_waits,
             }
 
     def get_or_compute(
-        self, key: str, ttl: float, compute_fn: Callable[[], Any]
+        self,
+        key: str,
+        ttl: float,
+        compute_fn: Callable[[], Any],
+        negative_ttl: Optional[float] = None,
     ) -> Any:
-        """Get from cache, or compute + cache on miss. Thread-safe."""
-        value = self.get(key)
-        if value is not None:
+        """Get from cache, or compute + cache on miss. Thread-safe.
+
+        Only one caller computes a missing key; concurrent callers wait
+        for its result (or its exception). A None result is cached for
+        `negative_ttl` seconds (default: `ttl`).
+        """
+        value = self.get(key, MISSING)
+        if value is not MISSING:
             return value
-        # Compute outside lock to avoid blocking other cache ops
-        result = compute_fn()
-        self.set(key, result, ttl)
-        return result
+
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+            else:
+                self._flight_waits += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            # Stamp first: a source that changes mid-compute reads as newer
+            stamp = self._stamp(key)
+            # Compute outside lock to avoid blocking other cache ops
+            result = compute_fn()
+        except BaseException as e:
+            flight.error = e
+            raise
+        else:
+            flight.value = result
+            if result is None and negative_ttl is not None:
+                ttl = negative_ttl
+            size = _approx_size(result)
+            with self._lock:
+                if not flight.stale:
+                    self._put(key, result, ttl, size, stamp)
+            return result
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+            flight.done.set()
 
 
 # ---------------------------------------------------------------------------
@@ -139,6 +319,46 @@ CACHE_TTLS: Dict[str, float] = {
     CacheKeys.UDR_DECISIONS: 300.0,
 }
 
+# TTLs once the event journal relays invalidations from every process
+# (daemon/event_journal.py). Only keys whose value changes solely through
+# an invalidating event are raised; mood decays and presence counts the
+# minutes since last seen, so those keep their short TTLs.
+COHERENT_CACHE_TTLS: Dict[str, float] = {
+    **CACHE_TTLS,
+    CacheKeys.MEMORY_COUNT: 1800.0,
+    CacheKeys.GOAL_LIST: 3600.0,
+    CacheKeys.CORRECTION_INDEX: 3600.0,
+    CacheKeys.DREAM_STATUS: 3600.0,
+    CacheKeys.UDR_DECISIONS: 3600.0,
+}
+
+_coherent = False
+
+
+def set_coherent(enabled: bool) -> None:
+    """Mark invalidations as cross-process (the event journal is attached)."""
+    global _coherent
+    _coherent = enabled
+
+
+def invalidation_relayed(bus) -> bool:
+    """True when every invalidating event has a remote cache subscriber on bus.
+
+    Only then do other processes' writes reach this cache, so only then
+    may it use COHERENT_CACHE_TTLS.
+    """
+    if not _EVENT_INVALIDATION_MAP:
+        return False
+    return all(
+        any(s["source"] == "cache" and s["remote"] for s in bus.subscribers_for(event_type))
+        for event_type in _EVENT_INVALIDATION_MAP
+    )
+
+
+def cache_ttl(key: str) -> float:
+    """TTL for a cache key — longer when other processes' writes invalidate it."""
+    return (COHERENT_CACHE_TTLS if _coherent else CACHE_TTLS)[key]
+
 # Map events → cache keys to invalidate
 # Imported lazily to avoid circular imports
 _EVENT_INVALIDATION_MAP: Dict[str, List[str]] = {}
@@ -165,9 +385,16 @@ def _build_invalidation_map() -> Dict[str, List[str]]:
     }
 
 
-def setup_cache_invalidation(cache_instance: CorticalCache) -> None:
-    """Subscribe to events that should invalidate cache entries."""
-    from daemon.events import bus
+def setup_cache_invalidation(cache_instance: CorticalCache, delivery: Optional[str] = None) -> None:
+    """Subscribe to events that should invalidate cache entries.
+
+    Inline by default, so a read right after the emitting call never sees
+    the stale entry. Also subscribed to events relayed from other
+    processes by the event journal. Not coalesced: every event has to
+    invalidate before emit() returns, or a read right after the second
+    save in a burst would be served the entry the first one left stale.
+    """
+    from daemon.events import bus, Delivery
 
     global _EVENT_INVALIDATION_MAP
     _EVENT_INVALIDATION_MAP = _build_invalidation_map()
@@ -178,7 +405,8 @@ def setup_cache_invalidation(cache_instance: CorticalCache) -> None:
             cache_instance.invalidate(*keys)
 
     for event_type in _EVENT_INVALIDATION_MAP:
-        bus.on(event_type, _on_invalidating_event, priority=100, source="cache")
+        bus.on(event_type, _on_invalidating_event, priority=100, source="cache",
+               delivery=delivery or Delivery.INLINE, remote=True)
 
     logger.info(
         "Cache invalidation wired: %d events → %d cache keys",
@@ -0,0 +1,121 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Warm start for the Layer 0 cache across MCP server restarts.
+
+Every server start used to begin with an empty CorticalCache, so the first
+tool calls of a session paid for cold reads. On shutdown, save_snapshot()
+writes the live entries of SNAPSHOT_SOURCES with their remaining TTL and
+the generation of the files they were computed from — stamped on the
+entry when it was computed (stamp_sources()), not read at save time, so
+a source edited after the compute can't vouch for the old value. On
+startup, load_snapshot() restores an entry only if its sources are
+unchanged and its TTL (counted in wall time across the restart) hasn't
+run out.
+"""
+
+import json
+import logging
+import time
+from functools import partial
+from typing import Any, Dict, Optional, Tuple
+
+from core.paths import get_paths
+from daemon.cache import CacheKeys, CorticalCache
+from daemon.file_cache import fingerprint
+from daemon.schemas import atomic_write_json
+
+logger = logging.getLogger("elara.cache_snapshot")
+
+SNAPSHOT_VERSION = 1
+
+# cache key -> source path attributes on ElaraPaths
+SNAPSHOT_SOURCES: Dict[str, Tuple[str, ...]] = {
+    CacheKeys.MOOD_STATE: ("state_file",),
+    CacheKeys.PRESENCE_STATS: ("presence_file",),
+    CacheKeys.GOAL_LIST: ("goals_file",),
+    CacheKeys.CORRECTION_INDEX: ("corrections_file",),
+    CacheKeys.MEMORY_COUNT: ("memory_db",),
+    CacheKeys.DREAM_STATUS: ("dream_status",),
+}
+
+
+def _generation(key: str) -> Dict[str, Any]:
+    paths = get_paths()
+    return {attr: fingerprint(getattr(paths, attr)) for attr in SNAPSHOT_SOURCES[key]}
+
+
+def stamp_sources(cache_instance: CorticalCache) -> None:
+    """Have the cache record each snapshot key's source generation at compute time."""
+    for key in SNAPSHOT_SOURCES:
+        cache_instance.stamp_with(key, partial(_generation, key))
+
+
+def save_snapshot(cache_instance: Optional[CorticalCache] = None) -> int:
+    """Persist live snapshot entries. Returns how many were written."""
+    if cache_instance is None:
+        from daemon.cache import cache as cache_instance
+
+    now = time.time()
+    entries = {}
+    for key in SNAPSHOT_SOURCES:
+        live = cache_instance.peek(key)
+        if live is None:
+            continue
+        value, ttl_left, generation = live
+        if generation is None:
+            continue  # computed before stamping began: source unknown
+        try:
+            json.dumps(value)
+        except (TypeError, ValueError):
+            continue
+        entries[key] = {
+            "value": value,
+            "expires": now + ttl_left,
+            "generation": generation,
+        }
+
+    try:
+        atomic_write_json(get_paths().cache_snapshot, {
+            "version": SNAPSHOT_VERSION,
+            "saved": now,
+            "entries": entries,
+        })
+    except OSError as e:
+        logger.warning("Cache snapshot write failed: %s", e)
+        return 0
+    logger.info("Cache snapshot saved: %d entries", len(entries))
+    return len(entries)
+
+
+def load_snapshot(cache_instance: Optional[CorticalCache] = None) -> int:
+    """Restore still-valid entries and start stamping new ones.
+
+    Returns how many were restored.
+    """
+    if cache_instance is None:
+        from daemon.cache import cache as cache_instance
+    stamp_sources(cache_instance)
+
+    try:
+        snapshot = json.loads(get_paths().cache_snapshot.read_text())
+    except (OSError, ValueError):
+        return 0
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        return 0
+
+    now = time.time()
+    restored = 0
+    for key, entry in snapshot.get("entries", {}).items():
+        if key not in SNAPSHOT_SOURCES:
+            continue
+        ttl_left = entry.get("expires", 0) - now
+        if ttl_left <= 0 or entry.get("generation") != _generation(key):
+            continue
+        cache_instance.set(key, entry.get("value"), ttl_left)
+        restored += 1
+    logger.info("Cache snapshot: %d of %d entries restored",
+                restored, len(snapshot.get("entries", {})))
+    return restored
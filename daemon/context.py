@@ -22,7 +22,7 @@ from typing import Optional, Dict, Any
 
 from core.paths import get_paths
 from daemon.schemas import (
-    Context, ContextConfig, load_validated, save_validated,
+    Context, ContextConfig, load_validated_dump, save_validated,
 )
 
 logger = logging.getLogger("elara.context")
@@ -35,8 +35,7 @@ CONFIG_FILE = _p.context_config
 def is_enabled() -> bool:
     """Check if context tracking is enabled. Default: ON"""
     if CONFIG_FILE.exists():
-        config = load_validated(CONFIG_FILE, ContextConfig)
-        return config.enabled
+        return load_validated_dump(CONFIG_FILE, ContextConfig)["enabled"]
     return True  # Default ON
 
 
@@ -81,8 +80,7 @@ def save_context(
 
 def get_context() -> Dict[str, Any]:
     """Get saved context."""
-    model = load_validated(CONTEXT_FILE, Context)
-    return model.model_dump()
+    return load_validated_dump(CONTEXT_FILE, Context)
 
 
 def get_gap_seconds() -> Optional[int]:
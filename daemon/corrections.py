@@ -30,8 +30,9 @@ except ImportError:
     CHROMA_AVAILABLE = False
 
 from core.paths import get_paths
+from daemon.cache import cache, CacheKeys, cache_ttl
 from daemon.events import bus, Events
-from daemon.schemas import Correction, load_validated_list, save_validated_list
+from daemon.schemas import Correction, load_validated_list_dump, save_validated_list
 
 logger = logging.getLogger("elara.corrections")
 
@@ -46,13 +47,21 @@ MAX_CORRECTIONS = 50
 # ============================================================================
 
 def _load() -> List[Dict]:
-    models = load_validated_list(CORRECTIONS_FILE, Correction)
-    return [m.model_dump() for m in models]
+    return load_validated_list_dump(CORRECTIONS_FILE, Correction)
 
 
 def _save(corrections: List[Dict]):
     models = [Correction.model_validate(c) for c in corrections]
     save_validated_list(CORRECTIONS_FILE, models)
+    cache.invalidate(CacheKeys.CORRECTION_INDEX)
+
+
+def _load_readonly() -> List[Dict]:
+    """Corrections for read-only paths. Layer 0 cached (copies are returned)."""
+    cached = cache.get_or_compute(
+        CacheKeys.CORRECTION_INDEX, cache_ttl(CacheKeys.CORRECTION_INDEX), _load,
+    )
+    return [dict(c) for c in cached]
 
 
 # ============================================================================
@@ -210,13 +219,13 @@ def add_correction(
 
 def list_corrections(n: int = 20) -> List[Dict]:
     """Get recent corrections."""
-    corrections = _load()
+    corrections = _load_readonly()
     return corrections[-n:]
 
 
 def search_corrections(keyword: str) -> List[Dict]:
     """Simple keyword search through corrections."""
-    corrections = _load()
+    corrections = _load_readonly()
     keyword_lower = keyword.lower()
     return [
         c for c in corrections
@@ -361,7 +370,7 @@ def boot_corrections(n: int = 10) -> str:
     Get corrections for boot loading. Short format.
     Tendencies always show. Technical only if recently active.
     """
-    corrections = _load()
+    corrections = _load_readonly()
 
     # Always show tendencies (behavioral habits)
     tendencies = [c for c in corrections if c.get("correction_type") != "technical"]
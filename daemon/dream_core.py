@@ -15,7 +15,8 @@ from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any
 
 from core.paths import get_paths
-from daemon.schemas import DreamStatus, load_validated, save_validated
+from daemon.cache import cache, CacheKeys, cache_ttl
+from daemon.schemas import DreamStatus, load_validated_dump, save_validated
 
 logger = logging.getLogger("elara.dream_core")
 
@@ -36,10 +37,12 @@ def _ensure_dirs():
 
 
 def _load_status() -> dict:
-    """Load dream status (last run timestamps)."""
-    logger.debug("Loading dream status from %s", DREAM_STATUS_FILE)
-    model = load_validated(DREAM_STATUS_FILE, DreamStatus)
-    return model.model_dump()
+    """Load dream status (last run timestamps). Layer 0 cached."""
+    status = cache.get_or_compute(
+        CacheKeys.DREAM_STATUS, cache_ttl(CacheKeys.DREAM_STATUS),
+        lambda: load_validated_dump(DREAM_STATUS_FILE, DreamStatus),
+    )
+    return dict(status)
 
 
 def _save_status(status: dict):
@@ -48,6 +51,7 @@ def _save_status(status: dict):
     logger.debug("Saving dream status to %s", DREAM_STATUS_FILE)
     model = DreamStatus.model_validate(status)
     save_validated(DREAM_STATUS_FILE, model)
+    cache.invalidate(CacheKeys.DREAM_STATUS)
 
 
 # ============================================================================
@@ -0,0 +1,259 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Elara Event Journal — the event bus across processes.
+
+The MCP server, Overwatch and the overnight brain each have their own
+`daemon.events.bus` and `daemon.cache.cache`, so an event emitted in one
+never reached the others and caches leaned on short TTLs. The journal is
+a shared SQLite table (WAL mode, so readers never block the writer):
+
+    publish — a queued subscriber appends every shared event emitted in
+              this process, tagged with this process's origin id
+    tail    — a background thread polls for rows from other origins and
+              re-emits them locally with `origin` set
+
+Relayed events only reach subscribers registered with remote=True (cache
+invalidation, reactive processors). Side-effecting handlers such as the
+Layer 1 bridge or the continuity chain stay local, so nothing is signed
+or persisted twice, and relayed events are never journaled again.
+
+Rows older than RETENTION_SECONDS are pruned by whichever process tails.
+Set ELARA_EVENT_JOURNAL=0 to keep every process's bus local.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from core.paths import get_paths
+from daemon.events import Delivery, Event, EventBus, Events
+
+logger = logging.getLogger("elara.event_journal")
+
+POLL_INTERVAL = float(os.environ.get("ELARA_EVENT_JOURNAL_POLL", "0.5"))
+RETENTION_SECONDS = 3600
+PRUNE_EVERY_SECONDS = 300
+BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts REAL NOT NULL,
+    origin TEXT NOT NULL,
+    type TEXT NOT NULL,
+    data TEXT NOT NULL,
+    source TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_events_ts ON events(ts);
+"""
+
+
+def shared_event_types() -> List[str]:
+    """Events worth relaying: everything that invalidates a cache entry."""
+    from daemon.cache import _build_invalidation_map
+    types = list(_build_invalidation_map())
+    for extra in (Events.BRAIN_THINKING_COMPLETED, Events.EPISODE_NOTE_ADDED):
+        if extra not in types:
+            types.append(extra)
+    return types
+
+
+class EventJournal:
+    """One process's link to the shared event journal."""
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        event_types: Optional[Iterable[str]] = None,
+        poll_interval: float = POLL_INTERVAL,
+    ):
+        self._db_path = Path(db_path) if db_path else get_paths().event_journal
+        self.event_types = list(event_types) if event_types is not None else shared_event_types()
+        self.poll_interval = poll_interval
+        self.origin = uuid.uuid4().hex[:12]
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._bus: Optional[EventBus] = None
+        self._last_id = 0
+        self._last_prune = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {"published": 0, "received": 0, "errors": 0, "pruned": 0}
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False, timeout=5.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        return self._conn
+
+    def attach(self, bus: EventBus, tail: bool = True) -> "EventJournal":
+        """Publish this bus's shared events and (optionally) start tailing."""
+        self._bus = bus
+        with self._lock:
+            row = self._db().execute("SELECT MAX(id) FROM events").fetchone()
+            self._last_id = row[0] or 0  # only events from now on
+        for event_type in self.event_types:
+            bus.on(event_type, self.publish, priority=-100, source="event_journal",
+                   delivery=Delivery.QUEUED, coalesce=True)
+        if tail:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._tail, name="event-journal", daemon=True)
+            self._thread.start()
+        logger.info("Event journal attached (origin %s, %d event types)",
+                    self.origin, len(self.event_types))
+        return self
+
+    def detach(self, timeout: float = 2.0):
+        """Flush pending publishes, stop tailing, unsubscribe and close."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._bus is not None:
+            self._bus.drain(timeout)
+            for event_type in self.event_types:
+                self._bus.off(event_type, self.publish)
+            self._bus = None
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------
+    # Publish / tail
+    # ------------------------------------------------------------------
+
+    def publish(self, event: Event):
+        """Append a locally emitted event (relayed ones are never re-published)."""
+        if event.origin is not None:
+            return
+        try:
+            data = json.dumps(event.data, default=str)
+            with self._lock:
+                conn = self._db()
+                conn.execute(
+                    "INSERT INTO events (ts, origin, type, data, source) VALUES (?, ?, ?, ?, ?)",
+                    (time.time(), self.origin, event.type, data, event.source),
+                )
+                conn.commit()
+            self._stats["published"] += 1
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self._stats["errors"] += 1
+            logger.warning("Event journal publish failed for %s: %s", event.type, e)
+
+    def poll(self) -> int:
+        """Re-emit events other processes journaled since the last poll."""
+        if self._bus is None:
+            return 0
+        with self._lock:
+            rows = self._db().execute(
+                "SELECT id, origin, type, data, source FROM events WHERE id > ? ORDER BY id LIMIT ?",
+                (self._last_id, BATCH_SIZE),
+            ).fetchall()
+        relayed = 0
+        for row_id, origin, event_type, data, source in rows:
+            self._last_id = row_id
+            if origin == self.origin:
+                continue
+            try:
+                self._bus.emit(event_type, json.loads(data), source=source, origin=origin)
+                relayed += 1
+            except Exception as e:
+                self._stats["errors"] += 1
+                logger.warning("Event journal relay failed for %s: %s", event_type, e)
+        self._stats["received"] += relayed
+        return relayed
+
+    def prune(self, older_than: float = RETENTION_SECONDS) -> int:
+        """Drop journaled events older than `older_than` seconds."""
+        with self._lock:
+            conn = self._db()
+            cur = conn.execute("DELETE FROM events WHERE ts < ?", (time.time() - older_than,))
+            conn.commit()
+        self._stats["pruned"] += cur.rowcount
+        return cur.rowcount
+
+    def _tail(self):
+        while not self._stop.is_set():
+            try:
+                self.poll()
+                if time.monotonic() - self._last_prune >= PRUNE_EVERY_SECONDS:
+                    self._last_prune = time.monotonic()
+                    self.prune()
+            except sqlite3.Error as e:
+                self._stats["errors"] += 1
+                logger.debug("Event journal poll error: %s", e)
+            self._stop.wait(self.poll_interval)
+
+    def stats(self) -> Dict[str, Any]:
+        return dict(self._stats, origin=self.origin, last_id=self._last_id,
+                    tailing=self._thread is not None)
+
+
+# ---------------------------------------------------------------------------
+# Process-wide setup
+# ---------------------------------------------------------------------------
+
+_journal: Optional[EventJournal] = None
+
+
+def get_journal() -> Optional[EventJournal]:
+    return _journal
+
+
+def setup_event_journal(bus: Optional[EventBus] = None) -> Optional[EventJournal]:
+    """Attach this process's bus to the shared journal (once per process).
+
+    If setup_cache_invalidation() already wired this bus (MCP server),
+    cache entries covered by invalidating events get their longer
+    COHERENT_CACHE_TTLS from here on. Processes without remote cache
+    subscribers (Overwatch, overnight) only publish and keep the short
+    TTLs. Returns None when disabled or when the journal can't be opened
+    (the bus then stays process-local).
+    """
+    global _journal
+    if _journal is not None:
+        return _journal
+    if os.environ.get("ELARA_EVENT_JOURNAL", "1") == "0":
+        return None
+
+    from daemon.cache import invalidation_relayed, set_coherent
+    from daemon.events import bus as default_bus
+
+    bus = bus or default_bus
+    try:
+        _journal = EventJournal().attach(bus)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Event journal unavailable: %s", e)
+        return None
+    set_coherent(invalidation_relayed(bus))
+    return _journal
+
+
+def teardown_event_journal():
+    """Detach the process-wide journal. For testing and shutdown."""
+    global _journal
+    from daemon.cache import set_coherent
+
+    if _journal is not None:
+        _journal.detach()
+        _journal = None
+    set_coherent(False)
@@ -16,9 +16,14 @@ They emit/subscribe to events:
 
 Core design:
 - Dual dispatch: sync handlers called inline, async handlers scheduled
+- Queued delivery: slow sync handlers get their own bounded queue and
+  worker thread (per-subscriber order kept, drops counted)
+- Coalescing: opted-in subscribers get one merged event per window for
+  bursty event types (COALESCE_WINDOWS)
 - Typed events with payload schemas
 - Subscriber priority ordering
-- Event history for debugging
+- Event history for debugging (fixed-size ring of compact records)
+- Per-handler wall time histograms and error counts (slowest in stats())
 - Thread-safe for concurrent tool execution
 - Recursion depth limit (max 3) as safety valve
 
@@ -42,20 +47,39 @@ Usage:
 
     # One-shot listener
     bus.once(Events.SESSION_ENDED, cleanup_handler)
+
+    # Slow handler — off the emitting thread, in order, bounded
+    bus.on(Events.MODEL_CREATED, sign_artifact, delivery=Delivery.QUEUED)
+
+    # Bursty event — first one now, the rest merged per window (event.count)
+    bus.on(Events.MEMORY_SAVED, refresh_counts, coalesce=True)
 """
 
 import asyncio
+import contextvars
 import logging
+import queue
 import threading
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Set, Union
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple, Union
 
 logger = logging.getLogger("elara.events")
 
 # Recursion safety — max emit depth before refusing
 _MAX_EMIT_DEPTH = 3
 
+# Queued delivery — events buffered per subscriber before drops start
+_DEFAULT_QUEUE_SIZE = 256
+
+# Handler wall time histogram — bucket upper bounds in ms (last bucket: above)
+_LATENCY_BUCKETS_MS = (0.1, 1.0, 10.0, 100.0, 1000.0)
+
+# Handlers listed under "slowest_handlers" in stats()
+_SLOWEST_TOP_N = 5
+
 
 # ============================================================================
 # EVENT TYPES — All known events in Elara
@@ -170,6 +194,23 @@ class Events:
     BRAIN_THINKING_COMPLETED = "brain_thinking_completed"
 
 
+class Delivery:
+    """How a sync handler is invoked."""
+    INLINE = "inline"  # on the emitting thread, before emit() returns
+    QUEUED = "queued"  # on the subscriber's own worker thread, in order
+
+
+# Coalescing windows (seconds) for bursty event types — overnight runs and
+# bulk imports emit these in the hundreds. Used by subscriptions made with
+# coalesce=True; change per bus with set_coalesce_window().
+COALESCE_WINDOWS: Dict[str, float] = {
+    Events.MOOD_CHANGED: 2.0,
+    Events.MEMORY_SAVED: 1.0,
+    Events.SEED_ADDED: 1.0,
+    Events.EPISODE_NOTE_ADDED: 1.0,
+}
+
+
 # ============================================================================
 # EVENT DATA
 # ============================================================================
@@ -181,6 +222,76 @@ class Event:
     data: Dict[str, Any]
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     source: Optional[str] = None  # module that emitted
+    origin: Optional[str] = None  # emitting process, if not this one (event journal)
+    count: int = 1  # events merged into this one (coalesced delivery)
+
+
+class EventRecord:
+    """Compact history entry (the bus keeps a ring of these)."""
+    __slots__ = ("type", "data", "timestamp", "source", "origin")
+
+    def __init__(self, event: Event):
+        self.type = event.type
+        self.data = event.data
+        self.timestamp = event.timestamp
+        self.source = event.source
+        self.origin = event.origin
+
+
+# ============================================================================
+# HANDLER TIMING
+# ============================================================================
+
+class HandlerTiming:
+    """Wall time histogram and error count for one handler (by label)."""
+    __slots__ = ("label", "delivery", "calls", "errors", "total", "max", "buckets")
+
+    def __init__(self, label: str, delivery: str = "inline"):
+        self.label = label
+        self.delivery = delivery
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(_LATENCY_BUCKETS_MS) + 1)
+
+    def record(self, seconds: float, error: bool = False):
+        ms = seconds * 1000
+        self.calls += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+        if error:
+            self.errors += 1
+        for i, bound in enumerate(_LATENCY_BUCKETS_MS):
+            if ms <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def _percentile_bound(self, pct: float) -> Optional[float]:
+        """Upper bound of the bucket holding the pct-th call (None = above all)."""
+        rank = self.calls * pct / 100
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank and n:
+                return _LATENCY_BUCKETS_MS[i] if i < len(_LATENCY_BUCKETS_MS) else None
+        return None
+
+    def summary(self) -> Dict[str, Any]:
+        labels = [f"<={b:g}ms" for b in _LATENCY_BUCKETS_MS]
+        labels.append(f">{_LATENCY_BUCKETS_MS[-1]:g}ms")
+        return {
+            "handler": self.label,
+            "delivery": self.delivery,
+            "calls": self.calls,
+            "errors": self.errors,
+            "mean_ms": round(self.total / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max, 3),
+            "p95_le_ms": self._percentile_bound(95),
+            "total_ms": round(self.total, 1),
+            "histogram": dict(zip(labels, self.buckets)),
+        }
 
 
 # ============================================================================
@@ -195,6 +306,203 @@ class Subscriber:
     once: bool = False  # auto-remove after first call
     source: Optional[str] = None  # for debugging
     is_async: bool = False  # auto-detected from callback
+    queue: Optional["SubscriberQueue"] = None  # set for Delivery.QUEUED
+    remote: bool = False  # also receive events from other processes
+    coalescer: Optional["Coalescer"] = None  # set for coalesced subscriptions
+    timing: Optional[HandlerTiming] = None  # shared by the handler's subscriptions
+
+
+# ============================================================================
+# QUEUED DELIVERY
+# ============================================================================
+
+class SubscriberQueue:
+    """
+    Bounded queue + worker thread for one queued subscriber.
+
+    Shared by every event type the callback is subscribed to, so the
+    subscriber sees events in emit order. A full queue drops the new
+    event (emit never blocks) and counts it.
+    """
+
+    def __init__(self, callback: Callable[[Event], None], label: str,
+                 maxsize: int = _DEFAULT_QUEUE_SIZE,
+                 timing: Optional[HandlerTiming] = None):
+        self.callback = callback
+        self.label = label
+        self.maxsize = maxsize
+        self.timing = timing
+        self._queue: "queue.Queue[Optional[Event]]" = queue.Queue(maxsize=maxsize)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.enqueued = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+        self.high_water = 0
+
+    def put(self, event: Event) -> bool:
+        """Enqueue without blocking. False if the event was dropped."""
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 100 == 0:
+                logger.warning(
+                    "Event queue full for %s — %d event(s) dropped",
+                    self.label, self.dropped,
+                )
+            return False
+        self.enqueued += 1
+        self.high_water = max(self.high_water, self._queue.qsize())
+        return True
+
+    def _ensure_worker(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"event-{self.label}", daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            event = self._queue.get()
+            start = time.perf_counter()
+            try:
+                if event is None:
+                    return
+                self.callback(event)
+                self.delivered += 1
+                if self.timing is not None:
+                    self.timing.record(time.perf_counter() - start)
+            except Exception as e:
+                self.errors += 1
+                if self.timing is not None:
+                    self.timing.record(time.perf_counter() - start, error=True)
+                logger.error("Event handler error: %s -> %s: %s", event.type, self.label, e)
+            finally:
+                self._queue.task_done()
+
+    def drain(self, timeout: float) -> bool:
+        """Wait until every queued event was handled. False on timeout."""
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def stop(self):
+        """Finish queued events, then end the worker."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "depth": self._queue.qsize(),
+            "capacity": self.maxsize,
+            "high_water": self.high_water,
+            "enqueued": self.enqueued,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "errors": self.errors,
+        }
+
+
+# ============================================================================
+# COALESCING
+# ============================================================================
+
+class Coalescer:
+    """
+    Merges bursts of one event type for one subscription.
+
+    The first event after a quiet period is delivered at once. Events
+    arriving within the next `window` seconds are held; when the window
+    closes, one merged event goes out carrying the latest payload and
+    `count` = number of events it stands for, and a new window opens.
+    A subscriber therefore sees at most one delivery per window, and the
+    trailing delivery always reflects the last event of the burst — unless
+    `merge(held, newer)` picks which payload the held event keeps.
+    """
+
+    def __init__(self, deliver: Callable[[Event], None], window: float, label: str,
+                 merge: Optional[Callable[[Event, Event], Event]] = None):
+        self.deliver = deliver
+        self.window = window
+        self.label = label
+        self.merge = merge
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._pending: Optional[Event] = None
+        self._pending_count = 0
+        self.received = 0
+        self.delivered = 0
+
+    def offer(self, event: Event) -> None:
+        with self._lock:
+            self.received += 1
+            if self._timer is not None:
+                if self.merge is not None and self._pending is not None:
+                    event = self.merge(self._pending, event)
+                self._pending = event
+                self._pending_count += 1
+                return
+            self._start_window()
+            self.delivered += 1
+        self.deliver(event)
+
+    def _start_window(self):
+        """Open a window (lock held)."""
+        self._timer = threading.Timer(self.window, self.flush, kwargs={"reopen": True})
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self, reopen: bool = False) -> None:
+        """Deliver the merged pending event now (if any)."""
+        with self._lock:
+            pending, count = self._pending, self._pending_count
+            self._pending, self._pending_count = None, 0
+            if self._timer is not None and not reopen:
+                self._timer.cancel()
+            self._timer = None
+            if pending is None:
+                return
+            if reopen:
+                self._start_window()  # keep rate-limiting a burst that continues
+            self.delivered += 1
+        self.deliver(Event(
+            type=pending.type,
+            data=pending.data,
+            timestamp=pending.timestamp,
+            source=pending.source,
+            origin=pending.origin,
+            count=count,
+        ))
+
+    def cancel(self) -> None:
+        """Drop the pending event and stop the window timer."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = None
+            self._pending, self._pending_count = None, 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "window": self.window,
+            "received": self.received,
+            "delivered": self.delivered,
+            "saved": self.received - self.delivered - self._pending_count,
+            "pending": self._pending_count,
+        }
 
 
 # ============================================================================
@@ -211,12 +519,17 @@ class EventBus:
 
     def __init__(self, history_size: int = 100):
         self._subscribers: Dict[str, List[Subscriber]] = {}
-        self._history: List[Event] = []
+        self._history: Deque[EventRecord] = deque(maxlen=history_size)
         self._history_size = history_size
         self._lock = threading.Lock()
         self._muted: Set[str] = set()
         self._emit_count = 0
-        self._emit_depth = 0  # recursion guard
+        # Recursion guard, per thread and per asyncio task: unrelated emits
+        # from queue workers, the journal tail and tool threads don't add up
+        self._emit_depth = contextvars.ContextVar("emit_depth", default=0)
+        self._queues: Dict[Callable, SubscriberQueue] = {}  # per queued callback
+        self._coalesce_windows: Dict[str, float] = dict(COALESCE_WINDOWS)
+        self._timings: Dict[Tuple[str, str], HandlerTiming] = {}  # by (label, delivery)
 
     def on(
         self,
@@ -224,6 +537,11 @@ class EventBus:
         callback: Callable,
         priority: int = 0,
         source: Optional[str] = None,
+        delivery: str = Delivery.INLINE,
+        queue_size: int = _DEFAULT_QUEUE_SIZE,
+        remote: bool = False,
+        coalesce: Union[bool, float] = False,
+        coalesce_merge: Optional[Callable[[Event, Event], Event]] = None,
     ) -> None:
         """
         Subscribe to an event type. Accepts both sync and async callbacks.
@@ -233,19 +551,19 @@ class EventBus:
             callback: Function called with Event when fired (sync or async)
             priority: Higher = called first (default 0)
             source: Optional label for debugging
+            delivery: Delivery.INLINE or Delivery.QUEUED (sync handlers only)
+            queue_size: Queue bound for Delivery.QUEUED
+            remote: Also receive this event when another process emitted it
+                (relayed by the event journal, see daemon/event_journal.py)
+            coalesce: Merge bursts — True uses the event type's window
+                (COALESCE_WINDOWS), a number sets the window in seconds.
+                Event types without a window are delivered one by one.
+            coalesce_merge: merge(held, newer) -> event to hold instead of
+                the newer one, for handlers that need more than the latest
+                payload of a burst
         """
-        with self._lock:
-            if event_type not in self._subscribers:
-                self._subscribers[event_type] = []
-
-            sub = Subscriber(
-                callback=callback,
-                priority=priority,
-                source=source,
-                is_async=asyncio.iscoroutinefunction(callback),
-            )
-            self._subscribers[event_type].append(sub)
-            self._subscribers[event_type].sort(key=lambda s: -s.priority)
+        self._subscribe(event_type, callback, priority, source, False, delivery, queue_size,
+                        remote, coalesce, coalesce_merge)
 
     def once(
         self,
@@ -253,19 +571,54 @@ class EventBus:
         callback: Callable,
         priority: int = 0,
         source: Optional[str] = None,
+        delivery: str = Delivery.INLINE,
+        queue_size: int = _DEFAULT_QUEUE_SIZE,
+        remote: bool = False,
+        coalesce: Union[bool, float] = False,
     ) -> None:
         """Subscribe to an event, auto-remove after first call."""
+        self._subscribe(event_type, callback, priority, source, True, delivery, queue_size,
+                        remote, coalesce)
+
+    def _subscribe(self, event_type, callback, priority, source, once, delivery, queue_size,
+                   remote, coalesce, coalesce_merge=None):
+        if delivery not in (Delivery.INLINE, Delivery.QUEUED):
+            raise ValueError(f"Unknown delivery mode: {delivery}")
+        is_async = asyncio.iscoroutinefunction(callback)
+        label = source or getattr(callback, "__name__", "handler")
         with self._lock:
             if event_type not in self._subscribers:
                 self._subscribers[event_type] = []
 
+            queued = delivery == Delivery.QUEUED and not is_async
+            timing_key = (label, Delivery.QUEUED if queued else Delivery.INLINE)
+            timing = self._timings.get(timing_key)
+            if timing is None:
+                timing = self._timings[timing_key] = HandlerTiming(label, timing_key[1])
+
+            sub_queue = None
+            if queued:
+                sub_queue = self._queues.get(callback)
+                if sub_queue is None:
+                    sub_queue = SubscriberQueue(callback, label, maxsize=queue_size, timing=timing)
+                    self._queues[callback] = sub_queue
+
             sub = Subscriber(
                 callback=callback,
                 priority=priority,
-                once=True,
+                once=once,
                 source=source,
-                is_async=asyncio.iscoroutinefunction(callback),
+                is_async=is_async,
+                queue=sub_queue,
+                remote=remote,
+                timing=timing,
             )
+            window = self._coalesce_windows.get(event_type) if coalesce is True else coalesce
+            if window and not is_async and not once:
+                sub.coalescer = Coalescer(
+                    lambda e, sub=sub: self._deliver(sub, e), float(window), label,
+                    merge=coalesce_merge,
+                )
             self._subscribers[event_type].append(sub)
             self._subscribers[event_type].sort(key=lambda s: -s.priority)
 
@@ -275,17 +628,32 @@ class EventBus:
             if event_type not in self._subscribers:
                 return False
             before = len(self._subscribers[event_type])
-            self._subscribers[event_type] = [
-                s for s in self._subscribers[event_type]
-                if s.callback is not callback
-            ]
-            return len(self._subscribers[event_type]) < before
+            kept = []
+            for s in self._subscribers[event_type]:
+                if s.callback is not callback:
+                    kept.append(s)
+                elif s.coalescer is not None:
+                    s.coalescer.cancel()
+            self._subscribers[event_type] = kept
+            removed = len(kept) < before
+            if removed:
+                self._release_queue(callback)
+            return removed
+
+    def _release_queue(self, callback: Callable) -> None:
+        """Stop a queued callback's worker once it has no subscriptions left (lock held)."""
+        if callback not in self._queues:
+            return
+        if any(s.callback == callback for subs in self._subscribers.values() for s in subs):
+            return
+        self._queues.pop(callback).stop()
 
     def emit(
         self,
         event_type: str,
         data: Optional[Dict[str, Any]] = None,
         source: Optional[str] = None,
+        origin: Optional[str] = None,
     ) -> Event:
         """
         Emit an event — backward compatible sync dispatch.
@@ -298,6 +666,8 @@ class EventBus:
             event_type: Event type (use Events.* constants)
             data: Event payload dict
             source: Module name that emitted this event
+            origin: Emitting process when relaying a remote event (only
+                subscribers registered with remote=True receive it)
 
         Returns:
             The Event object that was dispatched
@@ -306,33 +676,35 @@ class EventBus:
             type=event_type,
             data=data or {},
             source=source,
+            origin=origin,
         )
 
         # Recursion guard
-        self._emit_depth += 1
-        if self._emit_depth > _MAX_EMIT_DEPTH:
+        depth = self._emit_depth.get() + 1
+        if depth > _MAX_EMIT_DEPTH:
             logger.warning(
                 "Event recursion depth %d exceeded for %s — skipping",
-                self._emit_depth, event_type,
+                depth, event_type,
             )
-            self._emit_depth -= 1
             return event
+        token = self._emit_depth.set(depth)
 
         try:
             with self._lock:
                 self._emit_count += 1
 
                 # Record in history
-                self._history.append(event)
-                if len(self._history) > self._history_size:
-                    self._history = self._history[-self._history_size:]
+                self._history.append(EventRecord(event))
 
                 # Skip if muted
                 if event_type in self._muted:
                     return event
 
                 # Get subscribers (copy to avoid mutation during iteration)
-                subs = list(self._subscribers.get(event_type, []))
+                subs = [
+                    s for s in self._subscribers.get(event_type, [])
+                    if origin is None or s.remote
+                ]
 
             # Dispatch outside lock to prevent deadlocks
             to_remove = []
@@ -350,8 +722,12 @@ class EventBus:
                                 sub.source or sub.callback.__name__,
                                 event_type,
                             )
+                    elif sub.coalescer is not None:
+                        sub.coalescer.offer(event)
+                    elif sub.queue is not None:
+                        sub.queue.put(event)
                     else:
-                        sub.callback(event)
+                        self._call(sub, event)
                 except Exception as e:
                     logger.error(
                         "Event handler error: %s -> %s: %s",
@@ -370,10 +746,12 @@ class EventBus:
                             self._subscribers[event_type].remove(sub)
                         except (ValueError, KeyError):
                             pass
+                        if sub.queue is not None:
+                            self._release_queue(sub.callback)
 
             return event
         finally:
-            self._emit_depth -= 1
+            self._emit_depth.reset(token)
 
     async def emit_async(
         self,
@@ -394,21 +772,19 @@ class EventBus:
         )
 
         # Recursion guard
-        self._emit_depth += 1
-        if self._emit_depth > _MAX_EMIT_DEPTH:
+        depth = self._emit_depth.get() + 1
+        if depth > _MAX_EMIT_DEPTH:
             logger.warning(
                 "Event recursion depth %d exceeded for %s — skipping",
-                self._emit_depth, event_type,
+                depth, event_type,
             )
-            self._emit_depth -= 1
             return event
+        token = self._emit_depth.set(depth)
 
         try:
             with self._lock:
                 self._emit_count += 1
-                self._history.append(event)
-                if len(self._history) > self._history_size:
-                    self._history = self._history[-self._history_size:]
+                self._history.append(EventRecord(event))
                 if event_type in self._muted:
                     return event
                 subs = list(self._subscribers.get(event_type, []))
@@ -417,9 +793,19 @@ class EventBus:
             for sub in subs:
                 try:
                     if sub.is_async:
-                        await sub.callback(event)
+                        start = time.perf_counter()
+                        try:
+                            await sub.callback(event)
+                        except Exception:
+                            sub.timing.record(time.perf_counter() - start, error=True)
+                            raise
+                        sub.timing.record(time.perf_counter() - start)
+                    elif sub.coalescer is not None:
+                        sub.coalescer.offer(event)
+                    elif sub.queue is not None:
+                        sub.queue.put(event)
                     else:
-                        sub.callback(event)
+                        self._call(sub, event)
                 except Exception as e:
                     logger.error(
                         "Event handler error: %s -> %s: %s",
@@ -437,10 +823,44 @@ class EventBus:
                             self._subscribers[event_type].remove(sub)
                         except (ValueError, KeyError):
                             pass
+                        if sub.queue is not None:
+                            self._release_queue(sub.callback)
 
             return event
         finally:
-            self._emit_depth -= 1
+            self._emit_depth.reset(token)
+
+    @staticmethod
+    def _call(sub: Subscriber, event: Event) -> None:
+        """Run a sync handler inline, recording its wall time (and error)."""
+        start = time.perf_counter()
+        try:
+            sub.callback(event)
+        except Exception:
+            sub.timing.record(time.perf_counter() - start, error=True)
+            raise
+        sub.timing.record(time.perf_counter() - start)
+
+    def _deliver(self, sub: Subscriber, event: Event) -> None:
+        """Hand a (merged) event to a sync subscriber — used by coalescers."""
+        if sub.queue is not None:
+            sub.queue.put(event)
+            return
+        try:
+            self._call(sub, event)
+        except Exception as e:
+            logger.error(
+                "Event handler error: %s -> %s: %s",
+                event.type, sub.source or sub.callback.__name__, e,
+            )
+
+    def set_coalesce_window(self, event_type: str, seconds: Optional[float]) -> None:
+        """Window for coalesce=True subscriptions made from now on (None/0 = off)."""
+        with self._lock:
+            if seconds:
+                self._coalesce_windows[event_type] = seconds
+            else:
+                self._coalesce_windows.pop(event_type, None)
 
     def mute(self, event_type: str) -> None:
         """Temporarily stop dispatching an event type."""
@@ -464,6 +884,9 @@ class EventBus:
                     "once": s.once,
                     "source": s.source,
                     "is_async": s.is_async,
+                    "delivery": Delivery.QUEUED if s.queue is not None else Delivery.INLINE,
+                    "remote": s.remote,
+                    "coalesce": s.coalescer.window if s.coalescer is not None else None,
                 }
                 for s in self._subscribers.get(event_type, [])
             ]
@@ -471,7 +894,7 @@ class EventBus:
     def history(self, event_type: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
         """Get recent event history."""
         with self._lock:
-            events = self._history
+            events = list(self._history)
             if event_type:
                 events = [e for e in events if e.type == event_type]
             return [
@@ -484,8 +907,20 @@ class EventBus:
                 for e in events[-limit:]
             ]
 
-    def stats(self) -> Dict[str, Any]:
-        """Bus statistics."""
+    def handler_stats(self) -> List[Dict[str, Any]]:
+        """Wall time histogram and errors per handler, slowest (mean) first."""
+        with self._lock:
+            timings = list(self._timings.values())
+        summaries = [t.summary() for t in timings if t.calls]
+        summaries.sort(key=lambda s: s["mean_ms"], reverse=True)
+        return summaries
+
+    def stats(self, top: int = _SLOWEST_TOP_N) -> Dict[str, Any]:
+        """Bus statistics (`top` slowest handlers, without histograms)."""
+        slowest = [
+            {k: v for k, v in h.items() if k != "histogram"}
+            for h in self.handler_stats()[:top]
+        ]
         with self._lock:
             sub_counts = {
                 k: len(v) for k, v in self._subscribers.items() if v
@@ -497,20 +932,77 @@ class EventBus:
             return {
                 "total_emitted": self._emit_count,
                 "history_size": len(self._history),
+                "handler_errors": sum(t.errors for t in self._timings.values()),
+                "slowest_handlers": slowest,
                 "subscriber_counts": sub_counts,
                 "total_subscribers": sum(sub_counts.values()),
                 "async_subscribers": async_count,
                 "muted_events": list(self._muted),
+                "queued": self._queue_stats(),
+                "coalesced": self._coalesce_stats(),
             }
 
+    def _coalescers(self) -> List[Coalescer]:
+        """Every active coalescer (lock held)."""
+        return [s.coalescer for subs in self._subscribers.values()
+                for s in subs if s.coalescer is not None]
+
+    def _coalesce_stats(self) -> Dict[str, Any]:
+        """Per coalesced subscription (lock held), plus deliveries saved overall."""
+        per_sub: Dict[str, Dict[str, Any]] = {}
+        saved = 0
+        for event_type, subs in self._subscribers.items():
+            for s in subs:
+                if s.coalescer is None:
+                    continue
+                stats = s.coalescer.stats()
+                saved += stats["saved"]
+                key, n = f"{event_type}:{s.coalescer.label}", 2
+                while key in per_sub:
+                    key, n = f"{event_type}:{s.coalescer.label}#{n}", n + 1
+                per_sub[key] = stats
+        return {"saved_deliveries": saved, "subscriptions": per_sub}
+
+    def _queue_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per queued subscriber (lock held). Duplicate labels get a #n suffix."""
+        out: Dict[str, Dict[str, Any]] = {}
+        for q in self._queues.values():
+            label, n = q.label, 2
+            while label in out:
+                label, n = f"{q.label}#{n}", n + 1
+            out[label] = q.stats()
+        return out
+
+    def flush_coalesced(self) -> None:
+        """Deliver every held (merged) event now instead of at window end."""
+        with self._lock:
+            coalescers = self._coalescers()
+        for c in coalescers:
+            c.flush()
+
+    def drain(self, timeout: float = 5.0) -> bool:
+        """Flush coalesced events, then wait for every queued subscriber
+        to catch up. False on timeout."""
+        self.flush_coalesced()
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            queues = list(self._queues.values())
+        return all(q.drain(max(0.0, deadline - time.monotonic())) for q in queues)
+
     def reset(self) -> None:
         """Clear all subscribers and history. For testing."""
         with self._lock:
+            for c in self._coalescers():
+                c.cancel()
+            for q in self._queues.values():
+                q.stop()
+            self._queues.clear()
             self._subscribers.clear()
             self._history.clear()
+            self._timings.clear()
             self._muted.clear()
             self._emit_count = 0
-            self._emit_depth = 0
+            self._coalesce_windows = dict(COALESCE_WINDOWS)
 
 
 # ============================================================================
@@ -0,0 +1,127 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Loader cache for small JSON state files.
+
+Goals, corrections, principles, handoff, presence, state, context and
+user state are re-read (and re-validated) on nearly every tool call and
+hook. load_cached() keeps each file's loaded result keyed by path and
+checks it against the file's (st_mtime_ns, st_size, st_ino) — one stat()
+per read while the file is unchanged. Atomic writes rename a new inode
+into place, so writes from other processes are always noticed; local
+writes through daemon.schemas also forget() the entry explicitly.
+
+Results are stored marshalled and every call unmarshals a fresh copy, so
+callers may mutate what they get (copy-on-read; marshal.loads is several
+times faster than json.loads, let alone pydantic validation). Results
+marshal can't encode (non-JSON types) are simply not cached.
+"""
+
+import json
+import logging
+import marshal
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("elara.file_cache")
+
+MAX_ENTRIES = 256
+MAX_FILE_BYTES = 1024 * 1024  # bigger files are read every time
+
+# (path, kind) -> ((mtime_ns, size, inode), marshalled result)
+_entries: "OrderedDict[Tuple[str, str], Tuple[Tuple[int, int, int], bytes]]" = OrderedDict()
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "uncacheable": 0}
+
+
+def fingerprint(path: Path) -> Optional[List[int]]:
+    """JSON-able generation of a source: file (mtime_ns, size), dir (newest
+    child mtime_ns, child count). None when missing."""
+    try:
+        st = path.stat()
+        if not path.is_dir():
+            return [st.st_mtime_ns, st.st_size]
+        newest, count = st.st_mtime_ns, 0
+        for child in path.iterdir():
+            newest = max(newest, child.stat().st_mtime_ns)
+            count += 1
+        return [newest, count]
+    except OSError:
+        return None
+
+
+def _generation(path: Path) -> Tuple[int, int, int]:
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def load_cached(path: Path, kind: str, load: Callable[[Path], Any]) -> Any:
+    """`load(path)`, reused while the file is unchanged.
+
+    Args:
+        path: File the result is derived from
+        kind: Distinguishes different loads of one file (e.g. schema name)
+        load: Reads and parses the file; called on a miss, or every time
+              when the file is missing (its own fallback applies)
+    """
+    try:
+        gen = _generation(path)
+    except OSError:
+        forget(path)
+        return load(path)
+
+    key = (str(path), kind)
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None and entry[0] == gen:
+            _entries.move_to_end(key)
+            _stats["hits"] += 1
+            blob = entry[1]
+        else:
+            blob = None
+            _stats["misses"] += 1
+    if blob is not None:
+        return marshal.loads(blob)
+
+    result = load(path)  # stat before reading: a write mid-read reads as stale
+    if gen[1] > MAX_FILE_BYTES:
+        return result
+    try:
+        blob = marshal.dumps(result)
+    except ValueError:
+        _stats["uncacheable"] += 1
+        return result
+    with _lock:
+        _entries[key] = (gen, blob)
+        _entries.move_to_end(key)
+        while len(_entries) > MAX_ENTRIES:
+            _entries.popitem(last=False)
+    return result
+
+
+def load_json(path: Path) -> Any:
+    """Cached json.loads(path.read_text()) — raises the same errors."""
+    return load_cached(path, "json", lambda p: json.loads(p.read_text()))
+
+
+def forget(path: Path) -> None:
+    """Drop every cached load of `path` (after writing it)."""
+    name = str(path)
+    with _lock:
+        for key in [k for k in _entries if k[0] == name]:
+            del _entries[key]
+
+
+def clear() -> None:
+    with _lock:
+        _entries.clear()
+
+
+def stats() -> Dict[str, Any]:
+    with _lock:
+        return dict(_stats, entries=len(_entries))
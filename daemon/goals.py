@@ -15,8 +15,9 @@ from pathlib import Path
 from typing import Optional, List, Dict
 
 from core.paths import get_paths
+from daemon.cache import cache, CacheKeys, cache_ttl
 from daemon.events import bus, Events
-from daemon.schemas import Goal, load_validated_list, save_validated_list
+from daemon.schemas import Goal, load_validated_list_dump, save_validated_list
 
 logger = logging.getLogger("elara.goals")
 
@@ -25,14 +26,14 @@ GOALS_FILE = get_paths().goals_file
 
 def _load() -> List[Dict]:
     logger.debug("Loading goals from %s", GOALS_FILE)
-    models = load_validated_list(GOALS_FILE, Goal)
-    return [m.model_dump() for m in models]
+    return load_validated_list_dump(GOALS_FILE, Goal)
 
 
 def _save(goals: List[Dict]):
     logger.debug("Saving %d goals to %s", len(goals), GOALS_FILE)
     models = [Goal.model_validate(g) for g in goals]
     save_validated_list(GOALS_FILE, models)
+    cache.invalidate(CacheKeys.GOAL_LIST)
 
 
 def _next_id(goals: List[Dict]) -> int:
@@ -133,7 +134,9 @@ def list_goals(
     status: Optional[str] = None,
     project: Optional[str] = None,
 ) -> List[Dict]:
-    goals = _load()
+    """Goals, optionally filtered. Layer 0 cached (copies are returned)."""
+    cached = cache.get_or_compute(CacheKeys.GOAL_LIST, cache_ttl(CacheKeys.GOAL_LIST), _load)
+    goals = [dict(g) for g in cached]
     if status:
         goals = [g for g in goals if g["status"] == status]
     if project:
@@ -21,7 +21,7 @@ from typing import List, Dict, Any, Optional
 
 from core.paths import get_paths
 from daemon.events import bus, Events
-from daemon.schemas import Handoff, load_validated, save_validated
+from daemon.schemas import Handoff, load_validated_dump, save_validated
 
 logger = logging.getLogger("elara.handoff")
 
@@ -69,8 +69,7 @@ def load_handoff() -> Optional[dict]:
         logger.debug("No handoff file at %s", HANDOFF_PATH)
         return None
     try:
-        handoff = load_validated(HANDOFF_PATH, Handoff)
-        return handoff.model_dump()
+        return load_validated_dump(HANDOFF_PATH, Handoff)
     except Exception as e:
         logger.error("Failed to load handoff from %s: %s", HANDOFF_PATH, e)
         return None
@@ -0,0 +1,222 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Overwatch injection channel — acknowledged delivery over a Unix socket.
+
+Replaces the inject-file handoff (temp file + rename, hook polls and
+deletes), where a new injection could land while the hook was still
+reading the previous one. Overwatch keeps at most one pending injection
+per session in memory; the hook fetches and acknowledges it:
+
+    hook -> {"op": "fetch", "session_id": "..."}
+    hook <- {"id": 7, "content": "..."}          (id null: nothing pending)
+    hook -> {"op": "ack", "id": 7}
+    hook <- {"ok": true}                         (false: superseded meanwhile)
+
+The injection is removed only by its ack, and the hook prints only after
+an ok, so each injection is consumed exactly once. A newer injection for
+the same session replaces an unacked older one; acking the older id then
+fails and the hook fetches again.
+
+This module is imported by the hook, so it stays stdlib-only.
+
+CLI (for shell hooks): run the file itself, not `-m daemon.inject_channel`,
+so the daemon package (presence, state, events, pydantic) is never
+imported on the prompt path. -I keeps daemon/ off sys.path:
+    python3 -I daemon/inject_channel.py fetch <session_id> <socket_path>
+"""
+
+import itertools
+import json
+import logging
+import os
+import socket
+import socketserver
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger("elara.inject_channel")
+
+CLIENT_TIMEOUT = 0.5   # seconds — the hook must never stall a prompt
+FETCH_ATTEMPTS = 3     # re-fetch when an ack loses to a newer injection
+
+
+def default_socket_path() -> Path:
+    from core.paths import get_paths
+    return get_paths().overwatch_socket
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    timeout = 2.0
+
+    def handle(self):
+        try:
+            for raw in self.rfile:
+                try:
+                    msg = json.loads(raw)
+                except ValueError:
+                    return
+                reply = self.server.channel.handle(msg)
+                self.wfile.write((json.dumps(reply) + "\n").encode())
+        except OSError:
+            pass  # client went away or timed out — unacked work stays pending
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class InjectionChannel:
+    """Per-session pending injections served to hooks over a Unix socket."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._pending: Dict[str, Tuple[int, str]] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._server: Optional[_Server] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {"queued": 0, "superseded": 0, "fetched": 0, "acked": 0, "stale_acks": 0}
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Bind the socket (owner-only) and serve on a daemon thread."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self.path.unlink()  # left behind by a crashed daemon
+        except FileNotFoundError:
+            pass
+        self._server = _Server(str(self.path), _Handler)
+        self._server.channel = self
+        os.chmod(self.path, 0o600)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="overwatch-inject-channel", daemon=True,
+        )
+        self._thread.start()
+
+    def close(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    # ------------------------------------------------------------------
+    # Producer side (Overwatch)
+    # ------------------------------------------------------------------
+
+    def put(self, session_id: str, content: str) -> int:
+        """Queue an injection for a session, replacing any unacked one."""
+        with self._lock:
+            if session_id in self._pending:
+                self._stats["superseded"] += 1
+            inject_id = next(self._ids)
+            self._pending[session_id] = (inject_id, content)
+            self._stats["queued"] += 1
+            return inject_id
+
+    def discard(self, session_id: str):
+        with self._lock:
+            self._pending.pop(session_id, None)
+
+    def pending(self, session_id: str) -> Optional[str]:
+        with self._lock:
+            entry = self._pending.get(session_id)
+            return entry[1] if entry else None
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, pending=len(self._pending))
+
+    # ------------------------------------------------------------------
+    # Protocol
+    # ------------------------------------------------------------------
+
+    def handle(self, msg: Dict[str, Any]) -> Dict[str, Any]:
+        op = msg.get("op")
+        with self._lock:
+            if op == "fetch":
+                entry = self._pending.get(msg.get("session_id", ""))
+                if entry is None:
+                    return {"id": None}
+                self._stats["fetched"] += 1
+                return {"id": entry[0], "content": entry[1]}
+
+            if op == "ack":
+                inject_id = msg.get("id")
+                for session_id, (pending_id, _) in self._pending.items():
+                    if pending_id == inject_id:
+                        del self._pending[session_id]
+                        self._stats["acked"] += 1
+                        return {"ok": True}
+                self._stats["stale_acks"] += 1
+                return {"ok": False}
+
+        return {"error": f"unknown op {op!r}"}
+
+
+def fetch_injection(
+    session_id: str, path: Optional[Path] = None, timeout: float = CLIENT_TIMEOUT,
+) -> Optional[str]:
+    """
+    Fetch and acknowledge this session's pending injection.
+
+    Returns the content ("" when nothing is pending), or None when no
+    daemon is listening — callers then fall back to the inject files.
+    """
+    path = Path(path) if path is not None else default_socket_path()
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        sock.connect(str(path))
+    except OSError:
+        return None
+
+    try:
+        stream = sock.makefile("rwb")
+
+        def call(msg: Dict[str, Any]) -> Dict[str, Any]:
+            stream.write((json.dumps(msg) + "\n").encode())
+            stream.flush()
+            line = stream.readline()
+            if not line:
+                raise OSError("channel closed")
+            return json.loads(line)
+
+        for _ in range(FETCH_ATTEMPTS):
+            reply = call({"op": "fetch", "session_id": session_id})
+            if reply.get("id") is None:
+                return ""
+            if call({"op": "ack", "id": reply["id"]}).get("ok"):
+                return reply.get("content", "")
+        return ""
+    except (OSError, ValueError):
+        return ""  # daemon is up; unacked injection stays pending for next time
+    finally:
+        sock.close()
+
+
+def main():
+    if len(sys.argv) not in (3, 4) or sys.argv[1] != "fetch":
+        print("Usage: inject_channel.py fetch <session_id> [socket_path]", file=sys.stderr)
+        sys.exit(2)
+    path = Path(sys.argv[3]) if len(sys.argv) == 4 else None
+    content = fetch_injection(sys.argv[2], path)
+    if content is None:
+        sys.exit(1)  # no daemon listening
+    if content:
+        print(content)
+
+
+if __name__ == "__main__":
+    main()
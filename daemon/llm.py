@@ -336,6 +336,58 @@ def judge_relevance(
     return None
 
 
+def judge_relevance_batch(
+    current_text: str,
+    candidates: List[str],
+    model: str = DEFAULT_MODEL,
+    timeout: int = 45,
+) -> Optional[List[Optional[Dict[str, Any]]]]:
+    """
+    Judge several historical cross-references in one prompt.
+
+    Returns a list aligned with candidates; each entry is a judge_relevance()
+    style dict ({relevant, reason, importance}) or None if the model skipped
+    that candidate. Returns None if unavailable or the reply isn't parseable.
+    """
+    if not candidates:
+        return []
+    listing = "\n".join(
+        f"{i}. \"{text[:200]}\"" for i, text in enumerate(candidates, 1)
+    )
+    prompt = (
+        f"Current: \"{current_text[:200]}\"\n\n"
+        f"Old contexts:\n{listing}\n\n"
+        "For each old context: is it useful for the current discussion? "
+        "Answer with a JSON array only, one object per old context: "
+        "[{\"id\": 1, \"relevant\": true/false, \"reason\": \"...\", \"importance\": 0.0-1.0}, ...]"
+    )
+    result = query(
+        prompt, model=model, temperature=0.1,
+        max_tokens=48 + 64 * len(candidates), timeout=timeout,
+    )
+    if not result:
+        return None
+
+    start, end = result.find("["), result.rfind("]")
+    if start < 0 or end <= start:
+        return None
+    try:
+        items = json.loads(result[start:end + 1])
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(items, list):
+        return None
+
+    verdicts: List[Optional[Dict[str, Any]]] = [None] * len(candidates)
+    for pos, item in enumerate(items):
+        if not isinstance(item, dict):
+            continue
+        idx = item.get("id", pos + 1)
+        if isinstance(idx, int) and 1 <= idx <= len(candidates):
+            verdicts[idx - 1] = item
+    return verdicts
+
+
 def status() -> Dict[str, Any]:
     """Get Ollama status info."""
     available = is_available()
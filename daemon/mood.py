@@ -22,7 +22,7 @@ from daemon.state_core import (
     TEMPERAMENT, MOOD_JOURNAL_FILE, IMPRINT_ARCHIVE_FILE,
 )
 from daemon.events import bus, Events
-from daemon.cache import cache, CacheKeys, CACHE_TTLS
+from daemon.cache import cache, CacheKeys, cache_ttl
 
 
 logger = logging.getLogger("elara.mood")
@@ -36,7 +36,7 @@ def get_mood() -> dict:
     state = _apply_time_decay(state)
     _save_state(state)
     mood = state["mood"]
-    cache.set(CacheKeys.MOOD_STATE, mood, CACHE_TTLS[CacheKeys.MOOD_STATE])
+    cache.set(CacheKeys.MOOD_STATE, mood, cache_ttl(CacheKeys.MOOD_STATE))
     return mood
 
 
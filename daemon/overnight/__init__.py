@@ -134,9 +134,18 @@ class OvernightRunner:
         self._setup_signals()
         self._write_pid()
 
+        # Tonight's goal/dream/brain events reach the daemons' caches
+        from daemon.event_journal import setup_event_journal, teardown_event_journal
+        setup_event_journal()
+        # Long-lived enough for the CPU lane to pay off
+        from daemon.workers import init_workers, shutdown_workers
+        init_workers()
+
         try:
             return self._run_inner()
         finally:
+            shutdown_workers()
+            teardown_event_journal()
             self._cleanup_pid()
 
     def _run_inner(self) -> dict:
@@ -237,6 +246,22 @@ class OvernightRunner:
             except Exception as e:
                 logger.warning("Memory consolidation failed: %s", e)
 
+        # Conversation summary tier — compress old sessions, archive raw text
+        if self.config.get("enable_conversation_summary", True):
+            try:
+                from memory.conversations import compress_old_conversations
+                summary_result = compress_old_conversations(
+                    days=self.config.get("conversation_summary_days", 90),
+                    use_llm=self.config.get("conversation_summary_llm", False),
+                )
+                cognition_summary["conversations_summarized"] = summary_result.get("sessions", 0)
+                cognition_summary["conversation_exchanges_archived"] = summary_result.get("exchanges_archived", 0)
+                logger.info("Conversation summary tier: sessions=%d, exchanges archived=%d",
+                            summary_result.get("sessions", 0),
+                            summary_result.get("exchanges_archived", 0))
+            except Exception as e:
+                logger.warning("Conversation summary tier failed: %s", e)
+
         # Write outputs
         if all_rounds:
             findings_mode = "mixed" if self.mode == "auto" and self.queue else self.mode
@@ -255,6 +280,13 @@ class OvernightRunner:
             except Exception as e:
                 logger.warning("Morning brief failed: %s", e)
 
+        # Materialize the boot bundle with tonight's state
+        try:
+            from daemon.boot_bundle import materialize
+            materialize("overnight")
+        except Exception as e:
+            logger.warning("Boot bundle failed: %s", e)
+
         status = "completed" if not self.stop_event.is_set() else "stopped"
         write_meta(
             self.started, self.config, self.mode,
@@ -39,6 +39,10 @@ DEFAULT_CONFIG = {
     "enable_3d_cognition": True,
     # Memory Consolidation
     "enable_consolidation": True,
+    # Conversation summary tier
+    "enable_conversation_summary": True,
+    "conversation_summary_days": 90,
+    "conversation_summary_llm": False,
     # Creative Drift
     "enable_drift": True,
     "drift_temperature": 0.95,
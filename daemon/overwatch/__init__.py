@@ -5,45 +5,128 @@
 """
 Elara Overwatch — Live Memory Daemon
 
-Tails the active Claude Code session JSONL in real-time,
+Tails the active Claude Code session JSONLs in real-time,
 searches ALL conversation history in ChromaDB for cross-references,
-and injects relevant context via a hook file.
+and injects relevant context via a per-session hook file.
 
 Split into mixins:
 - ParserMixin (parser.py) — text extraction, JSONL reading, exchange parsing
 - SearchMixin (search.py) — history search, events, LLM filtering, injection
 - IngestMixin (ingest.py) — micro-ingestion, triage, synthesis
 - SnapshotMixin (snapshot.py) — session snapshots for boot continuity
+- IdleMixin (idle.py) — pre-embedding and index warming while nothing arrives
+
+One Overwatch instance tails one session. SessionHub (sessions.py) runs
+up to MAX_SESSIONS of them in one process; they share OverwatchShared
+(conversation store, verdict cache, LLM judge worker, embeddings, and
+the injection socket from inject_channel.py).
+File watching lives in watcher.py (inotify, with polling as the fallback).
+With PIPELINE_ENABLED each session only tails; parsing, search, LLM
+judging, injection and micro-ingest run as stages in pipeline.py.
 """
 
 import os
+import sys
 import json
 import time
 import signal
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
 from memory.conversations import get_conversations, ConversationMemory
 from daemon.overwatch.config import (
-    PROJECTS_DIR, PID_PATH, INJECT_PATH, SESSION_STATE_PATH,
-    POLL_INTERVAL, HEARTBEAT_TIMEOUT, log,
+    PID_PATH, STATUS_PATH, INJECT_PATH, INJECT_TMP_PATH, INJECT_SOCKET_PATH, SESSION_STATE_PATH,
+    INJECT_SOCKET_ENABLED, PIPELINE_ENABLED, session_inject_path, log,
 )
+from daemon.inject_channel import InjectionChannel
 from daemon.overwatch.parser import ParserMixin
 from daemon.overwatch.search import SearchMixin
 from daemon.overwatch.ingest import IngestMixin
 from daemon.overwatch.snapshot import SnapshotMixin
+from daemon.overwatch.idle import IdleMixin
+from daemon.overwatch.pipeline import OverwatchPipeline
+from daemon.overwatch.latency import LatencyTracker, mark, format_status
+from daemon.overwatch.sessions import SessionHub
 
 
-class Overwatch(ParserMixin, SearchMixin, IngestMixin, SnapshotMixin):
+class OverwatchShared:
+    """Stores, caches and model workers shared by every session in one process."""
+
     def __init__(self):
         self.conv: ConversationMemory = get_conversations()
+
+        # Batched LLM relevance judging — one judge worker for all sessions
+        self.verdict_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self.verdict_lock = threading.Lock()
+        self.judge_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="overwatch-judge")
+        self.judge_inflight = threading.Event()  # set while the judge worker runs a batch
+        self.judge_stats: Dict[str, int] = {
+            "batches": 0, "candidates_judged": 0, "cache_hits": 0, "timeouts": 0, "fallbacks": 0,
+            "busy": 0,
+        }
+
+        # Embed-once: one vector per exchange, shared by search/ingest/synthesis
+        self.embed_lock = threading.Lock()
+        self.query_embedding_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self.embed_stats: Dict[str, int] = {"computed": 0, "reused": 0}
+
+        # Write-to-inject stage latencies across all sessions
+        self.latency = LatencyTracker()
+
+        # Acked injection delivery to hooks (None: inject files)
+        self.channel: Optional[InjectionChannel] = None
+
+    def open_channel(self):
+        """Serve injections on INJECT_SOCKET_PATH; stay on inject files if binding fails."""
+        if not INJECT_SOCKET_ENABLED:
+            return
+        channel = InjectionChannel(INJECT_SOCKET_PATH)
+        try:
+            channel.start()
+        except OSError as e:
+            log.warning(f"Injection socket unavailable ({e}), using inject files")
+            return
+        self.channel = channel
+        log.info(f"Serving injections on {INJECT_SOCKET_PATH}")
+
+    def close(self):
+        if self.channel is not None:
+            log.info(f"Injection channel: {self.channel.stats()}")
+            self.channel.close()
+            self.channel = None
+        self.judge_executor.shutdown(wait=False)
+        log.info(f"Embeddings: {self.embed_stats['computed']} computed, {self.embed_stats['reused']} avoided")
+
+
+class Overwatch(ParserMixin, SearchMixin, IngestMixin, SnapshotMixin, IdleMixin):
+    def __init__(self, shared: Optional[OverwatchShared] = None):
+        self.shared = shared if shared is not None else OverwatchShared()
+        self.conv: ConversationMemory = self.shared.conv
         self.last_position: int = 0
+        self.last_write_time: float = 0.0
         self.current_session_id: str = ""
         self.current_jsonl: Optional[Path] = None
+        self.inject_path: Path = INJECT_PATH
+        self.inject_tmp_path: Path = INJECT_TMP_PATH
         self.cooldowns: Dict[str, float] = {}
+
+        # Shared across sessions (see OverwatchShared)
+        self._verdict_cache = self.shared.verdict_cache
+        self._verdict_lock = self.shared.verdict_lock
+        self._judge_executor = self.shared.judge_executor
+        self._judge_inflight = self.shared.judge_inflight
+        self.judge_stats = self.shared.judge_stats
+        self._embed_lock = self.shared.embed_lock
+        self._query_embedding_cache = self.shared.query_embedding_cache
+        self.embed_stats = self.shared.embed_stats
+        self.latency = self.shared.latency
+
         self.prev_user_text: str = ""
-        self.running: bool = True
         self.injection_count: int = 0
+        self.pipeline: Optional[OverwatchPipeline] = None
 
         # Priority integration
         self.session_state: Dict[str, Any] = self._load_session_state()
@@ -63,21 +146,8 @@ class Overwatch(ParserMixin, SearchMixin, IngestMixin, SnapshotMixin):
         self.last_snapshot_time: float = 0
         self.recent_exchanges: List[Dict[str, str]] = []
 
-    def find_active_session(self) -> Optional[Path]:
-        """Find the most recently modified JSONL file — that's the active session."""
-        if not PROJECTS_DIR.exists():
-            return None
-        newest = None
-        newest_mtime = 0
-        for project_dir in PROJECTS_DIR.iterdir():
-            if not project_dir.is_dir() or project_dir.name.startswith("."):
-                continue
-            for jsonl_file in project_dir.glob("*.jsonl"):
-                mtime = jsonl_file.stat().st_mtime
-                if mtime > newest_mtime:
-                    newest = jsonl_file
-                    newest_mtime = mtime
-        return newest
+        # Idle work: exchange_counter at the last index warm
+        self._warmed_at: int = -1
 
     def _load_session_state(self) -> Dict[str, Any]:
         if SESSION_STATE_PATH.exists():
@@ -87,28 +157,47 @@ class Overwatch(ParserMixin, SearchMixin, IngestMixin, SnapshotMixin):
                 return {}
         return {}
 
-    def _process_exchange(self, exchange: Dict[str, str]):
-        """Core logic: process one new exchange."""
+    def _process_exchange(self, exchange: Dict[str, str], marks: Optional[Dict[str, float]] = None):
+        """Core logic: process one new exchange (marks: latency marks so far)."""
+        marks = marks if marks is not None else {}
         combined = exchange["user_text"] + " " + exchange["assistant_text"]
 
-        # 1. Search history for cross-references
-        results = self._search_history(combined, threshold=0.65)
-
-        # 2. Detect events
+        # 1. Search history for cross-references, and event-triggered searches
+        candidates = self._history_candidates(
+            combined, threshold=0.65, embedding=self._exchange_embedding(exchange),
+        )
         events = self._detect_events(exchange)
-        event_results = self._search_for_events(events) if events else []
+        event_groups = self._event_candidates(events) if events else []
+        self._mark(marks, "searched")
+
+        # 2. LLM relevance judging
+        results = self._judge_candidates(combined, candidates)
+        event_results = self._merge_event_results(
+            (event_type, self._judge_candidates(query, group))
+            for event_type, query, group in event_groups
+        ) if event_groups else []
+        self._mark(marks, "judged")
 
         # 3. Inject if anything found
         if results or event_results:
             self._write_inject(results, event_results)
+            self._mark(marks, "injected")
 
         # 4. Queue for micro-ingestion + synthesis
+        self._record_exchange(exchange)
+        self._check_micro_ingest()
+
+    def _mark(self, marks: Dict[str, float], name: str):
+        mark(marks, name)
+        self.latency.record_marks(marks, name)
+
+    def _record_exchange(self, exchange: Dict[str, str]):
+        """Per-session bookkeeping: index, micro-ingest queue, snapshot."""
         self.exchange_counter += 1
         exchange["exchange_index"] = self.exchange_counter
         self.pending_exchanges.append(exchange)
         self.pending_exchanges_for_synthesis.append(exchange)
         self.exchanges_since_ingest += 1
-        self._check_micro_ingest()
 
         self.prev_user_text = exchange["user_text"]
 
@@ -118,87 +207,85 @@ class Overwatch(ParserMixin, SearchMixin, IngestMixin, SnapshotMixin):
             self.recent_exchanges = self.recent_exchanges[-10:]
         self._check_snapshot()
 
-    def watch(self):
-        """Main loop — find active session, tail it, react."""
-        log.info("Overwatch starting...")
-        log.info(f"Conversations in DB: {self.conv.count()}")
-        overdue = self.session_state.get("overdue_items", [])
-        if overdue:
-            log.info(f"Session state loaded: {len(overdue)} overdue items")
-
-        while self.running:
-            try:
-                active = self.find_active_session()
-
-                if active is None:
-                    time.sleep(POLL_INTERVAL * 5)
-                    continue
-
-                # Heartbeat
-                try:
-                    mtime = active.stat().st_mtime
-                    if time.time() - mtime > HEARTBEAT_TIMEOUT:
-                        if self.recent_exchanges:
-                            self._build_snapshot()
-                        if self.pending_exchanges:
-                            self._micro_ingest()
-                        log.info(f"Session JSONL stale for {HEARTBEAT_TIMEOUT}s, exiting (orphan prevention)")
-                        break
-                except OSError:
-                    pass
-
-                # New session detected
-                if active != self.current_jsonl:
-                    if self.pending_exchanges:
-                        self._micro_ingest()
-
-                    self.current_jsonl = active
-                    self.current_session_id = active.stem
-                    self.last_position = active.stat().st_size
-                    self.cooldowns.clear()
-                    self.exchange_counter = 0
-                    self.pending_exchanges = []
-                    self.pending_exchanges_for_synthesis = []
-                    self.exchanges_since_ingest = 0
-                    self._pending_user = None
-                    self._assistant_texts = []
-                    self.last_ingest_time = time.time()
-                    self.last_snapshot_time = 0
-                    self.recent_exchanges = []
-                    self.session_state = self._load_session_state()
-                    log.info(f"Watching: {active.name} (session {self.current_session_id[:8]}...)")
-
-                # Read new lines
-                new_entries = self._read_new_lines(active)
-                if not new_entries:
-                    self._check_micro_ingest()
-                    time.sleep(POLL_INTERVAL)
-                    continue
-
-                # Parse into exchanges
-                exchanges = self._parse_exchanges(new_entries)
-                if exchanges:
-                    log.info(f"Parsed {len(exchanges)} exchange(s) from {len(new_entries)} entries")
-
-                for exchange in exchanges:
-                    self._process_exchange(exchange)
-                    log.info(f"Processed: {exchange['user_text'][:60]}...")
-
-                time.sleep(POLL_INTERVAL)
-
-            except KeyboardInterrupt:
-                break
-            except Exception as e:
-                log.error(f"Watch loop error: {e}")
-                time.sleep(POLL_INTERVAL * 2)
-
-        # Final flush
+    def _reset_session_state(self):
+        """Fresh per-session state when attaching to a JSONL."""
+        self.cooldowns.clear()
+        self.exchange_counter = 0
+        self.pending_exchanges = []
+        self.pending_exchanges_for_synthesis = []
+        self.exchanges_since_ingest = 0
+        self._pending_user = None
+        self._assistant_texts = []
+        self.last_ingest_time = time.time()
+        self.last_snapshot_time = 0
+        self.recent_exchanges = []
+        self.session_state = self._load_session_state()
+
+    def _shutdown_pipeline(self):
+        """Drain and stop pipeline workers; later state access is single-threaded."""
+        if self.pipeline is not None:
+            self.pipeline.close()
+            log.info(f"Pipeline stats [{self.current_session_id[:8]}]: {self.pipeline.stats()}")
+            self.pipeline = None
+
+    def attach(self, jsonl: Path) -> "Overwatch":
+        """Start tailing one session file from its current end."""
+        self.current_jsonl = jsonl
+        self.current_session_id = jsonl.stem
+        self.last_position = jsonl.stat().st_size
+        self.inject_path = session_inject_path(self.current_session_id)
+        self.inject_tmp_path = self.inject_path.with_suffix(".tmp")
+        self._reset_session_state()
+        if PIPELINE_ENABLED:
+            self.pipeline = OverwatchPipeline(self)
+            self.pipeline.start()
+        log.info(f"Watching: {jsonl.name} (session {self.current_session_id[:8]}...)")
+        return self
+
+    def poll(self) -> bool:
+        """Read and process lines appended since the last poll. True if any arrived."""
+        new_entries = self._read_new_lines(self.current_jsonl)
+        if not new_entries:
+            if self.pipeline is not None:
+                self.pipeline.tick()
+            else:
+                self._check_micro_ingest()
+            return False
+
+        if self.pipeline is not None:
+            self.pipeline.feed(new_entries, written=self.last_write_time)
+            return True
+
+        written = self.last_write_time
+        exchanges = self._parse_exchanges(new_entries)
+        if exchanges:
+            log.info(f"Parsed {len(exchanges)} exchange(s) from {len(new_entries)} entries")
+        for exchange in exchanges:
+            exchange["session_id"] = self.current_session_id
+            marks = {"written": written}
+            self._mark(marks, "parsed")
+            self._process_exchange(exchange, marks)
+            log.info(f"Processed: {exchange['user_text'][:60]}...")
+        return True
+
+    def detach(self):
+        """Stop tailing: drain workers, snapshot, flush micro-ingest, drop the inject file."""
+        self._shutdown_pipeline()
+        if self.recent_exchanges:
+            self._build_snapshot()
         if self.pending_exchanges:
             self._micro_ingest()
-        log.info("Overwatch stopped.")
+        if self.shared.channel is not None:
+            self.shared.channel.discard(self.current_session_id)
+        try:
+            self.inject_path.unlink()
+        except OSError:
+            pass
+        log.info(f"Stopped watching session {self.current_session_id[:8]}...")
 
-    def stop(self):
-        self.running = False
+    def busy(self) -> bool:
+        """Pipeline work in flight (idle work waits for it)."""
+        return self.pipeline is not None and self.pipeline.busy()
 
 
 def _handle_signal(signum, frame):
@@ -206,19 +293,41 @@ def _handle_signal(signum, frame):
     if _overwatch:
         _overwatch.stop()
 
-_overwatch: Optional[Overwatch] = None
+_overwatch: Optional[SessionHub] = None
+
+
+def print_stats() -> int:
+    """--stats: print the running daemon's status file."""
+    try:
+        status = json.loads(STATUS_PATH.read_text())
+    except (OSError, json.JSONDecodeError):
+        print(f"No Overwatch status at {STATUS_PATH} (not running yet?)")
+        return 1
+    print(format_status(status))
+    try:
+        os.kill(int(status.get("pid", 0)), 0)
+    except (OSError, ValueError):
+        print("\n(daemon not running — showing its last status)")
+    return 0
 
 
 def main():
     global _overwatch
+    if "--stats" in sys.argv[1:]:
+        sys.exit(print_stats())
+
     PID_PATH.write_text(str(os.getpid()))
     signal.signal(signal.SIGTERM, _handle_signal)
     signal.signal(signal.SIGINT, _handle_signal)
 
+    from daemon.event_journal import setup_event_journal, teardown_event_journal
+    setup_event_journal()
+
     try:
-        _overwatch = Overwatch()
-        _overwatch.watch()
+        _overwatch = SessionHub(OverwatchShared(), Overwatch)
+        _overwatch.run()
     finally:
+        teardown_event_journal()
         if PID_PATH.exists():
             PID_PATH.unlink()
         if INJECT_PATH.exists():
@@ -18,17 +18,38 @@ _p = get_paths()
 PROJECTS_DIR = _p.claude_projects
 INJECT_PATH = _p.overwatch_inject
 INJECT_TMP_PATH = INJECT_PATH.with_suffix(".tmp")
+INJECT_SOCKET_PATH = _p.overwatch_socket
 PID_PATH = _p.overwatch_pid
+STATUS_PATH = _p.overwatch_status
 LOG_PATH = _p.overwatch_log
 SESSION_STATE_PATH = _p.session_state
 SNAPSHOT_PATH = _p.session_snapshot
 
+
+def session_inject_path(session_id: str) -> Path:
+    """Per-session inject file — the hook reads the one matching its session_id."""
+    return INJECT_PATH.with_name(f"{INJECT_PATH.stem}-{session_id}{INJECT_PATH.suffix}")
+
+
 # Tuning
-POLL_INTERVAL = 2.0          # seconds between file checks
+POLL_INTERVAL = 2.0          # seconds between file checks (polling watcher)
+WATCH_MODE = os.environ.get("ELARA_OVERWATCH_WATCH", "auto")  # auto | inotify | poll
+WATCH_IDLE_TIMEOUT = 30.0    # inotify: max wait between housekeeping passes when idle
+PIPELINE_ENABLED = os.environ.get("ELARA_OVERWATCH_PIPELINE", "1") != "0"  # staged worker threads
+PIPELINE_QUEUE_SIZE = 4      # per-stage queue bound for search/judge/inject
+INJECT_SOCKET_ENABLED = os.environ.get("ELARA_OVERWATCH_SOCKET", "1") != "0"  # acked socket delivery (else files)
+LATENCY_WINDOW = 1000        # samples kept per stage for p50/p95/p99
+STATUS_INTERVAL = 15.0       # seconds between status file writes
+IDLE_ENABLED = os.environ.get("ELARA_OVERWATCH_IDLE", "1") != "0"  # idle-time pre-embedding/warming
+IDLE_GRACE_SECONDS = 3.0     # quiet time after the last new line before idle work starts
+MAX_SESSIONS = int(os.environ.get("ELARA_OVERWATCH_SESSIONS", "4"))  # concurrent sessions tailed per process
 RELEVANCE_THRESHOLD = 0.58   # minimum combined score to inject (cosine on conversations clusters 0.5-0.7)
 COOLDOWN_SECONDS = 600       # 10 min cooldown per topic cluster
 MAX_INJECTIONS_PER_CHECK = 3 # max results per injection
 EVENT_THRESHOLD = 0.55       # lower threshold for event-triggered searches
+JUDGE_BUDGET_SECONDS = 8.0   # batched LLM judge deadline before falling back to un-judged ranking
+VERDICT_CACHE_SIZE = 512     # cached (query, candidate) relevance verdicts
+QUERY_EMBED_CACHE_SIZE = 128 # cached event-query embeddings (intention queries repeat)
 HEARTBEAT_TIMEOUT = 300      # 5 min — exit if JSONL stale (session likely dead)
 TWENTY_FOUR_HOURS = 86400    # seconds — downweight recent results to prevent feedback loops
 RECENT_DOWNWEIGHT = 0.5      # multiply score by this for results < 24h old
@@ -0,0 +1,139 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Overwatch idle work — low-priority prep while no new lines are arriving.
+
+IdleMixin.idle_work() is a generator of small steps for one session:
+- embed exchanges still waiting for micro-ingest / synthesis
+- embed the winding-down intention queries (event searches hit the cache)
+- warm the vector index with one cheap query for the session's project,
+  once per burst of activity
+
+IdleScheduler runs those steps on one background thread, only after
+IDLE_GRACE_SECONDS without new lines and while no pipeline stage is
+busy. It checks between every step and stops the moment lines arrive
+(note_activity()), so the next exchange never queues behind idle work
+for more than one step.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+from daemon.overwatch.config import IDLE_GRACE_SECONDS, log
+
+
+class IdleMixin:
+    """Mixin providing a session's idle-time steps."""
+
+    def idle_work(self) -> Iterator[str]:
+        """Yield after each step (the label names the step for stats)."""
+        # 1. Pre-embed exchanges queued for micro-ingest and synthesis
+        waiting = list(self.pending_exchanges) + list(self.pending_exchanges_for_synthesis)
+        for ex in waiting:
+            if "embedding" not in ex:
+                self._exchange_embedding(ex)
+                yield "embed"
+
+        # 2. Event-search queries that don't depend on the next exchange
+        missing = [q for q in self._intention_queries() if q not in self._query_embedding_cache]
+        if missing:
+            self._query_embeddings(missing)
+            yield "queries"
+
+        # 3. Touch the index for this project once per burst of activity
+        if self._warmed_at != self.exchange_counter and self.current_jsonl is not None:
+            self._warmed_at = self.exchange_counter
+            last = self.recent_exchanges[-1] if self.recent_exchanges else None
+            try:
+                self.conv.recall(
+                    last["user_text"] if last else self.current_jsonl.parent.name,
+                    n_results=1,
+                    project=self.current_jsonl.parent.name,
+                    query_embedding=last.get("embedding") if last else None,
+                )
+            except Exception as e:
+                log.debug(f"Index warm error: {e}")
+            yield "warm"
+
+
+class IdleScheduler:
+    """Runs idle_work() steps from every session while Overwatch is idle."""
+
+    def __init__(
+        self,
+        tasks: Callable[[], Iterable[Iterator[str]]],
+        busy: Callable[[], bool],
+        grace: float = IDLE_GRACE_SECONDS,
+    ):
+        self.tasks = tasks
+        self.busy = busy
+        self.grace = grace
+        self._last_activity = time.monotonic()
+        self._activity_seq = 0
+        self._wake = threading.Event()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._stats: Dict[str, Any] = {"passes": 0, "interrupted": 0, "errors": 0, "steps": {}}
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="overwatch-idle", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._running = False
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def note_activity(self):
+        """New lines arrived — stop idle work and restart the grace period."""
+        self._last_activity = time.monotonic()
+        self._activity_seq += 1
+        self._wake.set()
+
+    def is_idle(self) -> bool:
+        return (self._running
+                and time.monotonic() - self._last_activity >= self.grace
+                and not self.busy())
+
+    def stats(self) -> Dict[str, Any]:
+        return dict(self._stats, steps=dict(self._stats["steps"]))
+
+    def _run(self):
+        done_seq = -1  # activity_seq whose idle work is finished
+        while self._running:
+            self._wake.clear()
+            if done_seq == self._activity_seq:
+                self._wake.wait()  # nothing new to prepare until lines arrive
+                continue
+            remaining = self.grace - (time.monotonic() - self._last_activity)
+            if remaining > 0:
+                self._wake.wait(remaining)
+                continue
+            if self.busy():
+                self._wake.wait(0.5)
+                continue
+
+            seq = self._activity_seq
+            if self._run_pass():
+                done_seq = seq
+
+    def _run_pass(self) -> bool:
+        """One pass over every session's steps. False if it yielded to activity."""
+        self._stats["passes"] += 1
+        try:
+            for task in self.tasks():
+                for label in task:
+                    steps = self._stats["steps"]
+                    steps[label] = steps.get(label, 0) + 1
+                    if not self.is_idle():
+                        self._stats["interrupted"] += 1
+                        return False
+        except Exception as e:
+            self._stats["errors"] += 1
+            log.debug(f"Idle work error: {e}")
+        return True
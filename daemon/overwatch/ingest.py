@@ -8,7 +8,7 @@ Overwatch micro-ingestion — triage and ChromaDB ingestion.
 
 import logging
 import time
-from typing import List, Dict
+from typing import Any, Dict, Optional
 
 from daemon import llm
 from daemon.overwatch.config import (
@@ -28,15 +28,34 @@ logger = logging.getLogger("elara.overwatch.ingest")
 class IngestMixin:
     """Mixin for micro-ingestion and triage."""
 
-    def _micro_ingest(self):
-        """Ingest pending exchanges into ChromaDB for same-session searchability.
-        Uses LLM for triage when available — classifies and scores importance."""
+    def _take_pending(self) -> Optional[Dict[str, Any]]:
+        """Detach the pending batch and reset the micro-ingest counters."""
         if not self.pending_exchanges:
-            return
+            return None
+        batch = {
+            "exchanges": self.pending_exchanges,
+            "synthesis": self.pending_exchanges_for_synthesis,
+        }
+        self.pending_exchanges = []
+        self.pending_exchanges_for_synthesis = []
+        self.exchanges_since_ingest = 0
+        self.last_ingest_time = time.time()
+        return batch
+
+    def _micro_ingest(self):
+        """Ingest pending exchanges into ChromaDB for same-session searchability."""
+        batch = self._take_pending()
+        if batch:
+            self._ingest_batch(batch)
+
+    def _ingest_batch(self, batch: Dict[str, Any]):
+        """Ingest one detached batch. Uses LLM for triage when available —
+        classifies and scores importance."""
+        exchanges = batch["exchanges"]
+        ingested = 0
         try:
-            ingested = 0
             triaged = 0
-            for ex in self.pending_exchanges:
+            for ex in exchanges:
                 # Try LLM triage — classify and score importance
                 triage = llm.triage_memory(ex["user_text"], ex["assistant_text"])
                 if triage:
@@ -51,13 +70,14 @@ class IngestMixin:
                     user_text=ex["user_text"],
                     assistant_text=ex["assistant_text"],
                     timestamp=ex.get("timestamp", ""),
-                    session_id=self.current_session_id,
+                    session_id=ex.get("session_id") or self.current_session_id,
                     exchange_index=ex.get("exchange_index", -1),
+                    embedding=self._exchange_embedding(ex),
                 )
                 if ok:
                     ingested += 1
             triage_msg = f", {triaged} triaged by LLM" if triaged else ""
-            log.info(f"Micro-ingested {ingested}/{len(self.pending_exchanges)} exchanges{triage_msg}")
+            log.info(f"Micro-ingested {ingested}/{len(exchanges)} exchanges{triage_msg}")
         except Exception as e:
             log.error(f"Micro-ingest error: {e}")
 
@@ -67,10 +87,11 @@ class IngestMixin:
                 synthesis_exchanges = [
                     {
                         "text": ex["user_text"] + " " + ex["assistant_text"],
-                        "session_id": self.current_session_id,
+                        "session_id": ex.get("session_id") or self.current_session_id,
                         "timestamp": ex.get("timestamp", ""),
+                        "embedding": self._exchange_embedding(ex),
                     }
-                    for ex in self.pending_exchanges_for_synthesis
+                    for ex in batch["synthesis"]
                 ]
                 if synthesis_exchanges:
                     reinforced = check_for_recurring_ideas(synthesis_exchanges)
@@ -79,13 +100,11 @@ class IngestMixin:
             except Exception as e:
                 log.debug(f"Synthesis check error: {e}")
 
-        self.pending_exchanges = []
-        self.pending_exchanges_for_synthesis = []
-        self.exchanges_since_ingest = 0
-        self.last_ingest_time = time.time()
+    def _micro_ingest_due(self) -> bool:
+        return (self.exchanges_since_ingest >= MICRO_INGEST_EXCHANGES or
+                bool(self.pending_exchanges and time.time() - self.last_ingest_time > MICRO_INGEST_SECONDS))
 
     def _check_micro_ingest(self):
         """Check if it's time to micro-ingest."""
-        if (self.exchanges_since_ingest >= MICRO_INGEST_EXCHANGES or
-                (self.pending_exchanges and time.time() - self.last_ingest_time > MICRO_INGEST_SECONDS)):
+        if self._micro_ingest_due():
             self._micro_ingest()
@@ -0,0 +1,127 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Overwatch latency — write-to-inject timing per exchange, rolling percentiles.
+
+Every exchange carries wall-clock marks (time.time()):
+
+    written  — mtime of the JSONL when its lines were read
+    parsed   — exchange assembled from the new lines
+    searched — vector search + score adjustments done
+    judged   — LLM relevance judging done
+    injected — injection handed to the hook (socket or inject file)
+
+The gap ending at each mark is recorded under that mark's name ("parsed"
+is write -> parse, "injected" is judge -> inject) plus "total" (write ->
+inject) in a LatencyTracker: one bounded window per stage, summarised as
+count/p50/p95/p99/max in milliseconds. The session hub writes the summary
+to STATUS_PATH; `python -m daemon.overwatch --stats` prints it.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from daemon.overwatch.config import LATENCY_WINDOW
+
+STAGES = ("parsed", "searched", "judged", "injected", "total")
+
+
+class LatencyWindow:
+    """The last N samples of one stage (seconds)."""
+
+    def __init__(self, size: int = LATENCY_WINDOW):
+        self.samples: Deque[float] = deque(maxlen=size)
+        self.count = 0
+
+    def add(self, seconds: float):
+        self.samples.append(max(0.0, seconds))
+        self.count += 1
+
+    def summary(self) -> Dict[str, Any]:
+        ordered = sorted(self.samples)
+        return {
+            "count": self.count,
+            "p50_ms": _ms(_percentile(ordered, 50)),
+            "p95_ms": _ms(_percentile(ordered, 95)),
+            "p99_ms": _ms(_percentile(ordered, 99)),
+            "max_ms": _ms(ordered[-1] if ordered else 0.0),
+        }
+
+
+class LatencyTracker:
+    """Per-stage windows shared by every session (thread-safe)."""
+
+    def __init__(self, size: int = LATENCY_WINDOW):
+        self._windows = {stage: LatencyWindow(size) for stage in STAGES}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float):
+        with self._lock:
+            self._windows[stage].add(seconds)
+
+    def record_marks(self, marks: Dict[str, float], upto: str):
+        """Record the gap ending at `upto` (and the total once injected)."""
+        prev = _previous_mark(marks, upto)
+        if prev is None or upto not in marks:
+            return
+        self.record(upto, marks[upto] - prev)
+        if upto == "injected" and "written" in marks:
+            self.record("total", marks["injected"] - marks["written"])
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {stage: window.summary() for stage, window in self._windows.items()}
+
+
+def mark(marks: Dict[str, float], name: str):
+    marks[name] = time.time()
+
+
+def _previous_mark(marks: Dict[str, float], name: str) -> Optional[float]:
+    order = ("written",) + STAGES[:-1]
+    idx = order.index(name)
+    for earlier in reversed(order[:idx]):
+        if earlier in marks:
+            return marks[earlier]
+    return None
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a sorted list."""
+    if not ordered:
+        return 0.0
+    rank = max(1, -(-len(ordered) * pct // 100))  # ceil
+    return ordered[int(rank) - 1]
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 1)
+
+
+def format_status(status: Dict[str, Any]) -> str:
+    """Human-readable rendering of the status file for --stats."""
+    age = time.time() - status.get("updated", 0)
+    lines = [
+        f"Overwatch pid {status.get('pid', '?')} — updated {age:.0f}s ago, "
+        f"up {(status.get('updated', 0) - status.get('started', 0)) / 60:.0f} min",
+        "",
+        f"{'stage':<10} {'count':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}",
+    ]
+    for stage, s in status.get("latency", {}).items():
+        lines.append(
+            f"{stage:<10} {s['count']:>7} {s['p50_ms']:>9} {s['p95_ms']:>9} {s['p99_ms']:>9} {s['max_ms']:>9}"
+        )
+    sessions = status.get("sessions", {})
+    lines.append("")
+    lines.append(f"Sessions: {len(sessions)}")
+    for session_id, s in sessions.items():
+        lines.append(f"  {session_id[:8]}  {s.get('exchanges', 0)} exchanges, {s.get('injections', 0)} injections")
+    for key in ("judge", "embeddings", "channel", "idle"):
+        if status.get(key):
+            lines.append(f"{key.capitalize()}: {json.dumps(status[key])}")
+    return "\n".join(lines)
@@ -52,29 +52,41 @@ class ParserMixin:
         return None
 
     def _read_new_lines(self, jsonl_path: Path) -> List[dict]:
-        """Read new lines from the JSONL since last position."""
+        """Read new lines from the JSONL since last position.
+
+        Only complete (newline-terminated) lines are consumed. With event-driven
+        watching a read can land mid-write; the partial tail line is left for
+        the next read instead of being dropped as corrupt JSON.
+        """
         entries = []
         try:
-            file_size = jsonl_path.stat().st_size
+            stat = jsonl_path.stat()
+            file_size = stat.st_size
+            self.last_write_time = stat.st_mtime
             if file_size < self.last_position:
                 log.warning("JSONL truncated (%d < %d), resetting position", file_size, self.last_position)
                 self.last_position = 0
             if file_size <= self.last_position:
                 return []
 
-            with open(jsonl_path, 'r') as f:
+            with open(jsonl_path, 'rb') as f:
                 f.seek(self.last_position)
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        entry = json.loads(line)
-                        if not entry.get("isSidechain"):
-                            entries.append(entry)
-                    except json.JSONDecodeError:
-                        continue
-                self.last_position = f.tell()
+                data = f.read()
+            end = data.rfind(b"\n") + 1
+            if end == 0:
+                return []
+
+            for raw in data[:end].splitlines():
+                line = raw.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                    if not entry.get("isSidechain"):
+                        entries.append(entry)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+            self.last_position += end
         except (OSError, IOError) as e:
             log.error(f"Read error: {e}")
 
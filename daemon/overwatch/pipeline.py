@@ -0,0 +1,312 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Overwatch pipeline — staged processing so tailing never waits on search or LLM.
+
+    tail (watch loop) -> parse -> search -> judge -> inject
+                           \\-> ingest (micro-ingest batches)
+
+Each stage is one worker thread behind a bounded queue. Parse owns all
+per-session bookkeeping (parser state, counters, pending batches,
+snapshots), so no state is shared between writers. Search, judge and
+inject keep only the newest work: a full queue drops its oldest job, and
+a job is cancelled at every stage boundary (and between LLM calls) once
+a newer exchange has been parsed. Parse and ingest never drop.
+
+stats() reports per-stage queue depth, processed/cancelled/dropped
+counts and latency. Each job also carries write -> parse -> search ->
+judge -> inject marks that feed the shared LatencyTracker (latency.py).
+"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from daemon.overwatch.config import PIPELINE_QUEUE_SIZE, log
+from daemon.overwatch.latency import mark
+
+_STOP = object()
+
+
+@dataclass
+class ExchangeJob:
+    """One parsed exchange moving through search -> judge -> inject."""
+    seq: int
+    session_id: str
+    exchange: Dict[str, str]
+    created: float = field(default_factory=time.monotonic)
+    query: str = ""
+    candidates: List[Dict[str, Any]] = field(default_factory=list)
+    event_groups: List[Any] = field(default_factory=list)
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    event_results: List[Dict[str, Any]] = field(default_factory=list)
+    marks: Dict[str, float] = field(default_factory=dict)  # wall-clock stage marks
+
+    def mark(self, name: str, latency) -> None:
+        mark(self.marks, name)
+        latency.record_marks(self.marks, name)
+
+
+class Stage:
+    """A worker thread draining a bounded queue into a handler."""
+
+    def __init__(self, name: str, handler: Callable[[Any], bool], maxsize: int, keep_latest: bool):
+        self.name = name
+        self.handler = handler
+        self.keep_latest = keep_latest
+        self.queue: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+        self.downstream: List["Stage"] = []
+
+        self.processed = 0
+        self.cancelled = 0
+        self.dropped = 0
+        self.errors = 0
+        self.running = False  # handler in progress
+        self.latency_last = 0.0
+        self.latency_max = 0.0
+        self._latency_total = 0.0
+
+        self._thread = threading.Thread(target=self._run, name=f"overwatch-{name}", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def submit(self, item: Any):
+        """Enqueue. keep_latest stages evict their oldest job instead of blocking."""
+        if not self.keep_latest:
+            self.queue.put(item)
+            return
+        while True:
+            try:
+                self.queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def stop(self):
+        """Queue the stop marker behind any pending work (blocking put)."""
+        self.queue.put(_STOP)
+
+    def join(self, timeout: Optional[float] = None):
+        self._thread.join(timeout)
+
+    @property
+    def busy(self) -> bool:
+        return self.running or not self.queue.empty()
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is _STOP:
+                for stage in self.downstream:
+                    stage.stop()
+                return
+            start = time.monotonic()
+            self.running = True
+            try:
+                done = self.handler(item)
+            except Exception as e:
+                self.errors += 1
+                log.error(f"Pipeline {self.name} error: {e}")
+                continue
+            finally:
+                self.running = False
+            elapsed = time.monotonic() - start
+            if done is False:
+                self.cancelled += 1
+                continue
+            self.processed += 1
+            self.latency_last = elapsed
+            self.latency_max = max(self.latency_max, elapsed)
+            self._latency_total += elapsed
+
+    def stats(self) -> Dict[str, Any]:
+        avg = self._latency_total / self.processed if self.processed else 0.0
+        return {
+            "depth": self.queue.qsize(),
+            "processed": self.processed,
+            "cancelled": self.cancelled,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "latency_ms": {
+                "last": round(self.latency_last * 1000, 1),
+                "avg": round(avg * 1000, 1),
+                "max": round(self.latency_max * 1000, 1),
+            },
+        }
+
+
+class OverwatchPipeline:
+    """Wires an Overwatch instance's mixin methods into stages."""
+
+    def __init__(self, ow, queue_size: int = PIPELINE_QUEUE_SIZE):
+        self.ow = ow
+        self.latest_seq = 0
+        self.injected = 0
+        self._seq = 0
+        self._session_id = ow.current_session_id
+        self._e2e_last = 0.0
+        self._e2e_max = 0.0
+
+        self.parse = Stage("parse", self._on_parse, queue_size * 4, keep_latest=False)
+        self.search = Stage("search", self._on_search, queue_size, keep_latest=True)
+        self.judge = Stage("judge", self._on_judge, queue_size, keep_latest=True)
+        self.inject = Stage("inject", self._on_inject, queue_size, keep_latest=True)
+        self.ingest = Stage("ingest", self._on_ingest, queue_size * 4, keep_latest=False)
+
+        self.parse.downstream = [self.search, self.ingest]
+        self.search.downstream = [self.judge]
+        self.judge.downstream = [self.inject]
+        self.stages = [self.parse, self.search, self.judge, self.inject, self.ingest]
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # Lifecycle (called from the tail thread)
+    # ------------------------------------------------------------------
+
+    def start(self):
+        for stage in self.stages:
+            stage.start()
+
+    def close(self, timeout: float = 30.0):
+        """Let queued work finish, then stop every worker."""
+        if self._closed:
+            return
+        self._closed = True
+        self.parse.stop()
+        deadline = time.monotonic() + timeout
+        for stage in self.stages:
+            stage.join(max(0.0, deadline - time.monotonic()))
+
+    def feed(self, entries: List[dict], written: Optional[float] = None):
+        """New JSONL entries; written is the file mtime when they were read."""
+        self.parse.submit(("entries", (entries, written)))
+
+    def start_session(self, jsonl: Path):
+        self.parse.submit(("session", jsonl))
+
+    def tick(self):
+        """Idle housekeeping (timed micro-ingest), run on the parse thread."""
+        self.parse.submit(("tick", None))
+
+    def busy(self) -> bool:
+        """Any stage holding or processing work."""
+        return any(stage.busy for stage in self.stages)
+
+    def is_stale(self, job: ExchangeJob) -> bool:
+        return job.seq < self.latest_seq
+
+    # ------------------------------------------------------------------
+    # Stage handlers
+    # ------------------------------------------------------------------
+
+    def _on_parse(self, item) -> bool:
+        kind, payload = item
+        ow = self.ow
+
+        if kind == "session":
+            batch = ow._take_pending()
+            if batch:
+                self.ingest.submit(batch)
+            self._session_id = payload.stem
+            ow._reset_session_state()
+            return True
+
+        if kind == "entries":
+            entries, written = payload
+            exchanges = ow._parse_exchanges(entries)
+            if exchanges:
+                log.info(f"Parsed {len(exchanges)} exchange(s) from {len(entries)} entries")
+            for exchange in exchanges:
+                exchange["session_id"] = self._session_id
+                self._seq += 1
+                self.latest_seq = self._seq
+                job = ExchangeJob(seq=self._seq, session_id=self._session_id, exchange=exchange)
+                if written is not None:
+                    job.marks["written"] = written
+                job.mark("parsed", ow.latency)
+                self.search.submit(job)
+                ow._record_exchange(exchange)
+
+        if ow._micro_ingest_due():
+            self.ingest.submit(ow._take_pending())
+        return True
+
+    def _on_search(self, job: ExchangeJob) -> bool:
+        if self.is_stale(job):
+            return False
+        ow = self.ow
+        ex = job.exchange
+        job.query = ex["user_text"] + " " + ex["assistant_text"]
+        job.candidates = ow._history_candidates(
+            job.query, threshold=0.65, session_id=job.session_id,
+            embedding=ow._exchange_embedding(ex),
+        )
+        events = ow._detect_events(ex)
+        if events:
+            job.event_groups = ow._event_candidates(events, session_id=job.session_id)
+        if self.is_stale(job):
+            return False
+        job.mark("searched", ow.latency)
+        self.judge.submit(job)
+        return True
+
+    def _on_judge(self, job: ExchangeJob) -> bool:
+        cancelled = lambda: self.is_stale(job)  # noqa: E731
+        if cancelled():
+            return False
+        ow = self.ow
+        job.results = ow._judge_candidates(job.query, job.candidates, cancelled=cancelled)
+        if job.event_groups:
+            job.event_results = ow._merge_event_results(
+                (event_type, ow._judge_candidates(query, candidates, cancelled=cancelled))
+                for event_type, query, candidates in job.event_groups
+            )
+        if cancelled():
+            return False
+        job.mark("judged", ow.latency)
+        self.inject.submit(job)
+        return True
+
+    def _on_inject(self, job: ExchangeJob) -> bool:
+        if self.is_stale(job):
+            return False
+        if job.results or job.event_results:
+            self.ow._write_inject(job.results, job.event_results)
+            job.mark("injected", self.ow.latency)
+            self.injected += 1
+        self._e2e_last = time.monotonic() - job.created
+        self._e2e_max = max(self._e2e_max, self._e2e_last)
+        log.info(f"Processed: {job.exchange['user_text'][:60]}...")
+        return True
+
+    def _on_ingest(self, batch: Dict[str, Any]) -> bool:
+        self.ow._ingest_batch(batch)
+        return True
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "exchanges": self._seq,
+            "injections": self.injected,
+            "end_to_end_ms": {
+                "last": round(self._e2e_last * 1000, 1),
+                "max": round(self._e2e_max * 1000, 1),
+            },
+            "stages": {stage.name: stage.stats() for stage in self.stages},
+            "judge": dict(self.ow.judge_stats),
+            "embeddings": dict(self.ow.embed_stats),
+            "latency": self.ow.latency.summary(),
+        }
@@ -8,18 +8,21 @@ Overwatch search — history search, event detection, LLM filtering, injection w
 
 import logging
 import json
+import os
 import time
 import hashlib
-from typing import List, Dict, Any, Optional
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from daemon import llm
 from daemon.schemas import atomic_write_json
 from daemon.injector import format_injection, format_event_injection
 from daemon.overwatch.config import (
     RELEVANCE_THRESHOLD, COOLDOWN_SECONDS, MAX_INJECTIONS_PER_CHECK,
+    JUDGE_BUDGET_SECONDS, VERDICT_CACHE_SIZE, QUERY_EMBED_CACHE_SIZE,
     EVENT_THRESHOLD, TWENTY_FOUR_HOURS, RECENT_DOWNWEIGHT, OVERDUE_BOOST,
     TASK_COMPLETE_WORDS, WINDING_DOWN_WORDS,
-    INJECT_PATH, INJECT_TMP_PATH, SESSION_STATE_PATH, log,
+    SESSION_STATE_PATH, log,
 )
 
 
@@ -66,16 +69,83 @@ class SearchMixin:
 
         return events
 
-    def _search_history(self, text: str, threshold: float, n_results: int = 10) -> List[Dict[str, Any]]:
+    def _exchange_embedding(self, exchange: Dict[str, Any]) -> Optional[List[float]]:
+        """Embedding of the exchange's stored document, computed at most once.
+
+        Search, micro-ingest and synthesis all ask for it; the first caller
+        embeds and caches it on the exchange dict, the rest reuse it.
+        None (embedding unavailable) lets each consumer embed on its own.
+        """
+        with self._embed_lock:
+            if "embedding" in exchange:
+                if exchange["embedding"] is not None:
+                    self.embed_stats["reused"] += 1
+                return exchange["embedding"]
+            doc = self.conv._build_document(exchange["user_text"], exchange["assistant_text"])
+            try:
+                vectors = self.conv.embed([doc])
+            except Exception as e:
+                log.debug(f"Embedding error: {e}")
+                vectors = []
+            embedding = vectors[0] if len(vectors) == 1 else None
+            if embedding is not None:
+                self.embed_stats["computed"] += 1
+            exchange["embedding"] = embedding
+            return embedding
+
+    def _query_embeddings(self, queries: List[str]) -> List[Optional[List[float]]]:
+        """Embeddings for event search queries — one batched call, LRU-cached by text."""
+        with self._embed_lock:
+            missing = [q for q in dict.fromkeys(queries) if q not in self._query_embedding_cache]
+            cached = len(queries) - len(missing)
+            if missing:
+                try:
+                    vectors = self.conv.embed(missing)
+                except Exception as e:
+                    log.debug(f"Embedding error: {e}")
+                    vectors = []
+                if len(vectors) == len(missing):
+                    self.embed_stats["computed"] += len(missing)
+                    for q, vec in zip(missing, vectors):
+                        self._query_embedding_cache[q] = vec
+            self.embed_stats["reused"] += cached
+            result = []
+            for q in queries:
+                vec = self._query_embedding_cache.get(q)
+                if vec is not None:
+                    self._query_embedding_cache.move_to_end(q)
+                result.append(vec)
+            while len(self._query_embedding_cache) > QUERY_EMBED_CACHE_SIZE:
+                self._query_embedding_cache.popitem(last=False)
+            return result
+
+    def _search_history(
+        self, text: str, threshold: float, n_results: int = 10,
+        embedding: Optional[List[float]] = None,
+    ) -> List[Dict[str, Any]]:
         """Search all conversation history, excluding current session."""
+        return self._judge_candidates(
+            text, self._history_candidates(text, threshold, n_results, embedding=embedding),
+        )
+
+    def _history_candidates(
+        self,
+        text: str,
+        threshold: float,
+        n_results: int = 10,
+        session_id: Optional[str] = None,
+        embedding: Optional[List[float]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Vector search + score adjustments + cooldown filter (no LLM)."""
         try:
-            results = self.conv.recall(text, n_results=n_results)
+            results = self.conv.recall(text, n_results=n_results, query_embedding=embedding)
         except Exception as e:
             log.error(f"Search error: {e}")
             return []
 
         now = time.time()
         overdue_items = self.session_state.get("overdue_items", [])
+        exclude_session = session_id if session_id is not None else self.current_session_id
 
         relevant = []
         for r in results:
@@ -98,7 +168,7 @@ class SearchMixin:
 
             if score < threshold:
                 continue
-            if r["session_id"] == self.current_session_id:
+            if r["session_id"] == exclude_session:
                 continue
             topic = self._topic_hash(r["content"])
             if self._is_on_cooldown(topic):
@@ -106,77 +176,195 @@ class SearchMixin:
 
             r["score"] = score
             relevant.append(r)
+        return relevant
 
-        # LLM relevance judgment — filter false positives
-        if relevant and llm.is_available():
-            judged = []
-            for r in relevant[:MAX_INJECTIONS_PER_CHECK + 2]:
-                judgment = llm.judge_relevance(
-                    current_text=text,
-                    historical_text=r.get("content", r.get("user_text", "")),
-                )
-                if judgment and judgment.get("relevant"):
-                    ollama_importance = judgment.get("importance", 0.5)
-                    r["score"] = r["score"] * 0.6 + ollama_importance * 0.4
-                    r["_llm_reason"] = judgment.get("reason", "")
-                    judged.append(r)
-                elif judgment is None:
-                    judged.append(r)
-                else:
-                    log.debug(f"LLM filtered: {r.get('content', '')[:50]}... — {judgment.get('reason', '')}")
-            relevant = judged
+    def _judge_candidates(
+        self,
+        text: str,
+        relevant: List[Dict[str, Any]],
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> List[Dict[str, Any]]:
+        """LLM relevance judgment — filter false positives.
+
+        All candidates go to the model in one batched prompt. Verdicts are
+        cached per (query hash, candidate hash); if the batch misses the
+        JUDGE_BUDGET_SECONDS deadline, the un-judged ranking is used and
+        the late verdicts still land in the cache for next time.
+        """
+        if not relevant or not llm.is_available():
+            return relevant[:MAX_INJECTIONS_PER_CHECK]
 
-        return relevant[:MAX_INJECTIONS_PER_CHECK]
+        batch = relevant[:MAX_INJECTIONS_PER_CHECK + 2]
+        query_key = self._judge_hash(text)
+        keys = [(query_key, self._judge_hash(self._judge_text(r))) for r in batch]
+
+        verdicts: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+        missing = []
+        with self._verdict_lock:
+            for key in keys:
+                if key in self._verdict_cache:
+                    self._verdict_cache.move_to_end(key)
+                    verdicts[key] = self._verdict_cache[key]
+                    self.judge_stats["cache_hits"] += 1
+                elif key not in missing:
+                    missing.append(key)
+
+        if missing:
+            if cancelled is not None and cancelled():
+                return []
+            todo = [self._judge_text(batch[keys.index(key)]) for key in missing]
+            fresh = self._judge_batch(text, todo, missing)
+            if fresh is None:
+                self.judge_stats["fallbacks"] += 1
+                log.debug(f"Judge budget/LLM miss — using un-judged ranking for {len(batch)} candidates")
+                return relevant[:MAX_INJECTIONS_PER_CHECK]
+            verdicts.update(fresh)
+
+        judged = []
+        for r, key in zip(batch, keys):
+            judgment = verdicts.get(key)
+            if judgment and judgment.get("relevant"):
+                ollama_importance = judgment.get("importance", 0.5)
+                if not isinstance(ollama_importance, (int, float)):
+                    ollama_importance = 0.5
+                r["score"] = r["score"] * 0.6 + ollama_importance * 0.4
+                r["_llm_reason"] = judgment.get("reason", "")
+                judged.append(r)
+            elif judgment is None:
+                judged.append(r)
+            else:
+                log.debug(f"LLM filtered: {r.get('content', '')[:50]}... — {judgment.get('reason', '')}")
+
+        return judged[:MAX_INJECTIONS_PER_CHECK]
+
+    def _judge_batch(
+        self, text: str, candidates: List[str], keys: List[Tuple[str, str]],
+    ) -> Optional[Dict[Tuple[str, str], Optional[Dict[str, Any]]]]:
+        """One batched LLM call under the latency budget. None on timeout/failure.
+
+        The single judge worker may still be finishing a late batch (the LLM
+        gets 3x the budget so late verdicts reach the cache). Queuing behind
+        it would spend this check's whole budget waiting, so fall back at
+        once instead.
+        """
+        with self._verdict_lock:
+            if self._judge_inflight.is_set():
+                self.judge_stats["busy"] += 1
+                return None
+            self._judge_inflight.set()
+        self.judge_stats["batches"] += 1
+        self.judge_stats["candidates_judged"] += len(candidates)
+        try:
+            future = self._judge_executor.submit(
+                llm.judge_relevance_batch, text, candidates, timeout=int(JUDGE_BUDGET_SECONDS * 3),
+            )
+        except RuntimeError:  # executor shut down
+            self._judge_inflight.clear()
+            return None
+        # Late answers still fill the cache
+        future.add_done_callback(lambda f: self._judge_done(keys, f))
+        try:
+            result = future.result(timeout=JUDGE_BUDGET_SECONDS)
+        except FutureTimeout:
+            self.judge_stats["timeouts"] += 1
+            return None
+        except Exception as e:
+            log.debug(f"Batched judge error: {e}")
+            return None
+        if result is None:
+            return None
+        return dict(zip(keys, result))
+
+    def _judge_done(self, keys: List[Tuple[str, str]], future):
+        self._cache_verdicts(keys, future)
+        self._judge_inflight.clear()
+
+    def _cache_verdicts(self, keys: List[Tuple[str, str]], future):
+        try:
+            result = future.result()
+        except Exception:
+            return
+        if result is None:
+            return
+        with self._verdict_lock:
+            for key, verdict in zip(keys, result):
+                if verdict is None:
+                    continue  # model skipped it — ask again next time
+                self._verdict_cache[key] = verdict
+                self._verdict_cache.move_to_end(key)
+            while len(self._verdict_cache) > VERDICT_CACHE_SIZE:
+                self._verdict_cache.popitem(last=False)
+
+    def _judge_text(self, r: Dict[str, Any]) -> str:
+        return r.get("content", r.get("user_text", ""))
+
+    def _judge_hash(self, text: str) -> str:
+        return hashlib.md5(text[:200].encode()).hexdigest()[:12]
 
     def _search_for_events(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Run broader searches triggered by events."""
-        all_results = []
+        groups = self._event_candidates(events)
+        return self._merge_event_results(
+            (event_type, self._judge_candidates(query, candidates))
+            for event_type, query, candidates in groups
+        )
+
+    def _event_candidates(
+        self, events: List[Dict[str, Any]], session_id: Optional[str] = None,
+    ) -> List[Tuple[str, str, List[Dict[str, Any]]]]:
+        """(event_type, query, candidates) for every event-triggered search."""
+        searches = []  # (event_type, query, n_results)
 
         for event in events:
             if event["type"] == "task_complete":
                 llm_queries = llm.generate_search_queries(event["query"], n_queries=3)
                 if llm_queries:
                     log.info(f"LLM generated {len(llm_queries)} queries for task_complete")
-                    for q in llm_queries:
-                        results = self._search_history(q, threshold=EVENT_THRESHOLD, n_results=3)
-                        for r in results:
-                            r["_event"] = "task_complete"
-                        all_results.extend(results)
+                    searches.extend(("task_complete", q, 3) for q in llm_queries)
                 else:
-                    results = self._search_history(event["query"], threshold=EVENT_THRESHOLD, n_results=5)
-                    for r in results:
-                        r["_event"] = "task_complete"
-                    all_results.extend(results)
+                    searches.append(("task_complete", event["query"], 5))
 
             elif event["type"] == "winding_down":
-                overdue = self.session_state.get("overdue_items", [])
-                reminders = self.session_state.get("reminders", [])
-                intention_queries = overdue + reminders
-                if not intention_queries:
-                    intention_queries = [
-                        "plans for next session tomorrow",
-                        "promises I made to him",
-                        "things we should do want to try",
-                    ]
-                for q in intention_queries[:5]:
-                    results = self._search_history(q, threshold=EVENT_THRESHOLD, n_results=3)
-                    for r in results:
-                        r["_event"] = "winding_down"
-                    all_results.extend(results)
-
-        # Deduplicate
+                searches.extend(("winding_down", q, 3) for q in self._intention_queries())
+
+        embeddings = self._query_embeddings([q for _, q, _ in searches]) if searches else []
+        return [
+            (event_type, q, self._history_candidates(
+                q, threshold=EVENT_THRESHOLD, n_results=n, session_id=session_id, embedding=emb))
+            for (event_type, q, n), emb in zip(searches, embeddings)
+        ]
+
+    def _intention_queries(self) -> List[str]:
+        """Queries for a winding-down search: overdue items and reminders, else defaults."""
+        overdue = self.session_state.get("overdue_items", [])
+        reminders = self.session_state.get("reminders", [])
+        intention_queries = overdue + reminders
+        if not intention_queries:
+            intention_queries = [
+                "plans for next session tomorrow",
+                "promises I made to him",
+                "things we should do want to try",
+            ]
+        return intention_queries[:5]
+
+    def _merge_event_results(
+        self, judged_groups: Iterable[Tuple[str, List[Dict[str, Any]]]],
+    ) -> List[Dict[str, Any]]:
+        """Tag judged event results with their event type and deduplicate."""
         seen = set()
         unique = []
-        for r in all_results:
-            key = f"{r['session_id']}:{r['exchange_index']}"
-            if key not in seen:
-                seen.add(key)
-                unique.append(r)
+        for event_type, results in judged_groups:
+            for r in results:
+                r["_event"] = event_type
+                key = f"{r['session_id']}:{r['exchange_index']}"
+                if key not in seen:
+                    seen.add(key)
+                    unique.append(r)
 
         return unique[:MAX_INJECTIONS_PER_CHECK]
 
     def _write_inject(self, results: List[Dict[str, Any]], event_results: List[Dict[str, Any]] = None):
-        """Write the inject file for the hook to pick up."""
+        """Hand the injection to the hook — via the socket channel, else the inject file."""
         content = ""
         if results:
             content += format_injection(results)
@@ -187,8 +375,12 @@ class SearchMixin:
 
         if content:
             try:
-                INJECT_TMP_PATH.write_text(content)
-                os.rename(str(INJECT_TMP_PATH), str(INJECT_PATH))
+                if self.shared.channel is not None:
+                    # Acked socket delivery — hook fetches it for this session
+                    self.shared.channel.put(self.current_session_id, content)
+                else:
+                    self.inject_tmp_path.write_text(content)
+                    os.rename(str(self.inject_tmp_path), str(self.inject_path))
                 self.injection_count += 1
                 log.info(f"Injection #{self.injection_count}: {len(results or [])} cross-refs, {len(event_results or [])} event matches")
                 for r in (results or []) + (event_results or []):
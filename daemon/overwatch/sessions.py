@@ -0,0 +1,157 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Overwatch session hub — tail several concurrent sessions in one process.
+
+The watcher lists every session JSONL written within HEARTBEAT_TIMEOUT;
+the newest MAX_SESSIONS each get their own Overwatch (parser state,
+cooldowns, micro-ingest queue, pipeline, pending injection). All of them
+share one OverwatchShared — the conversation store, verdict cache, LLM
+judge worker, embedding cache and injection socket — instead of one
+daemon per session each opening its own handles.
+
+A session that goes stale (or is pushed out by newer ones) is detached:
+its pipeline drains, pending exchanges are micro-ingested and its
+undelivered injection is dropped. The process exits once every session
+file is stale (orphan prevention, as before). Between bursts of new
+lines the hub's IdleScheduler (idle.py) runs each session's idle work.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from daemon.overwatch.config import (
+    PROJECTS_DIR, POLL_INTERVAL, HEARTBEAT_TIMEOUT, WATCH_MODE, MAX_SESSIONS,
+    STATUS_PATH, STATUS_INTERVAL, IDLE_ENABLED, log,
+)
+from daemon.overwatch.idle import IdleScheduler
+from daemon.overwatch.watcher import make_watcher
+from daemon.schemas import atomic_write_json
+
+
+class SessionHub:
+    """Attaches/detaches one Overwatch per active session and drives their polls."""
+
+    def __init__(self, shared, session_factory: Callable[[Any], Any], max_sessions: int = MAX_SESSIONS):
+        self.shared = shared
+        self.session_factory = session_factory
+        self.max_sessions = max(1, max_sessions)
+        self.sessions: Dict[Path, Any] = {}
+        self.running: bool = True
+        self.watcher = None
+        self.started = time.time()
+        self._status_written = 0.0
+        self.idle = IdleScheduler(self._idle_tasks, self._busy)
+
+    def refresh(self) -> bool:
+        """Sync attached sessions with the watcher. False once every session file is stale."""
+        recent: List[Path] = self.watcher.recent(HEARTBEAT_TIMEOUT, self.max_sessions)
+
+        for path in [p for p in self.sessions if p not in recent]:
+            self.sessions.pop(path).detach()
+
+        for path in recent:
+            if path in self.sessions:
+                continue
+            try:
+                self.sessions[path] = self.session_factory(self.shared).attach(path)
+            except OSError as e:
+                log.warning(f"Cannot attach {path.name}: {e}")
+
+        if recent:
+            return True
+        # Session files exist but none was written recently — nobody to serve
+        return self.watcher.active() is None
+
+    def _idle_tasks(self):
+        return [ow.idle_work() for ow in list(self.sessions.values())]
+
+    def _busy(self) -> bool:
+        return any(ow.busy() for ow in list(self.sessions.values()))
+
+    def poll_all(self) -> bool:
+        """One read pass over every attached session. True if any had new lines."""
+        got = False
+        for ow in list(self.sessions.values()):
+            got = ow.poll() or got
+        if got:
+            self.idle.note_activity()
+        return got
+
+    def run(self):
+        """Main loop — track active sessions, tail each, react."""
+        log.info("Overwatch starting...")
+        log.info(f"Conversations in DB: {self.shared.conv.count()}")
+
+        self.watcher = make_watcher(PROJECTS_DIR, WATCH_MODE)
+        idle = self.watcher.idle_timeout
+        self.shared.open_channel()
+        if IDLE_ENABLED:
+            self.idle.start()
+
+        while self.running:
+            try:
+                if not self.refresh():
+                    log.info(f"Session JSONLs stale for {HEARTBEAT_TIMEOUT}s, exiting (orphan prevention)")
+                    break
+                if not self.sessions:
+                    self.watcher.wait(POLL_INTERVAL * 5)
+                    continue
+                self.poll_all()
+                self.maybe_write_status()
+                self.watcher.wait(idle)
+
+            except KeyboardInterrupt:
+                break
+            except Exception as e:
+                log.error(f"Watch loop error: {e}")
+                time.sleep(POLL_INTERVAL * 2)
+
+        # Final flush
+        self.idle.stop()
+        for path in list(self.sessions):
+            self.sessions.pop(path).detach()
+        self.write_status()
+        self.watcher.close()
+        self.shared.close()
+        log.info("Overwatch stopped.")
+
+    def stop(self):
+        self.running = False
+        if self.watcher is not None:
+            self.watcher.wake()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "sessions": {
+                ow.current_session_id: {
+                    "exchanges": ow.exchange_counter,
+                    "injections": ow.injection_count,
+                    "pipeline": ow.pipeline.stats() if ow.pipeline is not None else None,
+                }
+                for ow in self.sessions.values()
+            },
+            "judge": dict(self.shared.judge_stats),
+            "embeddings": dict(self.shared.embed_stats),
+            "channel": self.shared.channel.stats() if self.shared.channel is not None else None,
+            "latency": self.shared.latency.summary(),
+            "idle": self.idle.stats(),
+        }
+
+    def write_status(self):
+        """Stats + stage latency percentiles for `python -m daemon.overwatch --stats`."""
+        status = {"pid": os.getpid(), "started": self.started, "updated": time.time()}
+        status.update(self.stats())
+        try:
+            atomic_write_json(STATUS_PATH, status)
+        except OSError as e:
+            log.debug(f"Status write error: {e}")
+        self._status_written = time.monotonic()
+
+    def maybe_write_status(self):
+        if time.monotonic() - self._status_written >= STATUS_INTERVAL:
+            self.write_status()
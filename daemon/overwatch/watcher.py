@@ -0,0 +1,298 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Overwatch watcher — finds the active session JSONL and waits for writes.
+
+Two implementations behind one interface (active() / recent() / wait() / wake() / close()):
+- InotifyWatcher — Linux inotify via ctypes (no extra dependency). One
+  watch on the projects root plus one per project dir; the active file is
+  whichever .jsonl was written last, so no directory scans after startup.
+  wait() returns within milliseconds of a write and blocks in select()
+  while idle.
+- PollingWatcher — the original behaviour: scan every project dir for the
+  newest .jsonl, sleep POLL_INTERVAL between checks.
+
+recent() lists every session written within a max age, newest first, so
+one process can tail several concurrent sessions (sessions.py).
+
+make_watcher() picks inotify when available and falls back to polling
+(non-Linux, watch limit reached, projects dir missing).
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from daemon.overwatch.config import HEARTBEAT_TIMEOUT, POLL_INTERVAL, WATCH_IDLE_TIMEOUT, log
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+_ROOT_MASK = IN_CREATE | IN_MOVED_TO | IN_ONLYDIR
+_PROJECT_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_CREATE | IN_MOVED_TO | IN_DELETE_SELF | IN_ONLYDIR
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len (name follows, NUL-padded)
+_READ_SIZE = 64 * 1024
+
+
+def find_newest_session(root: Path) -> Optional[Path]:
+    """Most recently modified .jsonl under any project dir (full scan)."""
+    if not root.exists():
+        return None
+    newest = None
+    newest_mtime = 0.0
+    for project_dir in root.iterdir():
+        if not project_dir.is_dir() or project_dir.name.startswith("."):
+            continue
+        for jsonl_file in project_dir.glob("*.jsonl"):
+            try:
+                mtime = jsonl_file.stat().st_mtime
+            except OSError:
+                continue
+            if mtime > newest_mtime:
+                newest = jsonl_file
+                newest_mtime = mtime
+    return newest
+
+
+def find_recent_sessions(root: Path, max_age: float, limit: Optional[int] = None) -> List[Path]:
+    """.jsonl files modified within max_age seconds, newest first (full scan)."""
+    if not root.exists():
+        return []
+    cutoff = time.time() - max_age
+    found = []
+    for project_dir in root.iterdir():
+        if not project_dir.is_dir() or project_dir.name.startswith("."):
+            continue
+        for jsonl_file in project_dir.glob("*.jsonl"):
+            try:
+                mtime = jsonl_file.stat().st_mtime
+            except OSError:
+                continue
+            if mtime >= cutoff:
+                found.append((mtime, jsonl_file))
+    found.sort(key=lambda item: item[0], reverse=True)
+    return [path for _, path in found[:limit]]
+
+
+class PollingWatcher:
+    """Scan-and-sleep fallback."""
+
+    mode = "poll"
+    idle_timeout = POLL_INTERVAL
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def active(self) -> Optional[Path]:
+        return find_newest_session(self.root)
+
+    def recent(self, max_age: float, limit: Optional[int] = None) -> List[Path]:
+        return find_recent_sessions(self.root, max_age, limit)
+
+    def wait(self, timeout: float) -> bool:
+        """Sleep; polling can't tell whether anything changed."""
+        time.sleep(timeout)
+        return True
+
+    def wake(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Event-driven watcher on the projects root and every project dir."""
+
+    mode = "inotify"
+    idle_timeout = WATCH_IDLE_TIMEOUT
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._libc = _load_libc()
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._fd = fd
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        self._dirs: Dict[int, Path] = {}
+        self._active: Optional[Path] = None
+        self._written: Set[Path] = set()  # session files seen written (for recent())
+
+        try:
+            self._add_watch(root, _ROOT_MASK)
+            for project_dir in root.iterdir():
+                self._watch_project(project_dir)
+        except OSError:
+            self.close()
+            raise
+        self._rescan()
+
+    def _rescan(self):
+        self._active = find_newest_session(self.root)
+        for path in find_recent_sessions(self.root, HEARTBEAT_TIMEOUT):
+            self._written.add(path)
+
+    # ------------------------------------------------------------------
+    # Watches
+    # ------------------------------------------------------------------
+
+    def _add_watch(self, path: Path, mask: int):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(str(path)), mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+        self._dirs[wd] = path
+
+    def _watch_project(self, project_dir: Path):
+        if not project_dir.is_dir() or project_dir.name.startswith("."):
+            return
+        self._add_watch(project_dir, _PROJECT_MASK)
+
+    # ------------------------------------------------------------------
+    # Events
+    # ------------------------------------------------------------------
+
+    def _drain(self) -> bool:
+        """Consume queued events. True if a session file was written."""
+        wrote = False
+        while True:
+            try:
+                buf = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                return wrote
+            if not buf:
+                return wrote
+
+            offset = 0
+            while offset + _EVENT.size <= len(buf):
+                wd, mask, _cookie, length = _EVENT.unpack_from(buf, offset)
+                name = buf[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b"\0")
+                offset += _EVENT.size + length
+
+                if mask & IN_Q_OVERFLOW:
+                    # Lost events — rescan once to be sure of the active file
+                    log.warning("inotify queue overflow, rescanning sessions")
+                    self._rescan()
+                    wrote = True
+                    continue
+                if mask & IN_IGNORED:
+                    self._dirs.pop(wd, None)
+                    continue
+
+                parent = self._dirs.get(wd)
+                if parent is None or not name:
+                    continue
+                path = parent / os.fsdecode(name)
+
+                if parent == self.root:
+                    if mask & IN_ISDIR:
+                        self._on_new_project(path)
+                    continue
+                if path.suffix == ".jsonl" and not mask & IN_ISDIR:
+                    self._active = path
+                    self._written.add(path)
+                    wrote = True
+
+    def _on_new_project(self, project_dir: Path):
+        try:
+            self._watch_project(project_dir)
+        except OSError as e:
+            log.warning(f"Cannot watch new project dir {project_dir.name}: {e}")
+            return
+        # A session file may have appeared before the watch existed
+        newest = find_newest_session(self.root)
+        if newest is not None and newest.parent == project_dir:
+            self._active = newest
+            self._written.add(newest)
+
+    # ------------------------------------------------------------------
+    # Watcher interface
+    # ------------------------------------------------------------------
+
+    def active(self) -> Optional[Path]:
+        self._drain()
+        return self._active
+
+    def recent(self, max_age: float, limit: Optional[int] = None) -> List[Path]:
+        """Sessions written within max_age, newest first — stats only files seen written."""
+        self._drain()
+        cutoff = time.time() - max_age
+        found = []
+        for path in list(self._written):
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                mtime = 0.0
+            if mtime < cutoff:
+                self._written.discard(path)  # re-added on its next write
+                continue
+            found.append((mtime, path))
+        found.sort(key=lambda item: item[0], reverse=True)
+        return [path for _, path in found[:limit]]
+
+    def wait(self, timeout: float) -> bool:
+        """Block until a session file is written or timeout elapses."""
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            ready, _, _ = select.select([self._fd, self._wake_r], [], [], remaining)
+            if self._wake_r in ready:
+                try:
+                    os.read(self._wake_r, 64)
+                except BlockingIOError:
+                    pass
+                return False
+            if ready and self._drain():
+                return True
+
+    def wake(self):
+        """Interrupt a blocked wait() (shutdown)."""
+        try:
+            os.write(self._wake_w, b"x")
+        except OSError:
+            pass
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+            self._fd = -1
+
+
+def _load_libc():
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    # AttributeError here means no inotify (non-Linux libc)
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    return libc
+
+
+def make_watcher(root: Path, mode: str = "auto"):
+    """Watcher for the projects dir. mode: "auto", "inotify", or "poll"."""
+    if mode != "poll":
+        try:
+            watcher = InotifyWatcher(root)
+            log.info(f"Watching {root} via inotify ({len(watcher._dirs)} dirs)")
+            return watcher
+        except (OSError, AttributeError) as e:
+            log.info(f"inotify unavailable ({e}), falling back to polling every {POLL_INTERVAL}s")
+    return PollingWatcher(root)
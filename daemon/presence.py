@@ -16,8 +16,8 @@ from datetime import datetime, timedelta
 from typing import Optional
 
 from core.paths import get_paths
-from daemon.schemas import Presence, load_validated, save_validated
-from daemon.cache import cache, CacheKeys, CACHE_TTLS
+from daemon.schemas import Presence, load_validated_dump, save_validated
+from daemon.cache import cache, CacheKeys, cache_ttl
 
 logger = logging.getLogger("elara.presence")
 
@@ -27,8 +27,7 @@ PRESENCE_FILE = get_paths().presence_file
 
 def _load_presence() -> dict:
     """Load current presence state."""
-    model = load_validated(PRESENCE_FILE, Presence)
-    return model.model_dump()
+    return load_validated_dump(PRESENCE_FILE, Presence)
 
 
 def _save_presence(data: dict) -> None:
@@ -133,7 +132,7 @@ def get_stats() -> dict:
         "total_hours_together": round(data["total_time_together"] / 3600, 1),
         "history": data["history"][-5:]  # Last 5 sessions
     }
-    cache.set(CacheKeys.PRESENCE_STATS, stats, CACHE_TTLS[CacheKeys.PRESENCE_STATS])
+    cache.set(CacheKeys.PRESENCE_STATS, stats, cache_ttl(CacheKeys.PRESENCE_STATS))
     return stats
 
 
@@ -31,7 +31,7 @@ except ImportError:
 from core.paths import get_paths
 from daemon.events import bus, Events
 from daemon.schemas import (
-    Principle, load_validated_list, save_validated_list,
+    Principle, load_validated_list_dump, save_validated_list,
     ElaraNotFoundError,
 )
 
@@ -53,8 +53,7 @@ CRYSTALLIZATION_THRESHOLD = 3  # How many similar insights before crystallizing
 # ============================================================================
 
 def _load() -> List[Dict]:
-    models = load_validated_list(PRINCIPLES_FILE, Principle)
-    return [m.model_dump() for m in models]
+    return load_validated_list_dump(PRINCIPLES_FILE, Principle)
 
 
 def _save(principles: List[Dict]):
@@ -17,9 +17,9 @@ Processors:
 """
 
 import logging
-from typing import List
+from typing import List, Optional
 
-from daemon.events import bus, Events, Event
+from daemon.events import bus, Delivery, Events, Event
 from daemon.cache import cache, CacheKeys
 
 logger = logging.getLogger("elara.reactive")
@@ -27,12 +27,17 @@ logger = logging.getLogger("elara.reactive")
 _initialized = False
 
 
-def setup_reactive_processors() -> int:
-    """Wire up all reactive processors. Returns count of subscriptions."""
+def setup_reactive_processors(delivery: Optional[str] = None) -> int:
+    """Wire up all reactive processors. Returns count of subscriptions.
+
+    `delivery` applies to every processor (default Delivery.INLINE — they
+    are cheap cache invalidations and log lines).
+    """
     global _initialized
     if _initialized:
         return 0
     _initialized = True
+    delivery = delivery or Delivery.INLINE
 
     count = 0
 
@@ -42,8 +47,8 @@ def setup_reactive_processors() -> int:
         cache.invalidate(CacheKeys.CONTEXT_DATA)
         logger.debug("Context cache invalidated by %s", event.type)
 
-    bus.on(Events.MOOD_CHANGED, _on_mood_for_context, priority=50, source="reactive.context")
-    bus.on(Events.MOOD_SET, _on_mood_for_context, priority=50, source="reactive.context")
+    bus.on(Events.MOOD_CHANGED, _on_mood_for_context, priority=50, source="reactive.context", delivery=delivery, remote=True)
+    bus.on(Events.MOOD_SET, _on_mood_for_context, priority=50, source="reactive.context", delivery=delivery, remote=True)
     count += 2
 
     # --- 2. Correction matcher ---
@@ -52,7 +57,7 @@ def setup_reactive_processors() -> int:
         cache.invalidate(CacheKeys.CORRECTION_INDEX)
         logger.debug("Correction index invalidated")
 
-    bus.on(Events.CORRECTION_ADDED, _on_correction_change, priority=50, source="reactive.corrections")
+    bus.on(Events.CORRECTION_ADDED, _on_correction_change, priority=50, source="reactive.corrections", delivery=delivery, remote=True)
     count += 1
 
     # --- 3. Mood congruent memory surfacing ---
@@ -70,7 +75,7 @@ def setup_reactive_processors() -> int:
                 event.data.get("reason", "unknown"),
             )
 
-    bus.on(Events.MOOD_CHANGED, _on_significant_mood_shift, priority=30, source="reactive.mood")
+    bus.on(Events.MOOD_CHANGED, _on_significant_mood_shift, priority=30, source="reactive.mood", delivery=delivery, remote=True)
     count += 1
 
     # --- 4. Episode enricher ---
@@ -85,15 +90,15 @@ def setup_reactive_processors() -> int:
                 event.data.get("event", "")[:80],
             )
 
-    bus.on(Events.EPISODE_NOTE_ADDED, _on_episode_note, priority=30, source="reactive.episodes")
+    bus.on(Events.EPISODE_NOTE_ADDED, _on_episode_note, priority=30, source="reactive.episodes", delivery=delivery, remote=True)
     count += 1
 
     # --- 5. Goal change tracker ---
     def _on_goal_change(event: Event):
         cache.invalidate(CacheKeys.GOAL_LIST)
 
-    bus.on(Events.GOAL_ADDED, _on_goal_change, priority=50, source="reactive.goals")
-    bus.on(Events.GOAL_UPDATED, _on_goal_change, priority=50, source="reactive.goals")
+    bus.on(Events.GOAL_ADDED, _on_goal_change, priority=50, source="reactive.goals", delivery=delivery, remote=True)
+    bus.on(Events.GOAL_UPDATED, _on_goal_change, priority=50, source="reactive.goals", delivery=delivery, remote=True)
     count += 2
 
     # --- 6. Dream completion ---
@@ -101,7 +106,7 @@ def setup_reactive_processors() -> int:
         cache.invalidate(CacheKeys.DREAM_STATUS)
         logger.info("Dream completed: %s", event.data.get("dream_type", "?"))
 
-    bus.on(Events.DREAM_COMPLETED, _on_dream_complete, priority=50, source="reactive.dreams")
+    bus.on(Events.DREAM_COMPLETED, _on_dream_complete, priority=50, source="reactive.dreams", delivery=delivery, remote=True)
     count += 1
 
     # --- 7. Brain integration ---
@@ -110,7 +115,7 @@ def setup_reactive_processors() -> int:
         cache.clear()
         logger.info("Brain thinking completed — cache cleared")
 
-    bus.on(Events.BRAIN_THINKING_COMPLETED, _on_brain_complete, priority=90, source="reactive.brain")
+    bus.on(Events.BRAIN_THINKING_COMPLETED, _on_brain_complete, priority=90, source="reactive.brain", delivery=delivery, remote=True)
     count += 1
 
     logger.info("Reactive processors initialized: %d subscriptions", count)
@@ -645,6 +645,8 @@ import os
 from pathlib import Path
 from typing import Type, TypeVar
 
+from daemon import file_cache
+
 T = TypeVar("T", bound=ElaraModel)
 
 
@@ -672,6 +674,14 @@ def load_validated(path: Path, schema: Type[T], default: Any = None) -> T:
         return schema()
 
 
+def load_validated_dump(path: Path, schema: Type[T], default: Any = None) -> Dict[str, Any]:
+    """load_validated(...).model_dump(), cached while the file is unchanged."""
+    return file_cache.load_cached(
+        path, schema.__name__,
+        lambda p: load_validated(p, schema, default).model_dump(),
+    )
+
+
 def _atomic_rename(tmp: Path, dest: Path):
     """Flush, fsync, then rename — crash-safe atomic write."""
     fd = os.open(str(tmp), os.O_RDONLY)
@@ -680,6 +690,7 @@ def _atomic_rename(tmp: Path, dest: Path):
     finally:
         os.close(fd)
     os.rename(str(tmp), str(dest))
+    file_cache.forget(dest)
 
 
 def save_validated(path: Path, model: ElaraModel, atomic: bool = True):
@@ -700,6 +711,7 @@ def save_validated(path: Path, model: ElaraModel, atomic: bool = True):
         _atomic_rename(tmp, path)
     else:
         path.write_text(content)
+        file_cache.forget(path)
 
 
 def load_validated_list(path: Path, schema: Type[T]) -> List[T]:
@@ -715,6 +727,14 @@ def load_validated_list(path: Path, schema: Type[T]) -> List[T]:
         return []
 
 
+def load_validated_list_dump(path: Path, schema: Type[T]) -> List[Dict[str, Any]]:
+    """[m.model_dump() for m in load_validated_list(...)], cached while unchanged."""
+    return file_cache.load_cached(
+        path, f"list:{schema.__name__}",
+        lambda p: [m.model_dump() for m in load_validated_list(p, schema)],
+    )
+
+
 def save_validated_list(path: Path, items: List[ElaraModel], atomic: bool = True):
     """Save a list of validated models to JSON array."""
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -726,6 +746,7 @@ def save_validated_list(path: Path, items: List[ElaraModel], atomic: bool = True
         _atomic_rename(tmp, path)
     else:
         path.write_text(content)
+        file_cache.forget(path)
 
 
 def atomic_write_json(path: Path, data: Any, indent: int = 2):
@@ -25,23 +25,18 @@ def get_snapshot() -> Dict[str, Any]:
     Produce a complete state-of-the-world snapshot.
 
     Returns dict with all current state, safely handling
-    unavailable modules.
+    unavailable modules. Sections come from the boot bundle, which
+    recomputes only those whose sources changed since it was built.
     """
     now = datetime.now()
-    snapshot = {
-        "timestamp": now.isoformat(),
-        "mood": _get_mood(),
-        "presence": _get_presence(),
-        "episode": _get_episode(),
-        "goals": _get_goals(),
-        "corrections": _get_corrections(),
-        "business": _get_business(),
-        "memories": _get_memory_stats(),
-        "conversations": _get_conversation_stats(),
-        "synthesis": _get_synthesis(),
-        "briefing": _get_briefing(),
-        "handoff": _get_handoff(),
-    }
+    snapshot = {"timestamp": now.isoformat()}
+    try:
+        from daemon.boot_bundle import load_bundle
+        snapshot.update(load_bundle(SNAPSHOT_SECTIONS))
+    except Exception as e:
+        logger.debug(f"Boot bundle unavailable, building snapshot directly: {e}")
+        for name, getter in SNAPSHOT_SECTIONS.items():
+            snapshot[name] = getter()
 
     return snapshot
 
@@ -193,3 +188,19 @@ def _get_handoff() -> Optional[Dict[str, Any]]:
     except Exception as e:
         logger.debug(f"Handoff unavailable: {e}")
         return None
+
+
+# Section name -> getter, in snapshot order (also materialized by boot_bundle)
+SNAPSHOT_SECTIONS = {
+    "mood": _get_mood,
+    "presence": _get_presence,
+    "episode": _get_episode,
+    "goals": _get_goals,
+    "corrections": _get_corrections,
+    "business": _get_business,
+    "memories": _get_memory_stats,
+    "conversations": _get_conversation_stats,
+    "synthesis": _get_synthesis,
+    "briefing": _get_briefing,
+    "handoff": _get_handoff,
+}
@@ -20,6 +20,7 @@ from datetime import datetime
 from typing import Optional, List
 
 from core.paths import get_paths
+from daemon import file_cache
 from daemon.schemas import atomic_write_json
 
 from daemon.emotions import get_primary_emotion
@@ -146,7 +147,7 @@ def _load_state() -> dict:
 
         if STATE_FILE.exists():
             try:
-                state = json.loads(STATE_FILE.read_text())
+                state = file_cache.load_json(STATE_FILE)
                 if "temperament" not in state:
                     state["temperament"] = TEMPERAMENT.copy()
                 if "imprints" not in state:
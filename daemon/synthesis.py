@@ -305,6 +305,7 @@ def check_for_recurring_ideas(exchanges: List[Dict], min_matches: int = 3) -> Li
     Given new conversation exchanges, check if any cluster with existing seeds.
 
     Each exchange should have: {"text": "...", "session_id": "...", "timestamp": "..."}
+    and may carry a precomputed "embedding" of its text (used instead of re-embedding).
 
     Returns list of syntheses that got reinforced or newly created.
     """
@@ -325,10 +326,12 @@ def check_for_recurring_ideas(exchanges: List[Dict], min_matches: int = 3) -> Li
             if count == 0:
                 continue
 
-            results = seed_collection.query(
-                query_texts=[text],
-                n_results=min(5, count),
-            )
+            embedding = exchange.get("embedding")
+            if embedding is not None:
+                query_kwargs = {"query_embeddings": [embedding]}
+            else:
+                query_kwargs = {"query_texts": [text]}
+            results = seed_collection.query(n_results=min(5, count), **query_kwargs)
 
             ids = results.get("ids", [[]])[0]
             distances = results.get("distances", [[]])[0]
@@ -18,6 +18,7 @@ from datetime import datetime, timedelta
 from typing import Dict, Tuple, Optional
 
 from core.paths import get_paths
+from daemon import file_cache
 from daemon.schemas import atomic_write_json
 
 logger = logging.getLogger("elara.user_state")
@@ -399,7 +400,7 @@ def get_user_state() -> Optional[dict]:
     if not USER_STATE_FILE.exists():
         return None
     try:
-        return json.loads(USER_STATE_FILE.read_text())
+        return file_cache.load_json(USER_STATE_FILE)
     except (json.JSONDecodeError, OSError):
         return None
 
@@ -5,119 +5,460 @@
 """
 Cortical Layer 2 — DELIBERATIVE worker pools.
 
-Specialized thread pools for heavy operations with backpressure:
-  - io: 4 threads — ChromaDB, file I/O, SQLite
-  - llm: 2 threads — Ollama, Gmail API, RSS feeds
+One scheduler for every tool call and background job in the MCP server:
+  - io: 4 threads to start — ChromaDB, file I/O, SQLite
+  - llm: 2 threads to start — Ollama, Gmail API, RSS feeds
 
 Why threads not processes: ChromaDB PersistentClient can't be pickled,
-all ops are I/O-bound (GIL not a bottleneck).
-
-Backpressure: Queue depth > MAX_QUEUE_DEPTH -> WorkerPoolBusy exception.
-Callers fall back to blocking execution.
+and io/llm work is I/O-bound (GIL not a bottleneck). CPU-bound pure
+functions go to the separate CPU lane below.
+
+Priority: each pool serves its queue in Priority order, FIFO within a
+class, so interactive tool calls run ahead of background reindex and
+overnight work submitted to the same pool.
+
+Adaptive size: each pool starts at max_workers threads and moves between
+min_workers and ceiling. It grows when queued work waits longer than
+WAIT_TARGET_SECONDS and shrinks only when the host is overloaded. Process
+CPU time is no signal: ONNX and Chroma run native threads outside the
+GIL, so ordinary recall load reads as "CPU-bound" without any GIL
+contention. Threads are started on demand and exit after IDLE_SECONDS
+without work.
+
+Concurrency caps: a tool in TOOL_CONCURRENCY runs at most that many
+calls at once. Extra calls wait their turn in the queue instead of being
+rejected, and don't hold a thread while they wait.
+
+CPU lane: regex extraction, Jaccard comparison, JSONL parsing and recall
+counting serialize on the GIL, so cpu_map()/run_cpu() send the pure
+kernels in the stdlib-only `kernels` package to a small process pool
+instead. Workers are spawned (not forked from a process holding Chroma
+clients and threads), import only the kernel's module, and run at lower
+CPU priority.
+Only processes that call init_workers() (MCP server, overnight) use the
+lane; hooks and CLI commands run kernels inline. ELARA_CPU_WORKERS=0 runs
+everything inline.
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
+import multiprocessing
+import os
+import sys
 import threading
-from concurrent.futures import ThreadPoolExecutor, Future
-from typing import Any, Callable, Dict, Optional
+import time
+import types
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from kernels import worker_init
 
 logger = logging.getLogger("elara.workers")
 
-MAX_QUEUE_DEPTH = 32
 
+class Priority:
+    """Scheduling class of a job — lower runs first."""
+    INTERACTIVE = 0  # tool calls a user is waiting on
+    BACKGROUND = 10  # reindex, consolidation, dreams
+    OVERNIGHT = 20   # bulk work nobody is waiting on
+
+
+_PRIORITY_NAMES = {
+    Priority.INTERACTIVE: "interactive",
+    Priority.BACKGROUND: "background",
+    Priority.OVERNIGHT: "overnight",
+}
+
+# Adaptive sizing
+WAIT_TARGET_SECONDS = float(os.environ.get("ELARA_WORKER_WAIT_TARGET", "0.05"))
+ADAPT_INTERVAL = 0.5
+IDLE_SECONDS = 30.0
+_WAIT_SAMPLES = 64
+
+IO_WORKERS_MAX = int(os.environ.get("ELARA_IO_WORKERS_MAX", str(min(16, (os.cpu_count() or 1) + 4))))
+LLM_WORKERS_MAX = int(os.environ.get("ELARA_LLM_WORKERS_MAX", "3"))
+
+# Process lane — one core stays with the server; single-core hosts run inline
+CPU_WORKERS = int(os.environ.get("ELARA_CPU_WORKERS", str(max(0, min(4, (os.cpu_count() or 1) - 1)))))
+CPU_WORKER_NICE = 5
+
+
+class _Job:
+    """A queued call and the future that receives its result."""
 
-class WorkerPoolBusy(Exception):
-    """Raised when a worker pool's queue is full."""
-    pass
+    __slots__ = ("fn", "args", "kwargs", "future", "priority", "seq", "key", "cap", "submitted")
+
+    def __init__(self, fn, args, kwargs, priority, seq, key, cap):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.future: Future = Future()
+        self.priority = priority
+        self.seq = seq
+        self.key = key
+        self.cap = cap
+        self.submitted = time.monotonic()
+
+    def __lt__(self, other: "_Job") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
 
 
 class WorkerPool:
-    """A named thread pool with queue depth tracking."""
+    """A named, priority-ordered thread pool that resizes itself."""
 
-    def __init__(self, name: str, max_workers: int):
+    def __init__(self, name: str, max_workers: int,
+                 min_workers: int = 1, ceiling: Optional[int] = None):
         self.name = name
-        self.max_workers = max_workers
-        self._executor = ThreadPoolExecutor(
-            max_workers=max_workers,
-            thread_name_prefix=f"elara-{name}",
-        )
-        self._pending = 0
+        self.min_workers = max(1, min(min_workers, max_workers))
+        self.ceiling = max(max_workers, ceiling or max_workers)
+        self.max_workers = max_workers  # current limit, adapted at runtime
         self._lock = threading.Lock()
+        self._work = threading.Condition(self._lock)
+        self._heap: List[_Job] = []
+        self._seq = itertools.count()
+        self._threads = 0
+        self._idle = 0
+        self._running: Dict[str, int] = {}
+        self._deferred: Dict[str, Deque[_Job]] = {}
+        self._waits: Deque[float] = deque(maxlen=_WAIT_SAMPLES)
+        self._closed = False
         self._total_submitted = 0
         self._total_completed = 0
-        self._total_rejected = 0
+        self._total_failed = 0
+        self._total_capped = 0
+        self._resizes = 0
+        self._last_adapt = time.monotonic()
+
+    # -- submission ---------------------------------------------------------
+
+    def submit_job(self, fn: Callable, args: Tuple = (), kwargs: Optional[Dict] = None,
+                   priority: int = Priority.INTERACTIVE,
+                   key: Optional[str] = None, cap: Optional[int] = None) -> Future:
+        """Queue fn(*args, **kwargs).
+
+        Args:
+            priority: Priority class; lower runs first
+            key: Concurrency group (usually the tool name)
+            cap: Most jobs of `key` allowed to run at once; None = no cap
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"Pool '{self.name}' is shut down")
+            job = _Job(fn, args, kwargs or {}, priority, next(self._seq), key, cap)
+            self._total_submitted += 1
+            heapq.heappush(self._heap, job)
+            self._maybe_spawn()
+            self._work.notify()
+        return job.future
 
     def submit_sync(self, fn: Callable, *args, **kwargs) -> Future:
-        """Submit work to the pool. Raises WorkerPoolBusy if overloaded."""
+        """Submit work at interactive priority. Returns a Future."""
+        return self.submit_job(fn, args, kwargs)
+
+    async def submit(self, fn: Callable, **kwargs) -> Any:
+        """Async submit — awaits result."""
+        return await asyncio.wrap_future(self.submit_job(fn, kwargs=kwargs))
+
+    # -- workers ------------------------------------------------------------
+
+    def _maybe_spawn(self) -> None:
+        # Caller holds the lock. Idle threads already cover that many queued jobs.
+        if len(self._heap) > self._idle and self._threads < self.max_workers:
+            self._threads += 1
+            threading.Thread(
+                target=self._worker, name=f"elara-{self.name}-{self._threads}",
+                daemon=True,
+            ).start()
+
+    def _next_job(self) -> Optional[_Job]:
+        """Pop the best runnable job; None once idle or shut down. Lock held."""
+        while True:
+            while self._heap:
+                job = heapq.heappop(self._heap)
+                if job.cap is not None and self._running.get(job.key, 0) >= job.cap:
+                    # Park it; it returns to the heap when a sibling finishes
+                    self._deferred.setdefault(job.key, deque()).append(job)
+                    self._total_capped += 1
+                    continue
+                if job.key is not None:
+                    self._running[job.key] = self._running.get(job.key, 0) + 1
+                return job
+            if self._closed:
+                return None
+            self._idle += 1
+            notified = self._work.wait(timeout=IDLE_SECONDS)
+            self._idle -= 1
+            if not notified and not self._heap and self._threads > self.min_workers:
+                return None
+
+    def _worker(self) -> None:
+        while True:
+            with self._lock:
+                job = self._next_job()
+                if job is None:
+                    self._threads -= 1
+                    return
+                self._waits.append(time.monotonic() - job.submitted)
+
+            result = error = None
+            started = job.future.set_running_or_notify_cancel()
+            if started:
+                try:
+                    result = job.fn(*job.args, **job.kwargs)
+                except BaseException as e:
+                    error = e
+
+            with self._lock:
+                self._total_completed += 1
+                self._total_failed += error is not None
+                if job.key is not None:
+                    self._running[job.key] -= 1
+                    parked = self._deferred.get(job.key)
+                    if parked:
+                        # Its wait for a thread starts now: time held by the
+                        # cap must not read as pool pressure in _adapt
+                        nxt = parked.popleft()
+                        nxt.submitted = time.monotonic()
+                        heapq.heappush(self._heap, nxt)
+                        if not parked:
+                            del self._deferred[job.key]
+                        self._work.notify()
+                self._adapt()
+                retire = self._threads > self.max_workers
+                if retire:
+                    self._threads -= 1
+
+            # Resolve after the bookkeeping so stats() agree with the result
+            if error is not None:
+                job.future.set_exception(error)
+            elif started:
+                job.future.set_result(result)
+            if retire:
+                return
+
+    # -- adaptive sizing ----------------------------------------------------
+
+    def _adapt(self) -> None:
+        """Move max_workers one step toward what latency and host load allow. Lock held."""
+        now = time.monotonic()
+        if now - self._last_adapt < ADAPT_INTERVAL:
+            return
+        self._last_adapt = now
+
+        limit = self.max_workers
+        if _host_overloaded():
+            limit = max(self.min_workers, limit - 1)
+        elif self._heap and _percentile(self._waits, 0.5) > WAIT_TARGET_SECONDS:
+            limit = min(self.ceiling, limit + 1)
+        if limit != self.max_workers:
+            logger.debug("Pool '%s' resized %d -> %d", self.name, self.max_workers, limit)
+            self.max_workers = limit
+            self._resizes += 1
+            if self._heap:
+                self._maybe_spawn()
+
+    # -- introspection ------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool statistics."""
         with self._lock:
-            if self._pending >= MAX_QUEUE_DEPTH:
-                self._total_rejected += 1
-                raise WorkerPoolBusy(
-                    f"Pool '{self.name}' full ({self._pending}/{MAX_QUEUE_DEPTH})"
-                )
-            self._pending += 1
-            self._total_submitted += 1
+            queued = {name: 0 for name in _PRIORITY_NAMES.values()}
+            for job in self._heap:
+                name = _PRIORITY_NAMES.get(job.priority, str(job.priority))
+                queued[name] = queued.get(name, 0) + 1
+            deferred = sum(len(d) for d in self._deferred.values())
+            running = self._total_submitted - self._total_completed - sum(queued.values()) - deferred
+            return {
+                "name": self.name,
+                "max_workers": self.max_workers,
+                "min_workers": self.min_workers,
+                "ceiling": self.ceiling,
+                "threads": self._threads,
+                "pending": self._total_submitted - self._total_completed,
+                "running": running,
+                "queued": queued,
+                "capped": deferred,
+                "submitted": self._total_submitted,
+                "completed": self._total_completed,
+                "failed": self._total_failed,
+                "cap_waits": self._total_capped,
+                "wait_ms_p50": round(_percentile(self._waits, 0.5) * 1000, 2),
+                "wait_ms_p95": round(_percentile(self._waits, 0.95) * 1000, 2),
+                "resizes": self._resizes,
+            }
 
-        def _tracked(*a, **kw):
-            try:
-                return fn(*a, **kw)
-            finally:
+    def shutdown(self, wait: bool = False) -> None:
+        """Shut down the pool. Queued jobs still run; new ones are refused."""
+        with self._lock:
+            self._closed = True
+            self._work.notify_all()
+        if wait:
+            deadline = time.monotonic() + 30
+            while time.monotonic() < deadline:
                 with self._lock:
-                    self._pending -= 1
-                    self._total_completed += 1
+                    if self._threads == 0:
+                        break
+                time.sleep(0.01)
+        logger.info("Worker pool '%s' shut down", self.name)
 
-        return self._executor.submit(_tracked, *args, **kwargs)
 
-    async def submit(self, fn: Callable, **kwargs) -> Any:
-        """Async submit — awaits result. Raises WorkerPoolBusy."""
+def _percentile(samples: Deque[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _host_overloaded() -> bool:
+    try:
+        return os.getloadavg()[0] > (os.cpu_count() or 1) * 1.5
+    except (AttributeError, OSError):
+        return False
+
+
+class ProcessLane:
+    """Process pool for CPU-bound pure functions.
+
+    Functions and arguments must pickle: module-level functions and plain
+    data. The pool starts on first use; if processes can't be started (or
+    max_workers is 0) work runs inline in the calling thread.
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._broken = False
+        self._total_submitted = 0
+        self._total_inline = 0
+
+    def _pool(self) -> Optional[ProcessPoolExecutor]:
         with self._lock:
-            if self._pending >= MAX_QUEUE_DEPTH:
-                self._total_rejected += 1
-                raise WorkerPoolBusy(
-                    f"Pool '{self.name}' full ({self._pending}/{MAX_QUEUE_DEPTH})"
-                )
-            self._pending += 1
-            self._total_submitted += 1
+            if self._executor is None and not self._broken and self.max_workers > 0:
+                try:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=worker_init,
+                        initargs=(CPU_WORKER_NICE,),
+                    )
+                except (OSError, ValueError) as e:
+                    logger.warning("CPU lane unavailable, running inline: %s", e)
+                    self._broken = True
+            return self._executor
+
+    def submit_sync(self, fn: Callable, *args) -> Future:
+        """Run fn(*args) in a worker process. Returns a Future."""
+        pool = self._pool()
+        if pool is not None:
+            try:
+                with _plain_main():  # submit() is where workers get spawned
+                    future = pool.submit(fn, *args)
+                with self._lock:
+                    self._total_submitted += 1
+                return future
+            except (BrokenProcessPool, RuntimeError, OSError) as e:
+                logger.warning("CPU lane failed, running inline: %s", e)
+                with self._lock:
+                    self._broken = True
+        return self._inline(fn, *args)
 
-        def _run():
+    def _inline(self, fn: Callable, *args) -> Future:
+        future: Future = Future()
+        with self._lock:
+            self._total_inline += 1
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def map(self, fn: Callable, items: Iterable, min_items: int = 2) -> List[Any]:
+        """[fn(item) for item in items], spread over the worker processes.
+
+        Fewer than min_items run inline — a round trip to a worker costs
+        more than a small job. A worker dying mid-batch reruns the
+        unfinished items inline.
+        """
+        items = list(items)
+        if len(items) < min_items or self._pool() is None:
+            with self._lock:
+                self._total_inline += len(items)
+            return [fn(item) for item in items]
+        futures = [self.submit_sync(fn, item) for item in items]
+        results = []
+        for item, future in zip(items, futures):
             try:
-                return fn(**kwargs)
-            finally:
+                results.append(future.result())
+            except BrokenProcessPool:
                 with self._lock:
-                    self._pending -= 1
-                    self._total_completed += 1
+                    self._broken = True
+                    self._total_inline += 1
+                results.append(fn(item))
+        return results
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self._executor, _run)
+    async def submit(self, fn: Callable, *args) -> Any:
+        """Async submit — awaits result."""
+        return await asyncio.wrap_future(self.submit_sync(fn, *args))
 
     def stats(self) -> Dict[str, Any]:
-        """Pool statistics."""
+        """Lane statistics."""
         with self._lock:
             return {
                 "name": self.name,
                 "max_workers": self.max_workers,
-                "pending": self._pending,
+                "started": self._executor is not None,
+                "broken": self._broken,
                 "submitted": self._total_submitted,
-                "completed": self._total_completed,
-                "rejected": self._total_rejected,
+                "inline": self._total_inline,
             }
 
     def shutdown(self, wait: bool = False) -> None:
-        """Shut down the pool."""
-        self._executor.shutdown(wait=wait)
-        logger.info("Worker pool '%s' shut down", self.name)
+        """Stop the worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+        logger.info("Process lane '%s' shut down", self.name)
+
+
+@contextmanager
+def _plain_main():
+    """Hide a script __main__ from spawned children.
+
+    spawn re-imports the parent's main module in every child. For
+    `python -m elara_mcp.server` that would boot a whole server per worker;
+    a package __main__ (`python -m daemon.overnight`) is skipped already.
+    """
+    main = sys.modules.get("__main__")
+    spec = getattr(main, "__spec__", None)
+    if main is None or not getattr(main, "__file__", None) or (
+            spec is not None and spec.name.endswith("__main__")):
+        yield
+        return
+    sys.modules["__main__"] = types.ModuleType("__main__")
+    try:
+        yield
+    finally:
+        sys.modules["__main__"] = main
 
 
 class WorkerManager:
     """Manages all worker pools for the cortical execution model."""
 
     def __init__(self):
-        self.io = WorkerPool("io", max_workers=4)
-        self.llm = WorkerPool("llm", max_workers=2)
-        self._pools = {"io": self.io, "llm": self.llm}
+        self.io = WorkerPool("io", max_workers=4, min_workers=2, ceiling=IO_WORKERS_MAX)
+        self.llm = WorkerPool("llm", max_workers=2, min_workers=1, ceiling=LLM_WORKERS_MAX)
+        self.cpu = ProcessLane("cpu", max_workers=CPU_WORKERS)
+        self._pools = {"io": self.io, "llm": self.llm, "cpu": self.cpu}
 
-    def get_pool(self, name: str) -> Optional[WorkerPool]:
+    def get_pool(self, name: str) -> Optional[Any]:
         """Get a pool by name."""
         return self._pools.get(name)
 
@@ -166,6 +507,25 @@ LLM_TOOLS = frozenset({
     "elara_dream_info",
 })
 
+# Long-running tools queued behind interactive calls
+TOOL_PRIORITY: Dict[str, int] = {
+    "elara_rebuild_indexes": Priority.BACKGROUND,
+    "elara_memory_consolidation": Priority.BACKGROUND,
+    "elara_kg_index": Priority.BACKGROUND,
+    "elara_dream": Priority.BACKGROUND,
+}
+
+# Most calls of a tool allowed to run at once
+TOOL_CONCURRENCY: Dict[str, int] = {
+    "elara_rebuild_indexes": 1,
+    "elara_memory_consolidation": 1,
+    "elara_kg_index": 1,
+    "elara_dream": 1,
+    "elara_briefing": 1,
+    "elara_gmail": 1,
+    "elara_llm": 2,
+}
+
 
 def get_pool_for_tool(tool_name: str, manager: Optional[WorkerManager]) -> Optional[WorkerPool]:
     """Route a tool to the appropriate worker pool."""
@@ -179,27 +539,67 @@ def get_pool_for_tool(tool_name: str, manager: Optional[WorkerManager]) -> Optio
     return manager.io
 
 
+async def run_tool(tool_name: str, fn: Callable, kwargs: Dict[str, Any]) -> Any:
+    """Run a sync tool handler on its pool with the tool's priority and cap."""
+    pool = get_pool_for_tool(tool_name, get_workers())
+    future = pool.submit_job(
+        fn, kwargs=kwargs,
+        priority=TOOL_PRIORITY.get(tool_name, Priority.INTERACTIVE),
+        key=tool_name, cap=TOOL_CONCURRENCY.get(tool_name),
+    )
+    return await asyncio.wrap_future(future)
+
+
+def cpu_map(fn: Callable, items: Iterable, min_items: int = 2) -> List[Any]:
+    """Map a picklable pure function over items on the CPU lane.
+
+    Runs inline unless this process called init_workers(): only long-lived
+    processes (MCP server, overnight) amortize worker start-up. Hooks and
+    CLI commands would pay a cold process spawn to save milliseconds.
+    """
+    if workers is None:
+        return [fn(item) for item in items]
+    return workers.cpu.map(fn, items, min_items=min_items)
+
+
+def run_cpu(fn: Callable, *args) -> Any:
+    """fn(*args) on the CPU lane, blocking for the result (inline as cpu_map)."""
+    if workers is None:
+        return fn(*args)
+    return workers.cpu.submit_sync(fn, *args).result()
+
+
 # ---------------------------------------------------------------------------
 # SINGLETON — initialized by server.py
 # ---------------------------------------------------------------------------
 
 workers: Optional[WorkerManager] = None
+_init_lock = threading.Lock()
 
 
 def init_workers() -> WorkerManager:
     """Initialize the global worker manager."""
     global workers
-    workers = WorkerManager()
-    logger.info(
-        "Worker pools initialized: io=%d, llm=%d",
-        workers.io.max_workers, workers.llm.max_workers,
-    )
+    with _init_lock:
+        if workers is None:
+            workers = WorkerManager()
+            logger.info(
+                "Worker pools initialized: io=%d (max %d), llm=%d (max %d), cpu=%d processes",
+                workers.io.max_workers, workers.io.ceiling,
+                workers.llm.max_workers, workers.llm.ceiling, workers.cpu.max_workers,
+            )
     return workers
 
 
+def get_workers() -> WorkerManager:
+    """The global worker manager, created on first use."""
+    return workers or init_workers()
+
+
 def shutdown_workers() -> None:
     """Shut down the global worker manager."""
     global workers
-    if workers:
-        workers.shutdown()
-        workers = None
+    with _init_lock:
+        if workers:
+            workers.shutdown()
+            workers = None
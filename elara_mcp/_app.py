@@ -9,9 +9,10 @@ Profile system:
   - "lean"  — 7 core tools + 1 elara_do meta-tool (~5% context)
 
 Cortical Execution Model:
-  All sync tool handlers are wrapped in async def + run_in_executor so
-  concurrent MCP calls don't block each other. The raw sync function is
-  kept in _TOOL_REGISTRY for elara_do direct dispatch.
+  All sync tool handlers are wrapped in async def and run on the Layer 2
+  worker pools (daemon/workers.py) so concurrent MCP calls don't block
+  each other. The raw sync function is kept in _TOOL_REGISTRY for elara_do
+  direct dispatch.
 
 In both modes, every tool function is stored in _TOOL_REGISTRY so
 elara_do can dispatch to any tool by name.
@@ -20,10 +21,10 @@ elara_do can dispatch to any tool by name.
 import asyncio
 import functools
 import logging
-from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from core.paths import get_paths
+from daemon.workers import run_tool
 
 # Central logging config — all elara.* loggers route here
 _log_path = get_paths().daemon_log
@@ -41,13 +42,6 @@ from mcp.server.fastmcp import FastMCP
 
 mcp = FastMCP("elara")
 
-# ---------------------------------------------------------------------------
-# Cortical Layer 2 — DELIBERATIVE executor (default pool)
-# Specialized pools are in daemon/workers.py; this is the fallback.
-# ---------------------------------------------------------------------------
-
-_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="elara-tool")
-
 logger = logging.getLogger("elara.app")
 
 # ---------------------------------------------------------------------------
@@ -88,7 +82,7 @@ def tool():
     """Profile-aware decorator replacing @mcp.tool().
 
     - Always stores the raw sync function in _TOOL_REGISTRY.
-    - Wraps sync functions in async def + run_in_executor for MCP registration.
+    - Wraps sync functions in async def + run_tool() for MCP registration.
     - In "full" mode: registers async wrapper via @mcp.tool() (all schemas visible).
     - In "lean" mode: only registers core tools via @mcp.tool().
     """
@@ -102,10 +96,7 @@ def tool():
             if not asyncio.iscoroutinefunction(fn):
                 @functools.wraps(fn)
                 async def async_wrapper(**kwargs):
-                    loop = asyncio.get_event_loop()
-                    return await loop.run_in_executor(
-                        _executor, lambda: fn(**kwargs)
-                    )
+                    return await run_tool(name, fn, kwargs)
                 register_fn = async_wrapper
             else:
                 register_fn = fn
@@ -116,8 +107,3 @@ def tool():
 
     return decorator
 
-
-def shutdown_executor() -> None:
-    """Graceful shutdown of the tool executor pool."""
-    _executor.shutdown(wait=False)
-    logger.info("Tool executor pool shut down")
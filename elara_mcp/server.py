@@ -53,7 +53,7 @@ import logging
 import os as _os
 import sys as _sys
 
-from elara_mcp._app import mcp, get_profile, set_profile, shutdown_executor
+from elara_mcp._app import mcp, get_profile, set_profile
 
 logger = logging.getLogger("elara.server")
 
@@ -150,20 +150,27 @@ def _init_cortical():
 
     # Layer 0 — REFLEX: Cache + event-driven invalidation
     from daemon.cache import cache, setup_cache_invalidation
+    from daemon.cache_snapshot import load_snapshot
     setup_cache_invalidation(cache)
-    logger.info("Layer 0 (REFLEX): Cache initialized")
+    warm = load_snapshot(cache)
+    logger.info("Layer 0 (REFLEX): Cache initialized (%d entries warm)", warm)
 
     # Layer 1 — REACTIVE: Async event processors
     from daemon.reactive import setup_reactive_processors
     n_subs = setup_reactive_processors()
     logger.info("Layer 1 (REACTIVE): %d processors initialized", n_subs)
 
+    # Cross-process: relay invalidating events to/from the other daemons
+    from daemon.event_journal import setup_event_journal
+    if setup_event_journal():
+        logger.info("Event journal attached: caches coherent across processes")
+
     # Layer 2 — DELIBERATIVE: Worker pools
     from daemon.workers import init_workers
     wm = init_workers()
     logger.info(
-        "Layer 2 (DELIBERATIVE): Workers initialized (io=%d, llm=%d)",
-        wm.io.max_workers, wm.llm.max_workers,
+        "Layer 2 (DELIBERATIVE): Workers initialized (io=%d-%d, llm=%d-%d)",
+        wm.io.min_workers, wm.io.ceiling, wm.llm.min_workers, wm.llm.ceiling,
     )
 
     # Layer 3 — CONTEMPLATIVE: Brain events are wired through events.py
@@ -178,9 +185,16 @@ def _init_cortical():
 
 def _shutdown_cortical():
     """Graceful shutdown of all cortical layers."""
+    from daemon.cache_snapshot import save_snapshot
+    from daemon.event_journal import teardown_event_journal
+    from daemon.events import bus
     from daemon.workers import shutdown_workers
+    save_snapshot()
+    # Queued subscribers (the Layer 1 bridge signs on its own worker) must
+    # finish before exit; the journal also drains, but may be off or absent
+    bus.drain()
+    teardown_event_journal()
     shutdown_workers()
-    shutdown_executor()
     logger.info("Cortical Execution Model: shutdown complete")
 
 
@@ -7,12 +7,16 @@
 Consolidated from 7 → 4 tools.
 """
 
+from datetime import datetime, timezone
 from typing import Optional
 from elara_mcp._app import tool
 from memory.vector import remember, recall, get_memory
+from memory.search import SOURCES, search_everything
 from memory.conversations import (
     recall_conversation, recall_conversation_with_context,
     ingest_conversations, get_conversations, get_conversations_for_episode,
+    dedupe_conversations, compress_old_conversations, expand_conversation_summary,
+    conversation_window,
 )
 
 
@@ -43,7 +47,8 @@ def elara_remember(
 def elara_recall(
     query: str,
     n_results: int = 5,
-    memory_type: Optional[str] = None
+    memory_type: Optional[str] = None,
+    sources: Optional[str] = None,
 ) -> str:
     """
     Search memories by meaning. Returns semantically similar memories.
@@ -52,10 +57,26 @@ def elara_recall(
         query: What to search for (searches by meaning, not keywords)
         n_results: How many memories to return (default 5)
         memory_type: Filter by type (conversation, fact, moment, feeling, decision)
+        sources: Search several stores at once instead — comma-separated from
+            memories, conversations, principles, reasoning, milestones,
+            corrections, workflows, or "all". n_results is then per store.
 
     Returns:
         Matching memories with relevance scores
     """
+    if sources:
+        names = None if sources.strip() == "all" else [s.strip() for s in sources.split(",") if s.strip()]
+        try:
+            hits = search_everything(query, sources=names, k_per_source=n_results)
+        except ValueError as e:
+            return f"{e}. Valid: {', '.join(SOURCES)}, all"
+        if not hits:
+            return "No matches found."
+        return "\n".join(
+            f"[{h['source']}] (score:{h['score']:.2f}) {' '.join(h['content'].split())[:200]}"
+            for h in hits
+        )
+
     kwargs = {"n_results": n_results}
     if memory_type:
         kwargs["memory_type"] = memory_type
@@ -86,6 +107,9 @@ def elara_recall_conversation(
     project: Optional[str] = None,
     context_size: int = 0,
     episode_id: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    expand: bool = False,
 ) -> str:
     """
     Search past conversations by meaning, with optional context or episode filter.
@@ -99,6 +123,10 @@ def elara_recall_conversation(
         project: Filter by project dir (e.g., "-home-user")
         context_size: Include N exchanges before/after each match (0 = no context)
         episode_id: Get conversations from a specific episode instead of searching
+        since: Only exchanges on/after this date (YYYY-MM-DD)
+        until: Only exchanges on/before this date (YYYY-MM-DD)
+        expand: Show the raw exchanges behind [summary] hits from old,
+            compressed sessions
 
     Returns:
         Matching conversation exchanges with dates and relevance
@@ -120,10 +148,18 @@ def elara_recall_conversation(
     if not query:
         return "Provide a query to search, or an episode_id to retrieve."
 
+    for label, value in (("since", since), ("until", until)):
+        if value:
+            try:
+                datetime.fromisoformat(value)
+            except ValueError:
+                return f"Invalid {label} date: {value!r} (expected YYYY-MM-DD)"
+
     # With surrounding context
     if context_size > 0:
         results = recall_conversation_with_context(
-            query, n_results=n_results, context_size=context_size, project=project
+            query, n_results=n_results, context_size=context_size, project=project,
+            since=since, until=until,
         )
         if not results:
             return "No matching conversations found."
@@ -150,11 +186,17 @@ def elara_recall_conversation(
                 preview = ctx[:200] + "..." if len(ctx) > 200 else ctx
                 section.append(f"  [after] {preview}")
 
+            for raw in r.get("expanded", []):
+                preview = raw[:200] + "..." if len(raw) > 200 else raw
+                section.append(f"  [raw] {preview}")
+
             lines.append("\n".join(section))
         return "\n\n---\n\n".join(lines)
 
     # Standard search
-    results = recall_conversation(query, n_results=n_results, project=project)
+    results = recall_conversation(
+        query, n_results=n_results, project=project, since=since, until=until,
+    )
     if not results:
         return "No matching conversations found. Try running elara_conversations(action='ingest') first."
 
@@ -173,19 +215,39 @@ def elara_recall_conversation(
         header = f"[{date}] (score: {score:.2f}, sem: {relevance:.2f}, rec: {recency:.2f}, session: {session}...)"
         if episode:
             header += f"\n  Episode: {episode}"
+        if expand and r.get("tier") == "summary":
+            raw = expand_conversation_summary(
+                r.get("session_id", ""), r.get("covers_from"), r.get("covers_to"),
+            )
+            content += "".join(
+                f"\n  [raw {e['exchange_index']}] {e['content'][:200]}" for e in raw[:10]
+            )
         lines.append(f"{header}\n{content}")
 
     return "\n\n---\n\n".join(lines)
 
 
 @tool()
-def elara_conversations(action: str = "stats", force: bool = False) -> str:
+def elara_conversations(
+    action: str = "stats",
+    force: bool = False,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    project: Optional[str] = None,
+) -> str:
     """
-    Conversation memory management — stats or ingestion.
+    Conversation memory management — stats, ingestion, dedup, time windows.
 
     Args:
-        action: "stats" to view statistics, "ingest" to index new conversations
-        force: For ingest: if True, re-index everything (default: incremental)
+        action: "stats" to view statistics, "ingest" to index new conversations,
+            "dedupe" to collapse duplicate exchanges from resumed sessions,
+            "compress" to replace old sessions with summary chunks,
+            "window" for what happened in a date range (no semantic search)
+        force: For ingest: if True, re-index everything (default: incremental).
+            For dedupe: re-run even if the backfill already completed.
+        since: For window: first day, YYYY-MM-DD (default: 7 days before until)
+        until: For window: last day, YYYY-MM-DD (default: today)
+        project: For window: only this project dir (e.g., "-home-user")
 
     Returns:
         Statistics or ingestion results
@@ -200,6 +262,57 @@ def elara_conversations(action: str = "stats", force: bool = False) -> str:
             f"  Errors: {len(stats['errors'])}"
         )
 
+    if action == "dedupe":
+        stats = dedupe_conversations(force=force)
+        if stats["skipped"]:
+            return "Dedup backfill already done. Pass force=True to re-run."
+        return (
+            f"Dedup backfill complete:\n"
+            f"  Rows: {stats['rows_before']} -> {stats['rows_after']}\n"
+            f"  Duplicates removed: {stats['duplicates_removed']}\n"
+            f"  Rows re-keyed: {stats['rows_rekeyed']}\n"
+            f"  Space reclaimed: ~{stats['bytes_reclaimed'] // 1024} KB"
+        )
+
+    if action == "compress":
+        stats = compress_old_conversations()
+        return (
+            f"Summary tier:\n"
+            f"  Sessions compressed: {stats['sessions']}\n"
+            f"  Exchanges archived: {stats['exchanges_archived']}\n"
+            f"  Summary chunks: {stats['summary_chunks']}"
+        )
+
+    if action == "window":
+        for label, value in (("since", since), ("until", until)):
+            if value:
+                try:
+                    datetime.fromisoformat(value)
+                except ValueError:
+                    return f"Invalid {label} date: {value!r} (expected YYYY-MM-DD)"
+        w = conversation_window(since=since, until=until, project=project)
+        if not w["exchanges"]:
+            return f"No conversations between {w['since']} and {w['until']}."
+
+        lines = [
+            f"Conversations {w['since']} → {w['until']}: {w['exchanges']} exchanges, "
+            f"{w['sessions']} sessions, {w['active_days']} active days"
+        ]
+        # Day buckets come from the exchanges' UTC timestamps; show times in UTC too
+        for d in w["days"]:
+            first = datetime.fromtimestamp(d["first_epoch"], tz=timezone.utc).strftime("%H:%M")
+            last = datetime.fromtimestamp(d["last_epoch"], tz=timezone.utc).strftime("%H:%M")
+            lines.append(f"\n[{d['day']}] {d['exchanges']} exchanges, "
+                         f"{d['sessions']} sessions ({first}–{last} UTC)")
+            for preview in d["top_previews"][:3]:
+                lines.append(f"  - {preview}")
+        if len(w["projects"]) > 1:
+            lines.append("\nBy project:")
+            for p in w["projects"]:
+                lines.append(f"  {p['project_dir'] or '(live)'}: {p['exchanges']} exchanges, "
+                             f"{p['sessions']} sessions")
+        return "\n".join(lines)
+
     # stats (default)
     conv = get_conversations()
     s = conv.stats()
@@ -208,6 +321,9 @@ def elara_conversations(action: str = "stats", force: bool = False) -> str:
         f"  Indexed exchanges: {s['indexed_exchanges']}\n"
         f"  Sessions ingested: {s['sessions_ingested']}\n"
         f"  Cross-referenced: {s.get('cross_referenced', 0)} (linked to episodes)\n"
+        f"  Duplicates skipped: {s.get('duplicates_skipped', 0)} (resumed-session copies)\n"
+        f"  Summarized sessions: {s.get('sessions_summarized', 0)} "
+        f"({s.get('exchanges_archived', 0)} exchanges archived)\n"
         f"  Distance metric: cosine\n"
         f"  Scoring: semantic ({100 - 15}%) + recency ({15}%)"
     )
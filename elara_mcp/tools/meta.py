@@ -7,16 +7,15 @@
 Only loaded in lean profile. Registered directly via @mcp.tool() so it
 always gets a full MCP schema.
 
-Cortical integration: elara_do runs dispatched tools in the thread pool
-executor so they don't block the MCP event loop.
+Cortical integration: elara_do runs dispatched tools on the Layer 2 worker
+pools so they don't block the MCP event loop.
 """
 
-import asyncio
 import inspect
 import json
-from concurrent.futures import ThreadPoolExecutor
 
-from elara_mcp._app import mcp, _TOOL_REGISTRY, _CORE_TOOLS, _executor
+from elara_mcp._app import mcp, _TOOL_REGISTRY, _CORE_TOOLS
+from daemon.workers import run_tool
 
 
 @mcp.tool()
@@ -148,9 +147,8 @@ async def elara_do(tool: str, params: str = "{}") -> str:
             f"Expected signature:\n" + "\n".join(param_info)
         )
 
-    # Dispatch via executor — non-blocking
+    # Dispatch via the tool's worker pool — non-blocking
     try:
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(_executor, lambda: fn(**kwargs))
+        return await run_tool(full_name, fn, kwargs)
     except Exception as e:
         return f"Error running '{name}': {type(e).__name__}: {e}"
@@ -256,4 +256,24 @@ def elara_status() -> str:
     if residue and residue != "Mind is clear.":
         lines.append(f"[Elara] {residue}")
 
+    slowest = _format_slowest_handlers()
+    if slowest:
+        lines.append(f"[Elara] {slowest}")
+
     return "\n".join(lines)
+
+
+def _format_slowest_handlers(top: int = 3) -> str:
+    """One line naming the event handlers that cost the most per call."""
+    from daemon.events import bus
+    stats = bus.stats(top=top)
+    handlers = stats["slowest_handlers"]
+    if not handlers:
+        return ""
+    parts = [
+        f"{h['handler']} {h['mean_ms']:.1f}ms avg / {h['max_ms']:.0f}ms max"
+        + (f" ({h['delivery']})" if h["delivery"] != "inline" else "")
+        + (f", {h['errors']} err" if h["errors"] else "")
+        for h in handlers
+    ]
+    return "Slowest event handlers: " + "; ".join(parts)
@@ -62,6 +62,12 @@ try:
 except ImportError:
     TEMPORAL_AVAILABLE = False
 
+try:
+    from daemon.boot_bundle import load_bundle
+    BUNDLE_AVAILABLE = True
+except ImportError:
+    BUNDLE_AVAILABLE = False
+
 
 def boot():
     """Run boot sequence and output context."""
@@ -132,10 +138,19 @@ def boot():
         except Exception:
             pass  # Don't break boot if ingestion fails
 
+    # Precomputed boot bundle (session end / overnight) — only sections
+    # whose sources changed since are recomputed here
+    bundle = {}
+    if BUNDLE_AVAILABLE:
+        try:
+            bundle = load_bundle(["temporal", "business_summary", "briefing_summary"])
+        except Exception:
+            pass  # Fall back to computing each section below
+
     # Long-range memory — surface old important memories + landmarks
     if TEMPORAL_AVAILABLE:
         try:
-            temporal_ctx = boot_temporal_context()
+            temporal_ctx = bundle["temporal"] if "temporal" in bundle else boot_temporal_context()
             if temporal_ctx:
                 print(temporal_ctx)
         except Exception:
@@ -153,7 +168,7 @@ def boot():
     # Business summary — active ideas, stale ideas
     if BUSINESS_AVAILABLE:
         try:
-            biz = business_boot_summary()
+            biz = bundle["business_summary"] if "business_summary" in bundle else business_boot_summary()
             if biz:
                 print(biz)
         except Exception:
@@ -162,7 +177,7 @@ def boot():
     # Daily briefing — RSS feed highlights
     if BRIEFING_AVAILABLE:
         try:
-            brief = briefing_boot_summary()
+            brief = bundle["briefing_summary"] if "briefing_summary" in bundle else briefing_boot_summary()
             if brief:
                 print(brief)
         except Exception:
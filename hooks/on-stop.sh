@@ -10,5 +10,8 @@ python -c "from daemon.presence import end_session; end_session()" 2>/dev/null &
 # Context is passed via environment or defaults to "session ended"
 python -c "from daemon.context import save_context; save_context(last_exchange='session ended')" 2>/dev/null &
 
+# Materialize the boot bundle so the next session starts from one file
+python -m daemon.boot_bundle build session-end >/dev/null 2>&1 &
+
 # Touch session marker so brain scheduler knows we just left
 touch "$HOME/.claude/elara-session-ended" 2>/dev/null &
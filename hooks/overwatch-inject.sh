@@ -1,11 +1,30 @@
 #!/bin/bash
-# Overwatch injection hook — reads inject file if it exists, outputs it, deletes it.
+# Overwatch injection hook — fetches this session's pending injection and outputs it.
 # Called by Claude Code on every UserPromptSubmit.
 # Silent if no injection pending.
+#
+# The session_id comes from the hook's JSON on stdin. The daemon's socket
+# channel is tried first (acknowledged, consumed exactly once); when no
+# daemon is listening, the per-session inject file and then the shared
+# legacy file are read and deleted.
+#
+# Python starts only when the socket exists, and runs inject_channel.py as
+# a plain stdlib script (-I: no daemon/ on sys.path, no package imports).
 
-INJECT_FILE="$HOME/.claude/elara-overwatch-inject.md"
+ELARA_ROOT="$(cd "$(dirname "$0")/.." && pwd)"
+SOCKET="${ELARA_DATA_DIR:-$HOME/.elara}/elara-overwatch.sock"
+SESSION_ID=$(grep -o '"session_id"[[:space:]]*:[[:space:]]*"[^"]*"' | head -1 | sed 's/.*"\([^"]*\)"$/\1/')
 
-if [ -f "$INJECT_FILE" ]; then
-    cat "$INJECT_FILE"
-    rm -f "$INJECT_FILE"
+if [ -n "$SESSION_ID" ] && [ -S "$SOCKET" ]; then
+    if python3 -I "$ELARA_ROOT/daemon/inject_channel.py" fetch "$SESSION_ID" "$SOCKET" 2>/dev/null; then
+        exit 0
+    fi
 fi
+
+for INJECT_FILE in ${SESSION_ID:+"$HOME/.claude/elara-overwatch-inject-$SESSION_ID.md"} "$HOME/.claude/elara-overwatch-inject.md"; do
+    if [ -f "$INJECT_FILE" ]; then
+        cat "$INJECT_FILE"
+        rm -f "$INJECT_FILE"
+        break
+    fi
+done
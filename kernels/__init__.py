@@ -0,0 +1,23 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Pure CPU-bound kernels for the CPU lane (daemon/workers.py).
+
+Every module here is stdlib-only and never imports core, daemon or memory,
+so a spawned worker loads exactly what the kernel needs — no vector store,
+no pydantic, no logging setup from the MCP app.
+"""
+
+import os
+import sys
+
+
+def worker_init(nice: int = 0) -> None:
+    """Runs once in each CPU lane worker process."""
+    # The MCP server speaks JSON-RPC on stdout; stray prints must not reach it
+    sys.stdout = sys.stderr
+    try:
+        os.nice(nice)
+    except (AttributeError, OSError):
+        pass
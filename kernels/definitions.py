@@ -0,0 +1,53 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Definition comparison — pairwise cross-document word overlap for the
+knowledge graph contradiction check (memory.knowledge.validate).
+
+Works on bare content strings and returns indices, so a CPU lane job
+ships only the text it compares, not whole node rows.
+"""
+
+from typing import List, Tuple
+
+CONFLICT_SIMILARITY = 0.85  # below this, two definitions are flagged
+
+# (group, doc_i, doc_j, def_a, def_b, similarity)
+Conflict = Tuple[int, int, int, int, int, float]
+
+
+def jaccard(words_a: set, words_b: set) -> float:
+    """Jaccard similarity between word sets."""
+    if not words_a or not words_b:
+        return 0.0
+    return len(words_a & words_b) / len(words_a | words_b)
+
+
+def compare_definitions(groups: List[List[List[str]]]) -> List[Conflict]:
+    """Conflicting definition pairs across documents.
+
+    groups[g][doc] is the list of non-empty definition contents one
+    document gives for concept g. Every pair from two different documents
+    that is not identical and overlaps below CONFLICT_SIMILARITY is
+    returned as indices into groups, in group/doc/definition order.
+    """
+    conflicts: List[Conflict] = []
+    for g, docs in enumerate(groups):
+        # Lowercased content and word set once per definition, not per pair
+        prepared = [
+            [(c.lower().strip(), set(c.lower().split())) for c in contents]
+            for contents in docs
+        ]
+        for i in range(len(prepared)):
+            for j in range(i + 1, len(prepared)):
+                for a, (content_a, words_a) in enumerate(prepared[i]):
+                    for b, (content_b, words_b) in enumerate(prepared[j]):
+                        # Simple heuristic: if content is substantially different
+                        if content_a == content_b:
+                            continue
+                        similarity = jaccard(words_a, words_b)
+                        if similarity < CONFLICT_SIMILARITY:
+                            conflicts.append((g, i, j, a, b, similarity))
+    return conflicts
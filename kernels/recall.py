@@ -0,0 +1,59 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Recall log counting — recalls per memory_id over a byte range of the
+append-only recall log. Used by memory.consolidation.
+"""
+
+import json
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+
+def count_recalls(job: Tuple[str, int, int, Optional[str]]) -> Dict[str, int]:
+    """Count recalls per memory_id in lines starting in [start, end) of the log.
+
+    job = (log path, start, end, since). A line belongs to the range its
+    first byte falls in, so adjacent ranges never count a line twice.
+    """
+    path, start, end, since = job
+    counts: Dict[str, int] = {}
+
+    cutoff = None
+    if since:
+        try:
+            cutoff = datetime.fromisoformat(since)
+        except ValueError:
+            pass
+
+    try:
+        with open(path, "rb") as f:
+            if start > 0:
+                f.seek(start - 1)
+                f.readline()  # finish the line that straddles start
+            while f.tell() < end:
+                line = f.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+                if cutoff:
+                    try:
+                        ts = datetime.fromisoformat(entry["timestamp"])
+                        if ts < cutoff:
+                            continue
+                    except (KeyError, ValueError):
+                        continue
+                mid = entry.get("memory_id", "")
+                if mid:
+                    counts[mid] = counts.get(mid, 0) + 1
+    except OSError:
+        pass
+
+    return counts
@@ -0,0 +1,140 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Session JSONL parsing — user/assistant exchange pairs from a Claude Code
+session file. Used by conversation ingest (memory.conversations).
+"""
+
+import json
+import re
+from typing import Any, Dict, Optional
+
+# Regex to strip <system-reminder>...</system-reminder> blocks
+SYSTEM_REMINDER_RE = re.compile(r'<system-reminder>.*?</system-reminder>', re.DOTALL)
+
+
+def clean_text(text: str) -> str:
+    """Strip system-reminder blocks and clean up text."""
+    text = SYSTEM_REMINDER_RE.sub('', text)
+    text = text.strip()
+    return text
+
+
+def extract_user_text(message: dict) -> Optional[str]:
+    """Extract user text from a message entry. Returns None if not real user input."""
+    content = message.get("message", {}).get("content", "")
+
+    if isinstance(content, str):
+        text = clean_text(content)
+        if text:
+            return text
+        return None
+    elif isinstance(content, list):
+        texts = []
+        for block in content:
+            if isinstance(block, dict) and block.get("type") == "text":
+                cleaned = clean_text(block.get("text", ""))
+                if cleaned:
+                    texts.append(cleaned)
+        if texts:
+            return "\n".join(texts)
+    return None
+
+
+def extract_assistant_text(message: dict) -> Optional[str]:
+    """Extract assistant text from a message entry. Skip tool_use, thinking blocks."""
+    content = message.get("message", {}).get("content", [])
+
+    if isinstance(content, str):
+        text = clean_text(content)
+        return text if text else None
+
+    if isinstance(content, list):
+        texts = []
+        for block in content:
+            if isinstance(block, dict) and block.get("type") == "text":
+                cleaned = clean_text(block.get("text", ""))
+                if cleaned:
+                    texts.append(cleaned)
+        if texts:
+            return "\n".join(texts)
+    return None
+
+
+def parse_session_file(file_path: str) -> Dict[str, Any]:
+    """
+    Read a JSONL session file once: {"project_cwd", "exchanges"}.
+    Each exchange = user text + next assistant text response.
+
+    Pure, so ingest_all() can parse large batches on the CPU lane.
+    """
+    exchanges = []
+    entries = []
+    project_cwd = ""
+
+    with open(file_path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(entry, dict):
+                continue
+            entries.append(entry)
+            # Project cwd from first user entry
+            if not project_cwd and entry.get("type") == "user" and entry.get("cwd"):
+                project_cwd = entry["cwd"]
+
+    # Filter to user and assistant messages only
+    messages = []
+    for entry in entries:
+        entry_type = entry.get("type")
+        if entry_type not in ("user", "assistant"):
+            continue
+        if entry.get("isSidechain"):
+            continue
+        messages.append(entry)
+
+    # Pair: user text + following assistant text
+    i = 0
+    while i < len(messages):
+        msg = messages[i]
+
+        if msg.get("type") == "user":
+            user_text = extract_user_text(msg)
+            user_ts = msg.get("timestamp", "")
+
+            if user_text:
+                assistant_text = None
+                assistant_ts = ""
+                j = i + 1
+                while j < len(messages):
+                    next_msg = messages[j]
+                    if next_msg.get("type") == "assistant":
+                        text = extract_assistant_text(next_msg)
+                        if text:
+                            assistant_text = text
+                            assistant_ts = next_msg.get("timestamp", "")
+                            break
+                        j += 1
+                    elif next_msg.get("type") == "user":
+                        break
+                    else:
+                        j += 1
+
+                if assistant_text:
+                    exchanges.append({
+                        "user_text": user_text,
+                        "assistant_text": assistant_text,
+                        "timestamp": user_ts or assistant_ts,
+                        "exchange_index": len(exchanges),
+                    })
+
+        i += 1
+
+    return {"project_cwd": project_cwd, "exchanges": exchanges}
@@ -5,3 +5,4 @@
 """Elara memory modules - vector database, semantic search, and conversation memory."""
 from .vector import VectorMemory, get_memory, remember, recall
 from .conversations import ConversationMemory, get_conversations, recall_conversation
+from .search import search_everything
@@ -19,6 +19,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from core.paths import get_paths
+from kernels.recall import count_recalls
 
 logger = logging.getLogger("elara.memory.consolidation")
 
@@ -34,6 +35,7 @@ MAX_IMPORTANCE = 1.0
 PROTECTED_FLOOR = 0.3           # Decay floor for decisions / high-importance
 CONTRADICTION_LOW = 0.50        # Minimum similarity to check for contradictions
 CONTRADICTION_HIGH = 0.85       # Maximum (above this = duplicate, not contradiction)
+RECALL_PARALLEL_BYTES = 4 * 1024 * 1024  # Recall log byte range per CPU lane job
 
 
 # ---------------------------------------------------------------------------
@@ -100,37 +102,22 @@ class MemoryConsolidator:
         """Count recalls per memory_id, optionally since a timestamp."""
         counts: Dict[str, int] = {}
         log_path = self._paths.recall_log
-        if not log_path.exists():
-            return counts
-
-        cutoff = None
-        if since:
-            try:
-                cutoff = datetime.fromisoformat(since)
-            except ValueError:
-                pass
-
         try:
-            for line in log_path.read_text().splitlines():
-                if not line.strip():
-                    continue
-                try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                if cutoff:
-                    try:
-                        ts = datetime.fromisoformat(entry["timestamp"])
-                        if ts < cutoff:
-                            continue
-                    except (KeyError, ValueError):
-                        continue
-                mid = entry.get("memory_id", "")
-                if mid:
-                    counts[mid] = counts.get(mid, 0) + 1
+            size = log_path.stat().st_size
         except OSError:
-            pass
+            return counts
 
+        # The log only grows; big ones are counted in byte ranges on the CPU lane
+        if size < RECALL_PARALLEL_BYTES:
+            return count_recalls((str(log_path), 0, size, since))
+
+        from daemon.workers import cpu_map
+        step = RECALL_PARALLEL_BYTES
+        jobs = [(str(log_path), start, min(start + step, size), since)
+                for start in range(0, size, step)]
+        for part in cpu_map(count_recalls, jobs):
+            for mid, n in part.items():
+                counts[mid] = counts.get(mid, 0) + n
         return counts
 
     # ------------------------------------------------------------------
@@ -7,9 +7,14 @@ Elara Conversation Memory v2 — Search past conversations by meaning.
 
 Package re-exports. Composes ConversationMemory from mixins:
 - ConversationBase (core.py) — DB init, manifest, text utils, stats
+- ConversationManifest (manifest.py) — SQLite ingestion manifest + counters
 - IngesterMixin (ingester.py) — extract and index session files
 - SearcherMixin (searcher.py) — cosine recall with recency weighting
 - CrossRefMixin (crossref.py) — episode cross-referencing
+- DedupMixin (dedup.py) — content-hash dedup backfill for resumed sessions
+- ShardedCollection (shards.py) — optional monthly/quarterly time partitions
+- CompressionMixin (compression.py) — summary tier for old sessions + raw archive
+- RollupMixin (rollups.py) — per-day/per-project time-window rollups (no vector search)
 """
 
 from typing import List, Optional, Dict, Any
@@ -18,9 +23,15 @@ from memory.conversations.core import ConversationBase
 from memory.conversations.ingester import IngesterMixin
 from memory.conversations.searcher import SearcherMixin
 from memory.conversations.crossref import CrossRefMixin
+from memory.conversations.dedup import DedupMixin
+from memory.conversations.compression import CompressionMixin
+from memory.conversations.rollups import RollupMixin
 
 
-class ConversationMemory(ConversationBase, IngesterMixin, SearcherMixin, CrossRefMixin):
+class ConversationMemory(
+    ConversationBase, IngesterMixin, SearcherMixin, CrossRefMixin, DedupMixin, CompressionMixin,
+    RollupMixin,
+):
     """
     Semantic search over past conversations with cosine similarity,
     recency weighting, context windows, and episode cross-referencing.
@@ -39,15 +50,22 @@ def get_conversations() -> ConversationMemory:
     return _conversations
 
 
-def recall_conversation(query: str, n_results: int = 5, project: Optional[str] = None) -> List[Dict[str, Any]]:
-    return get_conversations().recall(query, n_results=n_results, project=project)
+def recall_conversation(
+    query: str, n_results: int = 5, project: Optional[str] = None,
+    since: Optional[str] = None, until: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    return get_conversations().recall(
+        query, n_results=n_results, project=project, since=since, until=until,
+    )
 
 
 def recall_conversation_with_context(
-    query: str, n_results: int = 3, context_size: int = 2, project: Optional[str] = None
+    query: str, n_results: int = 3, context_size: int = 2, project: Optional[str] = None,
+    since: Optional[str] = None, until: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     return get_conversations().recall_with_context(
-        query, n_results=n_results, context_size=context_size, project=project
+        query, n_results=n_results, context_size=context_size, project=project,
+        since=since, until=until,
     )
 
 
@@ -55,5 +73,28 @@ def ingest_conversations(force: bool = False) -> Dict[str, Any]:
     return get_conversations().ingest_all(force=force)
 
 
+def dedupe_conversations(force: bool = False) -> Dict[str, Any]:
+    return get_conversations().dedupe_backfill(force=force)
+
+
+def compress_old_conversations(days: Optional[int] = None, use_llm: bool = False) -> Dict[str, Any]:
+    kwargs = {"use_llm": use_llm}
+    if days is not None:
+        kwargs["days"] = days
+    return get_conversations().compress_old_sessions(**kwargs)
+
+
+def expand_conversation_summary(
+    session_id: str, covers_from: Optional[int] = None, covers_to: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    return get_conversations().expand_summary(session_id, covers_from, covers_to)
+
+
+def conversation_window(
+    since: Optional[str] = None, until: Optional[str] = None, project: Optional[str] = None,
+) -> Dict[str, Any]:
+    return get_conversations().window(since=since, until=until, project=project)
+
+
 def get_conversations_for_episode(episode_id: str, n_results: int = 20) -> List[Dict[str, Any]]:
     return get_conversations().get_conversations_for_episode(episode_id, n_results=n_results)
@@ -5,7 +5,7 @@
 """
 Elara Conversation Memory — CLI interface.
 
-Usage: python -m memory.conversations [ingest|search|context|stats|test|episode]
+Usage: python -m memory.conversations [ingest|search|context|stats|test|episode|dedupe|shards|compress|window]
 """
 
 import sys
@@ -17,12 +17,16 @@ from memory.conversations.core import PROJECTS_DIR
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python -m memory.conversations [ingest|search|context|stats|test|episode]")
+        print("Usage: python -m memory.conversations [ingest|search|context|stats|test|episode|dedupe|shards|compress|window]")
         print("  ingest [--force]       — Index all session files")
         print("  search <query>         — Search past conversations")
         print("  context <query>        — Search with surrounding context")
         print("  episode <episode_id>   — Get conversations for an episode")
         print("  stats                  — Show index statistics")
+        print("  dedupe [--force]       — Collapse duplicate exchanges (one-time backfill)")
+        print("  shards [reshard|archive <days>] — List, populate, or archive time shards")
+        print("  compress [days] [--llm] — Summarize sessions older than N days")
+        print("  window [since] [until] — Per-day activity for a date range (default: last 7 days)")
         print("  test                   — Test extraction on one file")
         sys.exit(1)
 
@@ -120,6 +124,58 @@ def main():
         print(f"Sessions ingested: {s['sessions_ingested']}")
         print(f"Cross-referenced: {s['cross_referenced']} (linked to episodes)")
         print(f"Manifest entries: {s['manifest_entries']}")
+        print(f"Duplicates skipped: {s['duplicates_skipped']} (resumed-session copies)")
+
+    elif cmd == "dedupe":
+        force = "--force" in sys.argv
+        cm = ConversationMemory()
+        s = cm.dedupe_backfill(force=force)
+        if s["skipped"]:
+            print("Backfill already done (use --force to re-run).")
+        else:
+            print(f"Rows: {s['rows_before']} -> {s['rows_after']}")
+            print(f"Duplicates removed: {s['duplicates_removed']}")
+            print(f"Rows re-keyed: {s['rows_rekeyed']}")
+            print(f"Space reclaimed: ~{s['bytes_reclaimed'] // 1024} KB")
+
+    elif cmd == "compress":
+        args = [a for a in sys.argv[2:] if not a.startswith("--")]
+        cm = ConversationMemory()
+        kwargs = {"use_llm": "--llm" in sys.argv}
+        if args:
+            kwargs["days"] = int(args[0])
+        s = cm.compress_old_sessions(**kwargs)
+        print(f"Sessions compressed: {s['sessions']}")
+        print(f"Exchanges archived: {s['exchanges_archived']} (~{s['raw_bytes'] // 1024} KB raw)")
+        print(f"Summary chunks: {s['summary_chunks']}")
+
+    elif cmd == "window":
+        cm = ConversationMemory()
+        since = sys.argv[2] if len(sys.argv) > 2 else None
+        until = sys.argv[3] if len(sys.argv) > 3 else None
+        w = cm.window(since=since, until=until)
+        print(f"{w['since']} -> {w['until']}: {w['exchanges']} exchanges, "
+              f"{w['sessions']} sessions, {w['active_days']} active days")
+        for d in w["days"]:
+            print(f"\n  [{d['day']}] {d['exchanges']} exchanges, {d['sessions']} sessions")
+            for preview in d["top_previews"]:
+                print(f"    - {preview[:80]}")
+
+    elif cmd == "shards":
+        cm = ConversationMemory()
+        if not cm.sharded:
+            print("Sharding is off. Set ELARA_CONVERSATION_SHARDS=monthly|quarterly.")
+            sys.exit(1)
+        sub = sys.argv[2] if len(sys.argv) > 2 else "list"
+        if sub == "reshard":
+            result = cm.reshard()
+            print(f"Moved {result['moved']} exchanges into shards.")
+        elif sub == "archive":
+            days = int(sys.argv[3]) if len(sys.argv) > 3 else 365
+            for a in cm.archive_shards(older_than_days=days):
+                print(f"  {a['key']}: {a['rows']} rows -> {a.get('path', '')}")
+        for info in cm.shard_stats():
+            print(f"  {info['key']:<10} {info['tier']:<5} {info['rows']:>7} rows")
 
     else:
         print(f"Unknown command: {cmd}")
@@ -0,0 +1,300 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Elara Conversation Memory — Session summary tier.
+
+Sessions older than SUMMARY_AGE_DAYS are replaced in the live index by a
+few summary chunks. Raw exchanges go to a gzip JSONL side archive (one
+file per session), so the index shrinks and old-history search gets
+cheaper, while expand_summary()/restore_session() can bring the raw
+exchanges back on demand.
+
+Summaries are extractive by default (term-frequency sentence picking, no
+model needed); use_llm=True asks the local LLM instead, falling back to
+extractive when it's unavailable.
+"""
+
+import gzip
+import json
+import logging
+import math
+import re
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from memory.conversations.core import CONVERSATIONS_DIR, SUMMARY_AGE_DAYS
+
+logger = logging.getLogger("elara.memory.conversations")
+
+ARCHIVE_DIR = CONVERSATIONS_DIR / "archive"
+EXCHANGES_PER_CHUNK = 12     # one summary chunk per ~12 raw exchanges
+MAX_SUMMARY_CHUNKS = 4
+PICKS_PER_CHUNK = 3
+SUMMARY_TIER = "summary"
+
+_WORD_RE = re.compile(r"[a-zA-Z][a-zA-Z0-9_\-]{3,}")
+_STOPWORDS = {
+    "that", "this", "with", "from", "have", "what", "when", "there", "their",
+    "then", "than", "they", "will", "would", "could", "should", "about", "just",
+    "like", "also", "into", "your", "you're", "it's", "been", "were", "which",
+    "some", "more", "here", "elara", "user", "does", "dont", "don't", "let's",
+}
+
+
+def _split_document(doc: str) -> Dict[str, str]:
+    """Recover user/assistant text from a stored 'User: ...\\n\\nElara: ...' document."""
+    user, _, assistant = doc.partition("\n\nElara: ")
+    return {"user": user.removeprefix("User: ").strip(), "assistant": assistant.strip()}
+
+
+def _first_sentence(text: str, limit: int = 200) -> str:
+    text = " ".join(text.split())
+    m = re.search(r"(.+?[.!?])(\s|$)", text)
+    sentence = m.group(1) if m else text
+    return sentence[:limit]
+
+
+class CompressionMixin:
+    """Mixin for the conversation summary tier."""
+
+    # ------------------------------------------------------------------
+    # Summarization
+    # ------------------------------------------------------------------
+
+    def _extractive_summary(self, rows: List[Dict[str, Any]]) -> str:
+        """Pick the exchanges whose vocabulary is most central to the chunk."""
+        words_per_row = [
+            [w.lower() for w in _WORD_RE.findall(r["document"]) if w.lower() not in _STOPWORDS]
+            for r in rows
+        ]
+        freq = Counter(w for words in words_per_row for w in set(words))
+
+        scored = []
+        for i, words in enumerate(words_per_row):
+            unique = set(words)
+            if not unique:
+                continue
+            score = sum(freq[w] for w in unique) / math.sqrt(len(unique))
+            scored.append((score, i))
+        picks = sorted(i for _, i in sorted(scored, reverse=True)[:PICKS_PER_CHUNK])
+
+        lines = []
+        for i in picks:
+            parts = _split_document(rows[i]["document"])
+            line = f"- {parts['user'][:150]}"
+            if parts["assistant"]:
+                line += f" → {_first_sentence(parts['assistant'])}"
+            lines.append(line)
+
+        topics = ", ".join(w for w, _ in freq.most_common(6))
+        if topics:
+            lines.append(f"Topics: {topics}")
+        return "\n".join(lines)
+
+    def _llm_summary(self, rows: List[Dict[str, Any]]) -> Optional[str]:
+        try:
+            from daemon import llm
+        except ImportError:
+            return None
+        text = "\n".join(
+            _split_document(r["document"])["user"][:120] for r in rows
+        )
+        try:
+            return llm.summarize(text, max_sentences=3)
+        except Exception:
+            return None
+
+    def _summary_chunks(
+        self, session_id: str, rows: List[Dict[str, Any]], use_llm: bool,
+    ) -> List[Dict[str, Any]]:
+        """Build summary chunk documents + metadata for one session's raw rows."""
+        n_chunks = min(MAX_SUMMARY_CHUNKS, max(1, math.ceil(len(rows) / EXCHANGES_PER_CHUNK)))
+        size = math.ceil(len(rows) / n_chunks)
+        chunks = []
+        for k in range(n_chunks):
+            part = rows[k * size:(k + 1) * size]
+            if not part:
+                continue
+            body = (self._llm_summary(part) if use_llm else None) or self._extractive_summary(part)
+            first, last = part[0]["metadata"], part[-1]["metadata"]
+            span = first.get("date", "")
+            if last.get("date") and last.get("date") != span:
+                span = f"{span} – {last['date']}"
+            doc = (
+                f"Session summary ({span}, exchanges "
+                f"{first.get('exchange_index', 0)}–{last.get('exchange_index', 0)}):\n{body}"
+            )[:2000]
+
+            episodes = Counter(r["metadata"].get("episode_id", "") for r in part)
+            episodes.pop("", None)
+            meta = dict(first)
+            meta.update({
+                "tier": SUMMARY_TIER,
+                "covers_from": first.get("exchange_index", 0),
+                "covers_to": last.get("exchange_index", 0),
+                "exchange_count": len(part),
+                "user_text_preview": f"[summary] {_split_document(part[0]['document'])['user'][:80]}",
+                "episode_id": episodes.most_common(1)[0][0] if episodes else "",
+            })
+            chunk_id = self._content_id(doc, f"summary:{session_id}:{k}")
+            chunks.append({"id": chunk_id, "document": doc, "metadata": meta})
+        return chunks
+
+    # ------------------------------------------------------------------
+    # Archive
+    # ------------------------------------------------------------------
+
+    def _archive_path(self, session_id: str):
+        return ARCHIVE_DIR / f"{session_id}.jsonl.gz"
+
+    def _read_archive(self, session_id: str) -> List[Dict[str, Any]]:
+        path = self._archive_path(session_id)
+        if not path.exists():
+            return []
+        rows = []
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    rows.append(json.loads(line))
+        return rows
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def compress_old_sessions(
+        self,
+        days: int = SUMMARY_AGE_DAYS,
+        use_llm: bool = False,
+        max_sessions: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Replace sessions older than N days with summary chunks.
+
+        - Archive raw rows (document + metadata) to archive/<session>.jsonl.gz
+        - Add 1..MAX_SUMMARY_CHUNKS summary rows to the live index
+        - Delete the raw rows (except ones a recently active session also contains)
+        """
+        stats = {"sessions": 0, "exchanges_archived": 0, "summary_chunks": 0, "raw_bytes": 0}
+        if not self.collection:
+            return stats
+
+        cutoff = datetime.now().timestamp() - days * 86400
+        ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+
+        for cand in self.manifest.summary_candidates(cutoff, limit=max_sessions):
+            session_id = cand["session_id"]
+            try:
+                got = self.collection.get(
+                    where={"session_id": session_id}, include=["documents", "metadatas"],
+                )
+            except Exception as e:
+                logger.warning("Summary tier: could not read session %s: %s", session_id, e)
+                continue
+
+            if not got["ids"]:
+                # Everything it contains is stored under another session — nothing to do
+                self.manifest.mark_summarized(
+                    session_id, file_mtime=cand["last_modified"], exchanges=0,
+                    summary_chunks=0, raw_bytes=0, archive_path="",
+                )
+                continue
+
+            # Rows a still-active session also contains stay raw
+            shared = self.manifest.referenced_by_live(got["ids"], session_id, cutoff)
+            rows = [
+                {"id": rid, "document": got["documents"][j], "metadata": got["metadatas"][j]}
+                for j, rid in enumerate(got["ids"])
+                if rid not in shared and got["metadatas"][j].get("tier") != SUMMARY_TIER
+            ]
+            if not rows:
+                continue
+            rows.sort(key=lambda r: r["metadata"].get("exchange_index", 0))
+
+            chunks = self._summary_chunks(session_id, rows, use_llm)
+
+            # Archive first; the live rows are only deleted once the raw text is safe
+            path = self._archive_path(session_id)
+            with gzip.open(path, "at", encoding="utf-8") as f:
+                for r in rows:
+                    f.write(json.dumps(r) + "\n")
+
+            self.collection.upsert(
+                ids=[c["id"] for c in chunks],
+                documents=[c["document"] for c in chunks],
+                metadatas=[c["metadata"] for c in chunks],
+            )
+            self.collection.delete(ids=[r["id"] for r in rows])
+
+            raw_bytes = sum(len(r["document"].encode()) for r in rows)
+            self.manifest.mark_summarized(
+                session_id,
+                file_mtime=cand["last_modified"],
+                exchanges=len(rows),
+                summary_chunks=len(chunks),
+                raw_bytes=raw_bytes,
+                archive_path=str(path),
+            )
+            stats["sessions"] += 1
+            stats["exchanges_archived"] += len(rows)
+            stats["summary_chunks"] += len(chunks)
+            stats["raw_bytes"] += raw_bytes
+
+        if stats["sessions"]:
+            logger.info(
+                "Summary tier: %d sessions, %d exchanges -> %d chunks",
+                stats["sessions"], stats["exchanges_archived"], stats["summary_chunks"],
+            )
+        return stats
+
+    def expand_summary(
+        self,
+        session_id: str,
+        covers_from: Optional[int] = None,
+        covers_to: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Raw exchanges behind a summary (read from the archive, index untouched)."""
+        result = []
+        for r in self._read_archive(session_id):
+            meta = r.get("metadata", {})
+            idx = meta.get("exchange_index", 0)
+            if covers_from is not None and idx < covers_from:
+                continue
+            if covers_to is not None and idx > covers_to:
+                continue
+            result.append({
+                "content": r.get("document", ""),
+                "exchange_index": idx,
+                "timestamp": meta.get("timestamp", ""),
+                "date": meta.get("date", ""),
+                "session_id": session_id,
+            })
+        result.sort(key=lambda x: x["exchange_index"])
+        return result
+
+    def restore_session(self, session_id: str) -> Dict[str, Any]:
+        """Put a summarized session's raw exchanges back in the live index."""
+        rows = self._read_archive(session_id)
+        if not rows or not self.collection:
+            return {"restored": 0}
+
+        summaries = self.collection.get(
+            where={"$and": [{"session_id": session_id}, {"tier": SUMMARY_TIER}]}, include=[],
+        )
+        self.collection.upsert(
+            ids=[r["id"] for r in rows],
+            documents=[r["document"] for r in rows],
+            metadatas=[r["metadata"] for r in rows],
+        )
+        if summaries["ids"]:
+            self.collection.delete(ids=summaries["ids"])
+        self.manifest.unmark_summarized(session_id)
+        try:
+            self._archive_path(session_id).unlink()
+        except OSError:
+            pass
+        return {"restored": len(rows)}
@@ -8,29 +8,39 @@ Elara Conversation Memory — Core base class.
 Database init, manifest management, text extraction utilities, stats.
 """
 
-import json
 import logging
 import os
 import hashlib
-import re
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Dict, Any, List
 
 logger = logging.getLogger("elara.memory.conversations")
 
 try:
     import chromadb
     from chromadb.config import Settings
+    from chromadb.utils import embedding_functions
     CHROMA_AVAILABLE = True
 except ImportError:
     CHROMA_AVAILABLE = False
 
 from core.paths import get_paths
+from kernels.sessions import clean_text, extract_assistant_text, extract_user_text
+from memory.conversations.manifest import ConversationManifest
+from memory.conversations.shards import (
+    ShardedCollection, SHARD_MODES, LEGACY_KEY, UNDATED_KEY, shard_range,
+)
 
 _p = get_paths()
 CONVERSATIONS_DIR = _p.conversations_db
-MANIFEST_PATH = CONVERSATIONS_DIR / "ingested.json"
+MANIFEST_DB_PATH = CONVERSATIONS_DIR / "manifest.db"
+LEGACY_MANIFEST_PATH = CONVERSATIONS_DIR / "ingested.json"  # migrated on first open
+SHARDS_DIR = CONVERSATIONS_DIR / "shards"
+COLD_SHARDS_DIR = CONVERSATIONS_DIR / "cold"
+
+# Time-partitioned shards: "" (off, one collection), "monthly", or "quarterly"
+SHARD_MODE = os.environ.get("ELARA_CONVERSATION_SHARDS", "").strip().lower()
 PROJECTS_DIR = _p.claude_projects
 EPISODES_DIR = _p.episodes_dir
 EPISODES_INDEX = EPISODES_DIR / "index.json"
@@ -38,8 +48,8 @@ EPISODES_INDEX = EPISODES_DIR / "index.json"
 # Current schema version — bump to force re-index on upgrade
 SCHEMA_VERSION = 2
 
-# Regex to strip <system-reminder>...</system-reminder> blocks
-SYSTEM_REMINDER_RE = re.compile(r'<system-reminder>.*?</system-reminder>', re.DOTALL)
+# Summary tier — sessions untouched for this long are compressed to summary chunks
+SUMMARY_AGE_DAYS = 90
 
 # Recency scoring parameters
 RECENCY_HALF_LIFE_DAYS = 30  # After 30 days, recency factor = 0.5
@@ -52,6 +62,12 @@ class ConversationBase:
     def __init__(self):
         self.client = None
         self.collection = None
+        self.legacy_collection = None
+        self._ef = None
+        self.manifest = ConversationManifest(
+            MANIFEST_DB_PATH, legacy_json=LEGACY_MANIFEST_PATH,
+            legacy_cross_refs=self._legacy_cross_refs,
+        )
 
         if CHROMA_AVAILABLE:
             self._init_db()
@@ -63,81 +79,106 @@ class ConversationBase:
             settings=Settings(anonymized_telemetry=False)
         )
 
+        # One embedding function shared by every collection and by embed()
+        self._ef = embedding_functions.DefaultEmbeddingFunction()
         self.collection = self.client.get_or_create_collection(
             name="elara_conversations_v2",
             metadata={
                 "description": "Elara's conversation memory — cosine similarity",
                 "hnsw:space": "cosine",
-            }
+            },
+            embedding_function=self._ef,
         )
 
-    def _load_manifest(self) -> Dict[str, Any]:
-        if not MANIFEST_PATH.exists():
+        if SHARD_MODE in SHARD_MODES:
+            # Monolithic collection stays readable until reshard() empties it
+            self.legacy_collection = self.collection
+            self.collection = ShardedCollection(
+                SHARDS_DIR, SHARD_MODE, self.manifest,
+                legacy=self.legacy_collection if self.legacy_collection.count() else None,
+                embedding_function=self._ef,
+            )
+        elif SHARD_MODE:
+            logger.warning("Unknown ELARA_CONVERSATION_SHARDS=%r, using one collection", SHARD_MODE)
+
+    def _legacy_cross_refs(self) -> Dict[str, int]:
+        """Episode-linked exchanges per session_id, for the ingested.json migration."""
+        collection = self.legacy_collection
+        if collection is None and not self.sharded:
+            collection = self.collection
+        if collection is None:
             return {}
-        try:
-            with open(MANIFEST_PATH) as f:
-                data = json.load(f)
-            if not isinstance(data, dict):
-                logger.warning("Manifest is not a dict, resetting")
-                return {}
-            return data
-        except (json.JSONDecodeError, OSError) as e:
-            logger.warning("Corrupt manifest, resetting: %s", e)
-            return {}
-
-    def _save_manifest(self, manifest: Dict[str, Any]):
-        manifest["_schema_version"] = SCHEMA_VERSION
-        with open(MANIFEST_PATH, 'w') as f:
-            json.dump(manifest, f, indent=2)
-
-    def _generate_id(self, session_id: str, exchange_index: int, timestamp: str) -> str:
-        content = f"{session_id}:{exchange_index}:{timestamp}"
+        rows = collection.get(where={"episode_id": {"$ne": ""}}, include=["metadatas"])
+        counts: Dict[str, int] = {}
+        for meta in rows.get("metadatas") or []:
+            sid = (meta or {}).get("session_id", "")
+            counts[sid] = counts.get(sid, 0) + 1
+        return counts
+
+    @property
+    def sharded(self) -> bool:
+        return isinstance(self.collection, ShardedCollection)
+
+    def shard_stats(self) -> List[Dict[str, Any]]:
+        """Per-shard row counts and tiers (empty when sharding is off)."""
+        return self.collection.shard_stats() if self.sharded else []
+
+    def reshard(self) -> Dict[str, Any]:
+        """Move rows from the monolithic collection into time shards."""
+        if not self.sharded:
+            return {"moved": 0, "error": "sharding disabled (set ELARA_CONVERSATION_SHARDS)"}
+        return self.collection.reshard()
+
+    def archive_shards(self, older_than_days: int = 365) -> List[Dict[str, Any]]:
+        """Compact hot shards whose period ended before the cutoff into cold storage."""
+        if not self.sharded:
+            return []
+        cutoff = datetime.now().timestamp() - older_than_days * 86400
+        archived = []
+        for info in self.collection.shard_stats():
+            key = info["key"]
+            if info["tier"] != "hot" or key in (UNDATED_KEY, LEGACY_KEY):
+                continue
+            if shard_range(key)[1] <= cutoff:
+                result = self.collection.archive_shard(key, COLD_SHARDS_DIR)
+                result["key"] = key
+                archived.append(result)
+        return archived
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts with the collection's model.
+
+        Callers that hit several consumers with the same text (Overwatch:
+        search, micro-ingest, synthesis) embed once and pass the vector as
+        query_embedding= / embedding= instead of re-embedding each time.
+        """
+        if self._ef is None or not texts:
+            return []
+        return [[float(x) for x in vec] for vec in self._ef(list(texts))]
+
+    def _build_document(self, user_text: str, assistant_text: str) -> str:
+        doc = f"User: {user_text}\n\nElara: {assistant_text}"
+        if len(doc) > 2000:
+            doc = doc[:2000]
+        return doc
+
+    def _content_id(self, document: str, timestamp: str) -> str:
+        """
+        Content-addressed exchange ID.
+
+        Resumed/forked sessions copy earlier history verbatim (same text, same
+        timestamp) into new JSONL files. Hashing the stored document plus its
+        timestamp makes those copies collide, so one exchange is embedded once
+        and referenced by every session that contains it.
+        """
+        content = f"{timestamp}\n{document}"
         return hashlib.sha256(content.encode()).hexdigest()[:16]
 
-    def _clean_text(self, text: str) -> str:
-        """Strip system-reminder blocks and clean up text."""
-        text = SYSTEM_REMINDER_RE.sub('', text)
-        text = text.strip()
-        return text
-
-    def _extract_user_text(self, message: dict) -> Optional[str]:
-        """Extract user text from a message entry. Returns None if not real user input."""
-        content = message.get("message", {}).get("content", "")
-
-        if isinstance(content, str):
-            text = self._clean_text(content)
-            if text:
-                return text
-            return None
-        elif isinstance(content, list):
-            texts = []
-            for block in content:
-                if isinstance(block, dict) and block.get("type") == "text":
-                    cleaned = self._clean_text(block.get("text", ""))
-                    if cleaned:
-                        texts.append(cleaned)
-            if texts:
-                return "\n".join(texts)
-        return None
-
-    def _extract_assistant_text(self, message: dict) -> Optional[str]:
-        """Extract assistant text from a message entry. Skip tool_use, thinking blocks."""
-        content = message.get("message", {}).get("content", [])
-
-        if isinstance(content, str):
-            text = self._clean_text(content)
-            return text if text else None
-
-        if isinstance(content, list):
-            texts = []
-            for block in content:
-                if isinstance(block, dict) and block.get("type") == "text":
-                    cleaned = self._clean_text(block.get("text", ""))
-                    if cleaned:
-                        texts.append(cleaned)
-            if texts:
-                return "\n".join(texts)
-        return None
+    # Text extraction lives in kernels.sessions, shared with the CPU lane
+    _clean_text = staticmethod(clean_text)
+    _extract_user_text = staticmethod(extract_user_text)
+    _extract_assistant_text = staticmethod(extract_assistant_text)
 
     def count(self) -> int:
         if not self.collection:
@@ -145,32 +186,16 @@ class ConversationBase:
         return self.collection.count()
 
     def stats(self) -> Dict[str, Any]:
-        manifest = self._load_manifest()
-        sessions = set()
-        total_exchanges = 0
-        for key, info in manifest.items():
-            if key.startswith("_"):
-                continue
-            sessions.add(info.get("session_id", ""))
-            total_exchanges += info.get("exchanges_ingested", 0)
-
-        # Count cross-referenced exchanges
-        cross_ref_count = 0
-        if self.collection:
-            try:
-                sample = self.collection.get(include=["metadatas"], limit=1000)
-                if sample["metadatas"]:
-                    cross_ref_count = sum(
-                        1 for m in sample["metadatas"] if m.get("episode_id")
-                    )
-            except Exception:
-                pass
-
+        """Index statistics from maintained manifest counters — O(1)."""
+        counters = self.manifest.counters()
         return {
             "indexed_exchanges": self.count(),
-            "sessions_ingested": len(sessions),
-            "manifest_entries": len([k for k in manifest if not k.startswith("_")]),
-            "total_exchanges_from_manifest": total_exchanges,
-            "cross_referenced": cross_ref_count,
-            "schema_version": manifest.get("_schema_version", 1),
+            "sessions_ingested": counters["sessions"],
+            "manifest_entries": counters["files"],
+            "total_exchanges_from_manifest": counters["exchanges"],
+            "cross_referenced": counters["cross_referenced"],
+            "duplicates_skipped": counters["duplicates_skipped"],
+            "sessions_summarized": counters["sessions_summarized"],
+            "exchanges_archived": counters["exchanges_archived"],
+            "schema_version": self.manifest.schema_version,
         }
@@ -0,0 +1,128 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Elara Conversation Memory — Cross-session deduplication mixin.
+
+New ingests are content-addressed (see ConversationBase._content_id), so
+resumed sessions no longer store copies. This mixin is the one-time
+backfill for indexes built under the old session:index:timestamp IDs:
+it re-keys every row to its content ID, collapses duplicates into one
+row, records every session reference in the manifest, and reports the
+space reclaimed. Stored embeddings are carried over — nothing is
+re-embedded.
+"""
+
+import logging
+from typing import Any, Dict, List
+
+logger = logging.getLogger("elara.memory.conversations")
+
+BACKFILL_META_KEY = "dedup_backfill_done"
+
+
+class DedupMixin:
+    """Mixin providing the content-hash dedup backfill."""
+
+    def dedupe_backfill(self, batch_size: int = 500, force: bool = False) -> Dict[str, Any]:
+        """
+        Collapse existing duplicate exchanges into one content-addressed row.
+
+        Safe to re-run; does nothing once completed unless force=True.
+        """
+        stats = {
+            "rows_before": 0,
+            "rows_after": 0,
+            "duplicates_removed": 0,
+            "rows_rekeyed": 0,
+            "bytes_reclaimed": 0,
+            "skipped": False,
+        }
+        if not self.collection:
+            return stats
+        if not force and self.manifest.get_meta(BACKFILL_META_KEY):
+            stats["skipped"] = True
+            stats["rows_before"] = stats["rows_after"] = self.count()
+            return stats
+
+        # Pass 1: fingerprint every row (documents + metadata only)
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        total = self.count()
+        stats["rows_before"] = total
+        embedding_dim = 0
+        if total:
+            probe = self.collection.get(include=["embeddings"], limit=1)
+            if probe["embeddings"] is not None and len(probe["embeddings"]):
+                embedding_dim = len(probe["embeddings"][0])
+        offset = 0
+        while offset < total:
+            page = self.collection.get(
+                include=["documents", "metadatas"], limit=batch_size, offset=offset,
+            )
+            if not page["ids"]:
+                break
+            for j, row_id in enumerate(page["ids"]):
+                doc = page["documents"][j] or ""
+                meta = page["metadatas"][j] or {}
+                cid = self._content_id(doc, meta.get("timestamp", ""))
+                groups.setdefault(cid, []).append({
+                    "id": row_id,
+                    "session_id": meta.get("session_id", ""),
+                    "exchange_index": meta.get("exchange_index", -1),
+                    "epoch": meta.get("epoch", 0.0),
+                    "doc_bytes": len(doc.encode()),
+                })
+            offset += len(page["ids"])
+
+        # Pass 2: per group, keep the earliest session's row under the content ID
+        rekey: Dict[str, str] = {}   # old id -> content id (keeper rows)
+        drop: List[str] = []
+        refs = []
+        for cid, rows in groups.items():
+            rows.sort(key=lambda r: (r["epoch"] or 0.0, r["session_id"]))
+            keeper = rows[0]
+            for r in rows:
+                refs.append((cid, r["session_id"], r["exchange_index"]))
+            if keeper["id"] != cid:
+                rekey[keeper["id"]] = cid
+            for r in rows[1:]:
+                # Embeddings are float32 in Chroma's HNSW index
+                stats["bytes_reclaimed"] += r["doc_bytes"] + embedding_dim * 4
+                if r["id"] != cid:
+                    drop.append(r["id"])  # a cid-keyed row is overwritten by the re-key
+            stats["duplicates_removed"] += len(rows) - 1
+
+        # Pass 3: re-key keepers with their stored embeddings
+        old_ids = list(rekey)
+        for i in range(0, len(old_ids), batch_size):
+            chunk = old_ids[i:i + batch_size]
+            got = self.collection.get(
+                ids=chunk, include=["documents", "metadatas", "embeddings"],
+            )
+            if not got["ids"]:
+                continue
+            new_ids = [rekey[old] for old in got["ids"]]
+            embeddings = [list(e) for e in got["embeddings"]]
+            self.collection.upsert(
+                ids=new_ids,
+                embeddings=embeddings,
+                documents=got["documents"],
+                metadatas=got["metadatas"],
+            )
+            self.collection.delete(ids=got["ids"])
+            stats["rows_rekeyed"] += len(got["ids"])
+
+        for i in range(0, len(drop), batch_size):
+            self.collection.delete(ids=drop[i:i + batch_size])
+
+        self.manifest.add_refs(refs)
+        self.manifest.set_meta(BACKFILL_META_KEY, "1")
+        stats["rows_after"] = self.count()
+
+        logger.info(
+            "Dedup backfill: %d -> %d rows (%d duplicates, ~%d KB reclaimed)",
+            stats["rows_before"], stats["rows_after"],
+            stats["duplicates_removed"], stats["bytes_reclaimed"] // 1024,
+        )
+        return stats
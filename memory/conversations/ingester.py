@@ -8,13 +8,14 @@ Elara Conversation Memory — Ingestion mixin.
 Extracts exchanges from JSONL session files and indexes them in ChromaDB.
 """
 
-import json
 import os
 from pathlib import Path
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
+from kernels.sessions import parse_session_file
 from memory.conversations.core import PROJECTS_DIR, SCHEMA_VERSION
+from memory.conversations.rollups import ROLLUP_META_KEY
 
 
 class IngesterMixin:
@@ -25,78 +26,17 @@ class IngesterMixin:
         Parse a JSONL session file into exchange pairs.
         Each exchange = user text + next assistant text response.
         """
-        exchanges = []
-        entries = []
-
-        with open(file_path) as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    entry = json.loads(line)
-                    entries.append(entry)
-                except json.JSONDecodeError:
-                    continue
-
-        # Filter to user and assistant messages only
-        messages = []
-        for entry in entries:
-            entry_type = entry.get("type")
-            if entry_type not in ("user", "assistant"):
-                continue
-            if entry.get("isSidechain"):
-                continue
-            messages.append(entry)
-
-        # Pair: user text + following assistant text
-        i = 0
-        while i < len(messages):
-            msg = messages[i]
-
-            if msg.get("type") == "user":
-                user_text = self._extract_user_text(msg)
-                user_ts = msg.get("timestamp", "")
-
-                if user_text:
-                    assistant_text = None
-                    assistant_ts = ""
-                    j = i + 1
-                    while j < len(messages):
-                        next_msg = messages[j]
-                        if next_msg.get("type") == "assistant":
-                            text = self._extract_assistant_text(next_msg)
-                            if text:
-                                assistant_text = text
-                                assistant_ts = next_msg.get("timestamp", "")
-                                break
-                            j += 1
-                        elif next_msg.get("type") == "user":
-                            break
-                        else:
-                            j += 1
-
-                    if assistant_text:
-                        exchanges.append({
-                            "user_text": user_text,
-                            "assistant_text": assistant_text,
-                            "timestamp": user_ts or assistant_ts,
-                            "exchange_index": len(exchanges),
-                        })
-
-            i += 1
-
-        return exchanges
+        return parse_session_file(file_path)["exchanges"]
 
     def ingest_file(
         self,
         file_path: str,
-        manifest: Dict[str, Any],
         episode_ranges: Optional[List[Dict]] = None,
     ) -> int:
         """
         Ingest a single JSONL file into ChromaDB.
-        Now with episode cross-referencing.
+        Now with episode cross-referencing. The manifest row is committed
+        as soon as the file is indexed.
         """
         if not self.collection:
             return 0
@@ -105,41 +45,27 @@ class IngesterMixin:
         session_id = path.stem
         project_dir = path.parent.name
 
-        # Get project cwd from first user entry
-        project_cwd = ""
-        with open(file_path) as f:
-            for line in f:
-                try:
-                    entry = json.loads(line)
-                    if entry.get("type") == "user" and entry.get("cwd"):
-                        project_cwd = entry["cwd"]
-                        break
-                except json.JSONDecodeError:
-                    continue
-
-        exchanges = self.extract_exchanges(file_path)
+        parsed = parse_session_file(file_path)
+        project_cwd = parsed["project_cwd"]
+        exchanges = parsed["exchanges"]
         if not exchanges:
             return 0
 
-        # Delete old entries for this session
-        try:
-            existing = self.collection.get(where={"session_id": session_id})
-            if existing and existing["ids"]:
-                self.collection.delete(ids=existing["ids"])
-        except Exception:
-            pass
-
-        # Prepare batch
+        # Prepare batch — IDs are content hashes so copied history collides
         ids = []
         documents = []
         metadatas = []
+        refs = []
+        cross_referenced = 0
+        seen = set()
 
         for ex in exchanges:
-            doc = f"User: {ex['user_text']}\n\nElara: {ex['assistant_text']}"
-            if len(doc) > 2000:
-                doc = doc[:2000]
-
-            ex_id = self._generate_id(session_id, ex["exchange_index"], ex["timestamp"])
+            doc = self._build_document(ex["user_text"], ex["assistant_text"])
+            ex_id = self._content_id(doc, ex["timestamp"])
+            refs.append((ex_id, ex["exchange_index"]))
+            if ex_id in seen:
+                continue
+            seen.add(ex_id)
 
             # Parse timestamp
             date_str = ""
@@ -160,6 +86,7 @@ class IngesterMixin:
                 matched = self._match_episode(ex["timestamp"], episode_ranges)
                 if matched:
                     episode_id = matched
+                    cross_referenced += 1
 
             meta = {
                 "session_id": session_id,
@@ -179,29 +106,96 @@ class IngesterMixin:
             documents.append(doc)
             metadatas.append(meta)
 
-        # Batch add
-        if documents:
-            self.collection.add(ids=ids, documents=documents, metadatas=metadatas)
+        skipped = self._store_session_exchanges(session_id, ids, documents, metadatas)
+        if self.manifest.unmark_summarized(session_id):
+            # Session grew again — raw rows are back, summary rows were dropped as stale
+            try:
+                self._archive_path(session_id).unlink()
+            except OSError:
+                pass
+        self.manifest.set_session_refs(session_id, refs)
 
         # Update manifest
         stat = os.stat(file_path)
-        manifest[file_path] = {
-            "last_modified": stat.st_mtime,
-            "size_bytes": stat.st_size,
-            "exchanges_ingested": len(exchanges),
-            "session_id": session_id,
-        }
+        self.manifest.record(
+            file_path,
+            session_id=session_id,
+            last_modified=stat.st_mtime,
+            size_bytes=stat.st_size,
+            exchanges=len(exchanges),
+            cross_referenced=cross_referenced,
+            duplicates_skipped=skipped,
+        )
 
         return len(exchanges)
 
+    def _store_session_exchanges(
+        self,
+        session_id: str,
+        ids: List[str],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+    ) -> int:
+        """
+        Write a session's exchanges without re-embedding anything already stored.
+
+        - Rows this session owns and still contains: metadata refreshed only.
+        - Rows another session already stored: left alone (referenced, not copied).
+        - Rows this session owned but no longer contains: deleted, unless some
+          other session still references them.
+        Returns the number of exchanges skipped as cross-session duplicates.
+        """
+        owned = set()
+        try:
+            existing = self.collection.get(where={"session_id": session_id}, include=[])
+            owned = set(existing["ids"]) if existing and existing["ids"] else set()
+        except Exception:
+            pass
+
+        wanted = set(ids)
+        stale = owned - wanted
+        if stale:
+            stale -= self.manifest.referenced_elsewhere(stale, session_id)
+            if stale:
+                self.collection.delete(ids=list(stale))
+                self.manifest.drop_timeline(stale)
+
+        stored = set()
+        if wanted:
+            try:
+                found = self.collection.get(ids=list(wanted), include=[])
+                stored = set(found["ids"]) if found and found["ids"] else set()
+            except Exception:
+                pass
+
+        add_ids, add_docs, add_metas = [], [], []
+        upd_ids, upd_metas = [], []
+        skipped = 0
+        for ex_id, doc, meta in zip(ids, documents, metadatas):
+            if ex_id not in stored:
+                add_ids.append(ex_id)
+                add_docs.append(doc)
+                add_metas.append(meta)
+            elif ex_id in owned:
+                upd_ids.append(ex_id)
+                upd_metas.append(meta)
+            else:
+                skipped += 1
+
+        if add_ids:
+            self.collection.add(ids=add_ids, documents=add_docs, metadatas=add_metas)
+        if upd_ids:
+            self.collection.update(ids=upd_ids, metadatas=upd_metas)
+        self._record_timeline(add_ids + upd_ids, add_metas + upd_metas)
+        return skipped
+
     def ingest_all(self, force: bool = False) -> Dict[str, Any]:
         """
         Walk all project dirs, find JSONL files, ingest new/modified ones.
         Now loads episode ranges for cross-referencing.
         """
-        manifest = {} if force else self._load_manifest()
-        # Preserve schema version
-        schema = manifest.pop("_schema_version", SCHEMA_VERSION)
+        if force:
+            self.manifest.reset()
 
         stats = {
             "files_scanned": 0,
@@ -212,8 +206,6 @@ class IngesterMixin:
         }
 
         if not PROJECTS_DIR.exists():
-            manifest["_schema_version"] = schema
-            self._save_manifest(manifest)
             return stats
 
         # Load episode ranges once for cross-referencing
@@ -234,22 +226,35 @@ class IngesterMixin:
                 file_stat = os.stat(jsonl_file)
 
                 # Check manifest for changes
-                if not force and file_str in manifest:
-                    prev = manifest[file_str]
-                    if (prev.get("last_modified") == file_stat.st_mtime
-                            and prev.get("size_bytes") == file_stat.st_size):
-                        stats["files_skipped"] += 1
-                        continue
+                if not force and self.manifest.is_unchanged(
+                        file_str, file_stat.st_mtime, file_stat.st_size):
+                    stats["files_skipped"] += 1
+                    continue
+
+                # Summarized sessions stay summarized unless the file changed
+                summarized = self.manifest.get_summarized(jsonl_file.stem)
+                if summarized and summarized["file_mtime"] == file_stat.st_mtime:
+                    if self.manifest.get(file_str) is None:
+                        self.manifest.record(
+                            file_str, jsonl_file.stem, file_stat.st_mtime,
+                            file_stat.st_size, summarized["exchanges"],
+                        )
+                    stats["files_skipped"] += 1
+                    continue
 
                 # Ingest
                 try:
-                    count = self.ingest_file(file_str, manifest, episode_ranges)
+                    count = self.ingest_file(file_str, episode_ranges)
                     stats["files_ingested"] += 1
                     stats["exchanges_total"] += count
                 except Exception as e:
                     stats["errors"].append(f"{jsonl_file.name}: {e}")
 
-        self._save_manifest(manifest)
+        # Indexes built before rollups existed get their timeline once
+        if not self.manifest.get_meta(ROLLUP_META_KEY):
+            self.rebuild_rollups()
+
+        self.manifest.schema_version = SCHEMA_VERSION
         return stats
 
     def ingest_exchange(
@@ -259,19 +264,19 @@ class IngesterMixin:
         timestamp: str,
         session_id: str,
         exchange_index: int = -1,
+        embedding: Optional[List[float]] = None,
     ) -> bool:
         """
         Ingest a single exchange into ChromaDB.
-        Used by Overwatch for mid-session micro-ingestion.
+        Used by Overwatch for mid-session micro-ingestion; embedding is the
+        vector of _build_document(user_text, assistant_text) when the caller
+        already has it.
         """
         if not self.collection:
             return False
 
-        doc = f"User: {user_text}\n\nElara: {assistant_text}"
-        if len(doc) > 2000:
-            doc = doc[:2000]
-
-        ex_id = self._generate_id(session_id, exchange_index, timestamp)
+        doc = self._build_document(user_text, assistant_text)
+        ex_id = self._content_id(doc, timestamp)
 
         date_str = ""
         hour = -1
@@ -300,7 +305,14 @@ class IngesterMixin:
         }
 
         try:
-            self.collection.add(ids=[ex_id], documents=[doc], metadatas=[meta])
+            self.manifest.add_refs([(ex_id, session_id, exchange_index)])
+            if self.collection.get(ids=[ex_id], include=[])["ids"]:
+                return True  # Already stored by this or an earlier session
+            if embedding is not None:
+                self.collection.add(ids=[ex_id], documents=[doc], metadatas=[meta], embeddings=[embedding])
+            else:
+                self.collection.add(ids=[ex_id], documents=[doc], metadatas=[meta])
+            self._record_timeline([ex_id], [meta])
             return True
         except Exception:
             return False
@@ -0,0 +1,728 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Elara Conversation Memory — Ingestion manifest (SQLite).
+
+Replaces the monolithic ingested.json. One row per session file, committed
+as soon as the file is indexed, so a crash mid-ingest keeps everything
+already done. Aggregate counters are maintained on every upsert/delete,
+which makes stats() a handful of primary-key reads instead of a full
+manifest parse plus a Chroma metadata scan.
+
+Tables:
+  files         — path, session_id, mtime/size fingerprint, per-file counts
+  exchange_refs — content-hash exchange ID -> every (session, index) that contains it
+  shards        — time-partition registry (key, path, hot/cold tier)
+  summarized    — sessions compressed to summary chunks + their raw archive
+  timeline      — one row per dated exchange (day, project, preview), no vectors
+  rollups       — per-day/per-project aggregates maintained from the timeline
+  counters      — maintained aggregates (sessions, exchanges, cross_referenced, ...)
+  meta          — schema version, migration markers
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger("elara.memory.conversations")
+
+
+# ============================================================================
+# Schema
+# ============================================================================
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    last_modified REAL NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    exchanges_ingested INTEGER NOT NULL DEFAULT 0,
+    cross_referenced INTEGER NOT NULL DEFAULT 0,
+    duplicates_skipped INTEGER NOT NULL DEFAULT 0,
+    ingested_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_files_session ON files(session_id);
+
+CREATE TABLE IF NOT EXISTS exchange_refs (
+    content_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    exchange_index INTEGER NOT NULL,
+    PRIMARY KEY (session_id, content_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_refs_content ON exchange_refs(content_id);
+CREATE INDEX IF NOT EXISTS idx_refs_session_index ON exchange_refs(session_id, exchange_index);
+
+CREATE TABLE IF NOT EXISTS shards (
+    key TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    tier TEXT NOT NULL DEFAULT 'hot',
+    rows INTEGER NOT NULL DEFAULT 0,
+    updated TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS summarized (
+    session_id TEXT PRIMARY KEY,
+    file_mtime REAL NOT NULL DEFAULT 0,
+    exchanges INTEGER NOT NULL DEFAULT 0,
+    summary_chunks INTEGER NOT NULL DEFAULT 0,
+    raw_bytes INTEGER NOT NULL DEFAULT 0,
+    archive_path TEXT NOT NULL,
+    summarized_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS timeline (
+    content_id TEXT PRIMARY KEY,
+    day TEXT NOT NULL,
+    project_dir TEXT NOT NULL DEFAULT '',
+    session_id TEXT NOT NULL,
+    epoch REAL NOT NULL DEFAULT 0,
+    preview TEXT NOT NULL DEFAULT ''
+);
+
+CREATE INDEX IF NOT EXISTS idx_timeline_day ON timeline(day, project_dir);
+
+CREATE TABLE IF NOT EXISTS rollups (
+    day TEXT NOT NULL,
+    project_dir TEXT NOT NULL DEFAULT '',
+    exchanges INTEGER NOT NULL DEFAULT 0,
+    sessions INTEGER NOT NULL DEFAULT 0,
+    first_epoch REAL NOT NULL DEFAULT 0,
+    last_epoch REAL NOT NULL DEFAULT 0,
+    first_preview TEXT NOT NULL DEFAULT '',
+    last_preview TEXT NOT NULL DEFAULT '',
+    top_previews TEXT NOT NULL DEFAULT '[]',
+    PRIMARY KEY (day, project_dir)
+);
+
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+COUNTER_NAMES = (
+    "files", "sessions", "exchanges", "cross_referenced", "duplicates_skipped",
+    "sessions_summarized", "exchanges_archived",
+)
+
+# Session openers kept per rollup row — "what was each session about"
+ROLLUP_TOP_PREVIEWS = 5
+
+
+# ============================================================================
+# Manifest
+# ============================================================================
+
+class ConversationManifest:
+    """
+    SQLite-backed ingestion manifest with maintained aggregate counters.
+
+    Follows the KnowledgeStore/DecisionRegistry pattern: lazy connection,
+    WAL mode, row_factory. Shared across threads (MCP executor, Overwatch),
+    so every operation runs under a lock.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        legacy_json: Optional[Path] = None,
+        legacy_cross_refs: Optional[Callable[[], Dict[str, int]]] = None,
+    ):
+        self._db_path = Path(db_path)
+        self._legacy_json = Path(legacy_json) if legacy_json else None
+        # ingested.json never stored cross-reference counts; this supplies
+        # them per session_id (from the collection) when migrating
+        self._legacy_cross_refs = legacy_cross_refs
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        for name in COUNTER_NAMES:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO counters (name, value) VALUES (?, 0)", (name,)
+            )
+        self._conn.commit()
+        self._migrate_legacy()
+        return self._conn
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _migrate_legacy(self):
+        """One-time import of ingested.json. Renames the JSON afterwards."""
+        src = self._legacy_json
+        if src is None or not src.exists():
+            return
+
+        try:
+            data = json.loads(src.read_text())
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning("Legacy manifest unreadable, skipping migration: %s", e)
+            return
+        if not isinstance(data, dict):
+            return
+
+        conn = self._conn
+        schema = data.get("_schema_version")
+        if schema is not None:
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(schema),),
+            )
+
+        refs: Dict[str, int] = {}
+        if self._legacy_cross_refs is not None:
+            try:
+                refs = dict(self._legacy_cross_refs())
+            except Exception as e:
+                logger.warning("Could not count legacy cross-references: %s", e)
+
+        migrated = 0
+        for path, info in data.items():
+            if path.startswith("_") or not isinstance(info, dict):
+                continue
+            session_id = info.get("session_id", "")
+            # A session's count goes to its first file only, so files that
+            # share a session_id don't count the same exchanges twice
+            counted = refs.pop(session_id, 0)
+            self._upsert_locked(
+                path,
+                session_id=session_id,
+                last_modified=info.get("last_modified", 0.0),
+                size_bytes=info.get("size_bytes", 0),
+                exchanges=info.get("exchanges_ingested", 0),
+                cross_referenced=info.get("cross_referenced", counted),
+                commit=False,
+            )
+            migrated += 1
+        conn.commit()
+
+        try:
+            src.rename(src.with_suffix(".json.migrated"))
+        except OSError as e:
+            logger.warning("Could not rename legacy manifest: %s", e)
+        logger.info("Migrated %d manifest entries from %s", migrated, src.name)
+
+    # ------------------------------------------------------------------
+    # Counter maintenance
+    # ------------------------------------------------------------------
+
+    def _bump(self, name: str, delta: int):
+        if delta:
+            self._conn.execute(
+                "UPDATE counters SET value = value + ? WHERE name = ?", (delta, name)
+            )
+
+    def _session_has_other_files(self, session_id: str, path: str) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM files WHERE session_id = ? AND path != ? LIMIT 1",
+            (session_id, path),
+        ).fetchone()
+        return row is not None
+
+    def _upsert_locked(
+        self,
+        path: str,
+        session_id: str,
+        last_modified: float,
+        size_bytes: int,
+        exchanges: int,
+        cross_referenced: int,
+        duplicates_skipped: int = 0,
+        commit: bool = True,
+    ):
+        conn = self._conn
+        old = conn.execute("SELECT * FROM files WHERE path = ?", (path,)).fetchone()
+
+        if old is None:
+            self._bump("files", 1)
+            if not self._session_has_other_files(session_id, path):
+                self._bump("sessions", 1)
+        else:
+            self._bump("exchanges", -old["exchanges_ingested"])
+            self._bump("cross_referenced", -old["cross_referenced"])
+            self._bump("duplicates_skipped", -old["duplicates_skipped"])
+            if old["session_id"] != session_id:
+                if not self._session_has_other_files(old["session_id"], path):
+                    self._bump("sessions", -1)
+                if not self._session_has_other_files(session_id, path):
+                    self._bump("sessions", 1)
+
+        self._bump("exchanges", exchanges)
+        self._bump("cross_referenced", cross_referenced)
+        self._bump("duplicates_skipped", duplicates_skipped)
+
+        conn.execute(
+            """INSERT OR REPLACE INTO files
+               (path, session_id, last_modified, size_bytes,
+                exchanges_ingested, cross_referenced, duplicates_skipped, ingested_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            (path, session_id, last_modified, size_bytes,
+             exchanges, cross_referenced, duplicates_skipped, datetime.now().isoformat()),
+        )
+        if commit:
+            conn.commit()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, path: str) -> Optional[Dict[str, Any]]:
+        """Manifest row for a file, or None if never ingested."""
+        with self._lock:
+            row = self._db().execute(
+                "SELECT * FROM files WHERE path = ?", (path,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def is_unchanged(self, path: str, last_modified: float, size_bytes: int) -> bool:
+        """True if the file fingerprint matches what was last ingested."""
+        prev = self.get(path)
+        if prev is None:
+            return False
+        return prev["last_modified"] == last_modified and prev["size_bytes"] == size_bytes
+
+    def record(
+        self,
+        path: str,
+        session_id: str,
+        last_modified: float,
+        size_bytes: int,
+        exchanges: int,
+        cross_referenced: int = 0,
+        duplicates_skipped: int = 0,
+    ):
+        """Record (or replace) one ingested file and commit immediately.
+
+        Counts are per file: re-recording a file replaces its share of the
+        maintained counters instead of adding to it.
+        """
+        with self._lock:
+            self._db()
+            self._upsert_locked(
+                path, session_id, last_modified, size_bytes,
+                exchanges, cross_referenced, duplicates_skipped,
+            )
+
+    def remove(self, path: str) -> bool:
+        """Drop a file from the manifest. Returns True if it was present."""
+        with self._lock:
+            conn = self._db()
+            old = conn.execute("SELECT * FROM files WHERE path = ?", (path,)).fetchone()
+            if old is None:
+                return False
+            conn.execute("DELETE FROM files WHERE path = ?", (path,))
+            self._bump("files", -1)
+            self._bump("exchanges", -old["exchanges_ingested"])
+            self._bump("cross_referenced", -old["cross_referenced"])
+            self._bump("duplicates_skipped", -old["duplicates_skipped"])
+            if not self._session_has_other_files(old["session_id"], path):
+                self._bump("sessions", -1)
+            conn.commit()
+            return True
+
+    def reset(self):
+        """
+        Forget every file (force re-index). Schema version and the summary
+        tier (sessions whose raw rows now live only in the archive) are kept.
+        """
+        with self._lock:
+            conn = self._db()
+            conn.execute("DELETE FROM files")
+            conn.execute("DELETE FROM exchange_refs")
+            conn.execute(
+                """UPDATE counters SET value = 0
+                   WHERE name NOT IN ('sessions_summarized', 'exchanges_archived')"""
+            )
+            conn.commit()
+
+    def bump_counter(self, name: str, delta: int = 1):
+        """Adjust a maintained counter by delta."""
+        with self._lock:
+            self._db()
+            self._bump(name, delta)
+            self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Exchange references (cross-session dedup)
+    # ------------------------------------------------------------------
+
+    def set_session_refs(self, session_id: str, refs: Iterable[Tuple[str, int]]):
+        """Replace every reference held by a session with (content_id, index) pairs."""
+        with self._lock:
+            conn = self._db()
+            conn.execute("DELETE FROM exchange_refs WHERE session_id = ?", (session_id,))
+            conn.executemany(
+                """INSERT OR REPLACE INTO exchange_refs
+                   (content_id, session_id, exchange_index) VALUES (?, ?, ?)""",
+                [(cid, session_id, idx) for cid, idx in refs],
+            )
+            conn.commit()
+
+    def add_refs(self, refs: Iterable[Tuple[str, str, int]]):
+        """Add (content_id, session_id, index) references without clearing."""
+        with self._lock:
+            conn = self._db()
+            conn.executemany(
+                """INSERT OR REPLACE INTO exchange_refs
+                   (content_id, session_id, exchange_index) VALUES (?, ?, ?)""",
+                list(refs),
+            )
+            conn.commit()
+
+    def session_refs(self, session_id: str) -> Set[str]:
+        """Content IDs referenced by a session."""
+        with self._lock:
+            rows = self._db().execute(
+                "SELECT content_id FROM exchange_refs WHERE session_id = ?", (session_id,)
+            ).fetchall()
+        return {r["content_id"] for r in rows}
+
+    def referenced_elsewhere(self, content_ids: Iterable[str], session_id: str) -> Set[str]:
+        """Subset of content_ids that some other session also references."""
+        ids = list(content_ids)
+        found: Set[str] = set()
+        with self._lock:
+            conn = self._db()
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                marks = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"""SELECT DISTINCT content_id FROM exchange_refs
+                        WHERE content_id IN ({marks}) AND session_id != ?""",
+                    (*chunk, session_id),
+                ).fetchall()
+                found.update(r["content_id"] for r in rows)
+        return found
+
+    def referenced_by_live(
+        self, content_ids: Iterable[str], session_id: str, cutoff_mtime: float,
+    ) -> Set[str]:
+        """Subset of content_ids that another session written since cutoff references."""
+        ids = list(content_ids)
+        found: Set[str] = set()
+        with self._lock:
+            conn = self._db()
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                marks = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"""SELECT DISTINCT r.content_id FROM exchange_refs r
+                        WHERE r.content_id IN ({marks}) AND r.session_id != ?
+                          AND EXISTS (SELECT 1 FROM files f
+                                      WHERE f.session_id = r.session_id
+                                        AND f.last_modified >= ?)""",
+                    (*chunk, session_id, cutoff_mtime),
+                ).fetchall()
+                found.update(r["content_id"] for r in rows)
+        return found
+
+    def sessions_for(self, content_id: str) -> List[str]:
+        """Every session that contains this exchange."""
+        with self._lock:
+            rows = self._db().execute(
+                "SELECT session_id FROM exchange_refs WHERE content_id = ? ORDER BY session_id",
+                (content_id,),
+            ).fetchall()
+        return [r["session_id"] for r in rows]
+
+    def refs_in_range(self, session_id: str, start: int, end: int) -> List[Tuple[int, str]]:
+        """(exchange_index, content_id) for a session's index window, sorted."""
+        with self._lock:
+            rows = self._db().execute(
+                """SELECT exchange_index, content_id FROM exchange_refs
+                   WHERE session_id = ? AND exchange_index BETWEEN ? AND ?
+                   ORDER BY exchange_index""",
+                (session_id, start, end),
+            ).fetchall()
+        return [(r["exchange_index"], r["content_id"]) for r in rows]
+
+    # ------------------------------------------------------------------
+    # Shard registry (time-partitioned collections)
+    # ------------------------------------------------------------------
+
+    def register_shard(self, key: str, path: str, tier: str = "hot", rows: int = 0):
+        with self._lock:
+            conn = self._db()
+            conn.execute(
+                """INSERT OR REPLACE INTO shards (key, path, tier, rows, updated)
+                   VALUES (?, ?, ?, ?, ?)""",
+                (key, path, tier, rows, datetime.now().isoformat()),
+            )
+            conn.commit()
+
+    def list_shards(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._db().execute("SELECT * FROM shards ORDER BY key").fetchall()
+        return [dict(r) for r in rows]
+
+    # ------------------------------------------------------------------
+    # Summary tier
+    # ------------------------------------------------------------------
+
+    def summary_candidates(self, cutoff_mtime: float, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Sessions whose files were last written before cutoff and aren't summarized yet."""
+        sql = """SELECT f.session_id, MAX(f.last_modified) AS last_modified,
+                        MAX(f.path) AS path
+                 FROM files f
+                 LEFT JOIN summarized s ON s.session_id = f.session_id
+                 WHERE s.session_id IS NULL
+                 GROUP BY f.session_id
+                 HAVING MAX(f.last_modified) < ?
+                 ORDER BY last_modified"""
+        params: Tuple[Any, ...] = (cutoff_mtime,)
+        if limit:
+            sql += " LIMIT ?"
+            params += (limit,)
+        with self._lock:
+            rows = self._db().execute(sql, params).fetchall()
+        return [dict(r) for r in rows]
+
+    def mark_summarized(
+        self,
+        session_id: str,
+        file_mtime: float,
+        exchanges: int,
+        summary_chunks: int,
+        raw_bytes: int,
+        archive_path: str,
+    ):
+        with self._lock:
+            conn = self._db()
+            existed = conn.execute(
+                "SELECT exchanges FROM summarized WHERE session_id = ?", (session_id,)
+            ).fetchone()
+            if existed is None:
+                self._bump("sessions_summarized", 1)
+            self._bump("exchanges_archived", exchanges - (existed["exchanges"] if existed else 0))
+            conn.execute(
+                """INSERT OR REPLACE INTO summarized
+                   (session_id, file_mtime, exchanges, summary_chunks, raw_bytes,
+                    archive_path, summarized_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (session_id, file_mtime, exchanges, summary_chunks, raw_bytes,
+                 archive_path, datetime.now().isoformat()),
+            )
+            conn.commit()
+
+    def get_summarized(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._db().execute(
+                "SELECT * FROM summarized WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def unmark_summarized(self, session_id: str) -> bool:
+        with self._lock:
+            conn = self._db()
+            old = conn.execute(
+                "SELECT exchanges FROM summarized WHERE session_id = ?", (session_id,)
+            ).fetchone()
+            if old is None:
+                return False
+            conn.execute("DELETE FROM summarized WHERE session_id = ?", (session_id,))
+            self._bump("sessions_summarized", -1)
+            self._bump("exchanges_archived", -old["exchanges"])
+            conn.commit()
+            return True
+
+    # ------------------------------------------------------------------
+    # Timeline + rollups (time-window questions, no vector search)
+    # ------------------------------------------------------------------
+
+    def record_timeline(self, rows: Iterable[Tuple[str, str, str, str, float, str]]):
+        """
+        Add (content_id, day, project_dir, session_id, epoch, preview) rows and
+        refresh the rollups they touch. An exchange keeps the session that
+        first stored it; only that session can update the row.
+        """
+        rows = [r for r in rows if r[1]]
+        if not rows:
+            return
+        with self._lock:
+            conn = self._db()
+            keys = self._timeline_keys_locked([r[0] for r in rows])
+            conn.executemany(
+                """INSERT INTO timeline
+                   (content_id, day, project_dir, session_id, epoch, preview)
+                   VALUES (?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(content_id) DO UPDATE SET
+                       day = excluded.day, project_dir = excluded.project_dir,
+                       epoch = excluded.epoch, preview = excluded.preview
+                   WHERE timeline.session_id = excluded.session_id""",
+                rows,
+            )
+            keys.update((r[1], r[2]) for r in rows)
+            self._refresh_rollups_locked(keys)
+            conn.commit()
+
+    def drop_timeline(self, content_ids: Iterable[str]):
+        """Remove exchanges from the timeline (deleted from the index)."""
+        ids = list(content_ids)
+        if not ids:
+            return
+        with self._lock:
+            conn = self._db()
+            keys = self._timeline_keys_locked(ids)
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                marks = ",".join("?" * len(chunk))
+                conn.execute(f"DELETE FROM timeline WHERE content_id IN ({marks})", chunk)
+            self._refresh_rollups_locked(keys)
+            conn.commit()
+
+    def _timeline_keys_locked(self, content_ids: List[str]) -> Set[Tuple[str, str]]:
+        keys: Set[Tuple[str, str]] = set()
+        for i in range(0, len(content_ids), 500):
+            chunk = content_ids[i:i + 500]
+            marks = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT DISTINCT day, project_dir FROM timeline WHERE content_id IN ({marks})",
+                chunk,
+            ).fetchall()
+            keys.update((r["day"], r["project_dir"]) for r in rows)
+        return keys
+
+    def _refresh_rollups_locked(self, keys: Iterable[Tuple[str, str]]):
+        """Recompute the rollup row for each (day, project_dir) from the timeline."""
+        conn = self._conn
+        for day, project in keys:
+            rows = conn.execute(
+                """SELECT session_id, epoch, preview FROM timeline
+                   WHERE day = ? AND project_dir = ? ORDER BY epoch""",
+                (day, project),
+            ).fetchall()
+            if not rows:
+                conn.execute(
+                    "DELETE FROM rollups WHERE day = ? AND project_dir = ?", (day, project)
+                )
+                continue
+
+            openers: Dict[str, str] = {}
+            for r in rows:
+                openers.setdefault(r["session_id"], r["preview"])
+            conn.execute(
+                """INSERT OR REPLACE INTO rollups
+                   (day, project_dir, exchanges, sessions, first_epoch, last_epoch,
+                    first_preview, last_preview, top_previews)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (day, project, len(rows), len(openers),
+                 rows[0]["epoch"], rows[-1]["epoch"],
+                 rows[0]["preview"], rows[-1]["preview"],
+                 json.dumps(list(openers.values())[:ROLLUP_TOP_PREVIEWS])),
+            )
+
+    def rollups(
+        self,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        project: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Rollup rows for days in [since, until] (YYYY-MM-DD, inclusive), oldest first."""
+        sql = "SELECT * FROM rollups WHERE 1=1"
+        params: List[Any] = []
+        if since:
+            sql += " AND day >= ?"
+            params.append(since)
+        if until:
+            sql += " AND day <= ?"
+            params.append(until)
+        if project is not None:
+            sql += " AND project_dir = ?"
+            params.append(project)
+        sql += " ORDER BY day, project_dir"
+        with self._lock:
+            rows = self._db().execute(sql, params).fetchall()
+        result = []
+        for r in rows:
+            d = dict(r)
+            d["top_previews"] = json.loads(d["top_previews"] or "[]")
+            result.append(d)
+        return result
+
+    def timeline_sessions(
+        self, since: str, until: str, project: Optional[str] = None,
+    ) -> Dict[Optional[str], int]:
+        """Distinct sessions per project_dir in a day range; key None is the total."""
+        where = "day >= ? AND day <= ?"
+        params: List[Any] = [since, until]
+        if project is not None:
+            where += " AND project_dir = ?"
+            params.append(project)
+        with self._lock:
+            conn = self._db()
+            rows = conn.execute(
+                f"""SELECT project_dir, COUNT(DISTINCT session_id) AS n FROM timeline
+                    WHERE {where} GROUP BY project_dir""",
+                params,
+            ).fetchall()
+            total = conn.execute(
+                f"SELECT COUNT(DISTINCT session_id) AS n FROM timeline WHERE {where}", params,
+            ).fetchone()
+        result: Dict[Optional[str], int] = {r["project_dir"]: r["n"] for r in rows}
+        result[None] = total["n"]
+        return result
+
+    def counters(self) -> Dict[str, int]:
+        """Maintained aggregates — O(1), no table scans."""
+        with self._lock:
+            rows = self._db().execute("SELECT name, value FROM counters").fetchall()
+        result = {name: 0 for name in COUNTER_NAMES}
+        result.update({r["name"]: r["value"] for r in rows})
+        return result
+
+    def get_meta(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        with self._lock:
+            row = self._db().execute(
+                "SELECT value FROM meta WHERE key = ?", (key,)
+            ).fetchone()
+        return row["value"] if row else default
+
+    def set_meta(self, key: str, value: str):
+        with self._lock:
+            conn = self._db()
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+            )
+            conn.commit()
+
+    @property
+    def schema_version(self) -> int:
+        try:
+            return int(self.get_meta("schema_version", "1"))
+        except (TypeError, ValueError):
+            return 1
+
+    @schema_version.setter
+    def schema_version(self, version: int):
+        self.set_meta("schema_version", str(version))
@@ -0,0 +1,146 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Elara Conversation Memory — Time-window rollups.
+
+"What happened this week" is a question about time, not meaning. Every
+dated exchange gets a timeline row in the manifest at ingest (day, project,
+session, user preview), and per-day/per-project rollups are kept current
+from it. window() answers time-range questions from SQLite alone — no
+embedding, no ANN query. Timeline rows outlive the summary tier, so old
+weeks still roll up after their raw exchanges were archived.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from memory.conversations.manifest import ROLLUP_TOP_PREVIEWS
+
+logger = logging.getLogger("elara.memory.conversations")
+
+ROLLUP_META_KEY = "rollup_backfill_done"
+DEFAULT_WINDOW_DAYS = 7
+
+
+class RollupMixin:
+    """Mixin providing the per-day/per-project conversation rollups."""
+
+    def _record_timeline(self, ids: List[str], metadatas: List[Dict[str, Any]]):
+        """Timeline rows for freshly stored exchanges (undated ones are skipped)."""
+        self.manifest.record_timeline(
+            (
+                ex_id,
+                meta.get("date", ""),
+                meta.get("project_dir", ""),
+                meta.get("session_id", ""),
+                meta.get("epoch", 0.0),
+                meta.get("user_text_preview", ""),
+            )
+            for ex_id, meta in zip(ids, metadatas)
+        )
+
+    def rebuild_rollups(self, batch_size: int = 500) -> Dict[str, int]:
+        """
+        Rebuild the timeline from stored metadata (no embeddings read).
+
+        Runs once for indexes built before rollups existed. Summary-tier
+        rows are skipped; existing timeline rows (including those of
+        already-compressed sessions) are left in place.
+        """
+        stats = {"rows_scanned": 0, "timeline_rows": 0}
+        if not self.collection:
+            return stats
+
+        total = self.count()
+        offset = 0
+        while offset < total:
+            page = self.collection.get(
+                include=["documents", "metadatas"], limit=batch_size, offset=offset,
+            )
+            if not page["ids"]:
+                break
+            ids, metas = [], []
+            for j, row_id in enumerate(page["ids"]):
+                meta = page["metadatas"][j] or {}
+                if meta.get("tier") == "summary":
+                    continue
+                # Legacy rows predate content IDs — key them the way ingest would
+                ids.append(self._content_id(page["documents"][j] or "", meta.get("timestamp", "")))
+                metas.append(meta)
+            self._record_timeline(ids, metas)
+            stats["rows_scanned"] += len(page["ids"])
+            stats["timeline_rows"] += sum(1 for m in metas if m.get("date"))
+            offset += len(page["ids"])
+
+        self.manifest.set_meta(ROLLUP_META_KEY, "1")
+        logger.info("Rollups rebuilt: %d timeline rows from %d indexed",
+                    stats["timeline_rows"], stats["rows_scanned"])
+        return stats
+
+    def window(
+        self,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        project: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Aggregate conversation activity for a date range (YYYY-MM-DD, UTC,
+        inclusive). Defaults to the last DEFAULT_WINDOW_DAYS days.
+
+        Returns totals plus per-day and per-project breakdowns, each with
+        counts, first/last exchange time and session-opening previews.
+        """
+        today = datetime.now(timezone.utc).date()
+        if not until:
+            until = today.isoformat()
+        if not since:
+            since = (datetime.fromisoformat(until).date()
+                     - timedelta(days=DEFAULT_WINDOW_DAYS - 1)).isoformat()
+
+        rows = self.manifest.rollups(since=since, until=until, project=project)
+
+        days: Dict[str, Dict[str, Any]] = {}
+        projects: Dict[str, Dict[str, Any]] = {}
+        for r in rows:
+            for bucket, key in ((days, r["day"]), (projects, r["project_dir"])):
+                agg = bucket.get(key)
+                if agg is None:
+                    agg = bucket[key] = {
+                        "exchanges": 0, "sessions": 0,
+                        "first_epoch": r["first_epoch"], "first_preview": r["first_preview"],
+                        "last_epoch": r["last_epoch"], "last_preview": r["last_preview"],
+                        "top_previews": [],
+                    }
+                agg["exchanges"] += r["exchanges"]
+                agg["sessions"] += r["sessions"]
+                if r["first_epoch"] < agg["first_epoch"]:
+                    agg["first_epoch"], agg["first_preview"] = r["first_epoch"], r["first_preview"]
+                if r["last_epoch"] > agg["last_epoch"]:
+                    agg["last_epoch"], agg["last_preview"] = r["last_epoch"], r["last_preview"]
+                agg["top_previews"].extend(r["top_previews"])
+
+        # Sessions span days, so per-project and total session counts are
+        # distinct counts over the range rather than sums of the day rows
+        per_project = self.manifest.timeline_sessions(since, until, project)
+        for key, agg in projects.items():
+            agg["sessions"] = per_project.get(key, 0)
+        for bucket in (days, projects):
+            for agg in bucket.values():
+                agg["top_previews"] = agg["top_previews"][:ROLLUP_TOP_PREVIEWS]
+
+        return {
+            "since": since,
+            "until": until,
+            "project": project,
+            "exchanges": sum(d["exchanges"] for d in days.values()),
+            "sessions": per_project.get(None, 0),
+            "active_days": len(days),
+            "days": [{"day": k, **v} for k, v in sorted(days.items())],
+            "projects": [
+                {"project_dir": k, **v}
+                for k, v in sorted(projects.items(), key=lambda kv: -kv[1]["exchanges"])
+            ],
+        }
@@ -9,7 +9,7 @@ Cosine similarity search with recency weighting and context windows.
 """
 
 import math
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Dict, Any
 
 from memory.conversations.core import RECENCY_HALF_LIFE_DAYS, RECENCY_WEIGHT
@@ -33,12 +33,41 @@ class SearcherMixin:
         decay = math.pow(0.5, age_days / RECENCY_HALF_LIFE_DAYS)
         return decay
 
+    def _build_where(
+        self,
+        project: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Chroma where filter for project and an inclusive YYYY-MM-DD date range.
+        Date bounds filter on epoch, which also lets sharded collections
+        skip every shard outside the range.
+        """
+        clauses = []
+        if project:
+            clauses.append({"project_dir": project})
+        if since:
+            start = datetime.fromisoformat(since).replace(tzinfo=timezone.utc)
+            clauses.append({"epoch": {"$gte": start.timestamp()}})
+        if until:
+            end = datetime.fromisoformat(until).replace(tzinfo=timezone.utc) + timedelta(days=1)
+            clauses.append({"epoch": {"$lt": end.timestamp()}})
+        if not clauses:
+            return None
+        if len(clauses) == 1:
+            return clauses[0]
+        return {"$and": clauses}
+
     def recall(
         self,
         query: str,
         n_results: int = 5,
         project: Optional[str] = None,
         recency_weight: float = RECENCY_WEIGHT,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Semantic search with cosine similarity and recency weighting.
@@ -47,6 +76,9 @@ class SearcherMixin:
         Relevance = 1 - distance (gives -1 to 1, but practically 0.3 to 1.0).
 
         Final score = semantic * (1 - recency_weight) + recency * recency_weight
+
+        since/until (YYYY-MM-DD, inclusive, UTC) restrict to a date range.
+        query_embedding (from embed()) skips re-embedding the query text.
         """
         if not self.collection:
             return []
@@ -54,14 +86,16 @@ class SearcherMixin:
         # Fetch more than needed for re-ranking
         fetch_count = min(n_results * 3, 30)
 
-        where_filter = None
-        if project:
-            where_filter = {"project_dir": project}
+        where_filter = self._build_where(project, since, until)
 
+        if query_embedding is not None:
+            query_kwargs = {"query_embeddings": [query_embedding]}
+        else:
+            query_kwargs = {"query_texts": [query]}
         results = self.collection.query(
-            query_texts=[query],
             n_results=fetch_count,
             where=where_filter,
+            **query_kwargs,
         )
 
         matches = []
@@ -94,6 +128,9 @@ class SearcherMixin:
                     "user_text_preview": meta.get("user_text_preview", ""),
                     "episode_id": meta.get("episode_id", ""),
                     "epoch": epoch,
+                    "tier": meta.get("tier", "raw"),
+                    "covers_from": meta.get("covers_from", -1),
+                    "covers_to": meta.get("covers_to", -1),
                 })
 
         # Re-rank by combined score
@@ -106,6 +143,8 @@ class SearcherMixin:
         n_results: int = 3,
         context_size: int = 2,
         project: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Search conversations and return surrounding exchanges for context.
@@ -114,13 +153,26 @@ class SearcherMixin:
         plus `context_size` exchanges before and after from the same session.
         """
         # Get primary matches
-        matches = self.recall(query, n_results=n_results, project=project)
+        matches = self.recall(
+            query, n_results=n_results, project=project, since=since, until=until,
+        )
 
         if not matches or not self.collection:
             return matches
 
         # For each match, fetch surrounding exchanges from same session
         for match in matches:
+            if match["tier"] == "summary":
+                # Summarized session — context comes from the raw archive
+                match["context_before"] = []
+                match["context_after"] = []
+                match["expanded"] = [
+                    e["content"] for e in self.expand_summary(
+                        match["session_id"], match["covers_from"], match["covers_to"],
+                    )
+                ][:context_size * 2 + 1]
+                continue
+
             session_id = match["session_id"]
             exchange_idx = match["exchange_index"]
             total = match["total_exchanges"]
@@ -134,31 +186,37 @@ class SearcherMixin:
                 match["context_after"] = []
                 continue
 
-            # Fetch all exchanges in range for this session
+            # Fetch all exchanges in range for this session. Prefer the
+            # manifest's reference table: exchanges copied from an earlier
+            # session are stored once under that session's metadata.
+            context_items = []
             try:
-                nearby = self.collection.get(
-                    where={
-                        "$and": [
-                            {"session_id": session_id},
-                            {"exchange_index": {"$gte": start_idx}},
-                            {"exchange_index": {"$lte": end_idx}},
-                        ]
-                    },
-                    include=["documents", "metadatas"],
-                )
+                refs = self.manifest.refs_in_range(session_id, start_idx, end_idx)
+                if refs:
+                    by_id = {cid: idx for idx, cid in refs}
+                    nearby = self.collection.get(ids=list(by_id), include=["documents"])
+                    for j, doc in enumerate(nearby["documents"] or []):
+                        context_items.append({"index": by_id[nearby["ids"][j]], "content": doc})
+                else:
+                    nearby = self.collection.get(
+                        where={
+                            "$and": [
+                                {"session_id": session_id},
+                                {"exchange_index": {"$gte": start_idx}},
+                                {"exchange_index": {"$lte": end_idx}},
+                            ]
+                        },
+                        include=["documents", "metadatas"],
+                    )
+                    for j, doc in enumerate(nearby["documents"] or []):
+                        meta = nearby["metadatas"][j] if nearby["metadatas"] else {}
+                        idx = meta.get("exchange_index", 0)
+                        context_items.append({"index": idx, "content": doc})
             except Exception:
                 match["context_before"] = []
                 match["context_after"] = []
                 continue
 
-            # Sort by exchange_index and split into before/after
-            context_items = []
-            if nearby["documents"]:
-                for j, doc in enumerate(nearby["documents"]):
-                    meta = nearby["metadatas"][j] if nearby["metadatas"] else {}
-                    idx = meta.get("exchange_index", 0)
-                    context_items.append({"index": idx, "content": doc})
-
             context_items.sort(key=lambda x: x["index"])
 
             match["context_before"] = [
@@ -0,0 +1,464 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Elara Conversation Memory — Time-partitioned shards.
+
+Optional (ELARA_CONVERSATION_SHARDS=monthly|quarterly). Instead of one
+multi-year HNSW index, each period gets its own Chroma directory under
+elara-conversations-db/shards/<key>/. ShardedCollection exposes the
+subset of the Chroma Collection API the conversation mixins use, so the
+rest of the package is unchanged:
+
+  writes  — routed by metadata epoch to the period's shard
+  query   — query embedded once, fanned out to shards in parallel,
+            merged by distance; shards outside an epoch range in the
+            where filter are pruned before they're even opened
+  get/del — fanned out (ids may live in any shard)
+
+Shards are opened lazily. A shard can be archived on its own: it is
+re-packed (compacted, no HNSW tombstones) into a cold directory and only
+searched when a query's date range reaches it, or when an unbounded
+query finds fewer matches than it asked for in the hot shards. The pre-sharding
+monolithic collection stays readable as a "legacy" shard until
+reshard() moves its rows out.
+"""
+
+import calendar
+import logging
+import shutil
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("elara.memory.conversations")
+
+try:
+    import chromadb
+    from chromadb.config import Settings
+    from chromadb.utils import embedding_functions
+    CHROMA_AVAILABLE = True
+except ImportError:
+    CHROMA_AVAILABLE = False
+
+SHARD_MODES = ("monthly", "quarterly")
+UNDATED_KEY = "undated"
+LEGACY_KEY = "legacy"
+COLLECTION_NAME = "elara_conversations_v2"
+FANOUT_WORKERS = 8
+
+
+# ============================================================================
+# Shard keys
+# ============================================================================
+
+def shard_key(epoch: float, mode: str) -> str:
+    """Period key for an exchange epoch (UTC): '2026-01' or '2026-Q1'."""
+    if not epoch or epoch <= 0:
+        return UNDATED_KEY
+    dt = datetime.fromtimestamp(epoch, tz=timezone.utc)
+    if mode == "quarterly":
+        return f"{dt.year}-Q{(dt.month - 1) // 3 + 1}"
+    return f"{dt.year}-{dt.month:02d}"
+
+
+def shard_range(key: str) -> Tuple[float, float]:
+    """[start, end) epoch range covered by a shard key."""
+    if key in (UNDATED_KEY, LEGACY_KEY):
+        return (0.0, float("inf"))
+    year_s, part = key.split("-")
+    year = int(year_s)
+    if part.startswith("Q"):
+        first = (int(part[1:]) - 1) * 3 + 1
+        last = first + 2
+    else:
+        first = last = int(part)
+    start = calendar.timegm((year, first, 1, 0, 0, 0))
+    end_year, end_month = (year + 1, 1) if last == 12 else (year, last + 1)
+    end = calendar.timegm((end_year, end_month, 1, 0, 0, 0))
+    return (float(start), float(end))
+
+
+def epoch_bounds(where: Optional[Dict[str, Any]]) -> Tuple[float, float]:
+    """Extract the epoch [lo, hi] a where filter restricts to (top-level / $and only)."""
+    lo, hi = 0.0, float("inf")
+    if not where:
+        return lo, hi
+    clauses = where.get("$and", [where]) if isinstance(where, dict) else []
+    for clause in clauses:
+        cond = clause.get("epoch") if isinstance(clause, dict) else None
+        if not isinstance(cond, dict):
+            continue
+        for op, val in cond.items():
+            if op in ("$gte", "$gt"):
+                lo = max(lo, float(val))
+            elif op in ("$lte", "$lt"):
+                hi = min(hi, float(val))
+    return lo, hi
+
+
+# ============================================================================
+# Sharded collection
+# ============================================================================
+
+class ShardedCollection:
+    """Chroma Collection look-alike over per-period shard directories."""
+
+    def __init__(
+        self,
+        root: Path,
+        mode: str,
+        manifest,
+        legacy=None,
+        embedding_function=None,
+    ):
+        if mode not in SHARD_MODES:
+            raise ValueError(f"Unknown shard mode: {mode!r} (expected one of {SHARD_MODES})")
+        self.root = Path(root)
+        self.mode = mode
+        self.manifest = manifest
+        self.legacy = legacy
+        self._ef = embedding_function or embedding_functions.DefaultEmbeddingFunction()
+        self._open: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=FANOUT_WORKERS, thread_name_prefix="conv-shard")
+        # Fan-out threads go with the collection, even if close() is never called
+        self._finalizer = weakref.finalize(self, self._pool.shutdown, wait=False)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def close(self):
+        """Stop the fan-out threads and drop open shard handles."""
+        self._finalizer()
+        with self._lock:
+            self._open.clear()
+
+    # ------------------------------------------------------------------
+    # Shard registry
+    # ------------------------------------------------------------------
+
+    def _registry(self) -> Dict[str, Dict[str, Any]]:
+        """key -> {path, tier, rows}. Hot shards are discovered from disk."""
+        shards = {row["key"]: row for row in self.manifest.list_shards()}
+        for d in self.root.iterdir():
+            if d.is_dir() and d.name not in shards:
+                shards[d.name] = {"key": d.name, "path": str(d), "tier": "hot", "rows": 0}
+        return shards
+
+    def _shard(self, key: str, create: bool = False):
+        with self._lock:
+            if key in self._open:
+                return self._open[key]
+            info = self._registry().get(key)
+            if info is None:
+                if not create:
+                    return None
+                path = self.root / key
+                self.manifest.register_shard(key, str(path), tier="hot")
+            else:
+                path = Path(info["path"])
+            client = chromadb.PersistentClient(
+                path=str(path), settings=Settings(anonymized_telemetry=False),
+            )
+            col = client.get_or_create_collection(
+                name=COLLECTION_NAME,
+                embedding_function=self._ef,
+                metadata={
+                    "description": f"Elara conversation shard {key} — cosine similarity",
+                    "hnsw:space": "cosine",
+                },
+            )
+            self._open[key] = col
+            return col
+
+    def _targets(
+        self, where: Optional[Dict[str, Any]] = None, include_cold: bool = False,
+    ) -> List[Tuple[str, Any]]:
+        """Shards that may hold rows matching where, pruned by epoch range."""
+        lo, hi = epoch_bounds(where)
+        bounded = lo > 0 or hi != float("inf")
+        targets = []
+        for key, info in sorted(self._registry().items()):
+            if key == UNDATED_KEY and bounded:
+                continue
+            if info.get("tier") == "cold" and not (bounded or include_cold):
+                continue
+            start, end = shard_range(key)
+            if end <= lo or start > hi:
+                continue
+            col = self._shard(key)
+            if col is not None:
+                targets.append((key, col))
+        if self.legacy is not None:
+            targets.append((LEGACY_KEY, self.legacy))
+        return targets
+
+    def _fanout(self, fn, targets: List[Tuple[str, Any]]) -> List[Tuple[str, Any]]:
+        if len(targets) <= 1:
+            return [(key, fn(col)) for key, col in targets]
+        futures = [(key, self._pool.submit(fn, col)) for key, col in targets]
+        return [(key, fut.result()) for key, fut in futures]
+
+    # ------------------------------------------------------------------
+    # Collection API — writes
+    # ------------------------------------------------------------------
+
+    def _route(self, metadatas: List[Dict[str, Any]]) -> Dict[str, List[int]]:
+        groups: Dict[str, List[int]] = {}
+        for i, meta in enumerate(metadatas):
+            key = shard_key((meta or {}).get("epoch", 0.0), self.mode)
+            groups.setdefault(key, []).append(i)
+        return groups
+
+    def _write(self, method: str, ids, documents=None, metadatas=None, embeddings=None):
+        if metadatas is None:
+            # The epoch in each row's metadata picks its shard
+            raise ValueError(f"ShardedCollection.{method}() requires metadatas")
+        for key, idx in self._route(metadatas).items():
+            col = self._shard(key, create=True)
+            kwargs = {"ids": [ids[i] for i in idx], "metadatas": [metadatas[i] for i in idx]}
+            if documents is not None:
+                kwargs["documents"] = [documents[i] for i in idx]
+            if embeddings is not None:
+                kwargs["embeddings"] = [embeddings[i] for i in idx]
+            getattr(col, method)(**kwargs)
+
+    def add(self, ids, documents=None, metadatas=None, embeddings=None):
+        self._write("add", ids, documents, metadatas, embeddings)
+
+    def upsert(self, ids, documents=None, metadatas=None, embeddings=None):
+        self._write("upsert", ids, documents, metadatas, embeddings)
+
+    def update(self, ids, metadatas=None, documents=None, embeddings=None):
+        """Update rows where they live (epoch is part of the content ID, so it never moves)."""
+        wanted = set(ids)
+        pos = {row_id: i for i, row_id in enumerate(ids)}
+        for key, col in self._targets(include_cold=True):
+            found = col.get(ids=list(wanted), include=[])["ids"]
+            if not found:
+                continue
+            kwargs = {"ids": found}
+            if metadatas is not None:
+                kwargs["metadatas"] = [metadatas[pos[i]] for i in found]
+            if documents is not None:
+                kwargs["documents"] = [documents[pos[i]] for i in found]
+            if embeddings is not None:
+                kwargs["embeddings"] = [embeddings[pos[i]] for i in found]
+            col.update(**kwargs)
+            wanted -= set(found)
+            if not wanted:
+                break
+
+    def delete(self, ids=None, where=None):
+        targets = self._targets(where, include_cold=ids is not None)
+        self._fanout(lambda col: col.delete(ids=ids, where=where), targets)
+
+    # ------------------------------------------------------------------
+    # Collection API — reads
+    # ------------------------------------------------------------------
+
+    def count(self) -> int:
+        total = 0
+        for key, info in self._registry().items():
+            if info.get("tier") == "cold":
+                total += info.get("rows", 0)
+                continue
+            col = self._shard(key)
+            if col is not None:
+                total += col.count()
+        if self.legacy is not None:
+            total += self.legacy.count()
+        return total
+
+    def get(self, ids=None, where=None, limit=None, offset=None, include=None):
+        include = ["metadatas", "documents"] if include is None else include
+        # Lookups by ID must see every shard; scans skip cold ones
+        targets = self._targets(where, include_cold=ids is not None)
+        out: Dict[str, Any] = {"ids": []}
+        for field in ("documents", "metadatas", "embeddings"):
+            out[field] = [] if field in include else None
+
+        if limit is None and not offset:
+            parts = self._fanout(
+                lambda col: col.get(ids=ids, where=where, include=include), targets,
+            )
+        else:
+            # Sequential paging over the shards' rows in key order, so offset
+            # and limit apply to the merged result. A shard the offset passes
+            # over entirely is skipped by its (matching) row count.
+            parts = []
+            skip = offset or 0
+            remaining = limit
+            for key, col in targets:
+                if remaining is not None and remaining <= 0:
+                    break
+                if skip:
+                    if ids is None and where is None:
+                        n = col.count()
+                    else:
+                        n = len(col.get(ids=ids, where=where, include=[])["ids"])
+                    if skip >= n:
+                        skip -= n
+                        continue
+                res = col.get(ids=ids, where=where, include=include,
+                              limit=remaining if remaining is not None else None,
+                              offset=skip or None)
+                skip = 0
+                parts.append((key, res))
+                if remaining is not None:
+                    remaining -= len(res["ids"])
+
+        for _, res in parts:
+            out["ids"].extend(res["ids"])
+            for field in ("documents", "metadatas", "embeddings"):
+                if out[field] is not None and res.get(field) is not None:
+                    out[field].extend(res[field])
+        return out
+
+    def query(self, query_texts=None, query_embeddings=None, n_results: int = 10,
+              where=None, include=None):
+        include = ["metadatas", "documents", "distances"] if include is None else include
+        if "distances" not in include:
+            include = list(include) + ["distances"]
+        if query_embeddings is None:
+            texts = [query_texts] if isinstance(query_texts, str) else list(query_texts)
+            query_embeddings = self._ef(texts)  # embed once, not once per shard
+        n_queries = len(query_embeddings)
+
+        def _one(col):
+            if col.count() == 0:
+                return None
+            return col.query(
+                query_embeddings=query_embeddings, n_results=n_results,
+                where=where, include=include,
+            )
+
+        parts = [res for _, res in self._fanout(_one, self._targets(where)) if res]
+        lo, hi = epoch_bounds(where)
+        if lo <= 0 and hi == float("inf") and any(
+                sum(len(res["ids"][q]) for res in parts) < n_results for q in range(n_queries)):
+            # Unbounded and the warm shards came up short: old exchanges
+            # live only in cold shards, so search those too
+            registry = self._registry()
+            cold = [(key, col) for key, col in self._targets(where, include_cold=True)
+                    if registry.get(key, {}).get("tier") == "cold"]
+            parts += [res for _, res in self._fanout(_one, cold) if res]
+
+        out: Dict[str, Any] = {"ids": [], "distances": []}
+        fields = [f for f in ("documents", "metadatas", "embeddings") if f in include]
+        for f in fields:
+            out[f] = []
+        for q in range(n_queries):
+            rows = []
+            for res in parts:
+                for j, row_id in enumerate(res["ids"][q]):
+                    row = {"id": row_id, "distance": res["distances"][q][j]}
+                    for f in fields:
+                        row[f] = res[f][q][j]
+                    rows.append(row)
+            rows.sort(key=lambda r: r["distance"])
+            rows = rows[:n_results]
+            out["ids"].append([r["id"] for r in rows])
+            out["distances"].append([r["distance"] for r in rows])
+            for f in fields:
+                out[f].append([r[f] for r in rows])
+        return out
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def shard_stats(self) -> List[Dict[str, Any]]:
+        """Per-shard key, tier, row count and path."""
+        result = []
+        for key, info in sorted(self._registry().items()):
+            if info.get("tier") == "cold":
+                rows = info.get("rows", 0)
+            else:
+                col = self._shard(key)
+                rows = col.count() if col is not None else 0
+            result.append({"key": key, "tier": info.get("tier", "hot"),
+                           "rows": rows, "path": info["path"]})
+        if self.legacy is not None:
+            result.append({"key": LEGACY_KEY, "tier": "hot",
+                           "rows": self.legacy.count(), "path": ""})
+        return result
+
+    def _copy_rows(self, src, write, batch_size: int) -> int:
+        moved = 0
+        total = src.count()
+        offset = 0
+        while offset < total:
+            page = src.get(include=["documents", "metadatas", "embeddings"],
+                           limit=batch_size, offset=offset)
+            if not page["ids"]:
+                break
+            write(page)
+            moved += len(page["ids"])
+            offset += len(page["ids"])
+        return moved
+
+    def reshard(self, batch_size: int = 500) -> Dict[str, Any]:
+        """Move the pre-sharding monolithic collection's rows into shards."""
+        if self.legacy is None:
+            return {"moved": 0}
+        moved_ids: List[str] = []
+
+        def _write(page):
+            self.upsert(ids=page["ids"], documents=page["documents"],
+                        metadatas=page["metadatas"],
+                        embeddings=[list(e) for e in page["embeddings"]])
+            moved_ids.extend(page["ids"])
+
+        moved = self._copy_rows(self.legacy, _write, batch_size)
+        for i in range(0, len(moved_ids), batch_size):
+            self.legacy.delete(ids=moved_ids[i:i + batch_size])
+        logger.info("Resharded %d conversation rows into %s shards", moved, self.mode)
+        return {"moved": moved}
+
+    def archive_shard(self, key: str, cold_root: Path, batch_size: int = 500) -> Dict[str, Any]:
+        """
+        Compact a shard into cold storage.
+
+        Rows are re-packed with their stored embeddings into a fresh index
+        under cold_root/<key> (dropping HNSW tombstones), the hot copy is
+        deleted, and the shard is only searched by date-bounded queries.
+        """
+        info = self._registry().get(key)
+        if info is None or info.get("tier") == "cold":
+            return {"archived": False, "rows": 0}
+        src = self._shard(key)
+        dest = Path(cold_root) / key
+        client = chromadb.PersistentClient(
+            path=str(dest), settings=Settings(anonymized_telemetry=False),
+        )
+        dst = client.get_or_create_collection(
+            name=COLLECTION_NAME, embedding_function=self._ef,
+            metadata={"description": f"Elara conversation shard {key} (cold)",
+                      "hnsw:space": "cosine"},
+        )
+
+        def _write(page):
+            dst.upsert(ids=page["ids"], documents=page["documents"],
+                       metadatas=page["metadatas"],
+                       embeddings=[list(e) for e in page["embeddings"]])
+
+        rows = self._copy_rows(src, _write, batch_size)
+        with self._lock:
+            self._open.pop(key, None)
+            self._open[key] = dst
+        self.manifest.register_shard(key, str(dest), tier="cold", rows=rows)
+
+        hot_dir = Path(info["path"])
+        try:
+            chromadb.PersistentClient(
+                path=str(hot_dir), settings=Settings(anonymized_telemetry=False),
+            ).delete_collection(COLLECTION_NAME)
+            shutil.rmtree(hot_dir, ignore_errors=True)
+        except Exception as e:
+            logger.warning("Archived shard %s but could not remove hot copy: %s", key, e)
+        logger.info("Archived conversation shard %s (%d rows) to %s", key, rows, dest)
+        return {"archived": True, "rows": rows, "path": str(dest)}
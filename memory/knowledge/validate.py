@@ -17,6 +17,8 @@ import re
 from collections import defaultdict
 from typing import Dict, List, Optional
 
+from kernels.definitions import compare_definitions
+
 from .store import KnowledgeStore
 
 logger = logging.getLogger("elara.knowledge.validate")
@@ -28,6 +30,10 @@ logger = logging.getLogger("elara.knowledge.validate")
 
 MAX_DOC_IDS = 100  # Guard against SQL placeholder DoS
 
+# Corpora with this many definitions compare them on the CPU lane
+PARALLEL_MIN_DEFINITIONS = 2000
+COMPARE_CHUNK = 200  # semantic_id groups per worker job
+
 
 def find_contradictions(store: KnowledgeStore, doc_ids: Optional[List[str]] = None) -> List[Dict]:
     """
@@ -57,50 +63,46 @@ def find_contradictions(store: KnowledgeStore, doc_ids: Optional[List[str]] = No
         row = dict(row)
         by_semantic[row["semantic_id"]].append(row)
 
-    # Check for cross-document definition conflicts
+    # Check for cross-document definition conflicts — only concepts
+    # defined in multiple docs can conflict
+    groups = []
     for semantic_id, defs in by_semantic.items():
-        # Group by source_doc
         by_doc = defaultdict(list)
         for d in defs:
             by_doc[d["source_doc"]].append(d)
-
-        # Only flag when a concept is defined in multiple docs
-        if len(by_doc) < 2:
-            continue
-
-        docs = list(by_doc.keys())
-        for i in range(len(docs)):
-            for j in range(i + 1, len(docs)):
-                doc_a, doc_b = docs[i], docs[j]
-                defs_a = by_doc[doc_a]
-                defs_b = by_doc[doc_b]
-
-                # Compare content for conflicts
-                for da in defs_a:
-                    for db_item in defs_b:
-                        if da["content"] and db_item["content"]:
-                            # Simple heuristic: if content is substantially different
-                            content_a = da["content"].lower().strip()
-                            content_b = db_item["content"].lower().strip()
-                            if content_a != content_b:
-                                # Use semantic similarity if available
-                                similarity = _text_similarity(content_a, content_b)
-                                if similarity < 0.85:  # different enough to flag
-                                    contradictions.append({
-                                        "type": "definition_conflict",
-                                        "semantic_id": semantic_id,
-                                        "doc_a": doc_a,
-                                        "doc_b": doc_b,
-                                        "content_a": da["content"],
-                                        "content_b": db_item["content"],
-                                        "line_a": da.get("source_line"),
-                                        "line_b": db_item.get("source_line"),
-                                        "section_a": da.get("source_section"),
-                                        "section_b": db_item.get("source_section"),
-                                        "similarity": round(similarity, 4),
-                                        "confidence": max(da["confidence"], db_item["confidence"]),
-                                    })
-
+        if len(by_doc) >= 2:
+            groups.append((semantic_id, [(doc, [d for d in doc_defs if d["content"]])
+                                         for doc, doc_defs in by_doc.items()]))
+
+    # The kernel sees content strings only and answers with indices
+    texts = [[[d["content"] for d in doc_defs] for _, doc_defs in docs] for _, docs in groups]
+    if len(rows) < PARALLEL_MIN_DEFINITIONS:
+        conflicts = compare_definitions(texts)
+    else:
+        from daemon.workers import cpu_map
+        conflicts = []
+        for offset, found in zip(range(0, len(texts), COMPARE_CHUNK),
+                                 cpu_map(compare_definitions, _chunks(texts, COMPARE_CHUNK))):
+            conflicts.extend((g + offset, *rest) for g, *rest in found)
+
+    for g, i, j, a, b, similarity in conflicts:
+        semantic_id, docs = groups[g]
+        (doc_a, defs_a), (doc_b, defs_b) = docs[i], docs[j]
+        da, db_item = defs_a[a], defs_b[b]
+        contradictions.append({
+            "type": "definition_conflict",
+            "semantic_id": semantic_id,
+            "doc_a": doc_a,
+            "doc_b": doc_b,
+            "content_a": da["content"],
+            "content_b": db_item["content"],
+            "line_a": da.get("source_line"),
+            "line_b": db_item.get("source_line"),
+            "section_a": da.get("source_section"),
+            "section_b": db_item.get("source_section"),
+            "similarity": round(similarity, 4),
+            "confidence": max(da["confidence"], db_item["confidence"]),
+        })
     return contradictions
 
 
@@ -358,15 +360,8 @@ def validate_corpus(
 # Helpers
 # ============================================================================
 
-def _text_similarity(a: str, b: str) -> float:
-    """Simple Jaccard similarity between word sets."""
-    words_a = set(a.lower().split())
-    words_b = set(b.lower().split())
-    if not words_a or not words_b:
-        return 0.0
-    intersection = words_a & words_b
-    union = words_a | words_b
-    return len(intersection) / len(union) if union else 0.0
+def _chunks(items: List, size: int) -> List[List]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
 
 
 def _version_gt(a: str, b: str) -> bool:
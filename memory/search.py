@@ -0,0 +1,164 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+Unified semantic search — one query embedding across every collection.
+
+Memories, conversations, principles, reasoning trails, milestones,
+corrections and workflows each live in their own Chroma collection, and
+each module's search embeds the query text itself. search_everything()
+embeds once (every collection uses Chroma's default all-MiniLM-L6-v2
+model, so one vector fits all), queries each collection with
+query_embeddings, converts each collection's distance metric to a 0-1
+similarity and returns one merged, source-tagged list.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger("elara.memory.search")
+
+
+def _memories():
+    from memory.vector import get_memory
+    return get_memory().collection
+
+
+def _conversations():
+    from memory.conversations import get_conversations
+    return get_conversations().collection
+
+
+def _principles():
+    from daemon.principles import _get_collection
+    return _get_collection()
+
+
+def _reasoning():
+    from daemon.reasoning import _get_collection
+    return _get_collection()
+
+
+def _milestones():
+    from memory.episodic import get_episodic
+    return get_episodic().milestones_collection
+
+
+def _corrections():
+    from daemon.corrections import _get_collection
+    return _get_collection()
+
+
+def _workflows():
+    from daemon.workflows import _get_collection
+    return _get_collection()
+
+
+# source name -> collection getter (None when the store is unavailable)
+SOURCES: Dict[str, Callable[[], Any]] = {
+    "memories": _memories,
+    "conversations": _conversations,
+    "principles": _principles,
+    "reasoning": _reasoning,
+    "milestones": _milestones,
+    "corrections": _corrections,
+    "workflows": _workflows,
+}
+
+
+def embed_query(query: str) -> List[float]:
+    """Embed a query with the same model every collection indexes with."""
+    from memory.conversations import get_conversations
+    return get_conversations().embed([query])[0]
+
+
+def similarity(distance: float, space: str = "cosine") -> float:
+    """Map a Chroma distance to a 0-1 similarity, whatever the metric."""
+    if space == "l2":
+        # Squared L2 between unit vectors is 2 - 2cos
+        sim = 1.0 - distance / 2.0
+    else:
+        # cosine: 1 - cos; ip: 1 - dot (unit vectors, so dot == cos)
+        sim = 1.0 - distance
+    return max(0.0, min(1.0, sim))
+
+
+def _space(collection) -> str:
+    meta = getattr(collection, "metadata", None)
+    if isinstance(meta, dict):
+        return meta.get("hnsw:space", "l2")
+    return "cosine"  # ShardedCollection: every shard is cosine
+
+
+def search_everything(
+    query: str,
+    sources: Optional[Iterable[str]] = None,
+    k_per_source: int = 3,
+    min_score: float = 0.0,
+    query_embedding: Optional[List[float]] = None,
+) -> List[Dict[str, Any]]:
+    """Search several collections with one embedding; merged best-first.
+
+    Args:
+        query: Text to search for (embedded once)
+        sources: Names from SOURCES (default: all of them)
+        k_per_source: Hits to take from each collection
+        min_score: Drop hits below this similarity
+        query_embedding: Precomputed embedding of `query` (skips embedding)
+
+    Returns:
+        [{"source", "id", "content", "metadata", "score"}] sorted by score.
+        A source whose store is unavailable or empty contributes nothing.
+    """
+    names = list(SOURCES) if sources is None else list(sources)
+    unknown = [n for n in names if n not in SOURCES]
+    if unknown:
+        raise ValueError(f"Unknown search source(s): {', '.join(unknown)}")
+    if not names or k_per_source <= 0:
+        return []
+
+    if query_embedding is None:
+        try:
+            query_embedding = embed_query(query)
+        except Exception as e:
+            logger.warning("Query embedding failed: %s", e)
+            return []
+
+    hits: List[Dict[str, Any]] = []
+    for name in names:
+        try:
+            collection = SOURCES[name]()
+            if collection is None:
+                continue
+            count = collection.count()
+            if count == 0:
+                continue
+            res = collection.query(
+                query_embeddings=[query_embedding],
+                n_results=min(k_per_source, count),
+                include=["documents", "metadatas", "distances"],
+            )
+        except Exception as e:
+            logger.warning("Search of %s failed: %s", name, e)
+            continue
+
+        space = _space(collection)
+        ids = res.get("ids", [[]])[0]
+        docs = (res.get("documents") or [[]])[0]
+        metas = (res.get("metadatas") or [[]])[0]
+        distances = res.get("distances", [[]])[0]
+        for i, hit_id in enumerate(ids):
+            score = similarity(distances[i], space)
+            if score < min_score:
+                continue
+            hits.append({
+                "source": name,
+                "id": hit_id,
+                "content": docs[i] if i < len(docs) else "",
+                "metadata": (metas[i] if i < len(metas) else None) or {},
+                "score": round(score, 4),
+            })
+
+    hits.sort(key=lambda h: h["score"], reverse=True)
+    return hits
@@ -21,6 +21,9 @@ from datetime import datetime
 from typing import List, Optional, Dict, Any
 import hashlib
 
+from daemon.cache import cache, CacheKeys, cache_ttl
+from daemon.events import bus, Events
+
 # ChromaDB import
 try:
     import chromadb
@@ -153,6 +156,9 @@ class VectorMemory:
             metadatas=[meta],
             ids=[memory_id]
         )
+        cache.invalidate(CacheKeys.MEMORY_COUNT)
+        bus.emit(Events.MEMORY_SAVED, {"memory_id": memory_id, "memory_type": memory_type},
+                 source="memory.vector")
 
         return memory_id
 
@@ -417,15 +423,18 @@ class VectorMemory:
 
         try:
             self.collection.delete(ids=[memory_id])
+            cache.invalidate(CacheKeys.MEMORY_COUNT)
             return True
         except Exception:
             return False
 
     def count(self) -> int:
-        """How many memories do I have?"""
+        """How many memories do I have? Layer 0 cached."""
         if not CHROMA_AVAILABLE or not self.collection:
             return 0
-        return self.collection.count()
+        return cache.get_or_compute(
+            CacheKeys.MEMORY_COUNT, cache_ttl(CacheKeys.MEMORY_COUNT), self.collection.count,
+        )
 
     def summarize(self) -> str:
         """Summarize memory state."""
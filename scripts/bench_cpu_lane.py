@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""
+CPU lane benchmark — inline vs. process pool for the CPU-bound kernels.
+
+Runs each CPU lane kernel (KG extraction passes, definition comparison,
+recall counting, and JSONL session parsing, which ingest still runs inline)
+on synthetic data, once in this process and once spread over a
+daemon.workers.ProcessLane, and prints the speedup. Worker start-up is
+excluded: the lane is warmed before timing.
+
+Usage:
+    python -m scripts.bench_cpu_lane                # workers = cores - 1 (min 2)
+    python -m scripts.bench_cpu_lane --workers 4 --repeat 3
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from daemon.workers import ProcessLane
+from kernels.definitions import compare_definitions
+from kernels.kg_extract import EXTRACTORS, _parse_sections, run_extractor
+from kernels.recall import count_recalls
+from kernels.sessions import parse_session_file
+
+COMPARE_CHUNK = 200  # matches memory.knowledge.validate
+
+ROOT = Path(__file__).resolve().parent.parent
+WORDS = ("layer memory cortical event cache latency vector graph session "
+         "protocol witness decay recall dream mood goal index").split()
+
+
+def _sentence(rng: random.Random, n: int = 12) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n))
+
+
+def _markdown(rng: random.Random) -> str:
+    papers = sorted(ROOT.glob("ELARA-CORE-WHITEPAPER*.md"))
+    if papers:
+        return papers[0].read_text(encoding="utf-8")
+    parts = []
+    for i in range(400):
+        parts.append(f"## Section {i}\n\n**Cortical Layer {i % 5}** is a {_sentence(rng)}.\n"
+                     f"The cache must respond within {rng.randint(1, 99)} ms. "
+                     f"Event Bus depends on Worker Pool v1.{i % 9}.0.\n")
+    return "\n".join(parts)
+
+
+def _definition_groups(rng: random.Random) -> List[List[List[str]]]:
+    # 3000 concepts, each defined three times in four documents
+    return [[[_sentence(rng, 20) for _ in range(3)] for _ in range(4)] for _ in range(3000)]
+
+
+def _session_files(rng: random.Random, root: Path) -> List[str]:
+    paths = []
+    for s in range(24):
+        lines = []
+        for i in range(600):
+            lines.append(json.dumps({"type": "user", "cwd": "/proj", "timestamp": f"2026-01-01T00:{i % 60:02d}:00",
+                                     "message": {"content": _sentence(rng, 30)}}))
+            lines.append(json.dumps({"type": "assistant", "timestamp": f"2026-01-01T00:{i % 60:02d}:30",
+                                     "message": {"content": [{"type": "text", "text": _sentence(rng, 80)}]}}))
+        path = root / f"session-{s}.jsonl"
+        path.write_text("\n".join(lines) + "\n")
+        paths.append(str(path))
+    return paths
+
+
+def _recall_log(rng: random.Random, root: Path) -> Path:
+    path = root / "recall.jsonl"
+    with open(path, "w") as f:
+        for i in range(200_000):
+            f.write(json.dumps({"memory_id": f"m{rng.randint(0, 5000)}", "query": _sentence(rng, 5),
+                                "relevance": 0.5, "timestamp": f"2026-01-{1 + i % 28:02d}T12:00:00"}) + "\n")
+    return path
+
+
+def _time(fn: Callable, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workers", type=int, default=max(2, (os.cpu_count() or 1) - 1))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory(prefix="elara-bench-") as tmp:
+        _run(rng, Path(tmp), args.workers, args.repeat)
+
+
+def _run(rng: random.Random, tmp: Path, workers: int, repeat: int) -> None:
+    text = _markdown(rng)
+    sections = _parse_sections(text)
+    extract_jobs = [(name, text, "doc", "v1.0.0", sections) for name in EXTRACTORS]
+    groups = _definition_groups(rng)
+    compare_jobs = [groups[i:i + COMPARE_CHUNK] for i in range(0, len(groups), COMPARE_CHUNK)]
+    session_jobs = _session_files(rng, tmp)
+    log = _recall_log(rng, tmp)
+    size = log.stat().st_size
+    step = max(1, size // (workers * 2))
+    recall_jobs = [(str(log), s, min(s + step, size), "2026-01-10T00:00:00") for s in range(0, size, step)]
+
+    workloads = [
+        ("kg extraction (5 passes)", run_extractor, extract_jobs),
+        ("definition comparison", compare_definitions, compare_jobs),
+        ("jsonl session parsing", parse_session_file, session_jobs),
+        ("recall log counting", count_recalls, recall_jobs),
+    ]
+
+    lane = ProcessLane("bench", max_workers=workers)
+    # Warm every worker: spawn + kernel module imports
+    lane.map(run_extractor, [("definitions", "", "d", "v", [])] * workers * 2)
+
+    print(f"cores={os.cpu_count()} workers={workers} repeat={repeat} (best of)")
+    print(f"{'workload':<28}{'jobs':>6}{'inline s':>11}{'lane s':>10}{'speedup':>10}")
+    try:
+        for name, fn, jobs in workloads:
+            inline = _time(lambda: [fn(job) for job in jobs], repeat)
+            pooled = _time(lambda: lane.map(fn, jobs), repeat)
+            print(f"{name:<28}{len(jobs):>6}{inline:>11.3f}{pooled:>10.3f}{inline / pooled:>9.2f}x")
+    finally:
+        lane.shutdown(wait=True)
+
+
+if __name__ == "__main__":
+    main()
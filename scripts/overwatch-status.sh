@@ -1,6 +1,7 @@
 #!/bin/bash
 # Check Overwatch daemon status.
 
+ELARA_ROOT="$(cd "$(dirname "$0")/.." && pwd)"
 PID_FILE="$HOME/.claude/elara-overwatch.pid"
 LOG_FILE="$HOME/.claude/elara-overwatch.log"
 
@@ -8,6 +9,10 @@ if [ -f "$PID_FILE" ]; then
     PID=$(cat "$PID_FILE")
     if kill -0 "$PID" 2>/dev/null; then
         echo "[Overwatch] Running (PID $PID)"
+        if [ "$1" = "--stats" ]; then
+            PYTHONPATH="$ELARA_ROOT" python3 -m daemon.overwatch --stats
+            exit 0
+        fi
         if [ -f "$LOG_FILE" ]; then
             echo "--- Last 5 log entries ---"
             tail -5 "$LOG_FILE"
@@ -16,5 +16,5 @@ else
     echo "[Overwatch] Not running"
 fi
 
-# Clean up inject file
-rm -f "$HOME/.claude/elara-overwatch-inject.md"
+# Clean up inject files (shared + per-session)
+rm -f "$HOME/.claude/elara-overwatch-inject.md" "$HOME"/.claude/elara-overwatch-inject-*.md
@@ -0,0 +1,115 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Boot bundle — materialize once, reuse fresh sections, recompute stale ones."""
+
+import json
+import os
+import time
+
+import pytest
+
+import daemon.boot_bundle as bb
+
+
+@pytest.fixture
+def sections(isolated_paths, monkeypatch):
+    calls = {"goals": 0, "handoff": 0, "dated": 0}
+
+    def counted(name, value):
+        def compute():
+            calls[name] += 1
+            return value
+        return compute
+
+    monkeypatch.setattr(bb, "SECTIONS", {
+        "goals": (counted("goals", {"active": 2}), ("goals_file",), None),
+        "handoff": (counted("handoff", ["carry"]), ("handoff_file", "episodes_dir"), None),
+        "dated": (counted("dated", "today"), ("state_file",), 60),
+    })
+    isolated_paths.goals_file.write_text("[]")
+    return calls
+
+
+def test_fresh_bundle_is_read_not_recomputed(sections):
+    bb.materialize("session-end")
+    assert sections == {"goals": 1, "handoff": 1, "dated": 1}
+
+    assert bb.load_bundle() == {"goals": {"active": 2}, "handoff": ["carry"], "dated": "today"}
+    assert sections == {"goals": 1, "handoff": 1, "dated": 1}
+    assert set(bb.bundle_status().values()) == {"fresh"}
+
+    bundle = json.loads(bb.get_paths().boot_bundle.read_text())
+    assert bundle["version"] == bb.BUNDLE_VERSION and bundle["reason"] == "session-end"
+
+
+def test_only_changed_sources_are_recomputed(sections, isolated_paths):
+    bb.materialize()
+    isolated_paths.goals_file.write_text('[{"status": "active"}]')
+    (isolated_paths.episodes_dir / "2026-10-18.json").write_text("{}")
+    assert bb.bundle_status() == {"goals": "stale", "handoff": "stale", "dated": "fresh"}
+
+    bb.load_bundle(["goals"])
+    assert sections["goals"] == 2 and sections["handoff"] == 1
+
+    bb.load_bundle()  # handoff still stale; goals now fresh again
+    assert sections == {"goals": 2, "handoff": 2, "dated": 1}
+    assert set(bb.bundle_status().values()) == {"fresh"}
+
+
+def test_ttl_and_version_force_recompute(sections, isolated_paths):
+    bb.materialize()
+    bundle_path = isolated_paths.boot_bundle
+    bundle = json.loads(bundle_path.read_text())
+    bundle["sections"]["dated"]["built"] = time.time() - 120
+    bundle_path.write_text(json.dumps(bundle))
+    bb.load_bundle()
+    assert sections == {"goals": 1, "handoff": 1, "dated": 2}
+
+    bundle = json.loads(bundle_path.read_text())
+    bundle["version"] = bb.BUNDLE_VERSION - 1
+    bundle_path.write_text(json.dumps(bundle))
+    bb.load_bundle()
+    assert sections == {"goals": 2, "handoff": 2, "dated": 3}
+
+
+def test_generation_is_taken_before_compute(sections, isolated_paths, monkeypatch):
+    goals = isolated_paths.goals_file
+
+    def racing():
+        goals.write_text("[1]")  # source changes while the section is built
+        os.utime(goals, ns=(1, 1))
+        return {}
+
+    monkeypatch.setitem(bb.SECTIONS, "goals", (racing, ("goals_file",), None))
+    bb.materialize()
+    assert bb.bundle_status()["goals"] == "stale"
+
+
+def test_failed_build_is_not_fresh(sections, monkeypatch):
+    def broken():
+        raise RuntimeError("store locked")
+
+    monkeypatch.setitem(bb.SECTIONS, "goals", (broken, ("goals_file",), None))
+    monkeypatch.setitem(bb.SECTIONS, "handoff", (lambda: {"error": "unavailable"}, ("handoff_file",), None))
+    bb.materialize()
+    assert bb.bundle_status() == {"goals": "stale", "handoff": "stale", "dated": "fresh"}
+
+    monkeypatch.setitem(bb.SECTIONS, "goals", (lambda: {"active": 1}, ("goals_file",), None))
+    assert bb.load_bundle(["goals"]) == {"goals": {"active": 1}}
+    assert bb.bundle_status()["goals"] == "fresh"
+
+
+def test_snapshot_reads_the_bundle(isolated_paths, monkeypatch):
+    from daemon import snapshot
+
+    calls = []
+    getters = {"goals": lambda: calls.append("goals") or {"active": 3}}
+    monkeypatch.setattr(snapshot, "SNAPSHOT_SECTIONS", getters)
+    monkeypatch.setattr(bb, "SECTIONS", {"goals": (getters["goals"], ("goals_file",), None)})
+    isolated_paths.goals_file.write_text("[]")
+    bb.materialize()
+
+    assert snapshot.get_snapshot()["goals"] == {"active": 3}
+    assert calls == ["goals"]  # built once at materialize, read afterwards
@@ -8,7 +8,7 @@ import threading
 import time
 import pytest
 
-from daemon.cache import CorticalCache, CacheKeys, CACHE_TTLS
+from daemon.cache import CorticalCache, CacheKeys, CACHE_TTLS, MISSING
 
 
 @pytest.fixture
@@ -71,6 +71,17 @@ class TestInvalidation:
         assert cache.get("a") is None
         assert cache.get("b") is None
 
+    def test_every_event_in_a_burst_invalidates_before_emit_returns(self, cache, monkeypatch):
+        from daemon import events
+        from daemon.cache import setup_cache_invalidation
+        bus = events.EventBus()
+        monkeypatch.setattr(events, "bus", bus)
+        setup_cache_invalidation(cache)
+        for n in range(3):
+            cache.set(CacheKeys.MEMORY_COUNT, n, ttl=60.0)
+            bus.emit(events.Events.MEMORY_SAVED, {})
+            assert cache.get(CacheKeys.MEMORY_COUNT) is None
+
 
 class TestStats:
 
@@ -211,3 +222,115 @@ class TestCacheConstants:
     def test_ttls_are_positive(self):
         for key, ttl in CACHE_TTLS.items():
             assert ttl > 0, f"TTL for {key} must be positive"
+
+
+class TestSingleFlight:
+
+    def test_concurrent_misses_compute_once(self, cache):
+        calls = 0
+        release = threading.Event()
+
+        def compute():
+            nonlocal calls
+            calls += 1
+            release.wait(2)
+            return "value"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_compute("k", 10.0, compute)))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        time.sleep(0.05)
+        release.set()
+        for t in threads:
+            t.join(2)
+
+        assert calls == 1
+        assert results == ["value"] * 8
+        assert cache.stats()["singleflight_waits"] == 7
+
+    def test_error_reaches_waiters_and_is_not_cached(self, cache):
+        def boom():
+            raise RuntimeError("nope")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_compute("k", 10.0, boom)
+        assert cache.get_or_compute("k", 10.0, lambda: 1) == 1
+
+    def test_invalidation_during_compute_discards_result(self, cache):
+        def compute():
+            cache.invalidate("k")  # a write landed while we were reading
+            return "stale"
+
+        assert cache.get_or_compute("k", 10.0, compute) == "stale"
+        assert cache.get("k") is None
+
+    def test_callers_after_invalidation_start_a_fresh_compute(self, cache):
+        started, release = threading.Event(), threading.Event()
+        results = {}
+
+        def old_read():
+            started.set()
+            release.wait(2)
+            return "old"
+
+        leader = threading.Thread(
+            target=lambda: results.setdefault("leader", cache.get_or_compute("k", 10.0, old_read)))
+        leader.start()
+        started.wait(2)
+        cache.invalidate("k")  # a write lands while the first read is in flight
+
+        assert cache.get_or_compute("k", 10.0, lambda: "new") == "new"
+        release.set()
+        leader.join(2)
+        assert results["leader"] == "old"
+        assert cache.get("k") == "new"  # the late stale result didn't overwrite it
+        assert cache.stats()["inflight"] == 0
+
+
+class TestNegativeCaching:
+
+    def test_none_result_is_cached(self, cache):
+        calls = 0
+
+        def compute():
+            nonlocal calls
+            calls += 1
+            return None
+
+        assert cache.get_or_compute("k", 10.0, compute) is None
+        assert cache.get_or_compute("k", 10.0, compute) is None
+        assert calls == 1
+        assert cache.get("k", MISSING) is None
+        assert cache.get("other", MISSING) is MISSING
+        assert cache.stats()["negative_hits"] >= 1
+
+    def test_negative_ttl(self, cache):
+        cache.get_or_compute("k", 10.0, lambda: None, negative_ttl=0.01)
+        time.sleep(0.02)
+        assert cache.get("k", MISSING) is MISSING
+
+
+class TestEviction:
+
+    def test_lru_by_entry_count(self):
+        c = CorticalCache(max_entries=2)
+        c.set("a", 1, 10.0)
+        c.set("b", 2, 10.0)
+        c.get("a")            # a is now most recent
+        c.set("c", 3, 10.0)   # evicts b
+        assert c.get("b") is None
+        assert c.get("a") == 1 and c.get("c") == 3
+        assert c.stats()["evictions"] == 1
+
+    def test_byte_budget(self):
+        c = CorticalCache(max_bytes=20_000)
+        for i in range(10):
+            c.set(f"k{i}", "x" * 5_000, 10.0)
+        stats = c.stats()
+        assert stats["bytes"] <= 20_000
+        assert stats["evictions"] == 10 - stats["entries"]
+        assert c.get("k9") is not None
@@ -0,0 +1,77 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Cache warm start — snapshot on shutdown, validated restore on startup."""
+
+import json
+import time
+
+from daemon.cache import CacheKeys, CorticalCache
+from daemon.cache_snapshot import load_snapshot, save_snapshot, stamp_sources
+
+
+def _goals(paths, goals):
+    paths.goals_file.write_text(json.dumps(goals))
+
+
+def test_round_trip_restores_valid_entries(isolated_paths):
+    _goals(isolated_paths, [{"id": 1}])
+    old = CorticalCache()
+    stamp_sources(old)
+    old.set(CacheKeys.GOAL_LIST, [{"id": 1}], 60.0)
+    old.set(CacheKeys.MEMORY_COUNT, 42, 60.0)
+    old.set("not_snapshotted", "x", 60.0)
+    assert save_snapshot(old) == 2
+
+    new = CorticalCache()
+    assert load_snapshot(new) == 2
+    assert new.get(CacheKeys.GOAL_LIST) == [{"id": 1}]
+    assert new.get(CacheKeys.MEMORY_COUNT) == 42
+    assert new.get("not_snapshotted") is None
+
+
+def test_changed_source_is_not_restored(isolated_paths):
+    _goals(isolated_paths, [{"id": 1}])
+    old = CorticalCache()
+    stamp_sources(old)
+    old.set(CacheKeys.GOAL_LIST, [{"id": 1}], 60.0)
+    assert save_snapshot(old) == 1
+
+    _goals(isolated_paths, [{"id": 1}, {"id": 2}])  # edited while we were down
+    new = CorticalCache()
+    assert load_snapshot(new) == 0
+    assert new.get(CacheKeys.GOAL_LIST) is None
+
+
+def test_generation_is_the_one_the_value_was_computed_from(isolated_paths):
+    _goals(isolated_paths, [{"id": 1}])
+    old = CorticalCache()
+    stamp_sources(old)
+    old.get_or_compute(CacheKeys.GOAL_LIST, 60.0, lambda: [{"id": 1}])
+    # Edited after the compute; no invalidating event reached this cache
+    _goals(isolated_paths, [{"id": 1}, {"id": 2}])
+    assert save_snapshot(old) == 1
+
+    assert load_snapshot(CorticalCache()) == 0
+
+
+def test_unstamped_entries_are_not_saved(isolated_paths):
+    old = CorticalCache()
+    old.set(CacheKeys.MEMORY_COUNT, 42, 60.0)
+    assert save_snapshot(old) == 0
+
+
+def test_ttl_counts_across_restart(isolated_paths):
+    old = CorticalCache()
+    stamp_sources(old)
+    old.set(CacheKeys.MOOD_STATE, {"valence": 0.5}, 0.05)
+    save_snapshot(old)
+    time.sleep(0.1)
+    assert load_snapshot(CorticalCache()) == 0
+
+
+def test_missing_or_corrupt_snapshot(isolated_paths):
+    assert load_snapshot(CorticalCache()) == 0
+    isolated_paths.cache_snapshot.write_text("{not json")
+    assert load_snapshot(CorticalCache()) == 0
@@ -0,0 +1,27 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Continuity chain — coalesced mood trigger."""
+
+from core.continuity import ContinuityChain
+from daemon.events import EventBus, Events
+
+
+def test_mood_burst_collapses_but_keeps_the_large_shift(isolated_paths, monkeypatch):
+    checkpoints = []
+    monkeypatch.setattr(ContinuityChain, "checkpoint",
+                        lambda self, trigger: checkpoints.append(trigger))
+    bus = EventBus()
+    bus.set_coalesce_window(Events.MOOD_CHANGED, 60)
+    ContinuityChain(isolated_paths, bridge=None, event_bus=bus)
+
+    # A small change opens the window; the large one arrives inside it
+    for delta in (0.1, -0.05, 0.5, 0.02, -0.1):
+        bus.emit(Events.MOOD_CHANGED, {"delta": delta})
+    assert checkpoints == []
+    assert bus.drain(2)
+    assert checkpoints == ["mood_changed_significant"]
+
+    stats = bus.stats()["coalesced"]["subscriptions"]["mood_changed:continuity_chain"]
+    assert (stats["received"], stats["delivered"]) == (5, 2)
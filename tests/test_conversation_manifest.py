@@ -0,0 +1,230 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Tests for the SQLite conversation ingestion manifest."""
+
+import json
+
+import pytest
+
+from memory.conversations.manifest import ConversationManifest
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    m = ConversationManifest(tmp_path / "manifest.db")
+    yield m
+    m.close()
+
+
+class TestRecord:
+    def test_empty_counters(self, manifest):
+        c = manifest.counters()
+        assert c["files"] == 0
+        assert all(v == 0 for v in c.values())
+
+    def test_record_updates_counters(self, manifest):
+        manifest.record("/p/a.jsonl", "a", 1.0, 100, exchanges=10, cross_referenced=4)
+        manifest.record("/p/b.jsonl", "b", 2.0, 200, exchanges=5)
+        c = manifest.counters()
+        assert c["files"] == 2
+        assert c["sessions"] == 2
+        assert c["exchanges"] == 15
+        assert c["cross_referenced"] == 4
+
+    def test_rerecord_replaces_not_adds(self, manifest):
+        manifest.record("/p/a.jsonl", "a", 1.0, 100, exchanges=10, cross_referenced=4)
+        manifest.record("/p/a.jsonl", "a", 3.0, 150, exchanges=12, cross_referenced=1)
+        c = manifest.counters()
+        assert c["files"] == 1
+        assert c["sessions"] == 1
+        assert c["exchanges"] == 12
+        assert c["cross_referenced"] == 1
+
+    def test_duplicates_skipped_is_per_file(self, manifest):
+        manifest.record("/p/a.jsonl", "a", 1.0, 100, exchanges=10, duplicates_skipped=6)
+        manifest.record("/p/a.jsonl", "a", 2.0, 120, exchanges=11, duplicates_skipped=6)
+        manifest.record("/p/b.jsonl", "b", 1.0, 100, exchanges=3, duplicates_skipped=1)
+        assert manifest.counters()["duplicates_skipped"] == 7
+        manifest.remove("/p/b.jsonl")
+        assert manifest.counters()["duplicates_skipped"] == 6
+
+    def test_same_session_two_files_counts_once(self, manifest):
+        manifest.record("/p1/a.jsonl", "a", 1.0, 100, exchanges=3)
+        manifest.record("/p2/a.jsonl", "a", 1.0, 100, exchanges=3)
+        assert manifest.counters()["sessions"] == 1
+        manifest.remove("/p1/a.jsonl")
+        assert manifest.counters()["sessions"] == 1
+        manifest.remove("/p2/a.jsonl")
+        assert manifest.counters()["sessions"] == 0
+
+    def test_is_unchanged(self, manifest):
+        manifest.record("/p/a.jsonl", "a", 1.5, 100, exchanges=1)
+        assert manifest.is_unchanged("/p/a.jsonl", 1.5, 100)
+        assert not manifest.is_unchanged("/p/a.jsonl", 1.5, 101)
+        assert not manifest.is_unchanged("/p/missing.jsonl", 1.5, 100)
+
+    def test_reset_clears_rows_and_counters(self, manifest):
+        manifest.record("/p/a.jsonl", "a", 1.0, 100, exchanges=10)
+        manifest.schema_version = 2
+        manifest.reset()
+        assert manifest.get("/p/a.jsonl") is None
+        assert manifest.counters()["exchanges"] == 0
+        assert manifest.schema_version == 2
+
+
+class TestPersistence:
+    def test_rows_survive_reopen(self, tmp_path):
+        db = tmp_path / "manifest.db"
+        m = ConversationManifest(db)
+        m.record("/p/a.jsonl", "a", 1.0, 100, exchanges=7)
+        m.close()
+
+        m2 = ConversationManifest(db)
+        assert m2.get("/p/a.jsonl")["exchanges_ingested"] == 7
+        assert m2.counters()["exchanges"] == 7
+        m2.close()
+
+    def test_legacy_json_migrated(self, tmp_path):
+        legacy = tmp_path / "ingested.json"
+        legacy.write_text(json.dumps({
+            "_schema_version": 2,
+            "/p/a.jsonl": {"last_modified": 1.0, "size_bytes": 10,
+                           "exchanges_ingested": 4, "session_id": "a"},
+            "/p/b.jsonl": {"last_modified": 2.0, "size_bytes": 20,
+                           "exchanges_ingested": 6, "session_id": "b"},
+        }))
+        m = ConversationManifest(tmp_path / "manifest.db", legacy_json=legacy)
+        c = m.counters()
+        assert c["files"] == 2
+        assert c["exchanges"] == 10
+        assert m.schema_version == 2
+        assert not legacy.exists()
+        assert (tmp_path / "ingested.json.migrated").exists()
+        m.close()
+
+    def test_legacy_cross_references_carried_over(self, tmp_path):
+        legacy = tmp_path / "ingested.json"
+        legacy.write_text(json.dumps({
+            "/p/a.jsonl": {"exchanges_ingested": 4, "session_id": "a"},
+            "/p/a-resumed.jsonl": {"exchanges_ingested": 2, "session_id": "a"},
+            "/p/b.jsonl": {"exchanges_ingested": 6, "session_id": "b", "cross_referenced": 5},
+        }))
+        m = ConversationManifest(tmp_path / "manifest.db", legacy_json=legacy,
+                                 legacy_cross_refs=lambda: {"a": 3, "b": 1})
+        assert m.counters()["cross_referenced"] == 8
+        m.remove("/p/a.jsonl")
+        assert m.counters()["cross_referenced"] == 5
+        m.close()
+
+
+class TestExchangeRefs:
+    def test_set_session_refs_replaces(self, manifest):
+        manifest.set_session_refs("a", [("h1", 0), ("h2", 1)])
+        manifest.set_session_refs("a", [("h2", 0)])
+        assert manifest.session_refs("a") == {"h2"}
+
+    def test_shared_exchange_tracks_all_sessions(self, manifest):
+        manifest.set_session_refs("a", [("h1", 0), ("h2", 1)])
+        manifest.set_session_refs("b", [("h1", 0), ("h2", 1), ("h3", 2)])
+        assert manifest.sessions_for("h1") == ["a", "b"]
+        assert manifest.referenced_elsewhere({"h1", "h3"}, "b") == {"h1"}
+
+    def test_refs_in_range_sorted(self, manifest):
+        manifest.set_session_refs("b", [("h3", 2), ("h1", 0), ("h2", 1)])
+        assert manifest.refs_in_range("b", 1, 2) == [(1, "h2"), (2, "h3")]
+
+    def test_reset_clears_refs(self, manifest):
+        manifest.set_session_refs("a", [("h1", 0)])
+        manifest.reset()
+        assert manifest.sessions_for("h1") == []
+
+
+class TestSummaryTier:
+    def test_candidates_respect_cutoff_and_marking(self, manifest):
+        manifest.record("/p/old.jsonl", "old", 100.0, 10, exchanges=5)
+        manifest.record("/p/new.jsonl", "new", 900.0, 10, exchanges=5)
+        assert [c["session_id"] for c in manifest.summary_candidates(500.0)] == ["old"]
+
+        manifest.mark_summarized("old", 100.0, exchanges=5, summary_chunks=1,
+                                 raw_bytes=1000, archive_path="/a/old.jsonl.gz")
+        assert manifest.summary_candidates(500.0) == []
+        assert manifest.counters()["exchanges_archived"] == 5
+
+        assert manifest.unmark_summarized("old")
+        assert manifest.counters()["sessions_summarized"] == 0
+
+    def test_live_reference_blocks_compression(self, manifest):
+        manifest.record("/p/a.jsonl", "a", 100.0, 10, exchanges=2)
+        manifest.record("/p/b.jsonl", "b", 900.0, 10, exchanges=3)
+        manifest.set_session_refs("a", [("h1", 0), ("h2", 1)])
+        manifest.set_session_refs("b", [("h1", 0), ("h2", 1), ("h3", 2)])
+        assert manifest.referenced_by_live({"h1", "h2"}, "a", 500.0) == {"h1", "h2"}
+        assert manifest.referenced_by_live({"h1", "h2"}, "a", 1000.0) == set()
+
+
+class TestRollups:
+    def test_rollup_per_day_and_project(self, manifest):
+        manifest.record_timeline([
+            ("h1", "2026-03-02", "-proj-a", "s1", 100.0, "first question"),
+            ("h2", "2026-03-02", "-proj-a", "s1", 200.0, "follow-up"),
+            ("h3", "2026-03-02", "-proj-a", "s2", 300.0, "second session"),
+            ("h4", "2026-03-03", "-proj-b", "s3", 400.0, "next day"),
+            ("h5", "", "-proj-b", "s3", 0.0, "undated"),
+        ])
+        rows = manifest.rollups(since="2026-03-02", until="2026-03-02")
+        assert len(rows) == 1
+        r = rows[0]
+        assert (r["exchanges"], r["sessions"]) == (3, 2)
+        assert (r["first_preview"], r["last_preview"]) == ("first question", "second session")
+        assert r["top_previews"] == ["first question", "second session"]
+        assert len(manifest.rollups()) == 2
+
+    def test_shared_exchange_keeps_first_owner(self, manifest):
+        manifest.record_timeline([("h1", "2026-03-02", "-proj-a", "s1", 100.0, "q")])
+        manifest.record_timeline([("h1", "2026-03-02", "-proj-b", "s2", 100.0, "q")])
+        rows = manifest.rollups()
+        assert [(r["project_dir"], r["exchanges"]) for r in rows] == [("-proj-a", 1)]
+
+    def test_owner_update_moves_rollup(self, manifest):
+        # Micro-ingest has no project; the later file ingest fills it in
+        manifest.record_timeline([("h1", "2026-03-02", "", "s1", 100.0, "q")])
+        manifest.record_timeline([("h1", "2026-03-02", "-proj-a", "s1", 100.0, "q")])
+        assert [r["project_dir"] for r in manifest.rollups()] == ["-proj-a"]
+
+    def test_drop_timeline_refreshes(self, manifest):
+        manifest.record_timeline([
+            ("h1", "2026-03-02", "-proj-a", "s1", 100.0, "q1"),
+            ("h2", "2026-03-02", "-proj-a", "s1", 200.0, "q2"),
+        ])
+        manifest.drop_timeline(["h2"])
+        assert manifest.rollups()[0]["exchanges"] == 1
+        manifest.drop_timeline(["h1"])
+        assert manifest.rollups() == []
+
+    def test_timeline_sessions_distinct_across_days(self, manifest):
+        manifest.record_timeline([
+            ("h1", "2026-03-02", "-proj-a", "s1", 100.0, "q1"),
+            ("h2", "2026-03-03", "-proj-a", "s1", 200.0, "q2"),
+        ])
+        counts = manifest.timeline_sessions("2026-03-01", "2026-03-07")
+        assert counts == {"-proj-a": 1, None: 1}
+
+    def test_window_tool_shows_times_in_utc(self, monkeypatch):
+        import time as _time
+        from elara_mcp.tools import memory as tools
+        day = {"day": "2026-03-02", "exchanges": 2, "sessions": 1,
+               "first_epoch": 1772409600.0, "last_epoch": 1772495940.0,  # 00:00 / 23:59 UTC
+               "top_previews": []}
+        monkeypatch.setattr(tools, "conversation_window", lambda **kw: {
+            "since": "2026-03-02", "until": "2026-03-02", "exchanges": 2, "sessions": 1,
+            "active_days": 1, "days": [day], "projects": []})
+        monkeypatch.setenv("TZ", "America/New_York")
+        _time.tzset()
+        try:
+            out = tools.elara_conversations(action="window")
+        finally:
+            monkeypatch.undo()
+            _time.tzset()
+        assert "[2026-03-02] 2 exchanges, 1 sessions (00:00–23:59 UTC)" in out
@@ -0,0 +1,141 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Tests for conversation time-shard keys, date pruning and cross-shard paging."""
+
+import calendar
+
+import pytest
+
+from memory.conversations.shards import (
+    shard_key, shard_range, epoch_bounds, ShardedCollection, UNDATED_KEY,
+)
+
+
+def _epoch(y, m, d):
+    return float(calendar.timegm((y, m, d, 12, 0, 0)))
+
+
+class TestShardKey:
+    def test_monthly(self):
+        assert shard_key(_epoch(2026, 2, 14), "monthly") == "2026-02"
+
+    def test_quarterly(self):
+        assert shard_key(_epoch(2026, 2, 14), "quarterly") == "2026-Q1"
+        assert shard_key(_epoch(2026, 12, 31), "quarterly") == "2026-Q4"
+
+    def test_undated(self):
+        assert shard_key(0.0, "monthly") == UNDATED_KEY
+
+
+class TestShardRange:
+    def test_month_contains_its_days(self):
+        start, end = shard_range("2026-02")
+        assert start <= _epoch(2026, 2, 1) < end
+        assert start <= _epoch(2026, 2, 28) < end
+        assert not (start <= _epoch(2026, 3, 1) < end)
+
+    def test_december_rolls_year(self):
+        start, end = shard_range("2025-Q4")
+        assert start <= _epoch(2025, 12, 31) < end
+        assert end == float(calendar.timegm((2026, 1, 1, 0, 0, 0)))
+
+
+class TestEpochBounds:
+    def test_unbounded(self):
+        lo, hi = epoch_bounds({"project_dir": "x"})
+        assert lo == 0.0 and hi == float("inf")
+
+    def test_and_clauses(self):
+        where = {"$and": [
+            {"project_dir": "x"},
+            {"epoch": {"$gte": 100.0}},
+            {"epoch": {"$lt": 200.0}},
+        ]}
+        assert epoch_bounds(where) == (100.0, 200.0)
+
+
+class _FakeShard:
+    """Just enough of a Chroma collection: equality where, limit/offset."""
+
+    def __init__(self, rows):
+        self.rows = rows  # [(id, metadata)]
+
+    def count(self):
+        return len(self.rows)
+
+    def get(self, ids=None, where=None, include=None, limit=None, offset=None):
+        rows = [(i, m) for i, m in self.rows
+                if (ids is None or i in ids)
+                and all(m.get(k) == v for k, v in (where or {}).items())]
+        rows = rows[offset or 0:]
+        if limit is not None:
+            rows = rows[:limit]
+        return {"ids": [i for i, _ in rows], "metadatas": [m for _, m in rows], "documents": None}
+
+    def query(self, query_embeddings, n_results, where=None, include=None):
+        # Distance is stored in the row's metadata as "d"
+        rows = sorted(self.rows, key=lambda r: r[1].get("d", 1.0))[:n_results]
+        return {"ids": [[i for i, _ in rows]], "distances": [[m.get("d", 1.0) for _, m in rows]],
+                "metadatas": [[m for _, m in rows]], "documents": [[i for i, _ in rows]]}
+
+
+class _FakeManifest:
+    def __init__(self, shards=()):
+        self.shards = list(shards)
+
+    def list_shards(self):
+        return self.shards
+
+
+@pytest.fixture
+def sharded(tmp_path):
+    root = tmp_path / "shards"
+    col = ShardedCollection(root, "monthly", _FakeManifest(), embedding_function=lambda texts: [])
+    shards = {
+        "2026-01": [("a1", {"p": "x"}), ("a2", {"p": "y"}), ("a3", {"p": "x"})],
+        "2026-02": [("b1", {"p": "y"}), ("b2", {"p": "x"}), ("b3", {"p": "x"})],
+    }
+    for key, rows in shards.items():
+        (root / key).mkdir()
+        col._open[key] = _FakeShard(rows)
+    yield col
+    col.close()
+
+
+class TestShardedPaging:
+    def test_filtered_offset_pages_the_merged_result(self, sharded):
+        where = {"p": "x"}
+        assert sharded.get(where=where, offset=3, limit=1)["ids"] == ["b3"]
+        pages = [sharded.get(where=where, offset=o, limit=2)["ids"] for o in (0, 2, 4)]
+        assert pages == [["a1", "a3"], ["b2", "b3"], []]
+
+    def test_unfiltered_offset(self, sharded):
+        assert sharded.get(offset=2, limit=2)["ids"] == ["a3", "b1"]
+
+    def test_write_without_metadatas_is_rejected(self, sharded):
+        with pytest.raises(ValueError, match="metadatas"):
+            sharded.add(ids=["c1"], documents=["text"])
+
+
+
+class TestColdShards:
+    @pytest.fixture
+    def tiered(self, tmp_path):
+        root = tmp_path / "shards"
+        cold_dir = tmp_path / "cold" / "2024-01"
+        manifest = _FakeManifest([{"key": "2024-01", "path": str(cold_dir), "tier": "cold", "rows": 1}])
+        col = ShardedCollection(root, "monthly", manifest, embedding_function=lambda texts: [[0.0]])
+        (root / "2026-02").mkdir()
+        col._open["2026-02"] = _FakeShard([("new", {"d": 0.4})])
+        col._open["2024-01"] = _FakeShard([("old", {"d": 0.1})])
+        yield col
+        col.close()
+
+    def test_unbounded_query_reaches_cold_when_hot_is_short(self, tiered):
+        res = tiered.query(query_texts=["deploy"], n_results=5)
+        assert res["ids"] == [["old", "new"]]
+
+    def test_cold_skipped_when_hot_fills_the_results(self, tiered):
+        assert tiered.query(query_texts=["deploy"], n_results=1)["ids"] == [["new"]]
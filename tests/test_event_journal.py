@@ -0,0 +1,123 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Event journal — events relayed between processes through shared SQLite."""
+
+import time
+
+import pytest
+
+from daemon import cache as cache_mod
+from daemon.cache import CacheKeys, cache_ttl
+from daemon.event_journal import EventJournal, setup_event_journal, teardown_event_journal
+from daemon.events import EventBus, Events
+
+
+@pytest.fixture
+def pair(tmp_path):
+    """Two "processes": separate buses attached to one journal file."""
+    db = tmp_path / "events.db"
+    bus_a, bus_b = EventBus(), EventBus()
+    types = [Events.GOAL_UPDATED, Events.MEMORY_SAVED]
+    a = EventJournal(db, event_types=types).attach(bus_a, tail=False)
+    b = EventJournal(db, event_types=types).attach(bus_b, tail=False)
+    yield bus_a, a, bus_b, b
+    a.detach()
+    b.detach()
+    bus_a.reset()
+    bus_b.reset()
+
+
+def test_event_reaches_remote_subscribers_only(pair):
+    bus_a, a, bus_b, b = pair
+    remote, local = [], []
+    bus_b.on(Events.GOAL_UPDATED, lambda e: remote.append(e), remote=True)
+    bus_b.on(Events.GOAL_UPDATED, lambda e: local.append(e))
+
+    bus_a.emit(Events.GOAL_UPDATED, {"goal_id": 3}, source="goals")
+    assert bus_a.drain(5)
+    assert b.poll() == 1
+
+    assert len(remote) == 1 and local == []
+    assert remote[0].data == {"goal_id": 3}
+    assert remote[0].source == "goals"
+    assert remote[0].origin == a.origin
+
+
+def test_no_echo_and_no_republish(pair):
+    bus_a, a, bus_b, b = pair
+    bus_a.emit(Events.MEMORY_SAVED, {"id": "m1"})
+    bus_a.drain(5)
+    b.poll()
+    bus_b.drain(5)  # B's publisher must not journal the relayed event
+
+    assert a.poll() == 0
+    assert a.stats()["published"] == 1
+    assert b.stats()["published"] == 0
+    assert b.stats()["received"] == 1
+
+
+def test_attach_starts_at_current_tail_and_prune(pair, tmp_path):
+    bus_a, a, _, _ = pair
+    bus_a.emit(Events.GOAL_UPDATED, {})
+    bus_a.drain(5)
+
+    late_bus = EventBus()
+    late = EventJournal(tmp_path / "events.db", event_types=[Events.GOAL_UPDATED])
+    late.attach(late_bus, tail=False)
+    try:
+        assert late.poll() == 0  # history before attach isn't replayed
+        assert late.prune(older_than=-1) == 1
+    finally:
+        late.detach()
+
+
+def test_tail_thread_invalidates_within_poll_interval(tmp_path):
+    db = tmp_path / "events.db"
+    bus_a, bus_b = EventBus(), EventBus()
+    a = EventJournal(db, event_types=[Events.GOAL_UPDATED]).attach(bus_a, tail=False)
+    b = EventJournal(db, event_types=[Events.GOAL_UPDATED], poll_interval=0.02).attach(bus_b)
+    seen = []
+    bus_b.on(Events.GOAL_UPDATED, lambda e: seen.append(e), remote=True)
+    try:
+        bus_a.emit(Events.GOAL_UPDATED, {"goal_id": 1})
+        deadline = time.monotonic() + 5
+        while not seen and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(seen) == 1
+    finally:
+        a.detach()
+        b.detach()
+
+
+def test_setup_raises_covered_ttls(monkeypatch):
+    from daemon import events
+    bus = EventBus()
+    monkeypatch.setattr(events, "bus", bus)
+    cache_mod.setup_cache_invalidation(cache_mod.CorticalCache())
+    assert cache_ttl(CacheKeys.GOAL_LIST) == cache_mod.CACHE_TTLS[CacheKeys.GOAL_LIST]
+    monkeypatch.setenv("ELARA_EVENT_JOURNAL", "0")
+    assert setup_event_journal(bus) is None
+
+    monkeypatch.delenv("ELARA_EVENT_JOURNAL")
+    try:
+        assert setup_event_journal(bus) is not None
+        assert cache_ttl(CacheKeys.GOAL_LIST) > cache_mod.CACHE_TTLS[CacheKeys.GOAL_LIST]
+        # time-decayed values keep their short TTLs
+        assert cache_ttl(CacheKeys.MOOD_STATE) == cache_mod.CACHE_TTLS[CacheKeys.MOOD_STATE]
+    finally:
+        teardown_event_journal()
+        bus.reset()
+    assert cache_ttl(CacheKeys.GOAL_LIST) == cache_mod.CACHE_TTLS[CacheKeys.GOAL_LIST]
+
+
+def test_setup_without_cache_subscribers_keeps_short_ttls():
+    bus = EventBus()  # Overwatch / overnight: publish only, no invalidation wired
+    try:
+        assert setup_event_journal(bus) is not None
+        assert cache_ttl(CacheKeys.GOAL_LIST) == cache_mod.CACHE_TTLS[CacheKeys.GOAL_LIST]
+    finally:
+        teardown_event_journal()
+        bus.reset()
+
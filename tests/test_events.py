@@ -4,10 +4,16 @@
 
 """Tier 3: Event bus tests — dispatch, priority, mute, threading."""
 
+import os
+import subprocess
+import sys
 import threading
+import time
+from pathlib import Path
+
 import pytest
 
-from daemon.events import EventBus, Events, Event
+from daemon.events import Delivery, EventBus, Events, Event
 
 
 @pytest.fixture
@@ -159,3 +165,227 @@ class TestThreadSafety:
             t.join()
 
         assert count["n"] == 100
+
+
+    def test_emits_overlapping_on_threads_are_not_recursion(self, bus):
+        # Eight emits in flight at once would trip a process-wide depth of 3
+        barrier = threading.Barrier(8, timeout=2)
+        seen = []
+
+        def handler(e):
+            barrier.wait()
+            seen.append(e.data["i"])
+
+        bus.on("test", handler)
+        threads = [threading.Thread(target=bus.emit, args=("test", {"i": i})) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert sorted(seen) == list(range(8))
+
+    def test_recursion_still_capped_per_thread(self, bus):
+        depths = []
+
+        def again(e):
+            depths.append(e.data["d"])
+            bus.emit("test", {"d": e.data["d"] + 1})
+
+        bus.on("test", again)
+        bus.emit("test", {"d": 1})
+        assert depths == [1, 2, 3]
+        bus.emit("test", {"d": 1})  # depth unwound after the capped chain
+        assert depths == [1, 2, 3, 1, 2, 3]
+
+
+class TestQueuedDelivery:
+
+    def test_emit_does_not_wait_for_queued_handler(self, bus):
+        release = threading.Event()
+        received = []
+
+        def slow(e):
+            release.wait(2)
+            received.append(e.data["i"])
+
+        bus.on("test", slow, delivery=Delivery.QUEUED)
+        start = time.monotonic()
+        bus.emit("test", {"i": 1})
+        assert time.monotonic() - start < 0.5
+        assert received == []
+        release.set()
+        assert bus.drain(2)
+        assert received == [1]
+
+    def test_order_kept_across_event_types(self, bus):
+        seen = []
+        handler = lambda e: seen.append((e.type, e.data["i"]))
+        bus.on("a", handler, delivery=Delivery.QUEUED, source="ordered")
+        bus.on("b", handler, delivery=Delivery.QUEUED, source="ordered")
+        for i in range(50):
+            bus.emit("a" if i % 2 else "b", {"i": i})
+        assert bus.drain(2)
+        assert [i for _, i in seen] == list(range(50))
+        assert len(bus.stats()["queued"]) == 1  # one worker for the subscriber
+
+    def test_full_queue_drops_and_counts(self, bus):
+        release = threading.Event()
+        bus.on("test", lambda e: release.wait(2), delivery=Delivery.QUEUED,
+               queue_size=2, source="slow")
+        for i in range(6):
+            bus.emit("test", {"i": i})
+        stats = bus.stats()["queued"]["slow"]
+        assert stats["dropped"] >= 3
+        assert stats["high_water"] == 2
+        release.set()
+        assert bus.drain(2)
+        stats = bus.stats()["queued"]["slow"]
+        assert stats["delivered"] + stats["dropped"] == 6
+
+    def test_queued_errors_counted(self, bus):
+        ok = []
+
+        def flaky(e):
+            if e.data["i"] == 0:
+                raise RuntimeError("boom")
+            ok.append(e.data["i"])
+
+        bus.on("test", flaky, delivery=Delivery.QUEUED, source="flaky")
+        bus.emit("test", {"i": 0})
+        bus.emit("test", {"i": 1})
+        assert bus.drain(2)
+        assert ok == [1]
+        assert bus.stats()["queued"]["flaky"]["errors"] == 1
+
+    def test_off_stops_worker(self, bus):
+        handler = lambda e: None
+        bus.on("test", handler, delivery=Delivery.QUEUED)
+        bus.emit("test", {})
+        assert bus.off("test", handler)
+        assert bus.stats()["queued"] == {}
+
+    def test_server_shutdown_drains_without_journal(self, tmp_path):
+        # atexit runs _shutdown_cortical; with the journal off nothing else drains
+        out = tmp_path / "handled"
+        code = (
+            "import time, elara_mcp.server\n"
+            "from daemon.events import bus, Delivery\n"
+            "def slow(e):\n"
+            "    time.sleep(0.3)\n"
+            f"    open({str(out)!r}, 'w').write('signed')\n"
+            "bus.on('test_shutdown', slow, delivery=Delivery.QUEUED, source='slow')\n"
+            "bus.emit('test_shutdown', {'id': 1})\n"
+        )
+        env = dict(os.environ, ELARA_EVENT_JOURNAL="0", ELARA_DATA_DIR=str(tmp_path / "data"))
+        subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, timeout=60,
+                       cwd=str(Path(__file__).resolve().parent.parent), check=True)
+        assert out.read_text() == "signed"
+
+    def test_unknown_delivery_rejected(self, bus):
+        with pytest.raises(ValueError):
+            bus.on("test", lambda e: None, delivery="later")
+
+
+class TestCoalescing:
+
+    def test_burst_merged_into_leading_and_trailing(self, bus):
+        got = []
+        bus.on(Events.MEMORY_SAVED, lambda e: got.append((e.count, e.data["i"])),
+               coalesce=0.2, source="counts")
+        for i in range(10):
+            bus.emit(Events.MEMORY_SAVED, {"i": i})
+        assert got == [(1, 0)]  # first one immediately
+
+        deadline = time.monotonic() + 2
+        while len(got) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert got == [(1, 0), (9, 9)]  # rest merged, latest payload
+
+        coalesced = bus.stats()["coalesced"]
+        assert coalesced["saved_deliveries"] == 8
+        assert coalesced["subscriptions"]["memory_saved:counts"]["received"] == 10
+
+    def test_window_per_event_type(self, bus):
+        got = []
+        handler = lambda e: got.append(e.type)
+        bus.set_coalesce_window("test", 60)
+        bus.on("test", handler, coalesce=True)
+        bus.on("other", handler, coalesce=True)  # no window configured
+        for _ in range(3):
+            bus.emit("test", {})
+            bus.emit("other", {})
+        assert got.count("test") == 1
+        assert got.count("other") == 3
+        assert bus.subscribers_for("test")[0]["coalesce"] == 60
+        assert bus.subscribers_for("other")[0]["coalesce"] is None
+
+    def test_drain_flushes_pending(self, bus):
+        got = []
+        bus.on("test", lambda e: got.append(e.count), coalesce=60, delivery=Delivery.QUEUED)
+        for _ in range(4):
+            bus.emit("test", {})
+        assert bus.drain(2)
+        assert got == [1, 3]
+
+    def test_merge_picks_the_held_payload(self, bus):
+        got = []
+        keep_max = lambda held, new: new if new.data["v"] >= held.data["v"] else held
+        bus.on("test", lambda e: got.append((e.count, e.data["v"])), coalesce=60,
+               coalesce_merge=keep_max)
+        for v in (1, 2, 9, 3, 4):
+            bus.emit("test", {"v": v})
+        assert bus.drain(2)
+        assert got == [(1, 1), (4, 9)]
+
+    def test_off_cancels_pending(self, bus):
+        got = []
+        handler = lambda e: got.append(e)
+        bus.on("test", handler, coalesce=0.05)
+        bus.emit("test", {})
+        bus.emit("test", {})
+        assert bus.off("test", handler)
+        time.sleep(0.15)
+        assert len(got) == 1
+
+
+class TestHandlerTiming:
+
+    def test_history_is_bounded_ring_of_records(self):
+        b = EventBus(history_size=3)
+        for i in range(5):
+            b.emit("test", {"i": i})
+        assert [r.data["i"] for r in b._history] == [2, 3, 4]
+        assert not hasattr(b._history[0], "__dict__")  # __slots__ record
+        assert [h["data"]["i"] for h in b.history(limit=2)] == [3, 4]
+
+    def test_slowest_handlers_and_errors(self, bus):
+        def slow(e):
+            time.sleep(0.02)
+
+        def broken(e):
+            raise RuntimeError("boom")
+
+        bus.on("test", lambda e: None, source="fast")
+        bus.on("test", slow, source="slow")
+        bus.on("test", broken, source="broken")
+        bus.emit("test", {})
+        bus.emit("test", {})
+
+        stats = bus.stats(top=2)
+        slowest = stats["slowest_handlers"]
+        assert [h["handler"] for h in slowest][0] == "slow"
+        assert len(slowest) == 2
+        assert slowest[0]["calls"] == 2 and slowest[0]["mean_ms"] >= 20
+        assert stats["handler_errors"] == 2
+
+        by_name = {h["handler"]: h for h in bus.handler_stats()}
+        assert by_name["broken"]["errors"] == 2
+        assert by_name["slow"]["histogram"]["<=100ms"] == 2
+        assert by_name["slow"]["p95_le_ms"] == 100.0
+
+    def test_queued_handler_timed_separately(self, bus):
+        bus.on("test", lambda e: time.sleep(0.01), source="worker", delivery=Delivery.QUEUED)
+        bus.emit("test", {})
+        assert bus.drain(2)
+        (h,) = bus.handler_stats()
+        assert (h["handler"], h["delivery"], h["calls"]) == ("worker", "queued", 1)
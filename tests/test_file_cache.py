@@ -0,0 +1,77 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Loader cache — JSON state files re-read only when their generation changes."""
+
+import json
+import os
+
+import pytest
+
+from daemon import file_cache
+from daemon.schemas import Goal, atomic_write_json, load_validated_list_dump, save_validated_list
+
+
+@pytest.fixture(autouse=True)
+def _fresh():
+    file_cache.clear()
+    yield
+    file_cache.clear()
+
+
+def test_unchanged_file_parsed_once(tmp_path):
+    path = tmp_path / "state.json"
+    path.write_text(json.dumps({"a": [1, 2]}))
+    calls = []
+
+    def load(p):
+        calls.append(p)
+        return json.loads(p.read_text())
+
+    assert file_cache.load_cached(path, "json", load) == {"a": [1, 2]}
+    assert file_cache.load_cached(path, "json", load) == {"a": [1, 2]}
+    assert len(calls) == 1
+    assert file_cache.stats()["hits"] == 1
+
+
+def test_results_are_independent_copies(tmp_path):
+    path = tmp_path / "state.json"
+    path.write_text(json.dumps({"a": [1, 2]}))
+    first = file_cache.load_json(path)
+    first["a"].append(3)
+    assert file_cache.load_json(path) == {"a": [1, 2]}
+
+
+def test_external_write_detected(tmp_path):
+    path = tmp_path / "state.json"
+    path.write_text(json.dumps({"v": 1}))
+    assert file_cache.load_json(path) == {"v": 1}
+
+    # Another process replaces the file (new inode), same size and mtime
+    st = os.stat(path)
+    other = tmp_path / "other.json"
+    other.write_text(json.dumps({"v": 2}))
+    os.utime(other, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.replace(other, path)
+    assert file_cache.load_json(path) == {"v": 2}
+
+
+def test_local_save_forgets_entry(tmp_path):
+    path = tmp_path / "goals.json"
+    goal = {"id": 1, "title": "ship", "created": "x", "last_touched": "x"}
+    save_validated_list(path, [Goal.model_validate(goal)])
+    assert load_validated_list_dump(path, Goal)[0]["title"] == "ship"
+
+    save_validated_list(path, [Goal.model_validate(dict(goal, title="done"))], atomic=False)
+    assert load_validated_list_dump(path, Goal)[0]["title"] == "done"
+
+    atomic_write_json(path, [])
+    assert load_validated_list_dump(path, Goal) == []
+
+
+def test_missing_file_not_cached(tmp_path):
+    path = tmp_path / "missing.json"
+    with pytest.raises(FileNotFoundError):
+        file_cache.load_json(path)
+    assert file_cache.stats()["entries"] == 0
@@ -0,0 +1,102 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Overwatch injection channel — socket fetch/ack, exactly-once delivery, fallback."""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+import daemon.overwatch as overwatch_pkg
+from daemon.inject_channel import InjectionChannel, fetch_injection
+
+
+@pytest.fixture
+def channel(tmp_path):
+    ch = InjectionChannel(tmp_path / "ow.sock")
+    ch.start()
+    yield ch
+    ch.close()
+
+
+def test_fetch_acks_exactly_once(channel):
+    channel.put("sess-a", "remember the deploy script")
+    channel.put("sess-b", "other session")
+
+    assert fetch_injection("sess-a", channel.path) == "remember the deploy script"
+    assert fetch_injection("sess-a", channel.path) == ""
+    assert channel.pending("sess-b") == "other session"
+    assert channel.stats()["acked"] == 1
+
+
+def test_newer_injection_supersedes_unacked(channel):
+    channel.put("sess-a", "old")
+    fetched = channel.handle({"op": "fetch", "session_id": "sess-a"})
+    channel.put("sess-a", "new")
+
+    assert channel.handle({"op": "ack", "id": fetched["id"]}) == {"ok": False}
+    assert fetch_injection("sess-a", channel.path) == "new"
+    stats = channel.stats()
+    assert stats["superseded"] == 1 and stats["stale_acks"] == 1 and stats["pending"] == 0
+
+
+def test_no_daemon_means_fallback(tmp_path):
+    assert fetch_injection("sess-a", tmp_path / "missing.sock") is None
+
+
+def test_close_removes_socket(tmp_path):
+    ch = InjectionChannel(tmp_path / "ow.sock")
+    ch.start()
+    assert ch.path.exists()
+    ch.close()
+    assert not ch.path.exists()
+
+
+def test_overwatch_delivers_through_channel(tmp_path, monkeypatch):
+    monkeypatch.setattr(overwatch_pkg, "get_conversations", lambda: MagicMock())
+    ow = overwatch_pkg.Overwatch()
+    ow.shared.channel = InjectionChannel(tmp_path / "unused.sock")
+    ow.current_session_id = "sess-a"
+    ow.inject_path = tmp_path / "inject.md"
+    ow._track_injected_topics = lambda results, events: None
+
+    ow._write_inject([{"content": "User: x\n\nElara: y", "score": 0.9, "epoch": 0,
+                       "session_id": "old", "date": "2026-01-01"}])
+    assert "x" in ow.shared.channel.pending("sess-a")
+    assert not ow.inject_path.exists()
+    assert ow.injection_count == 1
+    ow.shared.close()
+
+
+
+HOOK = Path(__file__).resolve().parent.parent / "hooks" / "overwatch-inject.sh"
+
+
+def _run_hook(tmp_path, session_id):
+    env = dict(os.environ, ELARA_DATA_DIR=str(tmp_path), HOME=str(tmp_path))
+    return subprocess.run(["bash", str(HOOK)], input=json.dumps({"session_id": session_id}),
+                          capture_output=True, text=True, env=env, timeout=30).stdout.strip()
+
+
+def test_shell_hook_fetches_over_socket(tmp_path):
+    ch = InjectionChannel(tmp_path / "elara-overwatch.sock")
+    ch.start()
+    try:
+        ch.put("sess-a", "socket content")
+        assert _run_hook(tmp_path, "sess-a") == "socket content"
+        assert ch.pending("sess-a") is None
+    finally:
+        ch.close()
+
+
+def test_shell_hook_without_socket_reads_inject_file(tmp_path):
+    inject = tmp_path / ".claude" / "elara-overwatch-inject-sess-a.md"
+    inject.parent.mkdir()
+    inject.write_text("file content")
+    assert _run_hook(tmp_path, "sess-a") == "file content"
+    assert not inject.exists()
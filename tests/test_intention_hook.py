@@ -0,0 +1,103 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Intention hook fan-out — concurrent sections, deadlines, timing log."""
+
+import importlib.util
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+HOOK_PATH = Path(__file__).resolve().parent.parent / "hooks" / "intention-hook.py"
+
+
+@pytest.fixture
+def hook(tmp_path, monkeypatch):
+    spec = importlib.util.spec_from_file_location("intention_hook", HOOK_PATH)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    monkeypatch.setattr(mod, "TIMING_LOG_FILE", tmp_path / "timing.jsonl")
+    return mod
+
+
+def _timings(hook):
+    return [json.loads(line) for line in hook.TIMING_LOG_FILE.read_text().splitlines()]
+
+
+def test_sections_run_concurrently(hook):
+    start = time.monotonic()
+    found = hook.run_sections({
+        f"s{i}": (lambda i=i: time.sleep(0.2) or i) for i in range(5)
+    })
+    assert time.monotonic() - start < 0.6
+    assert found == {f"s{i}": i for i in range(5)}
+
+
+def test_missed_deadline_is_dropped_and_logged(hook, monkeypatch):
+    monkeypatch.setitem(hook.SECTION_DEADLINES, "slow", 0.1)
+    start = time.monotonic()
+    found = hook.run_sections({
+        "fast": lambda: "ok",
+        "slow": lambda: time.sleep(1.0) or "late",
+        "broken": lambda: 1 / 0,
+    })
+    assert time.monotonic() - start < 0.5
+    assert found == {"fast": "ok", "broken": None}
+
+    entry = _timings(hook)[-1]
+    assert entry["dropped"] == ["slow"]
+    assert set(entry["sections"]) == {"fast", "broken"}
+
+
+def test_budget_caps_every_deadline(hook):
+    found = hook.run_sections({"x": lambda: time.sleep(0.5) or 1}, budget=0.05)
+    assert found == {}
+
+
+def test_dropped_section_is_a_straggler(hook):
+    release = threading.Event()
+    found = hook.run_sections({"stuck": release.wait}, budget=0.05)
+    assert found == {} and hook.stragglers()
+    release.set()
+    for t in threading.enumerate():
+        if t.name.startswith("enrich-"):
+            t.join(2.0)
+    assert not hook.stragglers()
+
+
+def test_shared_singletons_warm_before_fan_out(hook, monkeypatch):
+    order = []
+    monkeypatch.setattr(hook, "warm_shared", lambda: order.append("warm") or 0.25)
+    monkeypatch.setattr(hook, "run_sections",
+                        lambda lookups, warm=0.0: order.append(("fan-out", warm)) or {})
+    monkeypatch.setattr(hook, "get_compound_query", lambda prompt: prompt)
+    monkeypatch.setattr(hook, "get_overwatch_injection", lambda session_id="": "")
+    hook.build_enrichment("deploy")
+    assert order == ["warm", ("fan-out", 0.25)]
+
+
+def test_enrichment_keeps_section_order(hook, monkeypatch):
+    monkeypatch.setattr(hook, "warm_shared", lambda: 0.0)
+    monkeypatch.setattr(hook, "get_compound_query", lambda prompt: prompt)
+    for name in ("get_current_context", "get_current_intention", "get_next_action",
+                 "get_handoff_summary"):
+        monkeypatch.setattr(hook, name, lambda: "")
+    for name in ("get_active_goals", "get_handoff_items"):
+        monkeypatch.setattr(hook, name, lambda *a, **k: [])
+    for name in ("get_relevant_memories", "get_relevant_conversations", "get_relevant_principles",
+                 "get_relevant_reasoning", "get_corrections", "get_decision_checks",
+                 "get_workflows"):
+        monkeypatch.setattr(hook, name, lambda q: [])
+    monkeypatch.setattr(hook, "get_current_mood", lambda: time.sleep(0.1) or {
+        "valence": 0.5, "energy": 0.5, "openness": 0.5, "description": "calm"})
+    monkeypatch.setattr(hook, "get_relevant_milestones", lambda q: [{"event": "shipped v1"}])
+    monkeypatch.setattr(hook, "get_overwatch_injection", lambda session_id="": "heads up")
+
+    out = hook.build_enrichment("deploy", session_id="sess-a").splitlines()
+    assert out[0].startswith("[MOOD] calm")
+    assert out[1] == "[MILESTONES] [milestone] shipped v1"
+    assert out[2:] == ["[OVERWATCH]", "heads up"]
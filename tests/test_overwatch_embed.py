@@ -0,0 +1,84 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Embed-once — one vector per exchange shared by search, micro-ingest and synthesis."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+import daemon.overwatch as overwatch_pkg
+import daemon.overwatch.ingest as ingest_mod
+from daemon import llm
+
+VEC = [0.1, 0.2, 0.3]
+
+
+@pytest.fixture
+def conv():
+    c = MagicMock()
+    c.embed.side_effect = lambda texts: [list(VEC) for _ in texts]
+    c.recall.return_value = []
+    c.ingest_exchange.return_value = True
+    c._build_document.side_effect = lambda u, a: f"User: {u}\n\nElara: {a}"
+    return c
+
+
+@pytest.fixture
+def ow(conv, monkeypatch):
+    monkeypatch.setattr(overwatch_pkg, "get_conversations", lambda: conv)
+    monkeypatch.setattr(llm, "is_available", lambda: False)
+    monkeypatch.setattr(llm, "triage_memory", lambda *a, **k: None)
+    o = overwatch_pkg.Overwatch()
+    monkeypatch.setattr(o, "_check_snapshot", lambda: None)
+    yield o
+    o._judge_executor.shutdown(wait=False)
+
+
+def _exchange(i=0):
+    return {"user_text": f"question {i} about indexing",
+            "assistant_text": f"answer {i} about the index", "timestamp": ""}
+
+
+class TestExchangeEmbedding:
+
+    def test_one_embedding_reaches_every_consumer(self, ow, conv, monkeypatch):
+        synthesis_calls = []
+        monkeypatch.setattr(ingest_mod, "SYNTHESIS_AVAILABLE", True)
+        monkeypatch.setattr(ingest_mod, "check_for_recurring_ideas",
+                            lambda exchanges: synthesis_calls.append(exchanges) or [])
+
+        ow._process_exchange(_exchange())
+        ow._micro_ingest()
+
+        assert conv.embed.call_count == 1
+        assert conv.recall.call_args.kwargs["query_embedding"] == VEC
+        assert conv.ingest_exchange.call_args.kwargs["embedding"] == VEC
+        assert synthesis_calls[0][0]["embedding"] == VEC
+        assert ow.embed_stats == {"computed": 1, "reused": 2}
+
+    def test_embedding_failure_falls_back_to_text(self, ow, conv):
+        conv.embed.side_effect = RuntimeError("model missing")
+        ex = _exchange()
+        assert ow._exchange_embedding(ex) is None
+        assert ow._exchange_embedding(ex) is None
+        assert conv.embed.call_count == 1  # failure is remembered per exchange
+        ow._search_history("q", threshold=0.65, embedding=None)
+        assert conv.recall.call_args.kwargs["query_embedding"] is None
+        assert ow.embed_stats == {"computed": 0, "reused": 0}
+
+
+class TestEventQueryEmbeddings:
+
+    def test_batched_and_cached(self, ow, conv):
+        events = [{"type": "winding_down", "text": "bye", "query": None}]
+        ow._event_candidates(events)
+        ow._event_candidates(events)
+
+        # Three default intention queries, embedded in one call, then cached
+        assert conv.embed.call_count == 1
+        assert len(conv.embed.call_args.args[0]) == 3
+        assert conv.recall.call_count == 6
+        assert all(c.kwargs["query_embedding"] == VEC for c in conv.recall.call_args_list)
+        assert ow.embed_stats == {"computed": 3, "reused": 3}
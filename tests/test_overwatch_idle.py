@@ -0,0 +1,96 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Overwatch idle work — session steps, and a scheduler that yields to new lines."""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+import daemon.overwatch as overwatch_pkg
+from daemon.overwatch.idle import IdleScheduler
+
+
+@pytest.fixture
+def ow(monkeypatch):
+    conv = MagicMock()
+    conv.embed.side_effect = lambda texts: [[0.5, 0.5] for _ in texts]
+    conv._build_document.side_effect = lambda u, a: f"User: {u}\n\nElara: {a}"
+    monkeypatch.setattr(overwatch_pkg, "get_conversations", lambda: conv)
+    o = overwatch_pkg.Overwatch()
+    o.session_state = {}
+    o.current_jsonl = Path("/tmp/projects/-home-a/sess-a.jsonl")
+    yield o
+    o.shared.close()
+
+
+def test_idle_work_steps_run_once(ow):
+    ex = {"user_text": "how do we deploy", "assistant_text": "with the script"}
+    ow.pending_exchanges = [ex]
+    ow.recent_exchanges = [ex]
+
+    assert list(ow.idle_work()) == ["embed", "queries", "warm"]
+    assert ex["embedding"] == [0.5, 0.5]
+    assert len(ow._query_embedding_cache) == 3
+    warm = ow.conv.recall.call_args
+    assert warm.kwargs["project"] == "-home-a"
+    assert warm.kwargs["query_embedding"] == [0.5, 0.5]
+
+    assert list(ow.idle_work()) == []  # nothing left until the next exchange
+    ow.exchange_counter += 1
+    assert list(ow.idle_work()) == ["warm"]
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_scheduler_yields_to_activity():
+    ran = []
+    sched = None
+
+    def task():
+        for i in range(5):
+            ran.append(i)
+            if i == 1:
+                sched.note_activity()  # new lines arrive mid-pass
+            yield "step"
+
+    sched = IdleScheduler(lambda: [task()], busy=lambda: False, grace=0.05)
+    sched.start()
+    try:
+        assert _wait_for(lambda: sched.stats()["interrupted"] == 1)
+        assert ran[:3] == [0, 1, 0] or ran == [0, 1]
+        # After the grace period the pass runs again (and is interrupted again at step 1)
+        assert _wait_for(lambda: sched.stats()["passes"] >= 2)
+    finally:
+        sched.stop()
+
+
+def test_scheduler_waits_for_busy_pipeline():
+    busy = threading.Event()
+    busy.set()
+    ran = []
+
+    def task():
+        ran.append(1)
+        yield "step"
+
+    sched = IdleScheduler(lambda: [task()], busy=busy.is_set, grace=0.0)
+    sched.start()
+    try:
+        time.sleep(0.2)
+        assert ran == []
+        busy.clear()
+        assert _wait_for(lambda: ran == [1])
+        time.sleep(0.1)
+        assert ran == [1]  # finished pass is not repeated without new activity
+    finally:
+        sched.stop()
@@ -0,0 +1,103 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Batched LLM relevance judging — prompt parsing, verdict cache, latency budget."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+import daemon.overwatch as overwatch_pkg
+import daemon.overwatch.search as search_mod
+from daemon import llm
+
+
+def _candidates(n):
+    return [
+        {"score": 0.8 - i * 0.01, "session_id": f"s{i}", "exchange_index": i,
+         "content": f"old exchange number {i}"}
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def ow(monkeypatch):
+    monkeypatch.setattr(overwatch_pkg, "get_conversations", lambda: MagicMock())
+    monkeypatch.setattr(llm, "is_available", lambda: True)
+    o = overwatch_pkg.Overwatch()
+    yield o
+    o._judge_executor.shutdown(wait=False)
+
+
+class TestBatchParsing:
+
+    def test_parses_array_with_prose(self, monkeypatch):
+        reply = 'Sure:\n[{"id": 2, "relevant": false, "reason": "no", "importance": 0.1},' \
+                ' {"id": 1, "relevant": true, "reason": "yes", "importance": 0.9}]'
+        monkeypatch.setattr(llm, "query", lambda *a, **k: reply)
+        verdicts = llm.judge_relevance_batch("now", ["a", "b", "c"])
+        assert verdicts[0]["relevant"] is True
+        assert verdicts[1]["relevant"] is False
+        assert verdicts[2] is None
+
+    def test_unparseable_is_none(self, monkeypatch):
+        monkeypatch.setattr(llm, "query", lambda *a, **k: "I think they are all fine")
+        assert llm.judge_relevance_batch("now", ["a"]) is None
+
+
+class TestJudgeCandidates:
+
+    def test_one_call_then_cache(self, ow, monkeypatch):
+        calls = []
+
+        def fake_batch(text, candidates, timeout=45):
+            calls.append(list(candidates))
+            return [{"relevant": i != 1, "importance": 0.5, "reason": ""}
+                    for i in range(len(candidates))]
+
+        monkeypatch.setattr(llm, "judge_relevance_batch", fake_batch)
+        first = ow._judge_candidates("current topic", _candidates(5))
+        assert len(calls) == 1 and len(calls[0]) == 5
+        assert "s1" not in [r["session_id"] for r in first]
+
+        again = ow._judge_candidates("current topic", _candidates(5))
+        assert len(calls) == 1
+        assert ow.judge_stats["cache_hits"] == 5
+        assert [r["session_id"] for r in again] == [r["session_id"] for r in first]
+
+    def test_budget_exceeded_falls_back(self, ow, monkeypatch):
+        monkeypatch.setattr(search_mod, "JUDGE_BUDGET_SECONDS", 0.05)
+
+        def slow_batch(text, candidates, timeout=45):
+            time.sleep(0.3)
+            return [{"relevant": False} for _ in candidates]
+
+        monkeypatch.setattr(llm, "judge_relevance_batch", slow_batch)
+        result = ow._judge_candidates("current topic", _candidates(4))
+        assert [r["session_id"] for r in result] == ["s0", "s1", "s2"]
+        assert ow.judge_stats["timeouts"] == 1
+
+        # The late verdicts land in the cache and apply next time
+        time.sleep(0.4)
+        assert ow._judge_candidates("current topic", _candidates(4)) == []
+
+    def test_busy_judge_falls_back_without_waiting(self, ow, monkeypatch):
+        monkeypatch.setattr(search_mod, "JUDGE_BUDGET_SECONDS", 0.05)
+        calls = []
+
+        def slow_batch(text, candidates, timeout=45):
+            calls.append(text)
+            time.sleep(0.5)
+            return [{"relevant": False} for _ in candidates]
+
+        monkeypatch.setattr(llm, "judge_relevance_batch", slow_batch)
+        ow._judge_candidates("first topic", _candidates(4))
+
+        start = time.monotonic()
+        result = ow._judge_candidates("second topic", _candidates(4))
+        assert time.monotonic() - start < 0.05
+        assert [r["session_id"] for r in result] == ["s0", "s1", "s2"]
+        assert calls == ["first topic"] and ow.judge_stats["busy"] == 1
+
@@ -0,0 +1,98 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Overwatch latency — stage marks, rolling percentiles, status file and --stats."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+import daemon.overwatch as overwatch_pkg
+import daemon.overwatch.sessions as sessions_mod
+from daemon import llm
+from daemon.overwatch.latency import LatencyTracker, LatencyWindow
+from daemon.overwatch.pipeline import OverwatchPipeline
+from daemon.overwatch.sessions import SessionHub
+
+
+def test_window_percentiles():
+    w = LatencyWindow(size=100)
+    for i in range(1, 201):
+        w.add(i / 1000)  # only the last 100 (101..200 ms) are kept
+    s = w.summary()
+    assert s["count"] == 200
+    assert (s["p50_ms"], s["p95_ms"], s["p99_ms"], s["max_ms"]) == (150.0, 195.0, 199.0, 200.0)
+
+
+def test_marks_record_gaps_and_total():
+    t = LatencyTracker()
+    marks = {"written": 100.0, "parsed": 100.2}
+    t.record_marks(marks, "parsed")
+    marks["judged"] = 101.0  # no search mark: gap runs from parse
+    t.record_marks(marks, "judged")
+    marks["injected"] = 101.5
+    t.record_marks(marks, "injected")
+
+    s = t.summary()
+    assert s["parsed"]["p50_ms"] == 200.0
+    assert s["searched"]["count"] == 0
+    assert s["judged"]["p50_ms"] == 800.0
+    assert s["injected"]["p50_ms"] == 500.0
+    assert s["total"]["p50_ms"] == 1500.0
+
+
+@pytest.fixture
+def ow(monkeypatch):
+    conv = MagicMock()
+    conv.recall.return_value = [{
+        "score": 0.9, "session_id": "other", "exchange_index": 1,
+        "content": "User: old talk\n\nElara: old answer", "epoch": 0,
+    }]
+    monkeypatch.setattr(overwatch_pkg, "get_conversations", lambda: conv)
+    monkeypatch.setattr(llm, "is_available", lambda: False)
+    o = overwatch_pkg.Overwatch()
+    o._write_inject = lambda results, events=None: None
+    o._ingest_batch = lambda batch: None
+    o._check_snapshot = lambda: None
+    yield o
+    o.shared.close()
+
+
+def _entries(user, assistant):
+    return [
+        {"type": "user", "message": {"content": user}},
+        {"type": "assistant", "message": {"content": [{"type": "text", "text": assistant}]}},
+    ]
+
+
+def test_pipeline_records_every_stage(ow):
+    p = OverwatchPipeline(ow)
+    p.start()
+    p.start_session(Path("/tmp/proj/sess-1.jsonl"))
+    p.feed(_entries("how do we deploy", "we use the script"), written=1.0)
+    p.feed(_entries("thanks", "sure"), written=2.0)
+    p.close(timeout=5)
+
+    latency = p.stats()["latency"]
+    for stage in ("parsed", "searched", "judged", "injected", "total"):
+        assert latency[stage]["count"] == 1, stage
+    assert latency["total"]["p50_ms"] > 1000  # measured from the (old) write time
+
+
+def test_status_file_and_stats_flag(ow, tmp_path, monkeypatch, capsys):
+    status_path = tmp_path / "status.json"
+    monkeypatch.setattr(sessions_mod, "STATUS_PATH", status_path)
+    monkeypatch.setattr(overwatch_pkg, "STATUS_PATH", status_path)
+
+    assert overwatch_pkg.print_stats() == 1
+
+    ow.latency.record("searched", 0.25)
+    hub = SessionHub(ow.shared, overwatch_pkg.Overwatch)
+    hub.write_status()
+
+    assert overwatch_pkg.print_stats() == 0
+    out = capsys.readouterr().out
+    assert "p95 ms" in out
+    assert "searched" in out and "250.0" in out
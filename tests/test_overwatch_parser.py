@@ -113,6 +113,17 @@ class TestReadNewLines:
         assert len(entries) == 1
         assert entries[0]["d"] == 4
 
+    def test_partial_line_left_for_next_read(self, parser, tmp_path):
+        f = tmp_path / "test.jsonl"
+        f.write_text('{"a": 1}\n{"b": ')
+        entries = parser._read_new_lines(f)
+        assert [e["a"] for e in entries] == [1]
+
+        with open(f, 'a') as fh:
+            fh.write('2}\n')
+        entries = parser._read_new_lines(f)
+        assert entries == [{"b": 2}]
+
     def test_missing_file(self, parser, tmp_path):
         f = tmp_path / "nonexistent.jsonl"
         entries = parser._read_new_lines(f)
@@ -0,0 +1,114 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Overwatch pipeline — stage flow, stale-work cancellation, ingest handoff."""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+import daemon.overwatch as overwatch_pkg
+from daemon import llm
+from daemon.overwatch.pipeline import OverwatchPipeline, Stage
+
+
+def _entries(user, assistant):
+    return [
+        {"type": "user", "message": {"content": user}, "timestamp": "2026-03-01T10:00:00Z"},
+        {"type": "assistant", "message": {"content": [{"type": "text", "text": assistant}]}},
+    ]
+
+
+@pytest.fixture
+def ow(monkeypatch):
+    conv = MagicMock()
+    conv.recall.return_value = [{
+        "score": 0.9, "session_id": "other", "exchange_index": 1,
+        "content": "User: old talk\n\nElara: old answer", "epoch": 0,
+    }]
+    monkeypatch.setattr(overwatch_pkg, "get_conversations", lambda: conv)
+    monkeypatch.setattr(llm, "is_available", lambda: False)
+
+    o = overwatch_pkg.Overwatch()
+    o.injected = []
+    o.ingested = []
+    o._write_inject = lambda results, events=None: o.injected.append((results, events))
+    o._ingest_batch = lambda batch: o.ingested.append(batch)
+    o._check_snapshot = lambda: None
+    return o
+
+
+def _run(ow, feed):
+    p = OverwatchPipeline(ow)
+    p.start()
+    p.start_session(Path("/tmp/proj/sess-1.jsonl"))
+    feed(p)
+    p.close(timeout=5)
+    return p
+
+
+def test_exchange_flows_to_inject(ow):
+    def feed(p):
+        # Second user message flushes the first exchange
+        p.feed(_entries("how do we deploy", "we use the script"))
+        p.feed(_entries("thanks", "sure"))
+
+    p = _run(ow, feed)
+    assert len(ow.injected) == 1
+    assert ow.injected[0][0][0]["session_id"] == "other"
+    stats = p.stats()
+    assert stats["exchanges"] == 1
+    assert stats["stages"]["inject"]["processed"] == 1
+    assert set(stats["stages"]) == {"parse", "search", "judge", "inject", "ingest"}
+
+
+def test_newer_exchange_cancels_stale_judging(ow):
+    release = threading.Event()
+    seen = []
+
+    def slow_judge(text, candidates, cancelled=None):
+        seen.append(text)
+        if len(seen) == 1:
+            release.wait(2)
+        return [] if cancelled and cancelled() else candidates
+
+    ow._judge_candidates = slow_judge
+
+    def feed(p):
+        p.feed(_entries("first question", "first answer"))
+        p.feed(_entries("second question", "second answer"))
+        while not seen:
+            time.sleep(0.01)
+        p.feed(_entries("third question", "third answer"))
+        time.sleep(0.1)
+        release.set()
+
+    p = _run(ow, feed)
+    judge = p.stats()["stages"]["judge"]
+    assert judge["cancelled"] >= 1
+    assert len(ow.injected) == 1
+    assert p.stats()["exchanges"] == 2
+
+
+def test_session_switch_hands_pending_to_ingest(ow):
+    def feed(p):
+        p.feed(_entries("one", "alpha"))
+        p.feed(_entries("two", "beta"))
+        p.start_session(Path("/tmp/proj/sess-2.jsonl"))
+
+    _run(ow, feed)
+    assert len(ow.ingested) == 1
+    assert [ex["session_id"] for ex in ow.ingested[0]["exchanges"]] == ["sess-1"]
+    assert ow.exchange_counter == 0
+
+
+def test_keep_latest_stage_drops_oldest():
+    stage = Stage("t", lambda item: True, maxsize=2, keep_latest=True)
+    for i in range(5):
+        stage.submit(i)
+    assert stage.dropped == 3
+    assert [stage.queue.get_nowait() for _ in range(2)] == [3, 4]
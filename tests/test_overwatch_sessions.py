@@ -0,0 +1,126 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Multi-session Overwatch — per-session state on shared stores, attach/detach by recency."""
+
+import json
+import os
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+import daemon.overwatch as overwatch_pkg
+from daemon import llm
+from daemon.overwatch.sessions import SessionHub
+from daemon.overwatch.watcher import InotifyWatcher, PollingWatcher
+
+
+def _append(path, user, assistant):
+    with open(path, "a") as f:
+        f.write(json.dumps({"type": "user", "message": {"content": user}}) + "\n")
+        f.write(json.dumps({"type": "assistant",
+                            "message": {"content": [{"type": "text", "text": assistant}]}}) + "\n")
+
+
+@pytest.fixture
+def projects(tmp_path):
+    root = tmp_path / "projects"
+    for name in ("-home-a", "-home-b"):
+        (root / name).mkdir(parents=True)
+    (root / "-home-a" / "sess-a.jsonl").write_text("")
+    (root / "-home-b" / "sess-b.jsonl").write_text("")
+    stale = root / "-home-b" / "sess-old.jsonl"
+    stale.write_text("")
+    os.utime(stale, (1, 1))
+    return root
+
+
+@pytest.fixture
+def hub(projects, tmp_path, monkeypatch):
+    monkeypatch.setattr(overwatch_pkg, "get_conversations", lambda: MagicMock())
+    monkeypatch.setattr(overwatch_pkg, "PIPELINE_ENABLED", False)
+    monkeypatch.setattr(overwatch_pkg, "session_inject_path",
+                        lambda sid: tmp_path / f"inject-{sid}.md")
+    monkeypatch.setattr(llm, "is_available", lambda: False)
+
+    class QuietOverwatch(overwatch_pkg.Overwatch):
+        def _process_exchange(self, exchange, marks=None):
+            self._record_exchange(exchange)
+
+        def _check_snapshot(self):
+            pass
+
+        def _build_snapshot(self):
+            pass
+
+        def _micro_ingest(self):
+            self.flushed = list(self.pending_exchanges)
+            self.pending_exchanges = []
+
+    h = SessionHub(overwatch_pkg.OverwatchShared(), QuietOverwatch, max_sessions=4)
+    h.watcher = PollingWatcher(projects)
+    yield h
+    h.shared.close()
+
+
+def test_polling_recent_lists_fresh_sessions(projects):
+    recent = PollingWatcher(projects).recent(300)
+    assert {p.name for p in recent} == {"sess-a.jsonl", "sess-b.jsonl"}
+    assert len(PollingWatcher(projects).recent(300, limit=1)) == 1
+
+
+def test_one_overwatch_per_session_on_shared_stores(hub):
+    assert hub.refresh()
+    assert {p.stem for p in hub.sessions} == {"sess-a", "sess-b"}
+
+    a, b = (hub.sessions[p] for p in sorted(hub.sessions))
+    assert a.inject_path != b.inject_path
+    assert a.cooldowns is not b.cooldowns
+    assert a._verdict_cache is b._verdict_cache
+    assert a.conv is b.conv
+
+
+def test_lines_reach_only_their_session(hub, projects):
+    hub.refresh()
+    path_a = projects / "-home-a" / "sess-a.jsonl"
+    _append(path_a, "first question", "first answer")
+    _append(path_a, "second question", "second answer")
+    assert hub.poll_all()
+
+    a = hub.sessions[path_a]
+    b = hub.sessions[projects / "-home-b" / "sess-b.jsonl"]
+    assert [ex["session_id"] for ex in a.pending_exchanges] == ["sess-a"]
+    assert b.pending_exchanges == []
+
+
+def test_stale_session_is_detached_and_flushed(hub, projects):
+    hub.refresh()
+    path_b = projects / "-home-b" / "sess-b.jsonl"
+    _append(path_b, "question", "answer")
+    _append(path_b, "next", "reply")
+    hub.poll_all()
+    ow_b = hub.sessions[path_b]
+    ow_b.inject_path.write_text("pending")
+
+    os.utime(path_b, (1, 1))
+    assert hub.refresh()
+    assert path_b not in hub.sessions
+    assert [ex["user_text"] for ex in ow_b.flushed] == ["question"]
+    assert not ow_b.inject_path.exists()
+
+    os.utime(projects / "-home-a" / "sess-a.jsonl", (1, 1))
+    assert not hub.refresh()  # every session stale -> exit
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_inotify_recent_tracks_writes(projects):
+    w = InotifyWatcher(projects)
+    try:
+        assert {p.name for p in w.recent(300)} == {"sess-a.jsonl", "sess-b.jsonl"}
+        new = projects / "-home-a" / "sess-c.jsonl"
+        new.write_text("{}\n")
+        assert w.recent(300, limit=1) == [new]
+    finally:
+        w.close()
@@ -0,0 +1,95 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Overwatch watcher — inotify active-file tracking and polling fallback."""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from daemon.overwatch.watcher import (
+    InotifyWatcher, PollingWatcher, find_newest_session, make_watcher,
+)
+
+linux_only = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+
+
+@pytest.fixture
+def projects(tmp_path):
+    root = tmp_path / "projects"
+    (root / "-home-a").mkdir(parents=True)
+    old = root / "-home-a" / "old.jsonl"
+    old.write_text("{}\n")
+    os.utime(old, (1, 1))
+    (root / "-home-a" / "new.jsonl").write_text("{}\n")
+    return root
+
+
+def test_find_newest_session(projects):
+    assert find_newest_session(projects).name == "new.jsonl"
+    assert find_newest_session(projects / "missing") is None
+
+
+def test_missing_root_falls_back_to_polling(tmp_path):
+    w = make_watcher(tmp_path / "missing")
+    assert isinstance(w, PollingWatcher)
+    assert w.active() is None
+
+
+def test_poll_mode_forced(projects):
+    assert make_watcher(projects, "poll").mode == "poll"
+
+
+@linux_only
+class TestInotifyWatcher:
+
+    def test_initial_active_from_scan(self, projects):
+        w = InotifyWatcher(projects)
+        try:
+            assert w.active().name == "new.jsonl"
+        finally:
+            w.close()
+
+    def test_write_switches_active_and_wakes(self, projects):
+        w = InotifyWatcher(projects)
+        try:
+            with open(projects / "-home-a" / "old.jsonl", "a") as f:
+                f.write("{}\n")
+            start = time.monotonic()
+            assert w.wait(5.0)
+            assert time.monotonic() - start < 1.0
+            assert w.active().name == "old.jsonl"
+        finally:
+            w.close()
+
+    def test_idle_wait_times_out(self, projects):
+        w = InotifyWatcher(projects)
+        try:
+            assert w.wait(0.05) is False
+        finally:
+            w.close()
+
+    def test_new_project_dir_is_watched(self, projects):
+        w = InotifyWatcher(projects)
+        try:
+            (projects / "-home-b").mkdir()
+            w.active()  # consume the dir event, adds the watch
+            (projects / "-home-b" / "fresh.jsonl").write_text("{}\n")
+            assert w.wait(5.0)
+            assert w.active().name == "fresh.jsonl"
+        finally:
+            w.close()
+
+    def test_wake_interrupts_wait(self, projects):
+        w = InotifyWatcher(projects)
+        try:
+            threading.Timer(0.05, w.wake).start()
+            start = time.monotonic()
+            assert w.wait(10.0) is False
+            assert time.monotonic() - start < 2.0
+        finally:
+            w.close()
@@ -0,0 +1,86 @@
+# Copyright (c) 2026 Nenad Vasic. All rights reserved.
+# Licensed under the Business Source License 1.1 (BSL-1.1)
+# See LICENSE file in the project root for full license text.
+
+"""Unified search — one embedding, per-metric score normalisation, merged results."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+import memory.search as search_mod
+from memory.search import search_everything, similarity
+
+
+def _collection(rows, space="cosine"):
+    """Fake collection returning (id, document, distance) rows."""
+    col = MagicMock()
+    col.metadata = {"hnsw:space": space}
+    col.count.return_value = len(rows)
+    col.query.return_value = {
+        "ids": [[r[0] for r in rows]],
+        "documents": [[r[1] for r in rows]],
+        "metadatas": [[{"n": i} for i in range(len(rows))]],
+        "distances": [[r[2] for r in rows]],
+    }
+    return col
+
+
+@pytest.fixture
+def stores(monkeypatch):
+    cols = {
+        "memories": _collection([("m1", "deploy with the script", 0.2), ("m2", "weak", 0.9)]),
+        "principles": _collection([("p1", "test before deploy", 0.6)], space="l2"),
+        "reasoning": _collection([]),
+    }
+
+    def broken():
+        raise RuntimeError("store down")
+
+    sources = {name: (lambda c=col: c) for name, col in cols.items()}
+    sources["workflows"] = broken
+    sources["milestones"] = lambda: None
+    monkeypatch.setattr(search_mod, "SOURCES", sources)
+    embed = MagicMock(return_value=[0.1, 0.2])
+    monkeypatch.setattr(search_mod, "embed_query", embed)
+    return cols, embed
+
+
+def test_one_embedding_for_every_source(stores):
+    cols, embed = stores
+    hits = search_everything("how do we deploy", k_per_source=2)
+
+    embed.assert_called_once_with("how do we deploy")
+    for col in (cols["memories"], cols["principles"]):
+        assert col.query.call_args.kwargs["query_embeddings"] == [[0.1, 0.2]]
+    cols["reasoning"].query.assert_not_called()  # empty store
+
+    assert [(h["source"], h["id"]) for h in hits] == [
+        ("memories", "m1"), ("principles", "p1"), ("memories", "m2"),
+    ]
+    assert hits[0]["score"] == 0.8
+    assert hits[1]["score"] == 0.7  # squared L2 0.6 -> cosine 0.7
+    assert hits[0]["metadata"] == {"n": 0}
+
+
+def test_sources_filter_and_min_score(stores):
+    cols, embed = stores
+    hits = search_everything("deploy", sources=["memories"], min_score=0.5)
+    assert [h["id"] for h in hits] == ["m1"]
+    cols["principles"].query.assert_not_called()
+
+    with pytest.raises(ValueError):
+        search_everything("deploy", sources=["nope"])
+
+
+def test_precomputed_embedding_skips_embedding(stores):
+    cols, embed = stores
+    search_everything("deploy", sources=["memories"], query_embedding=[1.0, 0.0])
+    embed.assert_not_called()
+    assert cols["memories"].query.call_args.kwargs["query_embeddings"] == [[1.0, 0.0]]
+
+
+def test_similarity_is_clamped():
+    assert similarity(1.5) == 0.0
+    assert similarity(0.0, "ip") == 1.0
+    assert similarity(4.0, "l2") == 0.0
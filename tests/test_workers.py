@@ -5,18 +5,26 @@
 """Tests for Cortical Layer 2 — DELIBERATIVE worker pools."""
 
 import asyncio
+import json
+import os
+import subprocess
+import sys
 import threading
 import time
+from pathlib import Path
+
 import pytest
 
+from daemon import workers as workers_mod
 from daemon.workers import (
+    Priority,
+    ProcessLane,
     WorkerPool,
-    WorkerPoolBusy,
     WorkerManager,
     IO_TOOLS,
     LLM_TOOLS,
     get_pool_for_tool,
-    MAX_QUEUE_DEPTH,
+    run_tool,
 )
 
 
@@ -84,7 +92,7 @@ class TestWorkerPool:
         assert stats["name"] == "test"
         assert stats["submitted"] == 2
         assert stats["completed"] == 2
-        assert stats["rejected"] == 0
+        assert stats["failed"] == 0
         assert stats["pending"] == 0
 
     def test_exception_propagation(self, pool):
@@ -96,54 +104,188 @@ class TestWorkerPool:
             future.result(timeout=2)
 
 
-class TestBackpressure:
-
-    def test_rejects_when_full(self):
-        pool = WorkerPool("tiny", max_workers=1)
-        barrier = threading.Event()
+class TestScheduling:
 
-        def block():
-            barrier.wait(timeout=5)
-
-        # Fill up the queue
-        futures = []
-        for _ in range(MAX_QUEUE_DEPTH):
-            futures.append(pool.submit_sync(block))
+    def test_interactive_runs_before_queued_background(self):
+        pool = WorkerPool("one", max_workers=1)
+        gate = threading.Event()
+        order = []
+        pool.submit_sync(gate.wait, 5)
+        pool.submit_job(order.append, ("overnight",), priority=Priority.OVERNIGHT)
+        pool.submit_job(order.append, ("background",), priority=Priority.BACKGROUND)
+        last = pool.submit_job(order.append, ("interactive",))
+        assert pool.stats()["queued"]["background"] == 1
+        gate.set()
+        last.result(timeout=2)
+        pool.shutdown(wait=True)
+        assert order == ["interactive", "background", "overnight"]
 
-        # Next submit should be rejected
-        with pytest.raises(WorkerPoolBusy):
-            pool.submit_sync(lambda: None)
+    def test_cap_queues_instead_of_rejecting(self):
+        pool = WorkerPool("capped", max_workers=4)
+        lock = threading.Lock()
+        running, peak = [0], [0]
 
-        stats = pool.stats()
-        assert stats["rejected"] == 1
+        def job():
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+            return True
+
+        futures = [pool.submit_job(job, key="elara_dream", cap=1) for _ in range(40)]
+        other = pool.submit_sync(lambda: "free")
+        assert other.result(timeout=2) == "free"  # capped jobs don't hold threads
+        assert all(f.result(timeout=5) for f in futures)
+        assert peak[0] == 1
+        assert pool.stats()["cap_waits"] > 0
+        pool.shutdown(wait=True)
 
-        # Release all
-        barrier.set()
+    def test_grows_when_work_waits(self, monkeypatch):
+        monkeypatch.setattr(workers_mod, "ADAPT_INTERVAL", 0.0)
+        monkeypatch.setattr(workers_mod, "_host_overloaded", lambda: False)
+        pool = WorkerPool("grow", max_workers=1, ceiling=3)
+        futures = [pool.submit_sync(time.sleep, 0.06) for _ in range(6)]
         for f in futures:
             f.result(timeout=5)
+        stats = pool.stats()
+        assert stats["max_workers"] > 1
+        assert stats["max_workers"] <= 3
         pool.shutdown(wait=True)
 
-    def test_async_rejects_when_full(self):
-        pool = WorkerPool("tiny", max_workers=1)
-        barrier = threading.Event()
+    def test_busy_process_still_grows(self, monkeypatch):
+        # Native threads (ONNX, Chroma) keep process CPU high without GIL contention
+        monkeypatch.setattr(workers_mod, "ADAPT_INTERVAL", 0.0)
+        monkeypatch.setattr(workers_mod, "_host_overloaded", lambda: False)
 
-        def block():
-            barrier.wait(timeout=5)
+        def spin(seconds):
+            end = time.monotonic() + seconds
+            while time.monotonic() < end:
+                pass
 
-        futures = []
-        for _ in range(MAX_QUEUE_DEPTH):
-            futures.append(pool.submit_sync(block))
+        pool = WorkerPool("busy", max_workers=1, ceiling=3)
+        for f in [pool.submit_sync(spin, 0.06) for _ in range(6)]:
+            f.result(timeout=5)
+        assert pool.stats()["max_workers"] > 1
+        pool.shutdown(wait=True)
 
+    def test_capped_key_does_not_grow_pool(self, monkeypatch):
+        # Jobs held back by a cap can't be helped by more threads
+        monkeypatch.setattr(workers_mod, "ADAPT_INTERVAL", 0.0)
+        monkeypatch.setattr(workers_mod, "_host_overloaded", lambda: False)
+        pool = WorkerPool("capped", max_workers=2, ceiling=6)
+        futures = [pool.submit_job(time.sleep, (0.03,), key="slow_tool", cap=1) for _ in range(8)]
+        for f in futures:
+            f.result(timeout=5)
+        stats = pool.stats()
+        assert stats["max_workers"] == 2
+        assert stats["wait_ms_p50"] < 30
+        pool.shutdown(wait=True)
+
+    def test_shrinks_when_host_overloaded(self, monkeypatch):
+        monkeypatch.setattr(workers_mod, "ADAPT_INTERVAL", 0.0)
+        monkeypatch.setattr(workers_mod, "_host_overloaded", lambda: True)
+        pool = WorkerPool("shrink", max_workers=3, min_workers=1)
+        for _ in range(4):
+            pool.submit_sync(sum, range(1000)).result(timeout=2)
+        assert pool.stats()["max_workers"] == 1
+        pool.shutdown(wait=True)
+
+    def test_run_tool_routes_and_awaits(self):
         async def run():
-            return await pool.submit(lambda: None)
+            return await run_tool("elara_llm", lambda x: x * 2, {"x": 21})
 
-        with pytest.raises(WorkerPoolBusy):
-            asyncio.run(run())
+        try:
+            assert asyncio.run(run()) == 42
+            assert workers_mod.workers.llm.stats()["completed"] == 1
+        finally:
+            workers_mod.shutdown_workers()
 
-        barrier.set()
-        for f in futures:
-            f.result(timeout=5)
+    def test_shutdown_refuses_new_work(self, pool):
         pool.shutdown(wait=True)
+        with pytest.raises(RuntimeError):
+            pool.submit_sync(lambda: None)
+
+
+class TestProcessLane:
+
+    def test_runs_in_other_processes(self):
+        lane = ProcessLane("cpu-test", max_workers=2)
+        try:
+            assert lane.map(abs, [-1, -2, -3]) == [1, 2, 3]
+            assert lane.submit_sync(os.getpid).result(timeout=60) != os.getpid()
+            assert lane.stats()["submitted"] == 4
+        finally:
+            lane.shutdown(wait=True)
+
+    def test_workers_load_no_elara_packages(self):
+        lane = ProcessLane("cpu-test", max_workers=1)
+        probe = ("sorted({m.split('.')[0] for m in __import__('sys').modules}"
+                 " & {'chromadb', 'core', 'daemon', 'memory'})")
+        try:
+            assert lane.submit_sync(eval, probe).result(timeout=60) == []
+        finally:
+            lane.shutdown(wait=True)
+
+    def test_short_lived_process_stays_inline(self):
+        workers_mod.shutdown_workers()
+        assert workers_mod.cpu_map(abs, [-1, -2]) == [1, 2]
+        assert workers_mod.run_cpu(abs, -3) == 3
+        assert workers_mod.workers is None  # no manager, no process spawned
+
+    def test_disabled_lane_runs_inline(self):
+        lane = ProcessLane("off", max_workers=0)
+        assert lane.map(abs, [-1, -2]) == [1, 2]
+        assert lane.submit_sync(abs, -3).result() == 3
+        stats = lane.stats()
+        assert stats["inline"] == 3 and not stats["started"]
+
+
+class TestCpuKernels:
+
+    def test_recall_ranges_count_each_line_once(self, tmp_path):
+        from kernels.recall import count_recalls
+        log = tmp_path / "recall.jsonl"
+        lines = [json.dumps({"memory_id": f"m{i % 7}", "timestamp": "2026-01-01T00:00:00"})
+                 for i in range(500)]
+        log.write_text("\n".join(lines) + "\n")
+        size = log.stat().st_size
+
+        whole = count_recalls((str(log), 0, size, None))
+        merged = {}
+        for start in range(0, size, 997):  # boundaries land mid-line
+            for mid, n in count_recalls((str(log), start, min(start + 997, size), None)).items():
+                merged[mid] = merged.get(mid, 0) + n
+        assert merged == whole
+        assert sum(whole.values()) == 500
+
+    def test_parse_session_file_single_pass(self, tmp_path):
+        from kernels.sessions import parse_session_file
+        path = tmp_path / "s.jsonl"
+        path.write_text("\n".join([
+            json.dumps({"type": "user", "cwd": "/proj", "timestamp": "t1",
+                        "message": {"content": "hello"}}),
+            "not json",
+            json.dumps({"type": "assistant", "timestamp": "t2",
+                        "message": {"content": [{"type": "text", "text": "hi"}]}}),
+        ]))
+        parsed = parse_session_file(str(path))
+        assert parsed["project_cwd"] == "/proj"
+        assert [(e["user_text"], e["assistant_text"]) for e in parsed["exchanges"]] == [("hello", "hi")]
+
+
+    def test_definition_conflicts_are_indices(self):
+        from kernels.definitions import compare_definitions
+        groups = [[["a b c d"], ["a b c d", "x y z"]]]
+        assert [c[:5] for c in compare_definitions(groups)] == [(0, 0, 1, 0, 1)]
+
+    def test_kernels_do_not_import_elara_packages(self):
+        code = ("import sys, kernels.definitions, kernels.kg_extract, kernels.recall, kernels.sessions; "
+                "print(sorted({m.split('.')[0] for m in sys.modules} & {'core', 'daemon', 'memory'}))")
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                             cwd=str(Path(__file__).resolve().parent.parent), check=True)
+        assert out.stdout.strip() == "[]"
 
 
 class TestWorkerManager: